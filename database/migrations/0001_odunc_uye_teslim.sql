@@ -0,0 +1,6 @@
+-- Uyenin aktif oduncleri (UyeID = ? AND TeslimTarihi IS NULL): odunc verme
+-- limit kontrolu, uye ozet raporu ve uye silme trigger'i.
+-- Bilesik indeks UyeID foreign key'ine de hizmet eder, tek kolonlu
+-- idx_uye gereksiz kalir.
+ALTER TABLE ODUNC ADD INDEX idx_odunc_uye_teslim (UyeID, TeslimTarihi);
+ALTER TABLE ODUNC DROP INDEX idx_uye;
@@ -0,0 +1,4 @@
+-- Aktif / geciken odunc listeleri (TeslimTarihi IS NULL AND SonTeslimTarihi < ?)
+-- tek indeks araligiyla okunur; idx_teslim_tarihi bu indeksin on ekidir.
+ALTER TABLE ODUNC ADD INDEX idx_odunc_teslim_vade (TeslimTarihi, SonTeslimTarihi);
+ALTER TABLE ODUNC DROP INDEX idx_teslim_tarihi;
@@ -0,0 +1,4 @@
+-- Uyenin odenmemis cezalari (UyeID = ? AND OdendiMi = FALSE).
+-- UyeID foreign key'i bilesik indeksi kullanir, idx_uye_ceza kaldirilir.
+ALTER TABLE CEZA ADD INDEX idx_ceza_uye_odendi (UyeID, OdendiMi);
+ALTER TABLE CEZA DROP INDEX idx_uye_ceza;
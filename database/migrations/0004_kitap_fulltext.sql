@@ -0,0 +1,8 @@
+-- Katalog aramasi icin ngram FULLTEXT indeksi (Book.search_ranked).
+-- Tablodaki ilk FULLTEXT indeksi gizli FTS_DOC_ID kolonunu ekler; tablo
+-- yeniden olusturulur ve LOCK=NONE desteklenmez (runner LOCK=SHARED'a duser,
+-- bu sirada KITAP'a yazma bekler, okuma devam eder). MySQL bunu Warning 124
+-- ("InnoDB rebuilding table to add column FTS_DOC_ID") ile bildirir; runner
+-- uyariyi not olarak yazar, migration'i basarisiz saymaz.
+SET SESSION innodb_ft_enable_stopword = OFF;
+ALTER TABLE KITAP ADD FULLTEXT INDEX ft_kitap_arama (KitapAdi, Yazar, Yayinevi) WITH PARSER ngram;
@@ -0,0 +1,16 @@
+-- LOG_ISLEM'i IslemTarihi'ne gore aylik partition'lara hazirlar.
+-- Partition'li InnoDB tablolari foreign key desteklemez (KullaniciID
+-- referansi artik zorlanmaz) ve partition kolonu birincil anahtarda
+-- olmalidir. Aylik partition'lar ilk rotasyonda p_max bolunerek acilir:
+--     python -m src.database.log_archive --ensure
+ALTER TABLE LOG_ISLEM DROP FOREIGN KEY LOG_ISLEM_ibfk_1;
+ALTER TABLE LOG_ISLEM
+    MODIFY IslemTarihi DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (LogID, IslemTarihi);
+-- Partitioning tabloyu kopyalar (ALGORITHM/LOCK verilemez); tablo bu
+-- sirada yazmaya kapalidir, yogun olmayan bir saatte calistirin.
+ALTER TABLE LOG_ISLEM
+    PARTITION BY RANGE COLUMNS (IslemTarihi) (
+        PARTITION p_max VALUES LESS THAN (MAXVALUE)
+    );
@@ -0,0 +1,31 @@
+-- Turkce karakterleri katlanmis, kucuk harfli arama kolonlari ve indeksleri
+-- (Book.search / Member.search "ile baslayan" aramasi). Ifade
+-- src/database/fulltext.py normalize_search ile ayni olmali. Telefon
+-- indeksi uye aramasindaki OR kosullarinin hepsini indeksli yapar.
+-- STORED kolon eklemek tabloyu yeniden yazar, INPLACE desteklenmez:
+-- kopyalama sirasinda okuma devam eder, yazma bekler.
+ALTER TABLE KITAP
+    ADD COLUMN KitapAdiArama VARCHAR(200) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(KitapAdi, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    ADD COLUMN YazarArama VARCHAR(100) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Yazar, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    ADD INDEX idx_kitap_adi_arama (KitapAdiArama),
+    ADD INDEX idx_yazar_arama (YazarArama),
+    ALGORITHM=COPY, LOCK=SHARED;
+ALTER TABLE UYE
+    ADD COLUMN AdArama VARCHAR(50) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Ad, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    ADD COLUMN SoyadArama VARCHAR(50) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Soyad, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    ADD COLUMN EmailArama VARCHAR(100) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Email, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    ADD INDEX idx_uye_ad_arama (AdArama),
+    ADD INDEX idx_uye_soyad_arama (SoyadArama),
+    ADD INDEX idx_uye_email_arama (EmailArama),
+    ADD INDEX idx_uye_telefon (Telefon),
+    ALGORITHM=COPY, LOCK=SHARED;
@@ -0,0 +1,20 @@
+-- Dashboard ozet tablolari (Statistics.get_summary). Tablolar son
+-- halleriyle (slotlu) olusturulur; daha once tek satirli haliyle kurulmus
+-- veritabaninda IF NOT EXISTS nedeniyle dokunulmaz, 0008 bunlari donusturur.
+-- Sayaclarin degerleri 0008 sonundaki sp_OzetYenile ile doldurulur.
+CREATE TABLE IF NOT EXISTS ISTATISTIK_OZET (
+    OzetID TINYINT PRIMARY KEY,
+    UyeSayisi INT NOT NULL DEFAULT 0,
+    KitapSayisi INT NOT NULL DEFAULT 0,
+    ToplamAdet INT NOT NULL DEFAULT 0,
+    MevcutAdet INT NOT NULL DEFAULT 0,
+    AktifOdunc INT NOT NULL DEFAULT 0,
+    OdenmemisCezaSayisi INT NOT NULL DEFAULT 0,
+    OdenmemisCezaTutari DECIMAL(12, 2) NOT NULL DEFAULT 0.00
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
+CREATE TABLE IF NOT EXISTS ODUNC_VADE_OZET (
+    SonTeslimTarihi DATE NOT NULL,
+    Slot TINYINT NOT NULL DEFAULT 0,
+    AktifOdunc INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (SonTeslimTarihi, Slot)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
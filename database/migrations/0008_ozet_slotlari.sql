@@ -0,0 +1,299 @@
+-- Dashboard ozet sayaclarini baglanti basina slot satirlarina boler
+-- (triggers.sql: CONNECTION_ID() % 16). Tek ozet satiri her odunc, teslim
+-- ve cezada commit'e kadar kilitli kaldigi icin eszamanli islemler o
+-- satirda sirada bekliyordu; Statistics.get_summary slotlari toplar.
+-- Mevcut OzetID = 1 satiri 1. slot olarak kalir, vade kovalari 0. slota
+-- duser. 0007 ile yeni olusturulan tablolarda ALTER adimlari atlanir (CHECK
+-- yok, Slot kolonu ve birincil anahtar zaten var).
+-- Ardindan ozet tablolarini guncelleyen trigger'lar ve sp_OzetYenile
+-- triggers.sql / stored_procedures.sql'deki halleriyle yeniden kurulur.
+-- DROP ile CREATE arasinda trigger'siz yazma olmasin diye tablolar kisa
+-- sure WRITE kilidiyle tutulur; sonda sayaclar sp_OzetYenile ile yeniden
+-- hesaplanir (eski trigger'larin birakmis olabilecegi kayma da duzelir).
+ALTER TABLE ISTATISTIK_OZET
+    DROP CHECK ISTATISTIK_OZET_chk_1,
+    ALTER COLUMN OzetID DROP DEFAULT;
+INSERT INTO ISTATISTIK_OZET (OzetID)
+VALUES (0), (1), (2), (3), (4), (5), (6), (7), (8), (9), (10), (11), (12), (13), (14), (15)
+ON DUPLICATE KEY UPDATE OzetID = OzetID;
+ALTER TABLE ODUNC_VADE_OZET
+    ADD COLUMN Slot TINYINT NOT NULL DEFAULT 0 AFTER SonTeslimTarihi,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (SonTeslimTarihi, Slot);
+
+LOCK TABLES ODUNC WRITE, CEZA WRITE, UYE WRITE, KITAP WRITE;
+
+DELIMITER //
+
+DROP TRIGGER IF EXISTS TR_ODUNC_INSERT //
+CREATE TRIGGER TR_ODUNC_INSERT
+AFTER INSERT ON ODUNC
+FOR EACH ROW
+BEGIN
+    UPDATE KITAP
+    SET MevcutAdet = MevcutAdet - 1
+    WHERE KitapID = NEW.KitapID;
+    
+    IF NEW.TeslimTarihi IS NULL THEN
+        UPDATE ISTATISTIK_OZET SET AktifOdunc = AktifOdunc + 1 WHERE OzetID = CONNECTION_ID() % 16;
+        
+        INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+        VALUES (NEW.SonTeslimTarihi, CONNECTION_ID() % 16, 1)
+        ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc + 1;
+    END IF;
+    
+    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+    VALUES (
+        'ODUNC',
+        'INSERT',
+        NEW.KullaniciID,
+        CONCAT('Trigger: Yeni odunc eklendi. OduncID: ', NEW.OduncID),
+        JSON_OBJECT(
+            'OduncID', NEW.OduncID,
+            'UyeID', NEW.UyeID,
+            'KitapID', NEW.KitapID,
+            'OduncTarihi', NEW.OduncTarihi
+        )
+    );
+END //
+
+DROP TRIGGER IF EXISTS TR_CEZA_INSERT //
+CREATE TRIGGER TR_CEZA_INSERT
+AFTER INSERT ON CEZA
+FOR EACH ROW
+BEGIN
+    UPDATE UYE
+    SET ToplamBorc = ToplamBorc + NEW.Tutar
+    WHERE UyeID = NEW.UyeID;
+    
+    IF NOT IFNULL(NEW.OdendiMi, FALSE) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi + 1,
+            OdenmemisCezaTutari = OdenmemisCezaTutari + NEW.Tutar
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+    
+    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, Aciklama, YeniVeri)
+    VALUES (
+        'CEZA',
+        'INSERT',
+        CONCAT('Trigger: Yeni ceza eklendi. UyeID: ', NEW.UyeID, ', Tutar: ', NEW.Tutar),
+        JSON_OBJECT(
+            'CezaID', NEW.CezaID,
+            'UyeID', NEW.UyeID,
+            'Tutar', NEW.Tutar,
+            'GecikmeGunu', NEW.GecikmeGunu
+        )
+    );
+END //
+
+DROP TRIGGER IF EXISTS TR_ODUNC_UPDATE_OZET //
+CREATE TRIGGER TR_ODUNC_UPDATE_OZET
+AFTER UPDATE ON ODUNC
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.TeslimTarihi <=> NEW.TeslimTarihi
+            AND OLD.SonTeslimTarihi <=> NEW.SonTeslimTarihi) THEN
+        -- Teslim, teslimin geri alinmasi ve sure uzatma ayni sekilde islenir
+        IF OLD.TeslimTarihi IS NULL THEN
+            -- Odunc baska slota yazilmis olabilir: bu slot eksiye duser
+            INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+            VALUES (OLD.SonTeslimTarihi, CONNECTION_ID() % 16, -1)
+            ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc - 1;
+            
+            DELETE FROM ODUNC_VADE_OZET
+            WHERE SonTeslimTarihi = OLD.SonTeslimTarihi
+              AND Slot = CONNECTION_ID() % 16 AND AktifOdunc = 0;
+        END IF;
+        
+        IF NEW.TeslimTarihi IS NULL THEN
+            INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+            VALUES (NEW.SonTeslimTarihi, CONNECTION_ID() % 16, 1)
+            ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc + 1;
+        END IF;
+        
+        IF (OLD.TeslimTarihi IS NULL) <> (NEW.TeslimTarihi IS NULL) THEN
+            UPDATE ISTATISTIK_OZET
+            SET AktifOdunc = AktifOdunc + IF(NEW.TeslimTarihi IS NULL, 1, -1)
+            WHERE OzetID = CONNECTION_ID() % 16;
+        END IF;
+    END IF;
+END //
+
+-- BEFORE: ON DELETE CASCADE ile silinen CEZA satirlari trigger calistirmaz,
+-- odenmemis cezalari silinmeden once dusulur
+DROP TRIGGER IF EXISTS TR_ODUNC_DELETE_OZET //
+CREATE TRIGGER TR_ODUNC_DELETE_OZET
+BEFORE DELETE ON ODUNC
+FOR EACH ROW
+BEGIN
+    DECLARE v_CezaSayisi INT;
+    DECLARE v_CezaTutari DECIMAL(12, 2);
+    
+    SELECT COUNT(*), IFNULL(SUM(Tutar), 0) INTO v_CezaSayisi, v_CezaTutari
+    FROM CEZA
+    WHERE OduncID = OLD.OduncID AND NOT IFNULL(OdendiMi, FALSE);
+    
+    UPDATE ISTATISTIK_OZET
+    SET AktifOdunc = AktifOdunc - IF(OLD.TeslimTarihi IS NULL, 1, 0),
+        OdenmemisCezaSayisi = OdenmemisCezaSayisi - v_CezaSayisi,
+        OdenmemisCezaTutari = OdenmemisCezaTutari - v_CezaTutari
+    WHERE OzetID = CONNECTION_ID() % 16;
+    
+    IF OLD.TeslimTarihi IS NULL THEN
+        INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+        VALUES (OLD.SonTeslimTarihi, CONNECTION_ID() % 16, -1)
+        ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc - 1;
+        
+        DELETE FROM ODUNC_VADE_OZET
+        WHERE SonTeslimTarihi = OLD.SonTeslimTarihi
+          AND Slot = CONNECTION_ID() % 16 AND AktifOdunc = 0;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_CEZA_UPDATE_OZET //
+CREATE TRIGGER TR_CEZA_UPDATE_OZET
+AFTER UPDATE ON CEZA
+FOR EACH ROW
+BEGIN
+    DECLARE v_EskiAcik BOOLEAN;
+    DECLARE v_YeniAcik BOOLEAN;
+    
+    SET v_EskiAcik = NOT IFNULL(OLD.OdendiMi, FALSE);
+    SET v_YeniAcik = NOT IFNULL(NEW.OdendiMi, FALSE);
+    
+    IF v_EskiAcik <> v_YeniAcik OR (v_YeniAcik AND OLD.Tutar <> NEW.Tutar) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi - v_EskiAcik + v_YeniAcik,
+            OdenmemisCezaTutari = OdenmemisCezaTutari
+                - IF(v_EskiAcik, OLD.Tutar, 0) + IF(v_YeniAcik, NEW.Tutar, 0)
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_CEZA_DELETE_OZET //
+CREATE TRIGGER TR_CEZA_DELETE_OZET
+AFTER DELETE ON CEZA
+FOR EACH ROW
+BEGIN
+    IF NOT IFNULL(OLD.OdendiMi, FALSE) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi - 1,
+            OdenmemisCezaTutari = OdenmemisCezaTutari - OLD.Tutar
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_UYE_INSERT_OZET //
+CREATE TRIGGER TR_UYE_INSERT_OZET
+AFTER INSERT ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi + 1 WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+DROP TRIGGER IF EXISTS TR_UYE_DELETE_OZET //
+CREATE TRIGGER TR_UYE_DELETE_OZET
+AFTER DELETE ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi - 1 WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+DROP TRIGGER IF EXISTS TR_KITAP_INSERT_OZET //
+CREATE TRIGGER TR_KITAP_INSERT_OZET
+AFTER INSERT ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi + 1,
+        ToplamAdet = ToplamAdet + NEW.ToplamAdet,
+        MevcutAdet = MevcutAdet + NEW.MevcutAdet
+    WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+-- ODUNC trigger'larinin MevcutAdet guncellemeleri de buradan gecer
+DROP TRIGGER IF EXISTS TR_KITAP_UPDATE_OZET //
+CREATE TRIGGER TR_KITAP_UPDATE_OZET
+AFTER UPDATE ON KITAP
+FOR EACH ROW
+BEGIN
+    IF OLD.ToplamAdet <> NEW.ToplamAdet OR OLD.MevcutAdet <> NEW.MevcutAdet THEN
+        UPDATE ISTATISTIK_OZET
+        SET ToplamAdet = ToplamAdet + NEW.ToplamAdet - OLD.ToplamAdet,
+            MevcutAdet = MevcutAdet + NEW.MevcutAdet - OLD.MevcutAdet
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_KITAP_DELETE_OZET //
+CREATE TRIGGER TR_KITAP_DELETE_OZET
+AFTER DELETE ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi - 1,
+        ToplamAdet = ToplamAdet - OLD.ToplamAdet,
+        MevcutAdet = MevcutAdet - OLD.MevcutAdet
+    WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+DELIMITER ;
+
+UNLOCK TABLES;
+
+DELIMITER //
+
+DROP PROCEDURE IF EXISTS sp_OzetYenile //
+CREATE PROCEDURE sp_OzetYenile()
+BEGIN
+    -- ISTATISTIK_OZET ve ODUNC_VADE_OZET tablolarini sifirdan hesaplar.
+    -- Normalde trigger'lar gunceller; bu procedure kayma suphesinde
+    -- (trigger'lar devre disiyken yapilan toplu yukleme vb.) kullanilir.
+    -- Toplamlar 0. slota yazilir, diger slotlar sifirlanir.
+    DECLARE v_SlotSayisi INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+    
+    START TRANSACTION;
+    
+    INSERT INTO ISTATISTIK_OZET (OzetID)
+    VALUES (0), (1), (2), (3), (4), (5), (6), (7), (8), (9), (10), (11), (12), (13), (14), (15)
+    ON DUPLICATE KEY UPDATE OzetID = OzetID;
+    -- Slot satirlarini kilitleyen trigger'lar yeniden hesaplama bitene kadar bekler
+    SELECT COUNT(*) INTO v_SlotSayisi FROM ISTATISTIK_OZET FOR UPDATE;
+    
+    UPDATE ISTATISTIK_OZET
+    SET UyeSayisi = 0, KitapSayisi = 0, ToplamAdet = 0, MevcutAdet = 0,
+        AktifOdunc = 0, OdenmemisCezaSayisi = 0, OdenmemisCezaTutari = 0
+    WHERE OzetID <> 0;
+    
+    UPDATE ISTATISTIK_OZET
+    SET UyeSayisi = (SELECT COUNT(*) FROM UYE),
+        KitapSayisi = (SELECT COUNT(*) FROM KITAP),
+        ToplamAdet = (SELECT IFNULL(SUM(ToplamAdet), 0) FROM KITAP),
+        MevcutAdet = (SELECT IFNULL(SUM(MevcutAdet), 0) FROM KITAP),
+        AktifOdunc = (SELECT COUNT(*) FROM ODUNC WHERE TeslimTarihi IS NULL),
+        OdenmemisCezaSayisi = (SELECT COUNT(*) FROM CEZA WHERE NOT IFNULL(OdendiMi, FALSE)),
+        OdenmemisCezaTutari = (SELECT IFNULL(SUM(Tutar), 0) FROM CEZA WHERE NOT IFNULL(OdendiMi, FALSE))
+    WHERE OzetID = 0;
+    
+    -- Eksi / sifir slot kovalari da burada tek satira toplanir
+    DELETE FROM ODUNC_VADE_OZET;
+    INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+    SELECT SonTeslimTarihi, 0, COUNT(*)
+    FROM ODUNC
+    WHERE TeslimTarihi IS NULL
+    GROUP BY SonTeslimTarihi;
+    
+    COMMIT;
+    
+END //
+
+DELIMITER ;
+
+CALL sp_OzetYenile();
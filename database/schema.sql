@@ -1,4 +1,9 @@
 
+-- Bos veritabani kurulumu. Calisan bir sistemde sema degisiklikleri
+-- database/migrations altindaki dosyalarla yapilir:
+--     python -m src.database.migrations
+-- Bu dosya her zaman son migration'in sonucunu yansitir.
+
 CREATE DATABASE IF NOT EXISTS kutuphane_db 
 CHARACTER SET utf8mb4 
 COLLATE utf8mb4_turkish_ci;
@@ -30,9 +35,23 @@ CREATE TABLE UYE (
     KayitTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
     ToplamBorc DECIMAL(10, 2) DEFAULT 0.00 CHECK (ToplamBorc >= 0),
     AktifMi BOOLEAN DEFAULT TRUE,
+    -- Arama kolonlari (bkz. KITAP)
+    AdArama VARCHAR(50) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Ad, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    SoyadArama VARCHAR(50) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Soyad, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    EmailArama VARCHAR(100) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Email, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
     INDEX idx_uye_ad (Ad, Soyad),
     INDEX idx_uye_email (Email),
-    INDEX idx_uye_borc (ToplamBorc)
+    INDEX idx_uye_borc (ToplamBorc),
+    INDEX idx_uye_ad_arama (AdArama),
+    INDEX idx_uye_soyad_arama (SoyadArama),
+    INDEX idx_uye_email_arama (EmailArama),
+    INDEX idx_uye_telefon (Telefon)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
 
 
@@ -44,6 +63,11 @@ CREATE TABLE KATEGORI (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
 
 
+-- ngram parser token'larini varsayilan (Ingilizce) stopword listesiyle
+-- eler; 'a', 'in' gibi harf dizilerini iceren Turkce ngram'lar
+-- indekse girsin diye FULLTEXT indeksi stopword'suz olusturulur.
+SET SESSION innodb_ft_enable_stopword = OFF;
+
 CREATE TABLE KITAP (
     KitapID INT AUTO_INCREMENT PRIMARY KEY,
     KitapAdi VARCHAR(200) NOT NULL,
@@ -56,13 +80,25 @@ CREATE TABLE KITAP (
     MevcutAdet INT NOT NULL DEFAULT 1 CHECK (MevcutAdet >= 0),
     RafNo VARCHAR(20),
     EklenmeTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    -- Arama kolonlari: kucuk harf, Turkce karakterler katlanmis ('Çalıkuşu'
+    -- ve 'Calikusu' ayni). "Ile baslayan" aramasi (LIKE 'metin%') indeksi
+    -- kullanir. Ifade src/database/fulltext.py normalize_search ile ayni olmali.
+    KitapAdiArama VARCHAR(200) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(KitapAdi, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
+    YazarArama VARCHAR(100) AS (
+        REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(LOWER(REPLACE(Yazar, 'İ', 'i')), 'ç', 'c'), 'ğ', 'g'), 'ı', 'i'), 'ö', 'o'), 'ş', 's'), 'ü', 'u'), 'â', 'a'), 'î', 'i'), 'û', 'u')
+    ) STORED,
     FOREIGN KEY (KategoriID) REFERENCES KATEGORI(KategoriID) 
         ON DELETE RESTRICT ON UPDATE CASCADE,
     CHECK (MevcutAdet <= ToplamAdet),
     INDEX idx_kitap_adi (KitapAdi),
     INDEX idx_yazar (Yazar),
     INDEX idx_kategori (KategoriID),
-    INDEX idx_mevcut_adet (MevcutAdet)
+    INDEX idx_mevcut_adet (MevcutAdet),
+    INDEX idx_kitap_adi_arama (KitapAdiArama),
+    INDEX idx_yazar_arama (YazarArama),
+    FULLTEXT INDEX ft_kitap_arama (KitapAdi, Yazar, Yayinevi) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
 
 
@@ -81,9 +117,9 @@ CREATE TABLE ODUNC (
         ON DELETE RESTRICT ON UPDATE CASCADE,
     FOREIGN KEY (KullaniciID) REFERENCES KULLANICI(KullaniciID) 
         ON DELETE RESTRICT ON UPDATE CASCADE,
-    INDEX idx_uye (UyeID),
+    INDEX idx_odunc_uye_teslim (UyeID, TeslimTarihi),
     INDEX idx_kitap (KitapID),
-    INDEX idx_teslim_tarihi (TeslimTarihi),
+    INDEX idx_odunc_teslim_vade (TeslimTarihi, SonTeslimTarihi),
     INDEX idx_son_teslim (SonTeslimTarihi),
     INDEX idx_odunc_tarihi (OduncTarihi)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
@@ -102,25 +138,82 @@ CREATE TABLE CEZA (
         ON DELETE CASCADE ON UPDATE CASCADE,
     FOREIGN KEY (UyeID) REFERENCES UYE(UyeID) 
         ON DELETE RESTRICT ON UPDATE CASCADE,
-    INDEX idx_uye_ceza (UyeID),
+    INDEX idx_ceza_uye_odendi (UyeID, OdendiMi),
     INDEX idx_odunc_ceza (OduncID),
     INDEX idx_odendi (OdendiMi)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
 
 
+-- Aylik RANGE partition'lar (pYYYYMM); yeni aylar ve eski aylarin
+-- arsivlenmesi src/database/log_archive.py ile yapilir. Partition'li
+-- InnoDB tablolari foreign key desteklemez ve partition kolonu her
+-- unique anahtarda bulunmalidir: KullaniciID referansi zorlanmaz,
+-- birincil anahtar (LogID, IslemTarihi) olur.
 CREATE TABLE LOG_ISLEM (
-    LogID INT AUTO_INCREMENT PRIMARY KEY,
+    LogID INT AUTO_INCREMENT,
     TabloAdi VARCHAR(50) NOT NULL,
     IslemTipi ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
-    IslemTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    IslemTarihi DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     KullaniciID INT DEFAULT NULL,
     Aciklama TEXT,
     EskiVeri JSON,
     YeniVeri JSON,
-    FOREIGN KEY (KullaniciID) REFERENCES KULLANICI(KullaniciID) 
-        ON DELETE SET NULL ON UPDATE CASCADE,
+    PRIMARY KEY (LogID, IslemTarihi),
     INDEX idx_tablo_adi (TabloAdi),
     INDEX idx_islem_tipi (IslemTipi),
     INDEX idx_islem_tarihi (IslemTarihi)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci
+PARTITION BY RANGE COLUMNS (IslemTarihi) (
+    PARTITION p_max VALUES LESS THAN (MAXVALUE)
+);
+
+
+-- Dashboard sayaclari: triggers.sql'deki trigger'larla artimsal guncellenir.
+-- Her baglanti kendi slot satirini (CONNECTION_ID() % 16) gunceller; eszamanli
+-- odunc / teslim islemleri tek satirin kilidinde sirada beklemez. Sayaclarin
+-- degeri tum slotlarin toplamidir.
+CREATE TABLE ISTATISTIK_OZET (
+    OzetID TINYINT PRIMARY KEY,
+    UyeSayisi INT NOT NULL DEFAULT 0,
+    KitapSayisi INT NOT NULL DEFAULT 0,
+    ToplamAdet INT NOT NULL DEFAULT 0,
+    MevcutAdet INT NOT NULL DEFAULT 0,
+    AktifOdunc INT NOT NULL DEFAULT 0,
+    OdenmemisCezaSayisi INT NOT NULL DEFAULT 0,
+    OdenmemisCezaTutari DECIMAL(12, 2) NOT NULL DEFAULT 0.00
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
+
+
+-- Aktif oduncler son teslim tarihine gore; geciken sayisi = CURDATE() oncesi kovalarin toplami.
+-- Ayni gun verilen oduncler ayni tarihe duser, bu yuzden kova da slotlara bolunur.
+-- Tek slotun degeri eksi olabilir (odunc baska, teslim baska baglantidan).
+CREATE TABLE ODUNC_VADE_OZET (
+    SonTeslimTarihi DATE NOT NULL,
+    Slot TINYINT NOT NULL DEFAULT 0,
+    AktifOdunc INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (SonTeslimTarihi, Slot)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
+
+
+-- Uygulanmis migration'lar (src/database/migrations.py). Bu dosya son
+-- migration'i zaten icerdiginden kurulumda tum surumler uygulanmis sayilir;
+-- yeni migration eklendiginde satiri buraya da eklenmeli. Bos Checksum
+-- "--status"ta "schema.sql ile kuruldu" olarak gosterilir.
+CREATE TABLE SCHEMA_VERSION (
+    Surum INT PRIMARY KEY,
+    Ad VARCHAR(100) NOT NULL,
+    Checksum CHAR(64) NOT NULL,
+    UygulanmaTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    SureMs INT NOT NULL,
+    Adimlar JSON
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci;
 
+INSERT INTO SCHEMA_VERSION (Surum, Ad, Checksum, SureMs) VALUES
+    (1, 'odunc_uye_teslim', '', 0),
+    (2, 'odunc_teslim_vade', '', 0),
+    (3, 'ceza_uye_odendi', '', 0),
+    (4, 'kitap_fulltext', '', 0),
+    (5, 'log_islem_partition', '', 0),
+    (6, 'arama_kolonlari', '', 0),
+    (7, 'ozet_tablolari', '', 0),
+    (8, 'ozet_slotlari', '', 0);
@@ -0,0 +1,373 @@
+-- Kutuphane Yonetim Sistemi - SQLite Semasi
+-- schema.sql ve triggers.sql'in SQLite karsiligi (DB_BACKEND=sqlite).
+-- Stored procedure'ler src/database/sqlite_procedures.py icinde Python ile yazilidir.
+
+PRAGMA foreign_keys = ON;
+
+
+CREATE TABLE IF NOT EXISTS KULLANICI (
+    KullaniciID INTEGER PRIMARY KEY AUTOINCREMENT,
+    KullaniciAdi VARCHAR(50) NOT NULL UNIQUE,
+    Sifre VARCHAR(255) NOT NULL,
+    Rol VARCHAR(10) NOT NULL DEFAULT 'Gorevli' CHECK (Rol IN ('Admin', 'Gorevli')),
+    AdSoyad VARCHAR(100) NOT NULL,
+    Email VARCHAR(100),
+    OlusturmaTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    AktifMi BOOLEAN DEFAULT TRUE
+);
+CREATE INDEX IF NOT EXISTS idx_rol ON KULLANICI (Rol);
+
+
+CREATE TABLE IF NOT EXISTS UYE (
+    UyeID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Ad VARCHAR(50) NOT NULL,
+    Soyad VARCHAR(50) NOT NULL,
+    Email VARCHAR(100) NOT NULL UNIQUE,
+    Telefon VARCHAR(15) NOT NULL,
+    Adres TEXT,
+    KayitTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    ToplamBorc DECIMAL(10, 2) DEFAULT 0.00 CHECK (ToplamBorc >= 0),
+    AktifMi BOOLEAN DEFAULT TRUE
+);
+CREATE INDEX IF NOT EXISTS idx_uye_ad ON UYE (Ad, Soyad);
+CREATE INDEX IF NOT EXISTS idx_uye_borc ON UYE (ToplamBorc);
+CREATE INDEX IF NOT EXISTS idx_uye_telefon ON UYE (Telefon COLLATE NOCASE);
+-- AdArama / SoyadArama / EmailArama: sqlite_backend.SEARCH_COLUMNS
+
+
+CREATE TABLE IF NOT EXISTS KATEGORI (
+    KategoriID INTEGER PRIMARY KEY AUTOINCREMENT,
+    KategoriAdi VARCHAR(100) NOT NULL UNIQUE,
+    Aciklama TEXT
+);
+
+
+CREATE TABLE IF NOT EXISTS KITAP (
+    KitapID INTEGER PRIMARY KEY AUTOINCREMENT,
+    KitapAdi VARCHAR(200) NOT NULL,
+    Yazar VARCHAR(100) NOT NULL,
+    KategoriID INTEGER NOT NULL
+        REFERENCES KATEGORI (KategoriID) ON DELETE RESTRICT ON UPDATE CASCADE,
+    Yayinevi VARCHAR(100),
+    BasimYili INTEGER,
+    ISBN VARCHAR(20) UNIQUE,
+    ToplamAdet INTEGER NOT NULL DEFAULT 1 CHECK (ToplamAdet >= 0),
+    MevcutAdet INTEGER NOT NULL DEFAULT 1 CHECK (MevcutAdet >= 0),
+    RafNo VARCHAR(20),
+    EklenmeTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    CHECK (MevcutAdet <= ToplamAdet)
+);
+CREATE INDEX IF NOT EXISTS idx_kitap_adi ON KITAP (KitapAdi);
+CREATE INDEX IF NOT EXISTS idx_yazar ON KITAP (Yazar);
+CREATE INDEX IF NOT EXISTS idx_kategori ON KITAP (KategoriID);
+CREATE INDEX IF NOT EXISTS idx_mevcut_adet ON KITAP (MevcutAdet);
+-- KitapAdiArama / YazarArama: sqlite_backend.SEARCH_COLUMNS
+
+
+CREATE TABLE IF NOT EXISTS ODUNC (
+    OduncID INTEGER PRIMARY KEY AUTOINCREMENT,
+    UyeID INTEGER NOT NULL
+        REFERENCES UYE (UyeID) ON DELETE RESTRICT ON UPDATE CASCADE,
+    KitapID INTEGER NOT NULL
+        REFERENCES KITAP (KitapID) ON DELETE RESTRICT ON UPDATE CASCADE,
+    KullaniciID INTEGER NOT NULL
+        REFERENCES KULLANICI (KullaniciID) ON DELETE RESTRICT ON UPDATE CASCADE,
+    OduncTarihi DATE NOT NULL,
+    SonTeslimTarihi DATE NOT NULL,
+    TeslimTarihi DATE DEFAULT NULL,
+    Notlar TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_odunc_uye_teslim ON ODUNC (UyeID, TeslimTarihi);
+CREATE INDEX IF NOT EXISTS idx_kitap ON ODUNC (KitapID);
+CREATE INDEX IF NOT EXISTS idx_odunc_teslim_vade ON ODUNC (TeslimTarihi, SonTeslimTarihi);
+CREATE INDEX IF NOT EXISTS idx_son_teslim ON ODUNC (SonTeslimTarihi);
+CREATE INDEX IF NOT EXISTS idx_odunc_tarihi ON ODUNC (OduncTarihi);
+
+
+CREATE TABLE IF NOT EXISTS CEZA (
+    CezaID INTEGER PRIMARY KEY AUTOINCREMENT,
+    OduncID INTEGER NULL
+        REFERENCES ODUNC (OduncID) ON DELETE CASCADE ON UPDATE CASCADE,
+    UyeID INTEGER NOT NULL
+        REFERENCES UYE (UyeID) ON DELETE RESTRICT ON UPDATE CASCADE,
+    Tutar DECIMAL(10, 2) NOT NULL CHECK (Tutar >= 0),
+    GecikmeGunu INTEGER NOT NULL DEFAULT 0 CHECK (GecikmeGunu >= 0),
+    OlusturmaTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    OdendiMi BOOLEAN DEFAULT FALSE,
+    Aciklama TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ceza_uye_odendi ON CEZA (UyeID, OdendiMi);
+CREATE INDEX IF NOT EXISTS idx_odunc_ceza ON CEZA (OduncID);
+CREATE INDEX IF NOT EXISTS idx_odendi ON CEZA (OdendiMi);
+
+
+CREATE TABLE IF NOT EXISTS LOG_ISLEM (
+    LogID INTEGER PRIMARY KEY AUTOINCREMENT,
+    TabloAdi VARCHAR(50) NOT NULL,
+    IslemTipi VARCHAR(10) NOT NULL CHECK (IslemTipi IN ('INSERT', 'UPDATE', 'DELETE')),
+    IslemTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+    KullaniciID INTEGER DEFAULT NULL
+        REFERENCES KULLANICI (KullaniciID) ON DELETE SET NULL ON UPDATE CASCADE,
+    Aciklama TEXT,
+    EskiVeri JSON,
+    YeniVeri JSON
+);
+CREATE INDEX IF NOT EXISTS idx_tablo_adi ON LOG_ISLEM (TabloAdi);
+CREATE INDEX IF NOT EXISTS idx_islem_tipi ON LOG_ISLEM (IslemTipi);
+CREATE INDEX IF NOT EXISTS idx_islem_tarihi ON LOG_ISLEM (IslemTarihi);
+
+
+-- MySQL'deki slot satirlari gerekmez: SQLite'ta ayni anda tek yazici var
+CREATE TABLE IF NOT EXISTS ISTATISTIK_OZET (
+    OzetID INTEGER PRIMARY KEY DEFAULT 1 CHECK (OzetID = 1),
+    UyeSayisi INTEGER NOT NULL DEFAULT 0,
+    KitapSayisi INTEGER NOT NULL DEFAULT 0,
+    ToplamAdet INTEGER NOT NULL DEFAULT 0,
+    MevcutAdet INTEGER NOT NULL DEFAULT 0,
+    AktifOdunc INTEGER NOT NULL DEFAULT 0,
+    OdenmemisCezaSayisi INTEGER NOT NULL DEFAULT 0,
+    OdenmemisCezaTutari DECIMAL(12, 2) NOT NULL DEFAULT 0.00
+);
+
+CREATE TABLE IF NOT EXISTS ODUNC_VADE_OZET (
+    SonTeslimTarihi DATE PRIMARY KEY,
+    AktifOdunc INTEGER NOT NULL DEFAULT 0
+);
+
+
+-- Trigger'lar (triggers.sql ile ayni davranis)
+
+CREATE TRIGGER IF NOT EXISTS TR_ODUNC_INSERT
+AFTER INSERT ON ODUNC
+FOR EACH ROW
+BEGIN
+    UPDATE KITAP
+    SET MevcutAdet = MevcutAdet - 1
+    WHERE KitapID = NEW.KitapID;
+
+    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+    VALUES (
+        'ODUNC',
+        'INSERT',
+        NEW.KullaniciID,
+        'Trigger: Yeni odunc eklendi. OduncID: ' || NEW.OduncID,
+        json_object(
+            'OduncID', NEW.OduncID,
+            'UyeID', NEW.UyeID,
+            'KitapID', NEW.KitapID,
+            'OduncTarihi', NEW.OduncTarihi
+        )
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_ODUNC_UPDATE_TESLIM
+AFTER UPDATE OF TeslimTarihi ON ODUNC
+FOR EACH ROW
+WHEN OLD.TeslimTarihi IS NULL AND NEW.TeslimTarihi IS NOT NULL
+BEGIN
+    UPDATE KITAP
+    SET MevcutAdet = MevcutAdet + 1
+    WHERE KitapID = NEW.KitapID;
+
+    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+    VALUES (
+        'ODUNC',
+        'UPDATE',
+        NEW.KullaniciID,
+        'Trigger: Kitap teslim alindi. OduncID: ' || NEW.OduncID,
+        json_object(
+            'OduncID', NEW.OduncID,
+            'TeslimTarihi', NEW.TeslimTarihi
+        )
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_CEZA_INSERT
+AFTER INSERT ON CEZA
+FOR EACH ROW
+BEGIN
+    UPDATE UYE
+    SET ToplamBorc = ToplamBorc + NEW.Tutar
+    WHERE UyeID = NEW.UyeID;
+
+    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, Aciklama, YeniVeri)
+    VALUES (
+        'CEZA',
+        'INSERT',
+        'Trigger: Yeni ceza eklendi. UyeID: ' || NEW.UyeID || ', Tutar: ' || NEW.Tutar,
+        json_object(
+            'CezaID', NEW.CezaID,
+            'UyeID', NEW.UyeID,
+            'Tutar', NEW.Tutar,
+            'GecikmeGunu', NEW.GecikmeGunu
+        )
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_UYE_DELETE_BLOCK
+BEFORE DELETE ON UYE
+FOR EACH ROW
+BEGIN
+    SELECT RAISE(ABORT, 'HATA: Aktif oduncu olan uye silinemez!')
+    WHERE EXISTS (
+        SELECT 1 FROM ODUNC
+        WHERE UyeID = OLD.UyeID AND TeslimTarihi IS NULL
+    );
+
+    SELECT RAISE(ABORT, 'HATA: Borcu olan uye silinemez!')
+    WHERE OLD.ToplamBorc > 0;
+END;
+
+
+-- Dashboard ozet tablolari (triggers.sql'deki *_OZET trigger'larinin karsiligi).
+-- SQLite'ta ON DELETE CASCADE ile silinen CEZA satirlari da trigger calistirir.
+
+CREATE TRIGGER IF NOT EXISTS TR_ODUNC_INSERT_OZET
+AFTER INSERT ON ODUNC
+FOR EACH ROW
+WHEN NEW.TeslimTarihi IS NULL
+BEGIN
+    UPDATE ISTATISTIK_OZET SET AktifOdunc = AktifOdunc + 1 WHERE OzetID = 1;
+
+    INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, AktifOdunc)
+    VALUES (NEW.SonTeslimTarihi, 1)
+    ON CONFLICT (SonTeslimTarihi) DO UPDATE SET AktifOdunc = AktifOdunc + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_ODUNC_UPDATE_OZET
+AFTER UPDATE OF TeslimTarihi, SonTeslimTarihi ON ODUNC
+FOR EACH ROW
+WHEN NOT (OLD.TeslimTarihi IS NEW.TeslimTarihi AND OLD.SonTeslimTarihi IS NEW.SonTeslimTarihi)
+BEGIN
+    UPDATE ODUNC_VADE_OZET
+    SET AktifOdunc = AktifOdunc - 1
+    WHERE SonTeslimTarihi = OLD.SonTeslimTarihi AND OLD.TeslimTarihi IS NULL;
+
+    DELETE FROM ODUNC_VADE_OZET
+    WHERE SonTeslimTarihi = OLD.SonTeslimTarihi AND AktifOdunc <= 0;
+
+    INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, AktifOdunc)
+    SELECT NEW.SonTeslimTarihi, 1
+    WHERE NEW.TeslimTarihi IS NULL
+    ON CONFLICT (SonTeslimTarihi) DO UPDATE SET AktifOdunc = AktifOdunc + 1;
+
+    UPDATE ISTATISTIK_OZET
+    SET AktifOdunc = AktifOdunc + (NEW.TeslimTarihi IS NULL) - (OLD.TeslimTarihi IS NULL)
+    WHERE OzetID = 1 AND (NEW.TeslimTarihi IS NULL) <> (OLD.TeslimTarihi IS NULL);
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_ODUNC_DELETE_OZET
+AFTER DELETE ON ODUNC
+FOR EACH ROW
+WHEN OLD.TeslimTarihi IS NULL
+BEGIN
+    UPDATE ISTATISTIK_OZET SET AktifOdunc = AktifOdunc - 1 WHERE OzetID = 1;
+
+    UPDATE ODUNC_VADE_OZET
+    SET AktifOdunc = AktifOdunc - 1
+    WHERE SonTeslimTarihi = OLD.SonTeslimTarihi;
+
+    DELETE FROM ODUNC_VADE_OZET
+    WHERE SonTeslimTarihi = OLD.SonTeslimTarihi AND AktifOdunc <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_CEZA_INSERT_OZET
+AFTER INSERT ON CEZA
+FOR EACH ROW
+WHEN NOT IFNULL(NEW.OdendiMi, 0)
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET OdenmemisCezaSayisi = OdenmemisCezaSayisi + 1,
+        OdenmemisCezaTutari = ROUND(OdenmemisCezaTutari + NEW.Tutar, 2)
+    WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_CEZA_UPDATE_OZET
+AFTER UPDATE OF OdendiMi, Tutar ON CEZA
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET OdenmemisCezaSayisi = OdenmemisCezaSayisi
+            - (NOT IFNULL(OLD.OdendiMi, 0)) + (NOT IFNULL(NEW.OdendiMi, 0)),
+        OdenmemisCezaTutari = ROUND(OdenmemisCezaTutari
+            - CASE WHEN IFNULL(OLD.OdendiMi, 0) THEN 0 ELSE OLD.Tutar END
+            + CASE WHEN IFNULL(NEW.OdendiMi, 0) THEN 0 ELSE NEW.Tutar END, 2)
+    WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_CEZA_DELETE_OZET
+AFTER DELETE ON CEZA
+FOR EACH ROW
+WHEN NOT IFNULL(OLD.OdendiMi, 0)
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET OdenmemisCezaSayisi = OdenmemisCezaSayisi - 1,
+        OdenmemisCezaTutari = ROUND(OdenmemisCezaTutari - OLD.Tutar, 2)
+    WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_UYE_INSERT_OZET
+AFTER INSERT ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi + 1 WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_UYE_DELETE_OZET
+AFTER DELETE ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi - 1 WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_KITAP_INSERT_OZET
+AFTER INSERT ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi + 1,
+        ToplamAdet = ToplamAdet + NEW.ToplamAdet,
+        MevcutAdet = MevcutAdet + NEW.MevcutAdet
+    WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_KITAP_UPDATE_OZET
+AFTER UPDATE OF ToplamAdet, MevcutAdet ON KITAP
+FOR EACH ROW
+WHEN OLD.ToplamAdet <> NEW.ToplamAdet OR OLD.MevcutAdet <> NEW.MevcutAdet
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET ToplamAdet = ToplamAdet + NEW.ToplamAdet - OLD.ToplamAdet,
+        MevcutAdet = MevcutAdet + NEW.MevcutAdet - OLD.MevcutAdet
+    WHERE OzetID = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS TR_KITAP_DELETE_OZET
+AFTER DELETE ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi - 1,
+        ToplamAdet = ToplamAdet - OLD.ToplamAdet,
+        MevcutAdet = MevcutAdet - OLD.MevcutAdet
+    WHERE OzetID = 1;
+END;
+
+-- Ilk acilista (veya ozet tablolari sonradan eklendiyse) mevcut veriyle doldurulur
+INSERT OR IGNORE INTO ISTATISTIK_OZET (OzetID, UyeSayisi, KitapSayisi, ToplamAdet, MevcutAdet,
+                                      AktifOdunc, OdenmemisCezaSayisi, OdenmemisCezaTutari)
+SELECT 1,
+       (SELECT COUNT(*) FROM UYE),
+       (SELECT COUNT(*) FROM KITAP),
+       (SELECT IFNULL(SUM(ToplamAdet), 0) FROM KITAP),
+       (SELECT IFNULL(SUM(MevcutAdet), 0) FROM KITAP),
+       (SELECT COUNT(*) FROM ODUNC WHERE TeslimTarihi IS NULL),
+       (SELECT COUNT(*) FROM CEZA WHERE NOT IFNULL(OdendiMi, 0)),
+       (SELECT ROUND(IFNULL(SUM(Tutar), 0), 2) FROM CEZA WHERE NOT IFNULL(OdendiMi, 0));
+
+INSERT OR IGNORE INTO ODUNC_VADE_OZET (SonTeslimTarihi, AktifOdunc)
+SELECT SonTeslimTarihi, COUNT(*)
+FROM ODUNC
+WHERE TeslimTarihi IS NULL
+  AND NOT EXISTS (SELECT 1 FROM ODUNC_VADE_OZET)
+GROUP BY SonTeslimTarihi;
@@ -1,7 +1,9 @@
+-- Procedure'leri (yeniden) kurar; tekrar calistirilabilir.
 USE kutuphane_db;
 
 DELIMITER //
 
+DROP PROCEDURE IF EXISTS sp_YeniOduncVer //
 CREATE PROCEDURE sp_YeniOduncVer(
     IN p_UyeID INT,
     IN p_KitapID INT,
@@ -13,10 +15,21 @@ BEGIN
     DECLARE v_OduncTarihi DATE;
     DECLARE v_SonTeslimTarihi DATE;
     DECLARE v_HataMesaji VARCHAR(255);
+    DECLARE v_OduncID INT;
+    
+    DECLARE v_HataKodu INT;
+    DECLARE v_HataDetay VARCHAR(128);
     
     DECLARE EXIT HANDLER FOR SQLEXCEPTION
     BEGIN
+        GET DIAGNOSTICS CONDITION 1
+            v_HataKodu = MYSQL_ERRNO, v_HataDetay = MESSAGE_TEXT;
         ROLLBACK;
+        -- Deadlock / lock wait timeout istemciye iletilir, uygulama tekrar dener
+        IF v_HataKodu IN (1213, 1205) THEN
+            SIGNAL SQLSTATE '40001'
+                SET MYSQL_ERRNO = v_HataKodu, MESSAGE_TEXT = v_HataDetay;
+        END IF;
         SELECT 'HATA: Islem sirasinda bir hata olustu!' AS Sonuc, 0 AS Basarili;
     END;
     
@@ -49,23 +62,29 @@ BEGIN
             INSERT INTO ODUNC (UyeID, KitapID, KullaniciID, OduncTarihi, SonTeslimTarihi)
             VALUES (p_UyeID, p_KitapID, p_KullaniciID, v_OduncTarihi, v_SonTeslimTarihi);
             
+            -- LOG_ISLEM insert'i LAST_INSERT_ID()'yi degistirir, ID hemen alinir
+            SET v_OduncID = LAST_INSERT_ID();
+            
             -- LOG_ISLEM tablosu için optional insert (hatayı yoksay)
             BEGIN
                 DECLARE CONTINUE HANDLER FOR SQLEXCEPTION BEGIN END;
-                INSERT INTO log_islem (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
-                VALUES (
-                    'ODUNC',
-                    'INSERT',
-                    p_KullaniciID,
-                    CONCAT('Yeni odunc verildi. Uye: ', p_UyeID, ', Kitap: ', p_KitapID),
-                    JSON_OBJECT(
-                        'OduncID', LAST_INSERT_ID(),
-                        'UyeID', p_UyeID,
-                        'KitapID', p_KitapID,
-                        'OduncTarihi', v_OduncTarihi,
-                        'SonTeslimTarihi', v_SonTeslimTarihi
-                    )
-                );
+                -- @sp_log_islem = 0: kayit uygulamanin audit kuyrugundan gelir
+                IF IFNULL(@sp_log_islem, 1) THEN
+                    INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+                    VALUES (
+                        'ODUNC',
+                        'INSERT',
+                        p_KullaniciID,
+                        CONCAT('Yeni odunc verildi. Uye: ', p_UyeID, ', Kitap: ', p_KitapID),
+                        JSON_OBJECT(
+                            'OduncID', v_OduncID,
+                            'UyeID', p_UyeID,
+                            'KitapID', p_KitapID,
+                            'OduncTarihi', v_OduncTarihi,
+                            'SonTeslimTarihi', v_SonTeslimTarihi
+                        )
+                    );
+                END IF;
             END;
             
             COMMIT;
@@ -73,7 +92,7 @@ BEGIN
             SELECT 
                 'BASARILI: Odunc islemi tamamlandi!' AS Sonuc,
                 1 AS Basarili,
-                LAST_INSERT_ID() AS OduncID,
+                v_OduncID AS OduncID,
                 v_OduncTarihi AS OduncTarihi,
                 v_SonTeslimTarihi AS SonTeslimTarihi;
         END IF;
@@ -81,6 +100,7 @@ BEGIN
     
 END //
 
+DROP PROCEDURE IF EXISTS sp_KitapTeslimAl //
 CREATE PROCEDURE sp_KitapTeslimAl(
     IN p_OduncID INT,
     IN p_TeslimTarihi DATE
@@ -93,9 +113,19 @@ BEGIN
     DECLARE v_CezaTutari DECIMAL(10, 2);
     DECLARE v_CezaID INT DEFAULT NULL;
     
+    DECLARE v_HataKodu INT;
+    DECLARE v_HataDetay VARCHAR(128);
+    
     DECLARE EXIT HANDLER FOR SQLEXCEPTION
     BEGIN
+        GET DIAGNOSTICS CONDITION 1
+            v_HataKodu = MYSQL_ERRNO, v_HataDetay = MESSAGE_TEXT;
         ROLLBACK;
+        -- Deadlock / lock wait timeout istemciye iletilir, uygulama tekrar dener
+        IF v_HataKodu IN (1213, 1205) THEN
+            SIGNAL SQLSTATE '40001'
+                SET MYSQL_ERRNO = v_HataKodu, MESSAGE_TEXT = v_HataDetay;
+        END IF;
         SELECT 'HATA: Islem sirasinda bir hata olustu!' AS Sonuc, 0 AS Basarili;
     END;
     
@@ -137,18 +167,21 @@ BEGIN
         -- LOG_ISLEM tablosu için optional insert (hatayı yoksay)
         BEGIN
             DECLARE CONTINUE HANDLER FOR SQLEXCEPTION BEGIN END;
-            INSERT INTO log_islem (TabloAdi, IslemTipi, Aciklama, YeniVeri)
-            VALUES (
-                'ODUNC',
-                'UPDATE',
-                CONCAT('Kitap teslim alindi. Odunc ID: ', p_OduncID),
-                JSON_OBJECT(
-                    'OduncID', p_OduncID,
-                    'TeslimTarihi', p_TeslimTarihi,
-                    'GecikmeGunu', v_GecikmeGunu,
-                    'CezaTutari', IFNULL(v_CezaTutari, 0)
-                )
-            );
+            -- @sp_log_islem = 0: kayit uygulamanin audit kuyrugundan gelir
+            IF IFNULL(@sp_log_islem, 1) THEN
+                INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, Aciklama, YeniVeri)
+                VALUES (
+                    'ODUNC',
+                    'UPDATE',
+                    CONCAT('Kitap teslim alindi. Odunc ID: ', p_OduncID),
+                    JSON_OBJECT(
+                        'OduncID', p_OduncID,
+                        'TeslimTarihi', p_TeslimTarihi,
+                        'GecikmeGunu', v_GecikmeGunu,
+                        'CezaTutari', IFNULL(v_CezaTutari, 0)
+                    )
+                );
+            END IF;
         END;
         
         COMMIT;
@@ -172,6 +205,7 @@ BEGIN
     
 END //
 
+DROP PROCEDURE IF EXISTS sp_UyeOzetRapor //
 CREATE PROCEDURE sp_UyeOzetRapor(
     IN p_UyeID INT
 )
@@ -214,6 +248,7 @@ BEGIN
     
 END //
 
+DROP PROCEDURE IF EXISTS sp_KitapAra //
 CREATE PROCEDURE sp_KitapAra(
     IN p_KitapAdi VARCHAR(200),
     IN p_Yazar VARCHAR(100),
@@ -244,6 +279,7 @@ BEGIN
     
 END //
 
+DROP PROCEDURE IF EXISTS sp_AktifOduncSayisi //
 CREATE PROCEDURE sp_AktifOduncSayisi(
     IN p_UyeID INT
 )
@@ -261,4 +297,293 @@ BEGIN
     
 END //
 
+DROP PROCEDURE IF EXISTS sp_TopluOduncVer //
+CREATE PROCEDURE sp_TopluOduncVer(
+    IN p_UyeID INT,
+    IN p_KitapIDler JSON,
+    IN p_KullaniciID INT
+)
+BEGIN
+    -- Bir uyeye birden fazla kitabi tek transaction'da odunc verir.
+    -- p_KitapIDler: JSON dizi, ornek '[3, 8, 12]' (ayni kitap iki kez verilebilir)
+    DECLARE v_AktifOduncSayisi INT;
+    DECLARE v_Adet INT;
+    DECLARE v_Sira INT DEFAULT 0;
+    DECLARE v_KitapID INT;
+    DECLARE v_Eksik TEXT;
+    DECLARE v_StokYok TEXT;
+    DECLARE v_OduncIDler JSON DEFAULT JSON_ARRAY();
+    DECLARE v_OduncTarihi DATE;
+    DECLARE v_SonTeslimTarihi DATE;
+    
+    DECLARE v_HataKodu INT;
+    DECLARE v_HataDetay VARCHAR(128);
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        GET DIAGNOSTICS CONDITION 1
+            v_HataKodu = MYSQL_ERRNO, v_HataDetay = MESSAGE_TEXT;
+        ROLLBACK;
+        -- Deadlock / lock wait timeout istemciye iletilir, uygulama tekrar dener
+        IF v_HataKodu IN (1213, 1205) THEN
+            SIGNAL SQLSTATE '40001'
+                SET MYSQL_ERRNO = v_HataKodu, MESSAGE_TEXT = v_HataDetay;
+        END IF;
+        SELECT 'HATA: Islem sirasinda bir hata olustu!' AS Sonuc, 0 AS Basarili;
+    END;
+    
+    SET v_Adet = IFNULL(JSON_LENGTH(p_KitapIDler), 0);
+    
+    START TRANSACTION;
+    
+    -- Limit kontrolu tek seferde yapilir
+    SELECT COUNT(*) INTO v_AktifOduncSayisi
+    FROM ODUNC
+    WHERE UyeID = p_UyeID AND TeslimTarihi IS NULL;
+    
+    -- Istenen kitaplar satirlari kilitlenerek kontrol edilir
+    SELECT GROUP_CONCAT(j.KitapID ORDER BY j.KitapID)
+    INTO v_Eksik
+    FROM (
+        SELECT DISTINCT t.KitapID
+        FROM JSON_TABLE(p_KitapIDler, '$[*]' COLUMNS (KitapID INT PATH '$')) t
+    ) j
+    LEFT JOIN KITAP k ON k.KitapID = j.KitapID
+    WHERE k.KitapID IS NULL;
+    
+    SELECT GROUP_CONCAT(k.KitapID ORDER BY k.KitapID)
+    INTO v_StokYok
+    FROM KITAP k
+    INNER JOIN (
+        SELECT t.KitapID, COUNT(*) AS Istenen
+        FROM JSON_TABLE(p_KitapIDler, '$[*]' COLUMNS (KitapID INT PATH '$')) t
+        GROUP BY t.KitapID
+    ) j ON j.KitapID = k.KitapID
+    WHERE k.MevcutAdet < j.Istenen
+    FOR UPDATE;
+    
+    IF v_Adet = 0 THEN
+        SELECT 'HATA: Odunc verilecek kitap secilmedi!' AS Sonuc, 0 AS Basarili;
+        ROLLBACK;
+    ELSEIF v_AktifOduncSayisi + v_Adet > 5 THEN
+        SELECT CONCAT('HATA: Uye maksimum 5 aktif odunc alabilir. Su an aktif odunc: ',
+                      v_AktifOduncSayisi, ', istenen: ', v_Adet) AS Sonuc,
+               0 AS Basarili;
+        ROLLBACK;
+    ELSEIF v_Eksik IS NOT NULL THEN
+        SELECT 'HATA: Kitap bulunamadi!' AS Sonuc, 0 AS Basarili, v_Eksik AS KitapIDler;
+        ROLLBACK;
+    ELSEIF v_StokYok IS NOT NULL THEN
+        SELECT 'HATA: Kitap stokta yok!' AS Sonuc, 0 AS Basarili, v_StokYok AS KitapIDler;
+        ROLLBACK;
+    ELSE
+        SET v_OduncTarihi = CURDATE();
+        SET v_SonTeslimTarihi = DATE_ADD(v_OduncTarihi, INTERVAL 15 DAY);
+        
+        -- Trigger her satir icin stoku dusurur
+        WHILE v_Sira < v_Adet DO
+            SET v_KitapID = JSON_EXTRACT(p_KitapIDler, CONCAT('$[', v_Sira, ']'));
+            
+            INSERT INTO ODUNC (UyeID, KitapID, KullaniciID, OduncTarihi, SonTeslimTarihi)
+            VALUES (p_UyeID, v_KitapID, p_KullaniciID, v_OduncTarihi, v_SonTeslimTarihi);
+            
+            SET v_OduncIDler = JSON_ARRAY_APPEND(v_OduncIDler, '$', LAST_INSERT_ID());
+            SET v_Sira = v_Sira + 1;
+        END WHILE;
+        
+        -- Kitap basina degil, islem basina tek log kaydi
+        BEGIN
+            DECLARE CONTINUE HANDLER FOR SQLEXCEPTION BEGIN END;
+            -- @sp_log_islem = 0: kayit uygulamanin audit kuyrugundan gelir
+            IF IFNULL(@sp_log_islem, 1) THEN
+                INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+                VALUES (
+                    'ODUNC',
+                    'INSERT',
+                    p_KullaniciID,
+                    CONCAT('Toplu odunc verildi. Uye: ', p_UyeID, ', Kitap sayisi: ', v_Adet),
+                    JSON_OBJECT(
+                        'OduncIDler', v_OduncIDler,
+                        'UyeID', p_UyeID,
+                        'KitapIDler', p_KitapIDler,
+                        'OduncTarihi', v_OduncTarihi,
+                        'SonTeslimTarihi', v_SonTeslimTarihi
+                    )
+                );
+            END IF;
+        END;
+        
+        COMMIT;
+        
+        SELECT 
+            CONCAT('BASARILI: ', v_Adet, ' kitap odunc verildi!') AS Sonuc,
+            1 AS Basarili,
+            v_Adet AS OduncSayisi,
+            v_OduncIDler AS OduncIDler,
+            v_OduncTarihi AS OduncTarihi,
+            v_SonTeslimTarihi AS SonTeslimTarihi;
+    END IF;
+    
+END //
+
+DROP PROCEDURE IF EXISTS sp_TopluTeslimAl //
+CREATE PROCEDURE sp_TopluTeslimAl(
+    IN p_OduncIDler JSON,
+    IN p_TeslimTarihi DATE
+)
+BEGIN
+    -- Birden fazla odunc kaydini tek transaction'da, kume bazli teslim alir.
+    -- p_OduncIDler: JSON dizi, ornek '[41, 42, 57]'
+    -- Bulunamayan / zaten teslim edilmis kayitlar atlanir ve sonucta HATA olarak doner.
+    DECLARE v_Adet INT DEFAULT 0;
+    DECLARE v_ToplamCeza DECIMAL(10, 2) DEFAULT 0;
+    
+    DECLARE v_HataKodu INT;
+    DECLARE v_HataDetay VARCHAR(128);
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        GET DIAGNOSTICS CONDITION 1
+            v_HataKodu = MYSQL_ERRNO, v_HataDetay = MESSAGE_TEXT;
+        ROLLBACK;
+        DROP TEMPORARY TABLE IF EXISTS tmp_TopluTeslim;
+        -- Deadlock / lock wait timeout istemciye iletilir, uygulama tekrar dener
+        IF v_HataKodu IN (1213, 1205) THEN
+            SIGNAL SQLSTATE '40001'
+                SET MYSQL_ERRNO = v_HataKodu, MESSAGE_TEXT = v_HataDetay;
+        END IF;
+        SELECT 'HATA: Islem sirasinda bir hata olustu!' AS Sonuc, 0 AS Basarili;
+    END;
+    
+    DROP TEMPORARY TABLE IF EXISTS tmp_TopluTeslim;
+    CREATE TEMPORARY TABLE tmp_TopluTeslim (
+        OduncID INT PRIMARY KEY,
+        UyeID INT NOT NULL,
+        GecikmeGunu INT NOT NULL
+    ) ENGINE = MEMORY;
+    
+    START TRANSACTION;
+    
+    -- Teslim edilecek aktif oduncler kilitlenerek alinir
+    INSERT INTO tmp_TopluTeslim (OduncID, UyeID, GecikmeGunu)
+    SELECT o.OduncID, o.UyeID, GREATEST(DATEDIFF(p_TeslimTarihi, o.SonTeslimTarihi), 0)
+    FROM ODUNC o
+    INNER JOIN (
+        SELECT DISTINCT jt.OduncID
+        FROM JSON_TABLE(p_OduncIDler, '$[*]' COLUMNS (OduncID INT PATH '$')) jt
+    ) j ON j.OduncID = o.OduncID
+    WHERE o.TeslimTarihi IS NULL
+    FOR UPDATE;
+    
+    SELECT COUNT(*), IFNULL(SUM(GecikmeGunu * 5.00), 0)
+    INTO v_Adet, v_ToplamCeza
+    FROM tmp_TopluTeslim;
+    
+    -- Tek UPDATE (Trigger her satir icin stoku artirir)
+    UPDATE ODUNC o
+    INNER JOIN tmp_TopluTeslim t ON t.OduncID = o.OduncID
+    SET o.TeslimTarihi = p_TeslimTarihi;
+    
+    -- Tum cezalar tek INSERT ile (Trigger ToplamBorc'u gunceller)
+    INSERT INTO CEZA (OduncID, UyeID, Tutar, GecikmeGunu, Aciklama)
+    SELECT t.OduncID, t.UyeID, t.GecikmeGunu * 5.00, t.GecikmeGunu,
+           CONCAT('Gecikme cezasi: ', t.GecikmeGunu, ' gun gecikme')
+    FROM tmp_TopluTeslim t
+    WHERE t.GecikmeGunu > 0;
+    
+    BEGIN
+        DECLARE CONTINUE HANDLER FOR SQLEXCEPTION BEGIN END;
+        -- @sp_log_islem = 0: kayit uygulamanin audit kuyrugundan gelir
+        IF IFNULL(@sp_log_islem, 1) THEN
+            INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, Aciklama, YeniVeri)
+            VALUES (
+                'ODUNC',
+                'UPDATE',
+                CONCAT('Toplu teslim alindi. Kitap sayisi: ', v_Adet),
+                JSON_OBJECT(
+                    'OduncIDler', p_OduncIDler,
+                    'TeslimTarihi', p_TeslimTarihi,
+                    'TeslimAlinan', v_Adet,
+                    'ToplamCeza', v_ToplamCeza
+                )
+            );
+        END IF;
+    END;
+    
+    COMMIT;
+    
+    -- Istenen her odunc icin bir satir
+    SELECT 
+        j.OduncID,
+        CASE
+            WHEN t.OduncID IS NULL THEN 'HATA: Odunc kaydi bulunamadi veya zaten teslim edilmis!'
+            WHEN t.GecikmeGunu > 0 THEN 'BASARILI: Kitap teslim alindi. Gecikme cezasi eklendi!'
+            ELSE 'BASARILI: Kitap zamaninda teslim alindi.'
+        END AS Sonuc,
+        IF(t.OduncID IS NULL, 0, 1) AS Basarili,
+        IFNULL(t.GecikmeGunu, 0) AS GecikmeGunu,
+        IFNULL(t.GecikmeGunu * 5.00, 0.00) AS CezaTutari,
+        (SELECT MAX(c.CezaID) FROM CEZA c
+         WHERE c.OduncID = t.OduncID AND t.GecikmeGunu > 0) AS CezaID
+    FROM (
+        SELECT DISTINCT jt.OduncID
+        FROM JSON_TABLE(p_OduncIDler, '$[*]' COLUMNS (OduncID INT PATH '$')) jt
+    ) j
+    LEFT JOIN tmp_TopluTeslim t ON t.OduncID = j.OduncID
+    ORDER BY j.OduncID;
+    
+    DROP TEMPORARY TABLE IF EXISTS tmp_TopluTeslim;
+    
+END //
+
+DROP PROCEDURE IF EXISTS sp_OzetYenile //
+CREATE PROCEDURE sp_OzetYenile()
+BEGIN
+    -- ISTATISTIK_OZET ve ODUNC_VADE_OZET tablolarini sifirdan hesaplar.
+    -- Normalde trigger'lar gunceller; bu procedure kayma suphesinde
+    -- (trigger'lar devre disiyken yapilan toplu yukleme vb.) kullanilir.
+    -- Toplamlar 0. slota yazilir, diger slotlar sifirlanir.
+    DECLARE v_SlotSayisi INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+    
+    START TRANSACTION;
+    
+    INSERT INTO ISTATISTIK_OZET (OzetID)
+    VALUES (0), (1), (2), (3), (4), (5), (6), (7), (8), (9), (10), (11), (12), (13), (14), (15)
+    ON DUPLICATE KEY UPDATE OzetID = OzetID;
+    -- Slot satirlarini kilitleyen trigger'lar yeniden hesaplama bitene kadar bekler
+    SELECT COUNT(*) INTO v_SlotSayisi FROM ISTATISTIK_OZET FOR UPDATE;
+    
+    UPDATE ISTATISTIK_OZET
+    SET UyeSayisi = 0, KitapSayisi = 0, ToplamAdet = 0, MevcutAdet = 0,
+        AktifOdunc = 0, OdenmemisCezaSayisi = 0, OdenmemisCezaTutari = 0
+    WHERE OzetID <> 0;
+    
+    UPDATE ISTATISTIK_OZET
+    SET UyeSayisi = (SELECT COUNT(*) FROM UYE),
+        KitapSayisi = (SELECT COUNT(*) FROM KITAP),
+        ToplamAdet = (SELECT IFNULL(SUM(ToplamAdet), 0) FROM KITAP),
+        MevcutAdet = (SELECT IFNULL(SUM(MevcutAdet), 0) FROM KITAP),
+        AktifOdunc = (SELECT COUNT(*) FROM ODUNC WHERE TeslimTarihi IS NULL),
+        OdenmemisCezaSayisi = (SELECT COUNT(*) FROM CEZA WHERE NOT IFNULL(OdendiMi, FALSE)),
+        OdenmemisCezaTutari = (SELECT IFNULL(SUM(Tutar), 0) FROM CEZA WHERE NOT IFNULL(OdendiMi, FALSE))
+    WHERE OzetID = 0;
+    
+    -- Eksi / sifir slot kovalari da burada tek satira toplanir
+    DELETE FROM ODUNC_VADE_OZET;
+    INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+    SELECT SonTeslimTarihi, 0, COUNT(*)
+    FROM ODUNC
+    WHERE TeslimTarihi IS NULL
+    GROUP BY SonTeslimTarihi;
+    
+    COMMIT;
+    
+END //
+
 DELIMITER ;
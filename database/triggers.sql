@@ -1,7 +1,10 @@
+-- Trigger'lari (yeniden) kurar; tekrar calistirilabilir. stored_procedures.sql'den
+-- sonra calistirilir: sonda ozet tablolari sp_OzetYenile ile yeniden hesaplanir.
 USE kutuphane_db;
 
 DELIMITER //
 
+DROP TRIGGER IF EXISTS TR_ODUNC_INSERT //
 CREATE TRIGGER TR_ODUNC_INSERT
 AFTER INSERT ON ODUNC
 FOR EACH ROW
@@ -10,6 +13,14 @@ BEGIN
     SET MevcutAdet = MevcutAdet - 1
     WHERE KitapID = NEW.KitapID;
     
+    IF NEW.TeslimTarihi IS NULL THEN
+        UPDATE ISTATISTIK_OZET SET AktifOdunc = AktifOdunc + 1 WHERE OzetID = CONNECTION_ID() % 16;
+        
+        INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+        VALUES (NEW.SonTeslimTarihi, CONNECTION_ID() % 16, 1)
+        ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc + 1;
+    END IF;
+    
     INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
     VALUES (
         'ODUNC',
@@ -25,6 +36,7 @@ BEGIN
     );
 END //
 
+DROP TRIGGER IF EXISTS TR_ODUNC_UPDATE_TESLIM //
 CREATE TRIGGER TR_ODUNC_UPDATE_TESLIM
 AFTER UPDATE ON ODUNC
 FOR EACH ROW
@@ -48,6 +60,7 @@ BEGIN
     END IF;
 END //
 
+DROP TRIGGER IF EXISTS TR_CEZA_INSERT //
 CREATE TRIGGER TR_CEZA_INSERT
 AFTER INSERT ON CEZA
 FOR EACH ROW
@@ -56,6 +69,13 @@ BEGIN
     SET ToplamBorc = ToplamBorc + NEW.Tutar
     WHERE UyeID = NEW.UyeID;
     
+    IF NOT IFNULL(NEW.OdendiMi, FALSE) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi + 1,
+            OdenmemisCezaTutari = OdenmemisCezaTutari + NEW.Tutar
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+    
     INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, Aciklama, YeniVeri)
     VALUES (
         'CEZA',
@@ -70,6 +90,7 @@ BEGIN
     );
 END //
 
+DROP TRIGGER IF EXISTS TR_UYE_DELETE_BLOCK //
 CREATE TRIGGER TR_UYE_DELETE_BLOCK
 BEFORE DELETE ON UYE
 FOR EACH ROW
@@ -94,4 +115,164 @@ BEGIN
     END IF;
 END //
 
+-- ---------------------------------------------
+-- Dashboard ozet tablolari (ISTATISTIK_OZET, ODUNC_VADE_OZET)
+-- Her baglanti kendi slot satirini (CONNECTION_ID() % 16) gunceller;
+-- eszamanli islemler tek ozet satirinin kilidinde beklemez.
+-- ---------------------------------------------
+
+DROP TRIGGER IF EXISTS TR_ODUNC_UPDATE_OZET //
+CREATE TRIGGER TR_ODUNC_UPDATE_OZET
+AFTER UPDATE ON ODUNC
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.TeslimTarihi <=> NEW.TeslimTarihi
+            AND OLD.SonTeslimTarihi <=> NEW.SonTeslimTarihi) THEN
+        -- Teslim, teslimin geri alinmasi ve sure uzatma ayni sekilde islenir
+        IF OLD.TeslimTarihi IS NULL THEN
+            -- Odunc baska slota yazilmis olabilir: bu slot eksiye duser
+            INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+            VALUES (OLD.SonTeslimTarihi, CONNECTION_ID() % 16, -1)
+            ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc - 1;
+            
+            DELETE FROM ODUNC_VADE_OZET
+            WHERE SonTeslimTarihi = OLD.SonTeslimTarihi
+              AND Slot = CONNECTION_ID() % 16 AND AktifOdunc = 0;
+        END IF;
+        
+        IF NEW.TeslimTarihi IS NULL THEN
+            INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+            VALUES (NEW.SonTeslimTarihi, CONNECTION_ID() % 16, 1)
+            ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc + 1;
+        END IF;
+        
+        IF (OLD.TeslimTarihi IS NULL) <> (NEW.TeslimTarihi IS NULL) THEN
+            UPDATE ISTATISTIK_OZET
+            SET AktifOdunc = AktifOdunc + IF(NEW.TeslimTarihi IS NULL, 1, -1)
+            WHERE OzetID = CONNECTION_ID() % 16;
+        END IF;
+    END IF;
+END //
+
+-- BEFORE: ON DELETE CASCADE ile silinen CEZA satirlari trigger calistirmaz,
+-- odenmemis cezalari silinmeden once dusulur
+DROP TRIGGER IF EXISTS TR_ODUNC_DELETE_OZET //
+CREATE TRIGGER TR_ODUNC_DELETE_OZET
+BEFORE DELETE ON ODUNC
+FOR EACH ROW
+BEGIN
+    DECLARE v_CezaSayisi INT;
+    DECLARE v_CezaTutari DECIMAL(12, 2);
+    
+    SELECT COUNT(*), IFNULL(SUM(Tutar), 0) INTO v_CezaSayisi, v_CezaTutari
+    FROM CEZA
+    WHERE OduncID = OLD.OduncID AND NOT IFNULL(OdendiMi, FALSE);
+    
+    UPDATE ISTATISTIK_OZET
+    SET AktifOdunc = AktifOdunc - IF(OLD.TeslimTarihi IS NULL, 1, 0),
+        OdenmemisCezaSayisi = OdenmemisCezaSayisi - v_CezaSayisi,
+        OdenmemisCezaTutari = OdenmemisCezaTutari - v_CezaTutari
+    WHERE OzetID = CONNECTION_ID() % 16;
+    
+    IF OLD.TeslimTarihi IS NULL THEN
+        INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, Slot, AktifOdunc)
+        VALUES (OLD.SonTeslimTarihi, CONNECTION_ID() % 16, -1)
+        ON DUPLICATE KEY UPDATE AktifOdunc = AktifOdunc - 1;
+        
+        DELETE FROM ODUNC_VADE_OZET
+        WHERE SonTeslimTarihi = OLD.SonTeslimTarihi
+          AND Slot = CONNECTION_ID() % 16 AND AktifOdunc = 0;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_CEZA_UPDATE_OZET //
+CREATE TRIGGER TR_CEZA_UPDATE_OZET
+AFTER UPDATE ON CEZA
+FOR EACH ROW
+BEGIN
+    DECLARE v_EskiAcik BOOLEAN;
+    DECLARE v_YeniAcik BOOLEAN;
+    
+    SET v_EskiAcik = NOT IFNULL(OLD.OdendiMi, FALSE);
+    SET v_YeniAcik = NOT IFNULL(NEW.OdendiMi, FALSE);
+    
+    IF v_EskiAcik <> v_YeniAcik OR (v_YeniAcik AND OLD.Tutar <> NEW.Tutar) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi - v_EskiAcik + v_YeniAcik,
+            OdenmemisCezaTutari = OdenmemisCezaTutari
+                - IF(v_EskiAcik, OLD.Tutar, 0) + IF(v_YeniAcik, NEW.Tutar, 0)
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_CEZA_DELETE_OZET //
+CREATE TRIGGER TR_CEZA_DELETE_OZET
+AFTER DELETE ON CEZA
+FOR EACH ROW
+BEGIN
+    IF NOT IFNULL(OLD.OdendiMi, FALSE) THEN
+        UPDATE ISTATISTIK_OZET
+        SET OdenmemisCezaSayisi = OdenmemisCezaSayisi - 1,
+            OdenmemisCezaTutari = OdenmemisCezaTutari - OLD.Tutar
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_UYE_INSERT_OZET //
+CREATE TRIGGER TR_UYE_INSERT_OZET
+AFTER INSERT ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi + 1 WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+DROP TRIGGER IF EXISTS TR_UYE_DELETE_OZET //
+CREATE TRIGGER TR_UYE_DELETE_OZET
+AFTER DELETE ON UYE
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET SET UyeSayisi = UyeSayisi - 1 WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+DROP TRIGGER IF EXISTS TR_KITAP_INSERT_OZET //
+CREATE TRIGGER TR_KITAP_INSERT_OZET
+AFTER INSERT ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi + 1,
+        ToplamAdet = ToplamAdet + NEW.ToplamAdet,
+        MevcutAdet = MevcutAdet + NEW.MevcutAdet
+    WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
+-- ODUNC trigger'larinin MevcutAdet guncellemeleri de buradan gecer
+DROP TRIGGER IF EXISTS TR_KITAP_UPDATE_OZET //
+CREATE TRIGGER TR_KITAP_UPDATE_OZET
+AFTER UPDATE ON KITAP
+FOR EACH ROW
+BEGIN
+    IF OLD.ToplamAdet <> NEW.ToplamAdet OR OLD.MevcutAdet <> NEW.MevcutAdet THEN
+        UPDATE ISTATISTIK_OZET
+        SET ToplamAdet = ToplamAdet + NEW.ToplamAdet - OLD.ToplamAdet,
+            MevcutAdet = MevcutAdet + NEW.MevcutAdet - OLD.MevcutAdet
+        WHERE OzetID = CONNECTION_ID() % 16;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS TR_KITAP_DELETE_OZET //
+CREATE TRIGGER TR_KITAP_DELETE_OZET
+AFTER DELETE ON KITAP
+FOR EACH ROW
+BEGIN
+    UPDATE ISTATISTIK_OZET
+    SET KitapSayisi = KitapSayisi - 1,
+        ToplamAdet = ToplamAdet - OLD.ToplamAdet,
+        MevcutAdet = MevcutAdet - OLD.MevcutAdet
+    WHERE OzetID = CONNECTION_ID() % 16;
+END //
+
 DELIMITER ;
+
+-- Ozet tablolarini mevcut veriyle doldur; sonrasini trigger'lar gunceller
+CALL sp_OzetYenile();
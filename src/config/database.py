@@ -7,6 +7,8 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from src.database.row_factory import DEFAULT_ROW_FACTORIES
+
 
 # Proje root dizinini bul
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -25,6 +27,97 @@ class DatabaseConfig:
     USER = os.getenv('DB_USER', 'root')
     PASSWORD = os.getenv('DB_PASSWORD', '')
     
+    # Veritabani backend'i: mysql / sqlite (sunucusuz, tek dosya)
+    BACKEND = os.getenv('DB_BACKEND', 'mysql').lower()
+    SQLITE_PATH = os.getenv('DB_SQLITE_PATH', str(BASE_DIR / 'data' / 'kutuphane.db'))
+    SQLITE_BUSY_TIMEOUT = float(os.getenv('DB_SQLITE_BUSY_TIMEOUT', 30))
+    
+    # Okuma replikasi (opsiyonel, bos ise tum sorgular primary'ye gider)
+    REPLICA_HOST = os.getenv('DB_REPLICA_HOST', '')
+    REPLICA_PORT = int(os.getenv('DB_REPLICA_PORT', PORT))
+    REPLICA_USER = os.getenv('DB_REPLICA_USER', USER)
+    REPLICA_PASSWORD = os.getenv('DB_REPLICA_PASSWORD', PASSWORD)
+    REPLICA_POOL_SIZE = int(os.getenv('DB_REPLICA_POOL_SIZE', os.getenv('DB_POOL_SIZE', 5)))
+    # Yazma sonrasi bu sure boyunca okumalar primary'den yapilir (sn)
+    READ_YOUR_WRITES_SECONDS = float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', 5))
+    
+    # Connection pool ayarlari
+    POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', 0))
+    POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 3600))
+    # Her iadede COM_RESET_CONNECTION (varsayilan kapali, acik transaction yine rollback edilir)
+    POOL_RESET_SESSION = os.getenv('DB_POOL_RESET_SESSION', 'False').lower() == 'true'
+    # Bu sureden uzun bosta kalan baglanti checkout'ta ping'lenir (sn)
+    POOL_VALIDATE_IDLE = float(os.getenv('DB_POOL_VALIDATE_IDLE', 30))
+    # Bosta bekleyen baglantilarin ping araligi (sn, 0: kapali)
+    POOL_KEEPALIVE = float(os.getenv('DB_POOL_KEEPALIVE', 300))
+    # Login ekraninda arka planda onceden acilacak baglanti sayisi (0: kapali)
+    POOL_WARM_SIZE = int(os.getenv('DB_POOL_WARM_SIZE', POOL_SIZE))
+    
+    # Session ayarlari (fiziksel baglanti basina bir kez, bos ise sunucu varsayilani)
+    TIME_ZONE = os.getenv('DB_TIME_ZONE', '')
+    SQL_MODE = os.getenv('DB_SQL_MODE', '')
+    
+    # Sorgu izleme ve yavas sorgu logu
+    SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 500))
+    SLOW_QUERY_LOG = os.getenv('DB_SLOW_QUERY_LOG', str(BASE_DIR / 'logs' / 'slow_query.log'))
+    SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv('DB_SLOW_QUERY_LOG_MAX_BYTES', 5 * 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUPS = int(os.getenv('DB_SLOW_QUERY_LOG_BACKUPS', 5))
+    SLOW_QUERY_EXPLAIN = os.getenv('DB_SLOW_QUERY_EXPLAIN', 'True').lower() == 'true'
+    
+    # Prepared statement modu (opsiyonel)
+    PREPARED_STATEMENTS = os.getenv('DB_PREPARED_STATEMENTS', 'False').lower() == 'true'
+    STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 64))
+    
+    # Deadlock (1213) / lock wait timeout (1205) tekrar denemesi
+    RETRY_ATTEMPTS = int(os.getenv('DB_RETRY_ATTEMPTS', 3))
+    RETRY_BASE_DELAY = float(os.getenv('DB_RETRY_BASE_DELAY', 0.05))
+    RETRY_MAX_DELAY = float(os.getenv('DB_RETRY_MAX_DELAY', 1.0))
+    # Idempotency anahtarli procedure sonuclarinin saklanma suresi (sn)
+    IDEMPOTENCY_TTL = float(os.getenv('DB_IDEMPOTENCY_TTL', 600))
+    
+    # Toplu yukleme (execute_many / load_data)
+    BULK_CHUNK_ROWS = int(os.getenv('DB_BULK_CHUNK_ROWS', 5000))
+    # Parca boyutu siniri (byte), 0 ise sunucunun max_allowed_packet degeri
+    BULK_MAX_PACKET = int(os.getenv('DB_BULK_MAX_PACKET', 0))
+    # LOAD DATA LOCAL INFILE (sunucuda local_infile=ON olmali)
+    LOCAL_INFILE = os.getenv('DB_LOCAL_INFILE', 'False').lower() == 'true'
+    
+    # LOG_ISLEM aylik partition rotasyonu (src/database/log_archive.py)
+    LOG_ARCHIVE_DIR = os.getenv('DB_LOG_ARCHIVE_DIR', str(BASE_DIR / 'logs' / 'log_islem_arsiv'))
+    # Bu kadar aydan eski partition'lar arsivlenip silinir
+    LOG_RETENTION_MONTHS = int(os.getenv('DB_LOG_RETENTION_MONTHS', 6))
+    # Onceden acik tutulacak gelecek ay partition'lari
+    LOG_PARTITIONS_AHEAD = int(os.getenv('DB_LOG_PARTITIONS_AHEAD', 3))
+    
+    # Uygulama tarafi audit kuyrugu (src/database/audit.py): model yazma
+    # metodlarinin olaylari LOG_ISLEM'e arka planda toplu INSERT ile yazilir
+    AUDIT_ENABLED = os.getenv('DB_AUDIT_ENABLED', 'False').lower() == 'true'
+    AUDIT_FLUSH_MS = float(os.getenv('DB_AUDIT_FLUSH_MS', 500))
+    AUDIT_BATCH_SIZE = int(os.getenv('DB_AUDIT_BATCH_SIZE', 200))
+    # Yazilmamis olaylar burada JSONL olarak tutulur, acilista tekrar gonderilir
+    AUDIT_SPOOL_DIR = os.getenv('DB_AUDIT_SPOOL_DIR', str(BASE_DIR / 'logs' / 'audit_spool'))
+    # Her olaydan sonra fsync (elektrik kesintisine karsi, yavas)
+    AUDIT_SPOOL_FSYNC = os.getenv('DB_AUDIT_SPOOL_FSYNC', 'False').lower() == 'true'
+    # Kalici hatayla bu kadar kez yazilamayan segment karantinaya (*.failed) alinir
+    AUDIT_MAX_ATTEMPTS = int(os.getenv('DB_AUDIT_MAX_ATTEMPTS', 3))
+    # Procedure icindeki LOG_ISLEM insert'leri. Varsayilan: audit kuyrugu
+    # aciksa kapali (ayni olay iki kez yazilmaz). Acikken her odunc verme ve
+    # teslim alma LOG_ISLEM'e bir satir ekler.
+    PROCEDURE_LOG = os.getenv(
+        'DB_PROCEDURE_LOG', str(not AUDIT_ENABLED)
+    ).lower() == 'true'
+    
+    # Varsayilan satir tipi: dict / record (anahtar erisimi olan tipler;
+    # tuple / namedtuple sadece cagri bazinda row_factory ile istenir)
+    ROW_FACTORY = os.getenv('DB_ROW_FACTORY', 'dict').lower()
+    
+    # Sorgu sonuc cache'i (sadece cache=True ile istenen sorgular icin)
+    QUERY_CACHE_ENABLED = os.getenv('DB_QUERY_CACHE', 'True').lower() == 'true'
+    QUERY_CACHE_SIZE = int(os.getenv('DB_QUERY_CACHE_SIZE', 256))
+    QUERY_CACHE_TTL = float(os.getenv('DB_QUERY_CACHE_TTL', 60))
+    
     @classmethod
     def get_config(cls):
         """
@@ -42,7 +135,8 @@ class DatabaseConfig:
             'charset': 'utf8mb4',
             'collation': 'utf8mb4_turkish_ci',
             'autocommit': False,
-            'raise_on_warnings': True
+            'raise_on_warnings': True,
+            'allow_local_infile': cls.LOCAL_INFILE
         }
     
     @classmethod
@@ -56,8 +150,85 @@ class DatabaseConfig:
         config = cls.get_config()
         config.update({
             'pool_name': 'kutuphane_pool',
-            'pool_size': 5,
-            'pool_reset_session': True
+            'pool_size': cls.POOL_SIZE,
+            'pool_max_overflow': cls.POOL_MAX_OVERFLOW,
+            'pool_timeout': cls.POOL_TIMEOUT,
+            'pool_recycle': cls.POOL_RECYCLE,
+            # Session reset sunucudaki prepared statement'lari siler
+            'pool_reset_session': cls.POOL_RESET_SESSION and not cls.PREPARED_STATEMENTS,
+            'pool_validate_idle': cls.POOL_VALIDATE_IDLE,
+            'pool_keepalive': cls.POOL_KEEPALIVE,
+            'session_init': cls.get_session_init()
+        })
+        return config
+    
+    @classmethod
+    def get_session_init(cls):
+        """
+        Yeni fiziksel baglantida bir kez calisacak SET ifadeleri.
+        charset / collation baglanti parametreleriyle zaten bir kez ayarlanir.
+        
+        Returns:
+            list: SQL ifadeleri
+        """
+        assignments = []
+        if cls.TIME_ZONE:
+            assignments.append(f"time_zone = '{cls.TIME_ZONE}'")
+        if cls.SQL_MODE:
+            assignments.append(f"sql_mode = '{cls.SQL_MODE}'")
+        statements = []
+        if assignments:
+            statements.append(f"SET SESSION {', '.join(assignments)}")
+        if not cls.PROCEDURE_LOG:
+            # Procedure'ler @sp_log_islem = 0 ise LOG_ISLEM'e yazmaz
+            statements.append("SET @sp_log_islem = 0")
+        return statements
+    
+    @classmethod
+    def get_sqlite_pool_config(cls):
+        """
+        SQLite backend'i icin pool konfigurasyonunu dondurur
+        
+        Returns:
+            dict: Pool konfigurasyonu (connector haric)
+        """
+        return {
+            'database': cls.SQLITE_PATH,
+            'busy_timeout': cls.SQLITE_BUSY_TIMEOUT,
+            'pool_name': 'kutuphane_sqlite_pool',
+            'pool_size': cls.POOL_SIZE,
+            'pool_max_overflow': cls.POOL_MAX_OVERFLOW,
+            'pool_timeout': cls.POOL_TIMEOUT,
+            # Yerel dosya baglantisi zaman asimina ugramaz, ping gereksiz
+            'pool_recycle': 0,
+            'pool_validate_idle': None,
+            'pool_keepalive': 0
+        }
+    
+    @classmethod
+    def is_sqlite(cls):
+        """SQLite backend'i mi kullaniliyor?"""
+        return cls.BACKEND == 'sqlite'
+    
+    @classmethod
+    def get_replica_pool_config(cls):
+        """
+        Okuma replikasi icin pool konfigurasyonunu dondurur
+        
+        Returns:
+            dict/None: Pool konfigurasyonu (replika tanimli degilse None)
+        """
+        if not cls.REPLICA_HOST or cls.is_sqlite():
+            return None
+        
+        config = cls.get_pool_config()
+        config.update({
+            'host': cls.REPLICA_HOST,
+            'port': cls.REPLICA_PORT,
+            'user': cls.REPLICA_USER,
+            'password': cls.REPLICA_PASSWORD,
+            'pool_name': 'kutuphane_read_pool',
+            'pool_size': cls.REPLICA_POOL_SIZE
         })
         return config
     
@@ -69,6 +240,18 @@ class DatabaseConfig:
         Returns:
             tuple: (bool, str) - (Gecerli mi, Hata mesaji)
         """
+        if cls.BACKEND not in ('mysql', 'sqlite'):
+            return False, f"Bilinmeyen DB_BACKEND: {cls.BACKEND}"
+        
+        if cls.ROW_FACTORY not in DEFAULT_ROW_FACTORIES:
+            return False, (f"Gecersiz DB_ROW_FACTORY: {cls.ROW_FACTORY} "
+                           f"(gecerli: {', '.join(DEFAULT_ROW_FACTORIES)})")
+        
+        if cls.is_sqlite():
+            if not cls.SQLITE_PATH:
+                return False, "DB_SQLITE_PATH tanimlanmamis"
+            return True, "Konfigurasi gecerli"
+        
         if not cls.HOST:
             return False, "DB_HOST tanimlanmamis"
         
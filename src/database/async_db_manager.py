@@ -0,0 +1,247 @@
+"""
+Kutuphane Yonetim Sistemi - Asenkron Veritabani Yoneticisi
+asyncio tabanli connection pool ve veritabani islemleri (aiomysql)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+try:
+    import aiomysql
+except ImportError:  # Opsiyonel bagimlilik
+    aiomysql = None
+
+from src.config.database import DatabaseConfig
+from src.database.db_manager import DatabaseManager
+
+
+# transaction() blogu icindeki baglanti (asyncio task bazinda)
+_async_transaction_connection = ContextVar('async_transaction_connection', default=None)
+
+
+class AsyncDatabaseManager:
+    """
+    DatabaseManager'in asyncio karsiligi. Tek event loop uzerinde yuzlerce
+    es zamanli sorguyu thread acmadan calistirir. Senkron API'yi etkilemez;
+    sorgu istatistikleri ayni QueryMonitor'a yazilir.
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._pool_lock = None
+
+    async def _get_pool(self):
+        """Pool'u ilk kullanimda (calisan event loop icinde) olusturur"""
+        if self._pool is not None:
+            return self._pool
+
+        if aiomysql is None:
+            raise RuntimeError("Asenkron backend icin aiomysql gerekli: pip install aiomysql")
+
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = await aiomysql.create_pool(
+                    host=DatabaseConfig.HOST,
+                    port=DatabaseConfig.PORT,
+                    user=DatabaseConfig.USER,
+                    password=DatabaseConfig.PASSWORD,
+                    db=DatabaseConfig.NAME,
+                    charset='utf8mb4',
+                    init_command=self._init_command(),
+                    # Tek ifadeler kendiligindan commit edilir, transaction()
+                    # blogu acikca BEGIN/COMMIT yapar
+                    autocommit=True,
+                    minsize=1,
+                    maxsize=DatabaseConfig.POOL_SIZE + DatabaseConfig.POOL_MAX_OVERFLOW,
+                    pool_recycle=DatabaseConfig.POOL_RECYCLE
+                )
+                print("[ASYNC DB] Connection pool olusturuldu")
+        return self._pool
+
+    @staticmethod
+    def _init_command():
+        """Her yeni baglantida calisacak SET ifadesi"""
+        command = "SET NAMES utf8mb4 COLLATE utf8mb4_turkish_ci"
+        if not DatabaseConfig.PROCEDURE_LOG:
+            command += ", @sp_log_islem = 0"
+        return command
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """
+        Async context manager ile baglanti al
+
+        Yields:
+            connection: aiomysql baglantisi
+        """
+        bound = _async_transaction_connection.get()
+        if bound is not None:
+            yield bound
+            return
+
+        pool = await self._get_pool()
+        started = time.perf_counter()
+        connection = await asyncio.wait_for(pool.acquire(), DatabaseConfig.POOL_TIMEOUT)
+        connection.wait_time = time.perf_counter() - started
+        try:
+            yield connection
+        except aiomysql.MySQLError as e:
+            print(f"[ASYNC DB ERROR] Baglanti hatasi: {e}")
+            raise
+        finally:
+            pool.release(connection)
+
+    def _record(self, kind, query, params, started, conn, rows):
+        """Sorgu suresini senkron yonetici ile ortak monitore kaydeder"""
+        DatabaseManager._monitor.record(
+            kind, query, params,
+            elapsed=time.perf_counter() - started,
+            rows=rows,
+            wait_time=getattr(conn, 'wait_time', 0.0)
+        )
+
+    async def execute_query(self, query, params=None, fetch_one=False):
+        """
+        SELECT sorgusu calistirir
+
+        Args:
+            query (str): SQL sorgusu
+            params (tuple): Parametre degerleri
+            fetch_one (bool): Tek satir mi donsun?
+
+        Returns:
+            list/dict: Sorgu sonucu
+        """
+        started = time.perf_counter()
+        try:
+            async with self.get_connection() as conn:
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params or ())
+                    if fetch_one:
+                        result = await cursor.fetchone()
+                        row_count = 1 if result else 0
+                    else:
+                        result = list(await cursor.fetchall())
+                        row_count = len(result)
+                self._record('query', query, params, started, conn, row_count)
+                return result
+
+        except aiomysql.MySQLError as e:
+            print(f"[ASYNC DB ERROR] Sorgu hatasi: {e}")
+            print(f"[ASYNC DB ERROR] Query: {query}")
+            raise
+
+    async def execute_update(self, query, params=None):
+        """
+        INSERT, UPDATE, DELETE sorgusu calistirir
+
+        Args:
+            query (str): SQL sorgusu
+            params (tuple): Parametre degerleri
+
+        Returns:
+            tuple: (affected_rows, last_insert_id)
+        """
+        started = time.perf_counter()
+        try:
+            async with self.get_connection() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params or ())
+                    affected_rows = cursor.rowcount
+                    last_id = cursor.lastrowid
+                self._record('update', query, params, started, conn, affected_rows)
+                return affected_rows, last_id
+
+        except aiomysql.MySQLError as e:
+            print(f"[ASYNC DB ERROR] Update hatasi: {e}")
+            print(f"[ASYNC DB ERROR] Query: {query}")
+            raise
+
+    async def call_procedure(self, proc_name, params=None):
+        """
+        Stored procedure calistirir
+
+        Args:
+            proc_name (str): Procedure adi
+            params (tuple): Parametre degerleri
+
+        Returns:
+            list: Procedure sonuclari (tum result set'ler)
+        """
+        started = time.perf_counter()
+        try:
+            async with self.get_connection() as conn:
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.callproc(proc_name, params or ())
+
+                    results = list(await cursor.fetchall() or [])
+                    while await cursor.nextset():
+                        results.extend(await cursor.fetchall() or [])
+                self._record('procedure', proc_name, params, started, conn, len(results))
+                return results
+
+        except aiomysql.MySQLError as e:
+            print(f"[ASYNC DB ERROR] Procedure hatasi: {e}")
+            print(f"[ASYNC DB ERROR] Procedure: {proc_name}")
+            raise
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Blok icindeki tum cagrilari tek baglanti ve tek commit ile calistirir.
+        DatabaseManager.transaction() ile ayni anlamdadir.
+
+        Example:
+            async with async_db_manager.transaction():
+                await AsyncPenalty.pay_penalty(ceza_id)
+        """
+        bound = _async_transaction_connection.get()
+        if bound is not None:
+            yield bound
+            return
+
+        async with self.get_connection() as connection:
+            token = _async_transaction_connection.set(connection)
+            try:
+                await connection.begin()
+                yield connection
+                await connection.commit()
+            except BaseException:
+                try:
+                    await connection.rollback()
+                except aiomysql.MySQLError as e:
+                    print(f"[ASYNC DB ERROR] Rollback hatasi: {e}")
+                raise
+            finally:
+                _async_transaction_connection.reset(token)
+
+    async def test_connection(self):
+        """
+        Veritabani baglantisini test eder
+
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        try:
+            row = await self.execute_query("SELECT DATABASE() AS db, VERSION() AS version",
+                                           fetch_one=True)
+            return True, f"Baglanti basarili! DB: {row['db']}, Version: {row['version']}"
+        except Exception as e:
+            return False, f"Baglanti hatasi: {e}"
+
+    async def close_pool(self):
+        """Connection pool'u kapatir"""
+        if self._pool is not None:
+            print("[ASYNC DB] Connection pool kapatiliyor...")
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+
+# Paylasilan instance (pool ilk await'te olusturulur)
+async_db_manager = AsyncDatabaseManager()
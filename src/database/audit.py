@@ -0,0 +1,342 @@
+"""
+Kutuphane Yonetim Sistemi - Audit Kuyrugu
+Model yazma metodlarinin olaylarini islem transaction'inin disinda,
+arka plan thread'inde LOG_ISLEM'e cok satirli INSERT ile yazar.
+
+Olaylar once yerel spool dosyasina (JSONL segmenti) eklenir. Her flush'ta
+acik segment kapatilip yenisine gecilir; kapali segment veritabanina
+yazildiktan sonra silinir. Surec cokerse kalan segmentler bir sonraki
+acilista gonderilir (en az bir kez teslim: INSERT ile silme arasinda
+coken surec ayni olaylari iki kez yazabilir). Spool dizini uygulama
+ornegi basina ayri olmalidir.
+
+Kalici hatayla (kolona sigmayan deger, bolumu olmayan tarih vb.)
+AUDIT_MAX_ATTEMPTS kez yazilamayan segment '.failed' uzantisiyla
+karantinaya alinir; sonraki segmentler onun arkasinda beklemez.
+
+Kullanim:
+    DB_AUDIT_ENABLED=true        # olaylari kuyruga al; DB_PROCEDURE_LOG
+                                 # verilmezse procedure kayitlari kapanir
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from mysql.connector import errors
+
+from src.config.database import DatabaseConfig
+from src.database.db_manager import db_manager
+from src.database.retry import retry_reason
+from src.utils.constants import TABLE_LOG_ISLEM
+
+
+AUDIT_COLUMNS = ('TabloAdi', 'IslemTipi', 'IslemTarihi', 'KullaniciID',
+                 'Aciklama', 'EskiVeri', 'YeniVeri')
+
+AUDIT_INSERT = (
+    f"INSERT INTO {TABLE_LOG_ISLEM} ({', '.join(AUDIT_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(AUDIT_COLUMNS))})"
+)
+
+SEGMENT_SUFFIX = '.jsonl'
+FAILED_SUFFIX = '.failed'
+
+# Baglanti / kilit kaynakli hatalar: segment sayaci artmaz, sonra tekrar denenir
+TRANSIENT_ERRORS = (errors.InterfaceError, errors.OperationalError, errors.PoolError)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"JSON'a cevrilemez: {type(value).__name__}")
+
+
+def _to_json(value):
+    """EskiVeri / YeniVeri kolonu icin JSON metni (None ise NULL)"""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def update_diff(existing, updates, params):
+    """
+    Model update() metodlarinin SET listesinden degisen alanlari cikarir
+
+    Args:
+        existing (dict): Guncelleme oncesi kayit
+        updates (list): "Kolon = %s" ifadeleri
+        params (list): Ifadelerin degerleri (sondaki WHERE parametresi atlanir)
+
+    Returns:
+        tuple: (eski_veri: dict, yeni_veri: dict)
+    """
+    fields = [update.split(' = ')[0] for update in updates]
+    eski = {field: existing.get(field) for field in fields}
+    return eski, dict(zip(fields, params))
+
+
+def read_segment(path):
+    """
+    Spool segmentindeki olaylari INSERT parametrelerine cevirir. Cokme
+    aninda yarim kalmis son satir atlanir.
+
+    Args:
+        path (Path): Segment dosyasi
+
+    Returns:
+        list: AUDIT_COLUMNS sirasinda tuple listesi
+    """
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            rows.append(tuple(event.get(column) for column in AUDIT_COLUMNS))
+    return rows
+
+
+class AuditWriter:
+    """
+    Spool dosyali, toplu yazan audit kuyrugu. emit() sadece dosyaya
+    ekleme yapar; veritabani yazmasi flush_ms'de bir veya batch_size
+    olay biriktiginde arka plan thread'inde yapilir.
+    """
+
+    def __init__(self, spool_dir=None, flush_ms=None, batch_size=None, fsync=None,
+                 max_attempts=None):
+        self.spool_dir = Path(spool_dir or DatabaseConfig.AUDIT_SPOOL_DIR)
+        self.flush_interval = (flush_ms if flush_ms is not None else DatabaseConfig.AUDIT_FLUSH_MS) / 1000
+        self.batch_size = batch_size or DatabaseConfig.AUDIT_BATCH_SIZE
+        self.fsync = DatabaseConfig.AUDIT_SPOOL_FSYNC if fsync is None else fsync
+        self.max_attempts = max_attempts or DatabaseConfig.AUDIT_MAX_ATTEMPTS
+
+        self._lock = threading.Lock()         # acik segment
+        self._flush_lock = threading.Lock()   # kapali segmentler
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self._file = None
+        self._path = None
+        self._count = 0
+        self._seq = 0
+        self._closed = []
+        self._failures = {}
+
+        self._stats = {'emitted': 0, 'written': 0, 'flushes': 0, 'errors': 0,
+                       'quarantined': 0}
+
+    def start(self):
+        """Onceki calismadan kalan segmentleri siraya alir ve thread'i baslatir"""
+        if self._thread is not None:
+            return
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        leftovers = sorted(self.spool_dir.glob(f'*{SEGMENT_SUFFIX}'))
+        if leftovers:
+            print(f"[AUDIT] {len(leftovers)} yazilmamis spool segmenti bulundu")
+        self._closed.extend(leftovers)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+        self._thread.start()
+
+    def emit(self, event):
+        """
+        Olayi spool'a ekler
+
+        Args:
+            event (dict): AUDIT_COLUMNS anahtarli olay
+        """
+        line = json.dumps(event, ensure_ascii=False, default=_json_default) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._count += 1
+            self._stats['emitted'] += 1
+            full = self._count >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def _open_segment(self):
+        """Yeni segment dosyasi acar (_lock altinda)"""
+        self._seq += 1
+        name = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{self._seq:06d}{SEGMENT_SUFFIX}"
+        self._path = self.spool_dir / name
+        self._file = open(self._path, 'a', encoding='utf-8')
+        self._count = 0
+
+    def _rotate(self):
+        """Acik segmenti kapatip yazilacaklar listesine ekler"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._closed.append(self._path)
+            self._file = None
+            self._path = None
+            self._count = 0
+
+    def flush(self):
+        """
+        Kapali ve acik segmentleri sirayla LOG_ISLEM'e yazar. Yazilamayan
+        segment (ve sonrakiler) bir sonraki flush'ta tekrar denenir; kalici
+        hatayla max_attempts kez yazilamayan segment karantinaya alinir.
+
+        Returns:
+            int: Yazilan olay sayisi
+        """
+        with self._flush_lock:
+            self._rotate()
+            written = 0
+            while self._closed:
+                path = self._closed[0]
+                rows = []
+                try:
+                    rows = read_segment(path)
+                    if rows:
+                        # Segment tek transaction'da yazilir: ya hepsi ya hicbiri
+                        db_manager.execute_many(AUDIT_INSERT, rows)
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    self._stats['errors'] += 1
+                    if not self._record_failure(path, e):
+                        print(f"[AUDIT ERROR] {path.name} yazilamadi, tekrar denenecek: {e}")
+                        break
+                    self._quarantine(path, e)
+                    rows = []
+                self._closed.pop(0)
+                self._failures.pop(path, None)
+                written += len(rows)
+            if written:
+                self._stats['written'] += written
+                self._stats['flushes'] += 1
+            return written
+
+    def _record_failure(self, path, error):
+        """
+        Kalici hatayi segment sayacina ekler
+
+        Returns:
+            bool: Segment karantinaya alinmali mi
+        """
+        if isinstance(error, TRANSIENT_ERRORS) or retry_reason(error):
+            return False
+        self._failures[path] = self._failures.get(path, 0) + 1
+        return self._failures[path] >= self.max_attempts
+
+    def _quarantine(self, path, error):
+        """Segmenti '.failed' uzantisiyla kenara ayirir (acilista tekrar gonderilmez)"""
+        target = path.with_suffix(FAILED_SUFFIX)
+        try:
+            os.replace(path, target)
+        except FileNotFoundError:
+            return
+        self._stats['quarantined'] += 1
+        print(f"[AUDIT ERROR] {path.name} {self.max_attempts} denemede yazilamadi, "
+              f"karantinaya alindi ({target.name}): {error}")
+
+    def _run(self):
+        """flush_interval'de bir veya batch_size dolunca flush eder"""
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self, timeout=5.0):
+        """Thread'i durdurur ve kalan olaylari son bir kez yazar"""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def get_stats(self):
+        """
+        Kuyruk istatistikleri
+
+        Returns:
+            dict: emitted, written, flushes, errors, quarantined, pending_segments
+        """
+        with self._flush_lock:
+            stats = dict(self._stats)
+            stats['pending_segments'] = len(self._closed) + (self._file is not None)
+        return stats
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """
+    Surec genelindeki AuditWriter (ilk cagrida baslatilir)
+
+    Returns:
+        AuditWriter/None: DB_AUDIT_ENABLED kapaliysa None
+    """
+    global _writer
+    if not DatabaseConfig.AUDIT_ENABLED:
+        return None
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                writer = AuditWriter()
+                writer.start()
+                atexit.register(writer.close)
+                _writer = writer
+    return _writer
+
+
+def audit_event(tablo_adi, islem_tipi, aciklama=None, eski_veri=None, yeni_veri=None,
+                kullanici_id=None):
+    """
+    Yazma islemini audit kuyruguna ekler. Acik transaction() varsa olay
+    commit'ten sonra eklenir, rollback olursa atilir. DB_AUDIT_ENABLED
+    kapaliysa hicbir sey yapmaz.
+
+    Args:
+        tablo_adi (str): Islem yapilan tablo
+        islem_tipi (str): INSERT / UPDATE / DELETE
+        aciklama (str): Aciklama metni
+        eski_veri (dict): Degisiklik oncesi degerler
+        yeni_veri (dict): Degisiklik sonrasi degerler
+        kullanici_id (int): Islem yapan kullanici
+    """
+    if not DatabaseConfig.AUDIT_ENABLED:
+        return
+
+    event = {
+        'TabloAdi': tablo_adi,
+        'IslemTipi': islem_tipi,
+        'IslemTarihi': datetime.now().isoformat(sep=' ', timespec='seconds'),
+        'KullaniciID': kullanici_id,
+        'Aciklama': aciklama,
+        'EskiVeri': _to_json(eski_veri),
+        'YeniVeri': _to_json(yeni_veri),
+    }
+
+    def emit():
+        try:
+            get_writer().emit(event)
+        except Exception as e:
+            # Audit hatasi tamamlanmis islemi bozmaz
+            print(f"[AUDIT ERROR] Olay kuyruga eklenemedi: {e}")
+
+    db_manager.after_commit(emit)
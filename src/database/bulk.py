@@ -0,0 +1,222 @@
+"""
+Kutuphane Yonetim Sistemi - Toplu Yukleme Yardimcilari
+execute_many parcalama (max_allowed_packet) ve LOAD DATA LOCAL INFILE
+icin TSV dosyasi uretimi
+"""
+
+import io
+import os
+import tempfile
+from datetime import date, datetime
+from itertools import islice
+
+
+# Tahmin hatasina karsi paketin bu orani kadari kullanilir
+PACKET_HEADROOM = 0.8
+
+# Satir basina "(", ")", ", " ve deger ayiricilari icin pay
+_ROW_OVERHEAD = 4
+_VALUE_OVERHEAD = 4
+
+
+def _value_size(value):
+    """Degerin SQL metnindeki yaklasik boyutu (byte)"""
+    if value is None:
+        return 4
+    if isinstance(value, (bytes, bytearray)):
+        # Kacis karakterleriyle en kotu durumda iki katina cikar
+        return 2 * len(value) + 3
+    if isinstance(value, str):
+        return 2 * len(value.encode('utf-8')) + 2
+    return len(str(value)) + 2
+
+
+def estimate_row_size(row):
+    """
+    Parametre satirinin cok satirli INSERT icindeki yaklasik boyutu
+
+    Args:
+        row (tuple/dict): Parametre satiri
+
+    Returns:
+        int: Byte
+    """
+    values = row.values() if isinstance(row, dict) else row
+    return _ROW_OVERHEAD + sum(_value_size(value) + _VALUE_OVERHEAD for value in values)
+
+
+def chunk_rows(rows, query, max_bytes, max_rows):
+    """
+    Parametre satirlarini hem satir sayisi hem de tahmini paket boyutu
+    sinirini asmayacak parcalara boler. rows liste veya generator olabilir;
+    bellekte tek seferde en fazla bir parca tutulur.
+
+    Args:
+        rows (iterable): Parametre satirlari
+        query (str): SQL sorgusu (boyutu her parcaya eklenir)
+        max_bytes (int): Parca basina tahmini en fazla byte (None ise sinirsiz)
+        max_rows (int): Parca basina en fazla satir
+
+    Yields:
+        list: Parametre satirlari
+    """
+    base = len(query.encode('utf-8'))
+    chunk = []
+    size = base
+    for row in rows:
+        row_size = estimate_row_size(row) if max_bytes else 0
+        # Tek basina siniri asan satir kendi parcasinda gider
+        if chunk and (len(chunk) >= max_rows or (max_bytes and size + row_size > max_bytes)):
+            yield chunk
+            chunk = []
+            size = base
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+def insert_statement(table, columns):
+    """
+    Kolon listesinden parametreli INSERT sorgusu olusturur
+
+    Args:
+        table (str): Tablo adi
+        columns (sequence): Kolon adlari
+
+    Returns:
+        str: INSERT INTO ... VALUES (%s, ...) sorgusu
+    """
+    column_list = ', '.join(f"`{column}`" for column in columns)
+    placeholders = ', '.join(['%s'] * len(columns))
+    return f"INSERT INTO `{table}` ({column_list}) VALUES ({placeholders})"
+
+
+def load_data_statement(table, columns, replace=False):
+    """
+    write_tsv ile uretilen dosya icin LOAD DATA LOCAL INFILE sorgusu.
+    Dosya yolu %s parametresi olarak verilir.
+
+    Args:
+        table (str): Tablo adi
+        columns (sequence): Kolon adlari
+        replace (bool): Ayni anahtarli satirlar degistirilsin mi (False ise hata verir)
+
+    Returns:
+        str: SQL sorgusu
+    """
+    column_list = ', '.join(f"`{column}`" for column in columns)
+    mode = ' REPLACE' if replace else ''
+    return (
+        f"LOAD DATA LOCAL INFILE %s{mode} INTO TABLE `{table}` "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+        "LINES TERMINATED BY '\\n' "
+        f"({column_list})"
+    )
+
+
+_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\0': '\\0',
+})
+
+
+def _tsv_value(value):
+    """Degeri LOAD DATA varsayilan kacis kurallarina gore yazar"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode('utf-8')
+    return str(value).translate(_ESCAPES)
+
+
+def write_tsv(rows, max_rows=None):
+    """
+    Satirlari LOAD DATA icin gecici TSV dosyasina yazar
+
+    Args:
+        rows (iterator): Parametre satirlari (tuple)
+        max_rows (int): En fazla yazilacak satir (None ise hepsi)
+
+    Returns:
+        tuple: (dosya yolu veya None, yazilan satir sayisi)
+    """
+    if max_rows is not None:
+        rows = islice(rows, max_rows)
+
+    handle = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', newline='\n', suffix='.tsv',
+        prefix='kutuphane_bulk_', delete=False
+    )
+    count = 0
+    try:
+        with handle:
+            for row in rows:
+                handle.write('\t'.join(_tsv_value(value) for value in row))
+                handle.write('\n')
+                count += 1
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+
+    if count == 0:
+        os.unlink(handle.name)
+        return None, 0
+    return handle.name, count
+
+
+_UNESCAPES = {'\\': '\\', 't': '\t', 'n': '\n', 'r': '\r', '0': '\0'}
+
+
+def _tsv_unescape(value):
+    """_tsv_value'nun tersi"""
+    if value == '\\N':
+        return None
+    if '\\' not in value:
+        return value
+    parts = []
+    chars = iter(value)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, '')
+            parts.append(_UNESCAPES.get(escaped, escaped))
+        else:
+            parts.append(char)
+    return ''.join(parts)
+
+
+def read_tsv(source):
+    """
+    write_tsv bicimindeki dosyayi veya akisi (baslik satiri yok) satir
+    satir okur. LOAD DATA kullanilamadiginda execute_many'ye veri saglar.
+
+    Args:
+        source (str/Path/file): Dosya yolu veya metin/binary akis
+
+    Yields:
+        tuple: Satir degerleri (\\N -> None)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8', newline='') as handle:
+            yield from read_tsv(handle)
+        return
+
+    if isinstance(source, io.BufferedIOBase) or 'b' in getattr(source, 'mode', ''):
+        source = io.TextIOWrapper(source, encoding='utf-8', newline='')
+
+    for line in source:
+        line = line.rstrip('\n')
+        if line.endswith('\r'):
+            line = line[:-1]
+        if line:
+            yield tuple(_tsv_unescape(value) for value in line.split('\t'))
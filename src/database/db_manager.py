@@ -3,40 +3,155 @@ Kutuphane Yonetim Sistemi - Veritabani Yoneticisi
 Connection pool ve veritabani islemleri
 """
 
+import os
+import threading
+import time
+from contextvars import ContextVar
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import Error
 from contextlib import contextmanager
 from src.config.database import DatabaseConfig
+from src.database.bulk import (
+    PACKET_HEADROOM, chunk_rows, insert_statement, load_data_statement, read_tsv, write_tsv
+)
+from src.database.pool import ConnectionPool
+from src.database.query_cache import QueryCache, tables_in
+from src.database.query_monitor import QueryMonitor
+from src.database.retry import IdempotencyGuard, RetryPolicy
+from src.database.row_factory import ROW_DICT, DEFAULT_ROW_FACTORIES, build_rows, build_row
+from src.database.statement_cache import StatementCache
+from src.utils.constants import SP_WRITE_TABLES, TRIGGER_WRITE_TABLES
+
+
+# transaction() blogu icindeki baglanti (thread / asyncio task bazinda)
+_transaction_connection = ContextVar('transaction_connection', default=None)
+
+# replica_reads() blogu icinde okumalar read-your-writes penceresini yok sayar
+_prefer_replica = ContextVar('prefer_replica', default=False)
+
+# transaction() icinde yazilan tablolar; commit sonrasi cache tekrar temizlenir
+_pending_invalidation = ContextVar('pending_invalidation', default=None)
+
+# transaction() commit edildikten sonra calisacak fonksiyonlar
+_after_commit = ContextVar('after_commit', default=None)
 
 
 class DatabaseManager:
     """Veritabani baglanti ve islem yoneticisi"""
     
     _pool = None
+    _read_pool = None
+    _last_write_at = 0.0
+    _max_allowed_packet = None
     _instance = None
+    _instance_lock = threading.Lock()
+    _statement_cache = StatementCache(DatabaseConfig.STATEMENT_CACHE_SIZE)
+    _monitor = QueryMonitor(
+        slow_threshold_ms=DatabaseConfig.SLOW_QUERY_MS,
+        log_path=DatabaseConfig.SLOW_QUERY_LOG,
+        max_bytes=DatabaseConfig.SLOW_QUERY_LOG_MAX_BYTES,
+        backup_count=DatabaseConfig.SLOW_QUERY_LOG_BACKUPS,
+        explain=DatabaseConfig.SLOW_QUERY_EXPLAIN
+    )
+    _query_cache = QueryCache(DatabaseConfig.QUERY_CACHE_SIZE, DatabaseConfig.QUERY_CACHE_TTL)
+    _retry = RetryPolicy(
+        attempts=DatabaseConfig.RETRY_ATTEMPTS,
+        base_delay=DatabaseConfig.RETRY_BASE_DELAY,
+        max_delay=DatabaseConfig.RETRY_MAX_DELAY
+    )
+    _idempotency = IdempotencyGuard(ttl=DatabaseConfig.IDEMPOTENCY_TTL)
     
     def __new__(cls):
         """Singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super(DatabaseManager, cls).__new__(cls)
+        # UI arka plan thread'leri ayni anda ilk ornegi olusturabilir
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(DatabaseManager, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-        """Connection pool'u baslatir"""
+        """
+        Pool'lar ilk kullanimda (veya warm_up ile) olusturulur; modul
+        import edilirken veritabanina baglanilmaz.
+        
+        Raises:
+            ValueError: DB_ROW_FACTORY anahtar erisimi olmayan bir tipse
+                (modeller sonuclari row['Kolon'] ile okur)
+        """
+        if DatabaseConfig.ROW_FACTORY not in DEFAULT_ROW_FACTORIES:
+            raise ValueError(
+                f"Gecersiz DB_ROW_FACTORY: {DatabaseConfig.ROW_FACTORY} "
+                f"(gecerli: {', '.join(DEFAULT_ROW_FACTORIES)}; tuple / namedtuple "
+                f"sadece cagri bazinda row_factory ile istenebilir)"
+            )
+    
+    def _primary_pool(self):
+        """Primary pool'u dondurur, yoksa olusturur"""
+        if DatabaseManager._pool is None:
+            with DatabaseManager._instance_lock:
+                self._init_pools()
+        return DatabaseManager._pool
+    
+    def _init_pools(self):
+        """Pool'lari bir kez olusturur (_instance_lock altinda cagrilir)"""
         if DatabaseManager._pool is None:
             try:
+                if DatabaseConfig.is_sqlite():
+                    # Gecikmeli import: sqlite_backend sadece bu modda gerekli
+                    from src.database import sqlite_backend
+                    pool_config = DatabaseConfig.get_sqlite_pool_config()
+                    DatabaseManager._pool = ConnectionPool(
+                        connector=sqlite_backend.connect, **pool_config
+                    )
+                    print(f"[DB] SQLite connection pool olusturuldu: {pool_config['database']}")
+                    return
+                
+                # Replika once kurulur: _pool'u goren thread replikayi da gorsun
+                replica_config = DatabaseConfig.get_replica_pool_config()
+                if replica_config:
+                    DatabaseManager._read_pool = ConnectionPool(**replica_config)
+                    print("[DB] Okuma replikasi pool'u olusturuldu")
+                
                 pool_config = DatabaseConfig.get_pool_config()
-                DatabaseManager._pool = pooling.MySQLConnectionPool(**pool_config)
+                DatabaseManager._pool = ConnectionPool(**pool_config)
                 print("[DB] Connection pool olusturuldu")
             except Error as e:
                 print(f"[DB ERROR] Pool olusturma hatasi: {e}")
                 raise
     
+    def _select_pool(self, read_only, use_replica):
+        """
+        Okuma/yazma ayrimina gore kullanilacak pool'u secer
+        
+        Args:
+            read_only (bool): Sorgu sadece okuma mi?
+            use_replica (bool): True: replika zorla, False: primary zorla,
+                None: son yazmadan sonra READ_YOUR_WRITES_SECONDS gecmisse replika
+        """
+        pool = self._primary_pool()
+        if not read_only or DatabaseManager._read_pool is None or use_replica is False:
+            return pool
+        
+        if use_replica is None and not _prefer_replica.get():
+            since_write = time.monotonic() - DatabaseManager._last_write_at
+            if since_write < DatabaseConfig.READ_YOUR_WRITES_SECONDS:
+                return pool
+        
+        return DatabaseManager._read_pool
+    
+    def _mark_write(self):
+        """Read-your-writes penceresini baslatir"""
+        DatabaseManager._last_write_at = time.monotonic()
+    
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, read_only=False, use_replica=None):
         """
         Context manager ile baglanti al
         
+        Args:
+            read_only (bool): Sadece okuma yapilacaksa replika kullanilabilir
+            use_replica (bool): Replika secimini cagri bazinda zorlar
+            
         Yields:
             connection: MySQL baglantisi
             
@@ -45,9 +160,16 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 # islemler...
         """
+        bound = _transaction_connection.get()
+        if bound is not None:
+            # Aktif transaction varsa ayni baglanti kullanilir; commit,
+            # rollback ve havuza iade transaction() blogunun isidir
+            yield bound
+            return
+        
         connection = None
         try:
-            connection = DatabaseManager._pool.get_connection()
+            connection = self._select_pool(read_only, use_replica).get_connection()
             yield connection
         except Error as e:
             if connection:
@@ -55,10 +177,73 @@ class DatabaseManager:
             print(f"[DB ERROR] Baglanti hatasi: {e}")
             raise
         finally:
-            if connection and connection.is_connected():
+            # Kopuk baglanti da havuza birakilir, havuz kendisi eler
+            if connection:
                 connection.close()
     
-    def execute_query(self, query, params=None, fetch_one=False):
+    def _record(self, kind, query, params, started, conn, rows):
+        """Sorgu suresini ve bekleme suresini monitore kaydeder"""
+        self._monitor.record(
+            kind, query, params,
+            elapsed=time.perf_counter() - started,
+            rows=rows,
+            wait_time=getattr(conn, 'wait_time', 0.0),
+            connection=conn
+        )
+    
+    def _use_prepared(self, prepared):
+        """Cagri bazinda veya konfigurasyondan prepared modu belirler"""
+        if prepared is None:
+            return DatabaseConfig.PREPARED_STATEMENTS
+        return prepared
+    
+    def _row_factory(self, row_factory):
+        """Cagri bazinda veya konfigurasyondan satir tipini belirler"""
+        return row_factory or DatabaseConfig.ROW_FACTORY
+    
+    def _with_retry(self, operation, *args):
+        """
+        Islemi deadlock / lock wait timeout durumunda jitter'li ustel
+        bekleme ile tekrar dener. transaction() blogu icinde tekrar
+        denenmez: sunucu tum transaction'i geri aldigi icin tekrar
+        denemek blogun (run_in_transaction) isidir.
+        """
+        if self.in_transaction():
+            return operation(*args)
+        return self._retry.run(operation, *args)
+    
+    def _invalidate(self, tables):
+        """
+        Yazilan tablolari (ve trigger'larin dolayli yazdiklarini) okuyan
+        cache kayitlarini siler
+        
+        Args:
+            tables (iterable): Yazilan tablolar (None ise tum cache)
+        """
+        if tables is None:
+            self._query_cache.clear()
+            pending = _pending_invalidation.get()
+            if pending is not None:
+                pending.add(None)
+            return
+        
+        affected = set()
+        queue = [table.upper() for table in tables]
+        while queue:
+            table = queue.pop()
+            if table not in affected:
+                affected.add(table)
+                queue.extend(TRIGGER_WRITE_TABLES.get(table, ()))
+        if not affected:
+            return
+        
+        self._query_cache.invalidate_tables(affected)
+        pending = _pending_invalidation.get()
+        if pending is not None:
+            pending.update(affected)
+    
+    def execute_query(self, query, params=None, fetch_one=False, prepared=None,
+                      use_replica=None, row_factory=None, cache=False, cache_ttl=None):
         """
         SELECT sorgusu calistirir
         
@@ -66,21 +251,78 @@ class DatabaseManager:
             query (str): SQL sorgusu
             params (tuple): Parametre degerleri
             fetch_one (bool): Tek satir mi donsun?
+            prepared (bool): Prepared statement cache kullanilsin mi?
+                (None ise DB_PREPARED_STATEMENTS ayari gecerli)
+            use_replica (bool): Okuma replikasi secimi (None ise otomatik,
+                transaction icinde her zaman primary)
+            row_factory (str): Satir tipi - dict / tuple / namedtuple / record
+                (None ise DB_ROW_FACTORY ayari gecerli)
+            cache (bool): Sonuc cache'lensin mi? Kayit, sorgunun okudugu
+                tablolara yazma yapildiginda otomatik silinir
+            cache_ttl (float): Cache suresi (sn), None ise DB_QUERY_CACHE_TTL
             
         Returns:
             list/dict: Sorgu sonucu
         """
+        row_factory = self._row_factory(row_factory)
+        
+        # Transaction icinde commit edilmemis veri cache'e girmemeli
+        if not cache or not DatabaseConfig.QUERY_CACHE_ENABLED or self.in_transaction():
+            return self._with_retry(self._execute_query, query, params, fetch_one,
+                                    prepared, use_replica, row_factory)
+        
+        key = self._query_cache.make_key(query, params, fetch_one, row_factory)
+        found, result = self._query_cache.get(key)
+        if not found:
+            tables = tables_in(query)
+            versions = self._query_cache.versions(tables)
+            result = self._with_retry(self._execute_query, query, params, fetch_one,
+                                      prepared, use_replica, row_factory)
+            self._query_cache.put(key, result, tables, ttl=cache_ttl, versions=versions)
+        # Cagiran listeyi degistirirse cache bozulmasin
+        return list(result) if isinstance(result, list) else result
+    
+    def _execute_query(self, query, params, fetch_one, prepared, use_replica, row_factory):
+        """execute_query govdesi (cache disinda)"""
+        started = time.perf_counter()
+        # dict disindaki tipler tuple cursor'dan uretilir
+        dictionary = row_factory == ROW_DICT
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
+            with self.get_connection(read_only=True, use_replica=use_replica) as conn:
+                if self._use_prepared(prepared):
+                    # Cursor baglantiyla birlikte cache'de kalir, kapatilmaz
+                    cursor = self._statement_cache.get_cursor(conn, query, dictionary=dictionary)
+                    try:
+                        cursor.execute(query, params or ())
+                        rows = cursor.fetchall()
+                    except Error:
+                        self._statement_cache.discard(conn, query)
+                        raise
+                    self._record('query', query, params, started, conn, len(rows))
+                    if fetch_one:
+                        rows = rows[:1]
+                    if not dictionary:
+                        rows = build_rows(rows, cursor.column_names, row_factory)
+                    if fetch_one:
+                        return rows[0] if rows else None
+                    return rows
+                
+                cursor = conn.cursor(dictionary=dictionary)
                 cursor.execute(query, params or ())
                 
                 if fetch_one:
                     result = cursor.fetchone()
+                    row_count = 1 if result else 0
+                    if not dictionary:
+                        result = build_row(result, cursor.column_names, row_factory)
                 else:
                     result = cursor.fetchall()
+                    row_count = len(result)
+                    if not dictionary:
+                        result = build_rows(result, cursor.column_names, row_factory)
                 
                 cursor.close()
+                self._record('query', query, params, started, conn, row_count)
                 return result
                 
         except Error as e:
@@ -88,27 +330,113 @@ class DatabaseManager:
             print(f"[DB ERROR] Query: {query}")
             raise
     
-    def execute_update(self, query, params=None):
+    def stream_query(self, query, params=None, batch_size=1000, use_replica=None,
+                     row_factory=None):
+        """
+        SELECT sorgusunu unbuffered cursor ile calistirir, satirlari
+        sabit boyutlu parcalar halinde uretir. Bellek kullanimi tablo
+        boyutundan bagimsizdir.
+        
+        Not: Generator tuketilene (veya kapatilana) kadar pool'dan alinan
+        baglanti tutulur.
+        
+        Args:
+            query (str): SQL sorgusu
+            params (tuple): Parametre degerleri
+            batch_size (int): Parca basina satir sayisi
+            use_replica (bool): Okuma replikasi secimi
+            row_factory (str): Satir tipi (None ise DB_ROW_FACTORY)
+            
+        Yields:
+            list: En fazla batch_size satirlik liste
+        """
+        row_factory = self._row_factory(row_factory)
+        dictionary = row_factory == ROW_DICT
+        try:
+            with self.get_connection(read_only=True, use_replica=use_replica) as conn:
+                cursor = conn.cursor(dictionary=dictionary, buffered=False)
+                try:
+                    cursor.execute(query, params or ())
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        if not dictionary:
+                            rows = build_rows(rows, cursor.column_names, row_factory)
+                        yield rows
+                finally:
+                    # Erken kapatilirsa okunmamis satirlar baglantiyi kirletmesin
+                    try:
+                        if conn.unread_result:
+                            conn.consume_results()
+                        cursor.close()
+                    except Error:
+                        pass
+                
+        except Error as e:
+            print(f"[DB ERROR] Stream sorgu hatasi: {e}")
+            print(f"[DB ERROR] Query: {query}")
+            raise
+    
+    def execute_iter(self, query, params=None, batch_size=1000, use_replica=None,
+                     row_factory=None):
+        """
+        stream_query ile ayni, fakat satirlari tek tek uretir
+        
+        Args:
+            query (str): SQL sorgusu
+            params (tuple): Parametre degerleri
+            batch_size (int): Sunucudan tek seferde cekilecek satir sayisi
+            use_replica (bool): Okuma replikasi secimi
+            row_factory (str): Satir tipi (None ise DB_ROW_FACTORY)
+            
+        Yields:
+            dict/Record: Sorgu satiri
+        """
+        for batch in self.stream_query(query, params, batch_size, use_replica, row_factory):
+            yield from batch
+    
+    def execute_update(self, query, params=None, prepared=None):
         """
         INSERT, UPDATE, DELETE sorgusu calistirir
         
         Args:
             query (str): SQL sorgusu
             params (tuple): Parametre degerleri
+            prepared (bool): Prepared statement cache kullanilsin mi?
             
         Returns:
             tuple: (affected_rows, last_insert_id)
         """
+        return self._with_retry(self._execute_update, query, params, prepared)
+    
+    def _execute_update(self, query, params, prepared):
+        """execute_update govdesi (tekrar deneme disinda)"""
+        started = time.perf_counter()
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params or ())
-                conn.commit()
+                use_prepared = self._use_prepared(prepared)
+                if use_prepared:
+                    cursor = self._statement_cache.get_cursor(conn, query)
+                else:
+                    cursor = conn.cursor()
+                try:
+                    cursor.execute(query, params or ())
+                except Error:
+                    if use_prepared:
+                        self._statement_cache.discard(conn, query)
+                    raise
+                if not self.in_transaction():
+                    conn.commit()
+                self._mark_write()
+                self._invalidate(tables_in(query) or None)
                 
                 affected_rows = cursor.rowcount
                 last_id = cursor.lastrowid
                 
-                cursor.close()
+                if not use_prepared:
+                    cursor.close()
+                self._record('update', query, params, started, conn, affected_rows)
                 return affected_rows, last_id
                 
         except Error as e:
@@ -116,42 +444,186 @@ class DatabaseManager:
             print(f"[DB ERROR] Query: {query}")
             raise
     
-    def execute_many(self, query, params_list):
+    def execute_many(self, query, params_list, chunk_size=None, atomic=True, progress=None):
         """
-        Toplu INSERT/UPDATE islemi
+        Toplu INSERT/UPDATE islemi. Satirlar max_allowed_packet'e sigacak
+        parcalara bolunur; INSERT ... VALUES sorgularini mysql-connector her
+        parca icin tek bir cok satirli INSERT olarak gonderir.
         
         Args:
             query (str): SQL sorgusu
-            params_list (list): Parametre listesi
+            params_list (iterable): Parametre listesi (liste veya generator)
+            chunk_size (int): Parca basina en fazla satir (None ise DB_BULK_CHUNK_ROWS)
+            atomic (bool): True ise tum parcalar tek transaction'da yazilir,
+                hata olursa hicbiri kalmaz. False ise her parca ayri commit
+                edilir, hata oncesi parcalar kalir.
+            progress (callable): Her parcadan sonra progress(yazilan, toplam)
+                cagrilir (toplam bilinmiyorsa None)
             
         Returns:
             int: Etkilenen satir sayisi
         """
+        chunk_size = chunk_size or DatabaseConfig.BULK_CHUNK_ROWS
+        total = len(params_list) if hasattr(params_list, '__len__') else None
+        started = time.perf_counter()
+        state = {'affected': 0, 'done': 0, 'first': None}
+        
+        def run(conn):
+            max_bytes = self._bulk_packet_limit(conn)
+            cursor = conn.cursor()
+            try:
+                for chunk in chunk_rows(params_list, query, max_bytes, chunk_size):
+                    if state['first'] is None:
+                        state['first'] = chunk[0]
+                    cursor.executemany(query, chunk)
+                    state['affected'] += max(cursor.rowcount, 0)
+                    if not atomic and not self.in_transaction():
+                        conn.commit()
+                    state['done'] += len(chunk)
+                    if progress:
+                        progress(state['done'], total)
+            finally:
+                cursor.close()
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany(query, params_list)
-                conn.commit()
-                
-                affected_rows = cursor.rowcount
+            self._run_bulk(run, atomic, query, state, started, retry=hasattr(params_list, '__len__'))
+            return state['affected']
+        except Error as e:
+            print(f"[DB ERROR] Bulk update hatasi: {e} ({state['done']} satir yazildi)")
+            raise
+    
+    def load_data(self, table, columns, source, chunk_size=None, atomic=True,
+                  progress=None, replace=False):
+        """
+        Tabloya toplu veri yukler. DB_LOCAL_INFILE acikken veri gecici TSV
+        dosyalarina yazilip LOAD DATA LOCAL INFILE ile yuklenir; aksi halde
+        (veya SQLite backend'inde) execute_many ile cok satirli INSERT kullanilir.
+        
+        Args:
+            table (str): Tablo adi
+            columns (sequence): Kolon adlari (satir degerleriyle ayni sirada)
+            source: Satir (tuple) iterable'i, TSV dosya yolu veya TSV akisi
+                (bulk.write_tsv bicimi: tab ayrimli, \\N = NULL, baslik yok)
+            chunk_size (int): Parca basina satir (None ise DB_BULK_CHUNK_ROWS)
+            atomic (bool): True: tek transaction, False: parca basina commit
+            progress (callable): progress(yuklenen, toplam)
+            replace (bool): LOAD DATA'da ayni anahtarli satirlar degistirilsin mi
+            
+        Returns:
+            int: Yuklenen satir sayisi
+        """
+        if isinstance(source, (str, os.PathLike)) or hasattr(source, 'read'):
+            rows = read_tsv(source)
+        else:
+            rows = source
+        
+        if not DatabaseConfig.LOCAL_INFILE or DatabaseConfig.is_sqlite():
+            return self.execute_many(
+                insert_statement(table, columns), rows,
+                chunk_size=chunk_size, atomic=atomic, progress=progress
+            )
+        
+        chunk_size = chunk_size or DatabaseConfig.BULK_CHUNK_ROWS
+        total = len(rows) if hasattr(rows, '__len__') else None
+        query = load_data_statement(table, columns, replace=replace)
+        started = time.perf_counter()
+        state = {'affected': 0, 'done': 0, 'first': None}
+        
+        def run(conn):
+            iterator = iter(rows)
+            cursor = conn.cursor()
+            try:
+                while True:
+                    path, count = write_tsv(iterator, max_rows=chunk_size)
+                    if path is None:
+                        break
+                    try:
+                        cursor.execute(query, (path,))
+                    finally:
+                        os.unlink(path)
+                    state['affected'] += max(cursor.rowcount, 0)
+                    if not atomic and not self.in_transaction():
+                        conn.commit()
+                    state['done'] += count
+                    if progress:
+                        progress(state['done'], total)
+            finally:
                 cursor.close()
-                return affected_rows
-                
+        
+        try:
+            self._run_bulk(run, atomic, query, state, started, retry=hasattr(rows, '__len__'))
+            return state['affected']
         except Error as e:
-            print(f"[DB ERROR] Bulk update hatasi: {e}")
+            print(f"[DB ERROR] LOAD DATA hatasi: {e} ({state['done']} satir yuklendi)")
             raise
     
-    def call_procedure(self, proc_name, params=None):
+    def _run_bulk(self, run, atomic, query, state, started, retry=False):
         """
-        Stored procedure calistirir
+        execute_many / load_data govdesini atomic moduna gore tek
+        transaction'da veya parca basina commit ile calistirir. Atomic
+        modda ve veri tekrar okunabiliyorsa (liste) kilit catismasinda
+        tum yukleme tekrar denenir.
+        """
+        def attempt():
+            state.update(affected=0, done=0, first=None)
+            context = self.transaction() if atomic else self.get_connection()
+            with context as conn:
+                run(conn)
+                self._record('many', query, state['first'], started, conn, state['affected'])
+        
+        try:
+            if atomic and retry:
+                self._with_retry(attempt)
+            else:
+                attempt()
+        finally:
+            # Kismi yazma (atomic=False) ve rollback durumunda da cache temizlenir
+            if state['done']:
+                self._mark_write()
+                self._invalidate(tables_in(query) or None)
+    
+    def _bulk_packet_limit(self, conn):
+        """
+        Parca boyutu siniri (byte). Sunucunun max_allowed_packet degeri
+        bir kez okunup saklanir.
+        """
+        if DatabaseConfig.BULK_MAX_PACKET:
+            return int(DatabaseConfig.BULK_MAX_PACKET * PACKET_HEADROOM)
+        if DatabaseConfig.is_sqlite():
+            # SQLite executemany satir satir calisir, paket siniri yok
+            return None
+        if DatabaseManager._max_allowed_packet is None:
+            cursor = conn.cursor()
+            cursor.execute("SELECT @@max_allowed_packet")
+            DatabaseManager._max_allowed_packet = int(cursor.fetchone()[0])
+            cursor.close()
+        return int(DatabaseManager._max_allowed_packet * PACKET_HEADROOM)
+    
+    def call_procedure(self, proc_name, params=None, idempotency_key=None):
+        """
+        Stored procedure calistirir. Deadlock / lock wait timeout hatasinda
+        (sunucu islemi geri almistir) cagri otomatik olarak tekrar denenir.
         
         Args:
             proc_name (str): Procedure adi
             params (tuple): Parametre degerleri
+            idempotency_key (str): Verilirse ayni anahtarla yapilan ikinci
+                cagri procedure'u tekrar calistirmaz, ilk cagrinin sonucunu
+                dondurur (cift tiklama / tekrar gonderim korumasi)
             
         Returns:
             list: Procedure sonuclari
         """
+        if idempotency_key is None:
+            return self._with_retry(self._call_procedure, proc_name, params)
+        return self._idempotency.run(
+            (proc_name, idempotency_key),
+            lambda: self._with_retry(self._call_procedure, proc_name, params)
+        )
+    
+    def _call_procedure(self, proc_name, params):
+        """call_procedure govdesi (tekrar deneme disinda)"""
+        started = time.perf_counter()
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor(dictionary=True)
@@ -162,8 +634,13 @@ class DatabaseManager:
                 for result in cursor.stored_results():
                     results.extend(result.fetchall())
                 
-                conn.commit()
+                if not self.in_transaction():
+                    conn.commit()
+                self._mark_write()
+                # Tanimsiz procedure icin (None) tum cache temizlenir
+                self._invalidate(SP_WRITE_TABLES.get(proc_name))
                 cursor.close()
+                self._record('procedure', proc_name, params, started, conn, len(results))
                 return results
                 
         except Error as e:
@@ -194,29 +671,240 @@ class DatabaseManager:
         except Error as e:
             return False, f"Baglanti hatasi: {e}"
     
+    def warm_up(self, progress=None):
+        """
+        Pool'u olusturur ve DB_POOL_WARM_SIZE kadar baglantiyi onceden acar.
+        Login ekrani gosterilirken arka planda cagrilir; boylece ilk sorgu
+        baglanti kurma gecikmesini odemez. Is bitmeden gelen istekler
+        havuzu normal sekilde kullanir.
+        
+        Args:
+            progress (callable): Her baglantidan sonra progress(acilan, hedef)
+            
+        Returns:
+            int: Acilan baglanti sayisi
+            
+        Raises:
+            Error: Baglanti acilamazsa
+        """
+        started = time.perf_counter()
+        count = DatabaseConfig.POOL_WARM_SIZE
+        try:
+            opened = self._primary_pool().warm(count, progress)
+            if DatabaseManager._read_pool is not None:
+                opened += DatabaseManager._read_pool.warm(count)
+        except Error as e:
+            print(f"[DB ERROR] Pool isitma hatasi: {e}")
+            raise
+        print(f"[DB] {opened} baglanti hazir ({(time.perf_counter() - started) * 1000:.0f} ms)")
+        return opened
+    
+    def in_transaction(self):
+        """Mevcut thread/context bir transaction() blogu icinde mi?"""
+        return _transaction_connection.get() is not None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Birden fazla model cagrisini tek baglanti ve tek commit ile calistirir.
+        Blok icindeki execute_query / execute_update / call_procedure
+        cagrilari ayni baglantiyi kullanir; hata olursa tumu geri alinir.
+        Ic ice kullanimda icteki blok distaki transaction'a katilir.
+        
+        Not: Kendi icinde START TRANSACTION yapan stored procedure'ler
+        (sp_YeniOduncVer, sp_KitapTeslimAl) acik transaction'i commit eder.
+        
+        Yields:
+            connection: Transaction'a bagli baglanti
+            
+        Example:
+            with db_manager.transaction():
+                Penalty.pay_penalty(ceza_id)
+                Member.update(uye_id, aktif_mi=True)
+        """
+        bound = _transaction_connection.get()
+        if bound is not None:
+            yield bound
+            return
+        
+        connection = self._primary_pool().get_connection()
+        token = _transaction_connection.set(connection)
+        pending = set()
+        pending_token = _pending_invalidation.set(pending)
+        callbacks = []
+        callbacks_token = _after_commit.set(callbacks)
+        try:
+            connection.start_transaction()
+            yield connection
+            connection.commit()
+            self._mark_write()
+            # Blok sirasinda baska thread eski veriyi cache'lemis olabilir
+            if None in pending:
+                self._query_cache.clear()
+            elif pending:
+                self._query_cache.invalidate_tables(pending)
+        except BaseException:
+            try:
+                connection.rollback()
+            except Error as e:
+                print(f"[DB ERROR] Rollback hatasi: {e}")
+            raise
+        finally:
+            _after_commit.reset(callbacks_token)
+            _pending_invalidation.reset(pending_token)
+            _transaction_connection.reset(token)
+            connection.close()
+        
+        for callback in callbacks:
+            self._run_callback(callback)
+    
+    def after_commit(self, callback):
+        """
+        callback'i acik transaction() commit edildikten sonra calistirir;
+        transaction geri alinirsa callback atilir. Transaction disinda
+        hemen calistirilir.
+        
+        Args:
+            callback (callable): Argumansiz fonksiyon
+        """
+        callbacks = _after_commit.get()
+        if callbacks is None:
+            self._run_callback(callback)
+        else:
+            callbacks.append(callback)
+    
+    @staticmethod
+    def _run_callback(callback):
+        """Commit sonrasi callback hatasi commit edilmis islemi bozmaz"""
+        try:
+            callback()
+        except Exception as e:
+            print(f"[DB ERROR] after_commit hatasi: {e}")
+    
+    def run_in_transaction(self, func, *args, **kwargs):
+        """
+        func'u transaction() icinde calistirir; deadlock / lock wait timeout
+        olursa tum blok geri alinip bastan tekrar denenir.
+        
+        Args:
+            func (callable): Transaction icinde calisacak fonksiyon
+            
+        Returns:
+            func'un sonucu
+        """
+        def attempt():
+            with self.transaction():
+                return func(*args, **kwargs)
+        
+        return self._with_retry(attempt)
+    
+    @contextmanager
+    def replica_reads(self):
+        """
+        Blok icindeki okumalari (model metodlari dahil) read-your-writes
+        penceresinden bagimsiz olarak replikaya yonlendirir. Raporlar gibi
+        birkac saniyelik gecikmeye toleransli ekranlar icindir.
+        """
+        token = _prefer_replica.set(True)
+        try:
+            yield
+        finally:
+            _prefer_replica.reset(token)
+    
     def begin_transaction(self):
         """Transaction baslatir"""
-        connection = DatabaseManager._pool.get_connection()
+        connection = self._primary_pool().get_connection()
         connection.start_transaction()
         return connection
     
     def commit_transaction(self, connection):
         """Transaction'i commit eder"""
-        if connection and connection.is_connected():
-            connection.commit()
-            connection.close()
+        if connection:
+            try:
+                connection.commit()
+                self._mark_write()
+                # Bu yoldan yapilan yazmalarin tablolari bilinmiyor
+                self._query_cache.clear()
+            finally:
+                connection.close()
     
     def rollback_transaction(self, connection):
         """Transaction'i geri alir"""
-        if connection and connection.is_connected():
-            connection.rollback()
-            connection.close()
+        if connection:
+            try:
+                connection.rollback()
+            finally:
+                connection.close()
+    
+    def get_statement_cache_stats(self):
+        """
+        Prepared statement cache istatistikleri
+        
+        Returns:
+            dict: hits, misses, evictions, hit_ratio, cached, connections
+        """
+        return self._statement_cache.get_stats()
+    
+    def get_retry_stats(self):
+        """
+        Deadlock / lock wait tekrar deneme istatistikleri
+        
+        Returns:
+            dict: retries, deadlocks, lock_wait_timeouts, recovered, gave_up,
+                  idempotent_hits
+        """
+        stats = self._retry.get_stats()
+        stats['idempotent_hits'] = self._idempotency.hits
+        return stats
+    
+    def get_query_cache_stats(self):
+        """
+        Sorgu sonuc cache'i istatistikleri
+        
+        Returns:
+            dict: hits, misses, hit_ratio, entries, evictions, invalidations
+        """
+        return self._query_cache.get_stats()
+    
+    def clear_query_cache(self):
+        """Sorgu sonuc cache'ini tamamen temizler"""
+        self._query_cache.clear()
+    
+    def get_query_stats(self, top=20, order_by='total_ms'):
+        """
+        Parmak izi bazinda sorgu istatistikleri
+        
+        Args:
+            top (int): Kac kayit donsun
+            order_by (str): total_ms, avg_ms, max_ms, count, rows, wait_ms
+            
+        Returns:
+            list: Sorgu istatistikleri
+        """
+        return self._monitor.get_stats(top=top, order_by=order_by)
+    
+    def get_pool_stats(self):
+        """
+        Connection pool istatistikleri
+        
+        Returns:
+            dict: in_use, idle, waiters ve checkout bekleme yuzdelikleri
+                  (replika varsa 'replica' anahtari altinda onun istatistikleri)
+        """
+        stats = self._primary_pool().get_stats()
+        if DatabaseManager._read_pool is not None:
+            stats['replica'] = DatabaseManager._read_pool.get_stats()
+        return stats
     
     def close_pool(self):
         """Connection pool'u kapatir"""
         if DatabaseManager._pool:
             print("[DB] Connection pool kapatiliyor...")
+            DatabaseManager._pool.close_all()
             DatabaseManager._pool = None
+        if DatabaseManager._read_pool:
+            DatabaseManager._read_pool.close_all()
+            DatabaseManager._read_pool = None
     
     def get_table_info(self, table_name):
         """
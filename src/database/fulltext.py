@@ -0,0 +1,100 @@
+"""
+Kutuphane Yonetim Sistemi - Arama Yardimcilari
+Kullanici metnini MATCH ... AGAINST (... IN BOOLEAN MODE) ifadesine cevirir.
+ngram parser'da ngram_token_size'dan kisa terimler indekste bulunmaz,
+bu terimler LIKE ile aranmak uzere ayri dondurulur.
+
+normalize_search / prefix_pattern "ile baslayan" aramasi icindir: KITAP ve
+UYE'deki *Arama kolonlari ayni katlamayla saklanir ve indekslidir.
+"""
+
+import re
+
+from src.utils.constants import NGRAM_TOKEN_SIZE
+
+
+# Boolean mode operatorleri; kullanici metninde arama ifadesini bozmasin
+_OPERATOR_RE = re.compile(r'[+\-<>()~*"@]+')
+
+# database/schema.sql'deki *Arama kolonlarinin ifadesiyle ayni katlama:
+# LOWER + Turkce harfler ve sapkali harfler ASCII karsiligina
+_FOLD = str.maketrans('çÇğĞıIİöÖşŞüÜâÂîÎûÛ', 'ccggiiioossuuaaiiuu')
+
+# LIKE joker karakterleri; desende ters bolu ile kacirilir. Sorgular
+# ESCAPE '\\' kullanir (SQLite'ta varsayilan escape karakteri yok)
+_LIKE_RE = re.compile(r'([%_\\])')
+
+
+def split_terms(text):
+    """
+    Arama metnini operator karakterlerinden arindirilmis kelimelere ayirir
+
+    Args:
+        text (str): Kullanici arama metni
+
+    Returns:
+        list: Kelimeler (tekrarlar atilir, sira korunur)
+    """
+    terms = _OPERATOR_RE.sub(' ', text or '').split()
+    return list(dict.fromkeys(terms))
+
+
+def boolean_query(text, min_length=NGRAM_TOKEN_SIZE):
+    """
+    Her kelimenin zorunlu oldugu boolean mode ifadesi uretir. ngram parser
+    ile "kelime" (phrase) aramasi, kelimenin ardisik ngram'larini arar;
+    LIKE '%kelime%' ile ayni sonucu indeks uzerinden verir.
+
+    Args:
+        text (str): Kullanici arama metni
+        min_length (int): Indekste aranabilecek en kisa terim uzunlugu
+
+    Returns:
+        tuple: (boolean ifade veya None, LIKE ile aranacak kisa terimler)
+
+    Example:
+        boolean_query('suc ve ceza')  ->  ('+"suc" +"ve" +"ceza"', [])
+        boolean_query('a tolstoy')    ->  ('+"tolstoy"', ['a'])
+    """
+    terms = split_terms(text)
+    indexed = [term for term in terms if len(term) >= min_length]
+    short = [term for term in terms if len(term) < min_length]
+    expression = ' '.join(f'+"{term}"' for term in indexed)
+    return expression or None, short
+
+
+def normalize_search(text):
+    """
+    Metni arama kolonlarindaki bicime getirir (kucuk harf, Turkce
+    karakterler katlanmis)
+
+    Args:
+        text (str): Metin
+
+    Returns:
+        str: Katlanmis metin
+
+    Example:
+        normalize_search('Çalıkuşu')  ->  'calikusu'
+    """
+    return str(text or '').translate(_FOLD).lower()
+
+
+def prefix_pattern(text):
+    """
+    "ile baslayan" aramasi icin LIKE deseni. Bastaki joker olmadigi icin
+    arama kolonunun B-tree indeksi kullanilir.
+
+    Args:
+        text (str): Kullanici arama metni
+
+    Returns:
+        str/None: 'katlanmis metin%' (bos metinde None)
+
+    Example:
+        prefix_pattern('ali_veli')  ->  'ali\\_veli%'
+    """
+    prefix = normalize_search(text).strip()
+    if not prefix:
+        return None
+    return _LIKE_RE.sub(r'\\\1', prefix) + '%'
@@ -0,0 +1,446 @@
+"""
+Kutuphane Yonetim Sistemi - LOG_ISLEM Partition Rotasyonu
+LOG_ISLEM IslemTarihi'ne gore aylik RANGE COLUMNS partition'lara bolunur
+(pYYYYMM + p_max). Rotasyon ileriki aylarin partition'larini p_max'tan
+ayirir, saklama suresini gecen aylari sikistirilmis JSONL dosyasina
+yazar ve partition'i DROP PARTITION ile siler (DELETE'in aksine aninda,
+undo log ve buffer pool yuku olmadan).
+
+read_logs() arsiv dosyalarini ve tablodaki kayitlari tek listede dondurur.
+
+Kullanim:
+    python -m src.database.log_archive --status
+    python -m src.database.log_archive --ensure
+    python -m src.database.log_archive --dry-run
+    python -m src.database.log_archive
+    python -m src.database.log_archive --read 2026-01-01 2026-03-01
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from src.config.database import DatabaseConfig
+from src.database.row_factory import ROW_DICT
+from src.utils.constants import TABLE_LOG_ISLEM
+
+
+MAX_PARTITION = 'p_max'
+LOG_COLUMNS = ('LogID', 'TabloAdi', 'IslemTipi', 'IslemTarihi', 'KullaniciID',
+               'Aciklama', 'EskiVeri', 'YeniVeri')
+
+# Arsiv dosyasi: LOG_ISLEM_p202601.jsonl.gz
+_ARCHIVE_RE = re.compile(rf'^{TABLE_LOG_ISLEM}_p(\d{{4}})(\d{{2}})\.jsonl\.gz$')
+_FETCH_SIZE = 1000
+
+
+class ArchiveError(Exception):
+    """Partition rotasyonu yapilamadi"""
+
+
+# ----------------------------------------------------------------------
+# Ay hesaplari
+# ----------------------------------------------------------------------
+
+def month_start(value):
+    """Tarihin ait oldugu ayin ilk gunu"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    """Ayin ilk gunune count ay ekler (negatif olabilir)"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """Ayin partition adi (p202601)"""
+    return f"p{month:%Y%m}"
+
+
+def archive_path(archive_dir, month):
+    """Ayin arsiv dosyasi yolu"""
+    return Path(archive_dir) / f"{TABLE_LOG_ISLEM}_{partition_name(month)}.jsonl.gz"
+
+
+# ----------------------------------------------------------------------
+# Partition yonetimi
+# ----------------------------------------------------------------------
+
+def _parse_bound(description):
+    """PARTITION_DESCRIPTION ("'2026-02-01 00:00:00'" / MAXVALUE) -> date / None"""
+    if description is None or description.upper() == 'MAXVALUE':
+        return None
+    return date.fromisoformat(description.strip("'")[:10])
+
+
+def list_partitions(conn):
+    """
+    LOG_ISLEM partition'lari (sirali)
+
+    Returns:
+        list: dict(name, month, upper, rows); month partition'in ayi
+              (p_max icin None), upper ust sinir (haric), rows tahmini satir
+
+    Raises:
+        ArchiveError: Tablo partition'li degilse
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY PARTITION_ORDINAL_POSITION
+        """,
+        (TABLE_LOG_ISLEM,)
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    if not rows or rows[0][0] is None:
+        raise ArchiveError(
+            f"{TABLE_LOG_ISLEM} partition'li degil "
+            f"(database/migrations/0005_log_islem_partition.sql uygulanmali)"
+        )
+
+    partitions = []
+    for name, description, table_rows in rows:
+        upper = _parse_bound(description)
+        partitions.append({
+            'name': name,
+            'month': add_months(upper, -1) if upper else None,
+            'upper': upper,
+            'rows': int(table_rows or 0),
+        })
+    if partitions[-1]['name'] != MAX_PARTITION:
+        raise ArchiveError(f"Son partition {MAX_PARTITION} olmali: {partitions[-1]['name']}")
+    return partitions
+
+
+def ensure_partitions(conn, months_ahead=None, today=None):
+    """
+    Bu ay ve ileriki months_ahead ay icin partition acar (p_max bolunur).
+    Ilk calismada p_max'taki en eski kaydin ayindan baslanir. p_max bos
+    oldugu surece REORGANIZE sadece metadata degisikligidir.
+
+    Args:
+        months_ahead (int): Onceden acilacak ay sayisi
+        today (date): Test icin bugunun tarihi
+
+    Returns:
+        list: Acilan partition adlari
+    """
+    months_ahead = DatabaseConfig.LOG_PARTITIONS_AHEAD if months_ahead is None else months_ahead
+    current = month_start(today or date.today())
+    partitions = list_partitions(conn)
+    bounded = [partition for partition in partitions if partition['upper']]
+
+    if bounded:
+        start = bounded[-1]['upper']
+    else:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT MIN(IslemTarihi) FROM {TABLE_LOG_ISLEM} PARTITION ({MAX_PARTITION})"
+        )
+        oldest = cursor.fetchone()[0]
+        cursor.close()
+        start = month_start(oldest) if oldest else current
+
+    end = add_months(current, months_ahead + 1)
+    definitions = []
+    created = []
+    month = start
+    while month < end:
+        upper = add_months(month, 1)
+        definitions.append(f"PARTITION {partition_name(month)} VALUES LESS THAN ('{upper:%Y-%m-%d}')")
+        created.append(partition_name(month))
+        month = upper
+    if not definitions:
+        return []
+
+    definitions.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    cursor = conn.cursor()
+    cursor.execute(
+        f"ALTER TABLE {TABLE_LOG_ISLEM} REORGANIZE PARTITION {MAX_PARTITION} INTO "
+        f"({', '.join(definitions)})"
+    )
+    cursor.close()
+    return created
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8')
+    raise TypeError(f"JSON'a cevrilemez: {type(value).__name__}")
+
+
+def export_partition(conn, partition, archive_dir):
+    """
+    Partition'in satirlarini gzip'li JSONL dosyasina yazar. Dosya once
+    gecici adla yazilir, tamamlaninca yerine tasinir; yarida kalan
+    export eksik arsiv birakmaz.
+
+    Args:
+        partition (dict): list_partitions() elemani
+        archive_dir (str): Arsiv dizini
+
+    Returns:
+        tuple: (dosya yolu veya None, satir sayisi)
+    """
+    path = archive_path(archive_dir, partition['month'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT {', '.join(LOG_COLUMNS)} FROM {TABLE_LOG_ISLEM} "
+        f"PARTITION ({partition['name']}) ORDER BY LogID"
+    )
+    count = 0
+    try:
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as archive:
+            while True:
+                rows = cursor.fetchmany(_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    archive.write(json.dumps(dict(zip(LOG_COLUMNS, row)),
+                                             default=_json_default, ensure_ascii=False))
+                    archive.write('\n')
+                count += len(rows)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        cursor.close()
+
+    if count == 0:
+        temp_path.unlink(missing_ok=True)
+        return None, 0
+    os.replace(temp_path, path)
+    return path, count
+
+
+def rotate(conn, retention_months=None, archive_dir=None, months_ahead=None,
+           dry_run=False, today=None):
+    """
+    Saklama suresini gecen partition'lari arsivler ve siler, ileriki aylarin
+    partition'larini acar
+
+    Args:
+        retention_months (int): Tabloda tutulacak ay sayisi (bu ay dahil)
+        archive_dir (str): Arsiv dizini
+        months_ahead (int): Onceden acilacak ay sayisi
+        dry_run (bool): Sadece arsivlenecek partition'lari dondur
+        today (date): Test icin bugunun tarihi
+
+    Returns:
+        dict: archived [(partition, satir, dosya)], created [partition]
+    """
+    retention_months = (DatabaseConfig.LOG_RETENTION_MONTHS
+                        if retention_months is None else retention_months)
+    archive_dir = archive_dir or DatabaseConfig.LOG_ARCHIVE_DIR
+    cutoff = add_months(month_start(today or date.today()), -(retention_months - 1))
+
+    old = [partition for partition in list_partitions(conn)
+           if partition['upper'] and partition['upper'] <= cutoff]
+    if dry_run:
+        return {'archived': [(partition['name'], partition['rows'], None) for partition in old],
+                'created': []}
+
+    archived = []
+    for partition in old:
+        path, count = export_partition(conn, partition, archive_dir)
+        # Dosya diske yazilmadan partition silinmez
+        cursor = conn.cursor()
+        cursor.execute(f"ALTER TABLE {TABLE_LOG_ISLEM} DROP PARTITION {partition['name']}")
+        cursor.close()
+        archived.append((partition['name'], count, path))
+        print(f"[LOG ARCHIVE] {partition['name']}: {count} kayit arsivlendi"
+              + (f" -> {path}" if path else ''))
+
+    created = ensure_partitions(conn, months_ahead, today)
+    return {'archived': archived, 'created': created}
+
+
+# ----------------------------------------------------------------------
+# Okuma
+# ----------------------------------------------------------------------
+
+def _matches(row, tablo_adi, islem_tipi, kullanici_id):
+    return ((tablo_adi is None or row['TabloAdi'] == tablo_adi)
+            and (islem_tipi is None or row['IslemTipi'] == islem_tipi)
+            and (kullanici_id is None or row['KullaniciID'] == kullanici_id))
+
+
+def _read_archive(archive_dir, start, end, tablo_adi, islem_tipi, kullanici_id):
+    """Tarih araligina dusen arsiv dosyalarindaki kayitlar"""
+    directory = Path(archive_dir)
+    if not directory.is_dir():
+        return
+    for path in sorted(directory.iterdir()):
+        match = _ARCHIVE_RE.match(path.name)
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        # Ay araliga hic dusmuyorsa dosya acilmaz
+        if (end and datetime.combine(month, datetime.min.time()) >= end) or \
+                (start and datetime.combine(add_months(month, 1), datetime.min.time()) <= start):
+            continue
+        with gzip.open(path, 'rt', encoding='utf-8') as archive:
+            for line in archive:
+                row = json.loads(line)
+                row['IslemTarihi'] = datetime.fromisoformat(row['IslemTarihi'])
+                if start and row['IslemTarihi'] < start:
+                    continue
+                if end and row['IslemTarihi'] >= end:
+                    continue
+                if _matches(row, tablo_adi, islem_tipi, kullanici_id):
+                    yield row
+
+
+def _as_datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.fromisoformat(str(value))
+
+
+def read_logs(start=None, end=None, tablo_adi=None, islem_tipi=None, kullanici_id=None,
+              limit=None, archive_dir=None):
+    """
+    Islem loglarini arsiv dosyalari ve LOG_ISLEM'den birlikte okur.
+    Tablo sorgusu IslemTarihi araligiyla yapilir; sadece araliga dusen
+    partition'lar taranir (partition pruning).
+
+    Args:
+        start (datetime/date/str): Baslangic (dahil)
+        end (datetime/date/str): Bitis (haric)
+        tablo_adi (str): TabloAdi filtresi
+        islem_tipi (str): INSERT / UPDATE / DELETE
+        kullanici_id (int): KullaniciID filtresi
+        limit (int): En fazla kayit (en eskiden baslayarak)
+        archive_dir (str): Arsiv dizini (None ise ayarlardaki)
+
+    Returns:
+        list: dict kayitlar (IslemTarihi, LogID sirali); arsivden gelenlerde
+              'Arsiv' anahtari True
+    """
+    from src.database.db_manager import db_manager
+
+    start, end = _as_datetime(start), _as_datetime(end)
+    conditions = []
+    params = []
+    for condition, value in (("IslemTarihi >= %s", start), ("IslemTarihi < %s", end),
+                             ("TabloAdi = %s", tablo_adi), ("IslemTipi = %s", islem_tipi),
+                             ("KullaniciID = %s", kullanici_id)):
+        if value is not None:
+            conditions.append(condition)
+            params.append(value)
+
+    logs = []
+    for row in _read_archive(archive_dir or DatabaseConfig.LOG_ARCHIVE_DIR, start, end,
+                             tablo_adi, islem_tipi, kullanici_id):
+        row['Arsiv'] = True
+        logs.append(row)
+    # Arsivlenen aylar tablodakilerden eski; siralama birlestirmede korunur
+    logs.sort(key=lambda row: (row['IslemTarihi'], row['LogID']))
+    if limit and len(logs) >= limit:
+        return logs[:limit]
+
+    query = f"SELECT {', '.join(LOG_COLUMNS)} FROM {TABLE_LOG_ISLEM}"
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    query += " ORDER BY IslemTarihi, LogID"
+    if limit:
+        query += f" LIMIT {int(limit) - len(logs)}"
+
+    try:
+        rows = db_manager.execute_query(query, tuple(params) or None, row_factory=ROW_DICT)
+    except Exception as e:
+        print(f"[DB ERROR] Log okuma hatasi: {e}")
+        rows = []
+    for row in rows:
+        row['IslemTarihi'] = _as_datetime(row['IslemTarihi'])
+        row['Arsiv'] = False
+    logs.extend(rows)
+    return logs
+
+
+# ----------------------------------------------------------------------
+# Komut satiri
+# ----------------------------------------------------------------------
+
+def main(argv=None):
+    """
+    Komut satiri girisi
+
+    Returns:
+        int: 0 basarili, 2 calistirilamadi
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.database.log_archive',
+        description='LOG_ISLEM aylik partition rotasyonu ve arsiv okuma.'
+    )
+    parser.add_argument('--status', action='store_true', help='Partition listesini yaz')
+    parser.add_argument('--ensure', action='store_true', help='Sadece ileriki ay partition\'larini ac')
+    parser.add_argument('--dry-run', action='store_true', help='Arsivlenecek partition\'lari yaz')
+    parser.add_argument('--retention', type=int, default=DatabaseConfig.LOG_RETENTION_MONTHS,
+                        help='Tabloda tutulacak ay sayisi')
+    parser.add_argument('--ahead', type=int, default=DatabaseConfig.LOG_PARTITIONS_AHEAD,
+                        help='Onceden acilacak ay sayisi')
+    parser.add_argument('--archive-dir', default=DatabaseConfig.LOG_ARCHIVE_DIR, help='Arsiv dizini')
+    parser.add_argument('--read', nargs=2, metavar=('BASLANGIC', 'BITIS'),
+                        help='Tarih araligindaki loglari (arsiv + tablo) JSONL olarak yaz')
+    args = parser.parse_args(argv)
+
+    if args.read:
+        for row in read_logs(args.read[0], args.read[1], archive_dir=args.archive_dir):
+            print(json.dumps(row, default=_json_default, ensure_ascii=False))
+        return 0
+
+    from src.database.db_manager import db_manager
+
+    if DatabaseConfig.is_sqlite():
+        print("[LOG ARCHIVE ERROR] Partition rotasyonu MySQL backend'i gerektirir (DB_BACKEND=mysql)")
+        return 2
+
+    try:
+        with db_manager.get_connection() as conn:
+            if args.status:
+                for partition in list_partitions(conn):
+                    upper = partition['upper'] or 'MAXVALUE'
+                    print(f"[LOG ARCHIVE] {partition['name']:<10} < {upper}  ~{partition['rows']} kayit")
+                return 0
+            if args.ensure:
+                created = ensure_partitions(conn, args.ahead)
+                print(f"[LOG ARCHIVE] {len(created)} partition acildi: {', '.join(created) or '-'}")
+                return 0
+
+            result = rotate(conn, args.retention, args.archive_dir, args.ahead,
+                            dry_run=args.dry_run)
+    except Exception as e:
+        print(f"[LOG ARCHIVE ERROR] {e}")
+        return 2
+
+    if args.dry_run:
+        for name, rows, _ in result['archived']:
+            print(f"[LOG ARCHIVE] arsivlenecek: {name} (~{rows} kayit)")
+    print(f"[LOG ARCHIVE] {len(result['archived'])} partition arsivlendi, "
+          f"{len(result['created'])} partition acildi")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,565 @@
+"""
+Kutuphane Yonetim Sistemi - Sema Migration'lari
+database/migrations altindaki numarali SQL dosyalarini sirayla uygular ve
+SCHEMA_VERSION tablosuna kaydeder. Indeks degisiklikleri mumkunse online
+(ALGORITHM=INPLACE, LOCK=NONE) yapilir; her adimin suresi ve kullanilan
+algoritma kayitla birlikte saklanir. Adimlar uyarilar hata sayilmadan
+calistirilir (raise_on_warnings kapali); uyarilar not olarak yazilir ve
+adim kaydina eklenir.
+
+Kullanim:
+    python -m src.database.migrations --status
+    python -m src.database.migrations --dry-run
+    python -m src.database.migrations
+    python -m src.database.migrations --target 2 --online-only
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from src.database.query_monitor import warnings_not_raised
+from src.utils.constants import TABLE_SCHEMA_VERSION
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+MIGRATIONS_DIR = BASE_DIR / 'database' / 'migrations'
+
+# Ayni anda iki runner calismasin (GET_LOCK adi)
+MIGRATION_LOCK = 'kutuphane_migrate'
+# ALTER metadata kilidini bu kadar bekler; uzun transaction'lar arkasinda
+# bekleyen ALTER tablodaki tum sorgulari bloklamasin
+LOCK_WAIT_TIMEOUT = 10
+
+# Sirayla denenen online DDL seviyeleri (algoritma, kilit)
+ONLINE_DDL_LEVELS = (('INPLACE', 'NONE'), ('INPLACE', 'SHARED'))
+
+# ALGORITHM / LOCK desteklenmiyor hatalari
+_ALTER_NOT_SUPPORTED = (1845, 1846)
+
+_FILE_RE = re.compile(r'^(\d+)_(\w+)\.sql$')
+_DELIMITER_RE = re.compile(r'^DELIMITER\s+(\S+)$', re.I)
+_ALTER_RE = re.compile(r'^\s*ALTER\s+TABLE\s+`?(\w+)`?', re.I)
+_DDL_OPTION_RE = re.compile(r'\b(?:ALGORITHM|LOCK)\s*=', re.I)
+# Partition islemleri ALGORITHM / LOCK almaz, oldugu gibi calisir
+_PARTITION_RE = re.compile(r'\bPARTITION\b', re.I)
+_ADD_INDEX_RE = re.compile(
+    r'\bADD\s+(?:UNIQUE\s+|FULLTEXT\s+|SPATIAL\s+)?(?:INDEX|KEY)\s+`?(\w+)`?', re.I
+)
+_DROP_INDEX_RE = re.compile(r'\bDROP\s+(?:INDEX|KEY)\s+`?(\w+)`?', re.I)
+_DROP_FK_RE = re.compile(r'\bDROP\s+FOREIGN\s+KEY\s+`?(\w+)`?', re.I)
+_DROP_CHECK_RE = re.compile(r'\bDROP\s+CHECK\s+`?(\w+)`?', re.I)
+_ADD_PK_RE = re.compile(r'\bADD\s+PRIMARY\s+KEY\s*\(([^)]*)\)', re.I)
+_PARTITION_BY_RE = re.compile(r'\bPARTITION\s+BY\b', re.I)
+_ADD_COLUMN_RE = re.compile(r'\bADD\s+COLUMN\s+`?(\w+)`?', re.I)
+# Migration dosyasinda acikca yazilmis, yazmalari bloklayan DDL
+_OFFLINE_DDL_RE = re.compile(r'\bALGORITHM\s*=\s*COPY\b|\bLOCK\s*=\s*(?:SHARED|EXCLUSIVE)\b', re.I)
+
+# database/schema.sql'deki SCHEMA_VERSION tanimiyla ayni
+VERSION_TABLE_DDL = f"""
+    CREATE TABLE IF NOT EXISTS {TABLE_SCHEMA_VERSION} (
+        Surum INT PRIMARY KEY,
+        Ad VARCHAR(100) NOT NULL,
+        Checksum CHAR(64) NOT NULL,
+        UygulanmaTarihi DATETIME DEFAULT CURRENT_TIMESTAMP,
+        SureMs INT NOT NULL,
+        Adimlar JSON
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci
+"""
+
+
+class MigrationError(Exception):
+    """Migration adimi uygulanamadi"""
+
+
+# ----------------------------------------------------------------------
+# Dosyalar
+# ----------------------------------------------------------------------
+
+def split_statements(sql):
+    """
+    Migration dosyasini ifadelere ayirir. Satir sonundaki ';' ifadeyi
+    bitirir; '--' ile baslayan satirlar atlanir. mysql istemcisindeki gibi
+    'DELIMITER //' satiri ayraci degistirir (trigger / procedure govdeleri);
+    DELIMITER satirlari sunucuya gonderilmez.
+
+    Args:
+        sql (str): Dosya icerigi
+
+    Returns:
+        list: SQL ifadeleri
+    """
+    statements = []
+    current = []
+    delimiter = ';'
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('--'):
+            continue
+        match = _DELIMITER_RE.match(stripped)
+        if match:
+            delimiter = match.group(1)
+            continue
+        if stripped.endswith(delimiter):
+            current.append(line.rstrip()[:-len(delimiter)])
+            statements.append('\n'.join(current).strip())
+            current = []
+        else:
+            current.append(line)
+    statements.append('\n'.join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """
+    Migration dosyalarini surum sirasina gore yukler
+
+    Args:
+        directory (Path): Migration dizini
+
+    Returns:
+        list: dict(version, name, path, checksum, statements)
+
+    Raises:
+        MigrationError: Ayni surum numarasi iki dosyada kullanildiysa
+    """
+    migrations = {}
+    for path in sorted(Path(directory).glob('*.sql')):
+        match = _FILE_RE.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(
+                f"Surum {version} iki kez tanimli: {migrations[version]['path'].name}, {path.name}"
+            )
+        sql = path.read_text(encoding='utf-8')
+        migrations[version] = {
+            'version': version,
+            'name': match.group(2),
+            'path': path,
+            'checksum': hashlib.sha256(sql.encode('utf-8')).hexdigest(),
+            'statements': split_statements(sql),
+        }
+    return [migrations[version] for version in sorted(migrations)]
+
+
+# ----------------------------------------------------------------------
+# Veritabani
+# ----------------------------------------------------------------------
+
+def ensure_version_table(conn):
+    """SCHEMA_VERSION tablosunu (yoksa) olusturur"""
+    # Tablo varsa IF NOT EXISTS Note 1050 uretir
+    with warnings_not_raised(conn):
+        cursor = conn.cursor()
+        cursor.execute(VERSION_TABLE_DDL)
+        cursor.close()
+
+
+def applied_versions(conn):
+    """
+    Uygulanmis migration'lar
+
+    Returns:
+        dict: surum -> dict(Ad, Checksum, UygulanmaTarihi, SureMs)
+    """
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(
+        f"SELECT Surum, Ad, Checksum, UygulanmaTarihi, SureMs FROM {TABLE_SCHEMA_VERSION} "
+        f"ORDER BY Surum"
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    return {row['Surum']: row for row in rows}
+
+
+def _existing_indexes(cursor, table):
+    """Tablodaki indeks adlari (kucuk harf)"""
+    cursor.execute(
+        """
+        SELECT DISTINCT INDEX_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        (table,)
+    )
+    return {row[0].lower() for row in cursor.fetchall()}
+
+
+def _existing_columns(cursor, table):
+    """Tablodaki kolon adlari (kucuk harf)"""
+    cursor.execute(
+        """
+        SELECT COLUMN_NAME
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        (table,)
+    )
+    return {row[0].lower() for row in cursor.fetchall()}
+
+
+def _existing_constraints(cursor, table, constraint_type):
+    """Tablodaki FOREIGN KEY / CHECK kisitlarinin adlari (kucuk harf)"""
+    cursor.execute(
+        """
+        SELECT CONSTRAINT_NAME
+        FROM information_schema.TABLE_CONSTRAINTS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+          AND CONSTRAINT_TYPE = %s
+        """,
+        (table, constraint_type)
+    )
+    return {row[0].lower() for row in cursor.fetchall()}
+
+
+def _primary_key_columns(cursor, table):
+    """Birincil anahtar kolonlari (sirali, kucuk harf)"""
+    cursor.execute(
+        """
+        SELECT COLUMN_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = 'PRIMARY'
+        ORDER BY SEQ_IN_INDEX
+        """,
+        (table,)
+    )
+    return [row[0].lower() for row in cursor.fetchall()]
+
+
+def _is_partitioned(cursor, table):
+    """Tablo partition'li mi?"""
+    cursor.execute(
+        """
+        SELECT COUNT(*)
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+          AND PARTITION_NAME IS NOT NULL
+        """,
+        (table,)
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def _already_applied(cursor, statement):
+    """
+    ALTER'in etkisi zaten var mi? schema.sql ile kurulan veya yarida kalmis
+    bir migration'da adim tekrar calistirilmaz. Kolon ekleme, indeks
+    ekleme / silme, foreign key / check silme, birincil anahtar degisikligi
+    ve PARTITION BY taninir; diger ifadeler her zaman calistirilir.
+    """
+    match = _ALTER_RE.match(statement)
+    if not match:
+        return False
+    table = match.group(1)
+    checks = []
+
+    added = _ADD_INDEX_RE.findall(statement)
+    dropped = _DROP_INDEX_RE.findall(statement)
+    if added or dropped:
+        existing = _existing_indexes(cursor, table)
+        checks.append(all(name.lower() in existing for name in added)
+                      and not any(name.lower() in existing for name in dropped))
+
+    added_columns = _ADD_COLUMN_RE.findall(statement)
+    if added_columns:
+        existing = _existing_columns(cursor, table)
+        checks.append(all(name.lower() in existing for name in added_columns))
+
+    dropped_fks = _DROP_FK_RE.findall(statement)
+    if dropped_fks:
+        existing = _existing_constraints(cursor, table, 'FOREIGN KEY')
+        checks.append(not any(name.lower() in existing for name in dropped_fks))
+
+    dropped_checks = _DROP_CHECK_RE.findall(statement)
+    if dropped_checks:
+        existing = _existing_constraints(cursor, table, 'CHECK')
+        checks.append(not any(name.lower() in existing for name in dropped_checks))
+
+    primary_key = _ADD_PK_RE.search(statement)
+    if primary_key:
+        columns = [column.strip(' `').lower() for column in primary_key.group(1).split(',')]
+        checks.append(_primary_key_columns(cursor, table) == columns)
+
+    if _PARTITION_BY_RE.search(statement):
+        checks.append(_is_partitioned(cursor, table))
+
+    return bool(checks) and all(checks)
+
+
+def _ddl_attempts(statement, online_only):
+    """
+    ALTER TABLE icin denenecek (ifade, algoritma) listesi. ALGORITHM / LOCK
+    zaten yazilmissa veya partition islemiyse ifade oldugu gibi calisir.
+    """
+    if (not _ALTER_RE.match(statement) or _DDL_OPTION_RE.search(statement)
+            or _PARTITION_RE.search(statement)):
+        return [(statement, None)]
+    levels = ONLINE_DDL_LEVELS[:1] if online_only else ONLINE_DDL_LEVELS
+    return [
+        (f"{statement}, ALGORITHM={algorithm}, LOCK={lock}", f"{algorithm}/{lock}")
+        for algorithm, lock in levels
+    ]
+
+
+def _statement_warnings(cursor):
+    """Son ifadenin uyarilari ('Seviye Kod: Mesaj')"""
+    cursor.execute("SHOW WARNINGS")
+    return [f"{level} {code}: {message}" for level, code, message in cursor.fetchall()]
+
+
+def run_statement(cursor, statement, online_only=False):
+    """
+    Tek bir migration adimini calistirir. Online DDL desteklenmiyorsa bir
+    sonraki (daha kisitli) kilit seviyesi denenir. Baglantida
+    raise_on_warnings kapali olmalidir (apply_migration); ifadenin uyarilari
+    adim kaydina eklenir.
+
+    Args:
+        cursor: MySQL cursor
+        statement (str): SQL ifadesi
+        online_only (bool): Sadece LOCK=NONE'a izin ver
+
+    Returns:
+        dict: sql, algorithm, ms, skipped, warnings
+    """
+    started = time.perf_counter()
+    step = {'sql': statement, 'algorithm': None, 'ms': 0, 'skipped': False, 'warnings': []}
+
+    if _already_applied(cursor, statement):
+        step['skipped'] = True
+        return step
+
+    if online_only and _ALTER_RE.match(statement) and _PARTITION_RE.search(statement):
+        raise MigrationError(f"Partition islemi online yapilamaz (--online-only)\n    {statement}")
+    if online_only and _ALTER_RE.match(statement) and _OFFLINE_DDL_RE.search(statement):
+        raise MigrationError(f"Ifade yazmalari bloklar (--online-only)\n    {statement}")
+
+    attempts = _ddl_attempts(statement, online_only)
+    for index, (sql, algorithm) in enumerate(attempts):
+        try:
+            cursor.execute(sql)
+            if cursor.with_rows:
+                cursor.fetchall()
+        except Exception as e:
+            last = index == len(attempts) - 1
+            if last or getattr(e, 'errno', None) not in _ALTER_NOT_SUPPORTED:
+                raise MigrationError(f"{e}\n    {sql}") from e
+            print(f"[MIGRATE] {algorithm} desteklenmiyor, sonraki seviye deneniyor: {e}")
+            continue
+        step['algorithm'] = algorithm
+        break
+
+    step['ms'] = int((time.perf_counter() - started) * 1000)
+    step['warnings'] = _statement_warnings(cursor)
+    return step
+
+
+def apply_migration(conn, migration, online_only=False):
+    """
+    Migration'in tum adimlarini uygular ve SCHEMA_VERSION'a yazar. DDL
+    MySQL'de otomatik commit edildiginden yarida kalan migration tekrar
+    calistirildiginda uygulanmis indeks adimlari atlanir. Uyarilar (ilk
+    FULLTEXT indeksindeki 124, IF [NOT] EXISTS notlari vb.) DDL calistiktan
+    sonra hata olarak firlatilmaz, not olarak yazilir.
+
+    Args:
+        conn: MySQL baglantisi
+        migration (dict): load_migrations() elemani
+        online_only (bool): Sadece LOCK=NONE'a izin ver
+
+    Returns:
+        list: Adim kayitlari (run_statement sonuclari)
+    """
+    cursor = conn.cursor()
+    started = time.perf_counter()
+    steps = []
+    try:
+        with warnings_not_raised(conn):
+            for statement in migration['statements']:
+                step = run_statement(cursor, statement, online_only)
+                steps.append(step)
+                status = 'atlandi' if step['skipped'] else f"{step['ms']} ms {step['algorithm'] or ''}"
+                print(f"[MIGRATE]   {statement.splitlines()[0][:100]}  ({status.strip()})")
+                for warning in step['warnings']:
+                    print(f"[MIGRATE]     not: {warning}")
+
+        total_ms = int((time.perf_counter() - started) * 1000)
+        cursor.execute(
+            f"""
+            INSERT INTO {TABLE_SCHEMA_VERSION} (Surum, Ad, Checksum, SureMs, Adimlar)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            (migration['version'], migration['name'], migration['checksum'],
+             total_ms, json.dumps(steps, ensure_ascii=False))
+        )
+        conn.commit()
+    except Exception:
+        # Yarida kalan dosyanin LOCK TABLES'i baglanti havuza donmeden birakilir
+        try:
+            cursor.execute("UNLOCK TABLES")
+        except Exception:
+            pass
+        raise
+    finally:
+        cursor.close()
+    return steps
+
+
+def _acquire_lock(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT GET_LOCK(%s, 0)", (MIGRATION_LOCK,))
+    acquired = cursor.fetchone()[0] == 1
+    cursor.close()
+    return acquired
+
+
+def _release_lock(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+    cursor.fetchall()
+    cursor.close()
+
+
+def migrate(conn, migrations, target=None, online_only=False,
+            lock_wait_timeout=LOCK_WAIT_TIMEOUT):
+    """
+    Uygulanmamis migration'lari sirayla uygular
+
+    Args:
+        conn: MySQL baglantisi
+        migrations (list): load_migrations() sonucu
+        target (int): Bu surume kadar uygula (None ise hepsi)
+        online_only (bool): Sadece LOCK=NONE ile yapilabilen DDL'e izin ver
+        lock_wait_timeout (int): ALTER'in metadata kilidi bekleme suresi (sn)
+
+    Returns:
+        list: Uygulanan surum numaralari
+
+    Raises:
+        MigrationError: Baska runner calisiyorsa veya bir adim basarisizsa
+    """
+    if not _acquire_lock(conn):
+        raise MigrationError("Baska bir migration calisiyor")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SET SESSION lock_wait_timeout = %s", (lock_wait_timeout,))
+        cursor.close()
+
+        ensure_version_table(conn)
+        applied = applied_versions(conn)
+        done = []
+        for migration in migrations:
+            version = migration['version']
+            if version in applied:
+                continue
+            if target is not None and version > target:
+                break
+            print(f"[MIGRATE] {version:04d}_{migration['name']} uygulaniyor")
+            steps = apply_migration(conn, migration, online_only)
+            total_ms = sum(step['ms'] for step in steps)
+            print(f"[MIGRATE] {version:04d}_{migration['name']} tamamlandi ({total_ms} ms)")
+            done.append(version)
+        return done
+    finally:
+        _release_lock(conn)
+
+
+# ----------------------------------------------------------------------
+# Komut satiri
+# ----------------------------------------------------------------------
+
+def _print_status(migrations, applied):
+    for migration in migrations:
+        record = applied.get(migration['version'])
+        label = f"{migration['version']:04d}_{migration['name']}"
+        if record is None:
+            print(f"[BEKLIYOR]   {label}")
+            continue
+        note = ''
+        if not record['Checksum']:
+            note = '  (schema.sql ile kuruldu)'
+        elif record['Checksum'] != migration['checksum']:
+            note = '  (dosya uygulandiktan sonra degismis!)'
+        print(f"[UYGULANDI]  {label}  {record['UygulanmaTarihi']}  {record['SureMs']} ms{note}")
+    known = {migration['version'] for migration in migrations}
+    for version in sorted(set(applied) - known):
+        print(f"[BILINMIYOR] {version:04d}_{applied[version]['Ad']} (dosyasi yok)")
+
+
+def main(argv=None):
+    """
+    Komut satiri girisi
+
+    Returns:
+        int: 0 basarili, 1 migration basarisiz, 2 calistirilamadi
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.database.migrations',
+        description='database/migrations altindaki sema degisikliklerini uygular.'
+    )
+    parser.add_argument('--dir', default=str(MIGRATIONS_DIR), help='Migration dizini')
+    parser.add_argument('--status', action='store_true', help='Uygulanmis / bekleyen migration listesi')
+    parser.add_argument('--dry-run', action='store_true', help='Bekleyen adimlari yaz, uygulama')
+    parser.add_argument('--target', type=int, metavar='N', help='N numarali surume kadar uygula')
+    parser.add_argument('--online-only', action='store_true',
+                        help='LOCK=NONE ile yapilamayan DDL adimlarinda dur')
+    parser.add_argument('--lock-wait-timeout', type=int, default=LOCK_WAIT_TIMEOUT,
+                        help='ALTER metadata kilidi bekleme suresi (sn)')
+    args = parser.parse_args(argv)
+
+    try:
+        migrations = load_migrations(args.dir)
+    except MigrationError as e:
+        print(f"[MIGRATE ERROR] {e}")
+        return 2
+
+    from src.config.database import DatabaseConfig
+    from src.database.db_manager import db_manager
+
+    if DatabaseConfig.is_sqlite():
+        # SQLite semasi (schema_sqlite.sql) her acilista IF NOT EXISTS ile uygulanir
+        print("[MIGRATE ERROR] Migration'lar MySQL backend'i icindir (DB_BACKEND=mysql)")
+        return 2
+
+    try:
+        with db_manager.get_connection() as conn:
+            ensure_version_table(conn)
+            applied = applied_versions(conn)
+
+            if args.status:
+                _print_status(migrations, applied)
+                return 0
+
+            if args.dry_run:
+                for migration in migrations:
+                    if migration['version'] in applied:
+                        continue
+                    if args.target is not None and migration['version'] > args.target:
+                        break
+                    print(f"[MIGRATE] {migration['version']:04d}_{migration['name']}")
+                    for statement in migration['statements']:
+                        sql, _ = _ddl_attempts(statement, args.online_only)[0]
+                        print(f"    {sql};")
+                return 0
+
+            done = migrate(conn, migrations, target=args.target, online_only=args.online_only,
+                           lock_wait_timeout=args.lock_wait_timeout)
+    except MigrationError as e:
+        print(f"[MIGRATE ERROR] {e}")
+        return 1
+    except Exception as e:
+        print(f"[MIGRATE ERROR] {e}")
+        return 2
+
+    print(f"[MIGRATE] {len(done)} migration uygulandi" if done else "[MIGRATE] Sema guncel")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Kutuphane Yonetim Sistemi - Keyset Sayfalama
+Liste sorgularini OFFSET yerine son gorulen siralama anahtarindan
+devam ederek (seek) sayfalar:
+    WHERE Kolon <= %s AND (Kolon < %s OR (Kolon = %s AND ID < %s))
+    ORDER BY Kolon DESC, ID DESC LIMIT n
+Siralama kolonu indeksli oldugunda sayfa maliyeti tablo boyutundan ve
+sayfa numarasindan bagimsizdir. Satir karsilastirmasi ((Kolon, ID) <
+(%s, %s)) MySQL'de range erisimine cevrilmedigi icin acik hali yazilir;
+bastaki Kolon <= %s fazladan bir sinirdir, SQLite da OR'lu ifadede indeksi
+aralik olarak kullanir.
+
+Siralama kolonlari NOT NULL olmalidir (NULL satir karsilastirmasi
+bilinmeyen doner ve sayfalar arasinda kaybolur). ID her zaman ikinci
+anahtar olarak eklenir, ayni degerli satirlar tekrarlanmaz veya atlanmaz.
+"""
+
+from src.config.database import DatabaseConfig
+from src.database.db_manager import db_manager
+from src.utils.constants import LIST_PAGE_SIZE
+
+
+def parse_sort(sort, sort_keys):
+    """
+    Siralama ifadesini cozer ('-Kolon' azalan, 'Kolon' artan)
+
+    Args:
+        sort (str): Siralama ifadesi
+        sort_keys (dict): Izin verilen anahtar -> SQL kolonu
+
+    Returns:
+        tuple: (anahtar, SQL kolonu, azalan mi)
+
+    Raises:
+        ValueError: Anahtar sort_keys'te yoksa
+    """
+    descending = sort.startswith('-')
+    key = sort.lstrip('-+')
+    if key not in sort_keys:
+        raise ValueError(f"Gecersiz siralama: {sort} (gecerli: {', '.join(sort_keys)})")
+    return key, sort_keys[key], descending
+
+
+def fetch_page(select_query, sort_keys, id_key, sort, cursor=None, page_size=None,
+               row_factory=None):
+    """
+    Keyset sayfasi getirir
+
+    Args:
+        select_query (str): WHERE / ORDER BY icermeyen SELECT ... FROM ... sorgusu
+        sort_keys (dict): Siralanabilir anahtarlar -> SQL kolonu; anahtar
+            sonuc satirindaki kolon adiyla ayni olmali
+        id_key (str): Benzersiz ID anahtari (sort_keys icinde)
+        sort (str): Siralama ifadesi ('-KitapID', 'KitapAdi', ...)
+        cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+        page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+        row_factory (str): Satir tipi
+
+    Returns:
+        tuple: (satirlar: list, next_cursor: tuple veya None)
+    """
+    page_size = page_size or LIST_PAGE_SIZE
+    key, column, descending = parse_sort(sort, sort_keys)
+    keys = [key] if key == id_key else [key, id_key]
+    columns = [sort_keys[k] for k in keys]
+    direction = 'DESC' if descending else 'ASC'
+
+    query = select_query
+    params = []
+    if cursor is not None:
+        if len(cursor) != len(keys):
+            raise ValueError(f"Cursor {sort} siralamasina ait degil")
+        operator = '<' if descending else '>'
+        if len(columns) == 1:
+            query += f" WHERE {columns[0]} {operator} %s"
+            params.extend(cursor)
+        else:
+            first, second = columns
+            query += (f" WHERE {first} {operator}= %s AND ({first} {operator} %s"
+                      f" OR ({first} = %s AND {second} {operator} %s))")
+            params.extend((cursor[0], cursor[0], cursor[0], cursor[1]))
+
+    query += f" ORDER BY {', '.join(f'{c} {direction}' for c in columns)} LIMIT %s"
+    # Bir fazla satir istenir: sonraki sayfa var mi bilmek icin COUNT(*) gerekmez
+    params.append(page_size + 1)
+
+    rows = db_manager.execute_query(query, tuple(params), row_factory=row_factory)
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, tuple(rows[-1][k] for k in keys)
+
+
+def estimated_count(table):
+    """
+    Tablodaki yaklasik satir sayisi (UI sayaclari icin, COUNT(*) yerine).
+    MySQL'de information_schema.TABLES.TABLE_ROWS InnoDB istatistiginden
+    gelir: tahminidir ve information_schema_stats_expiry suresince
+    (varsayilan 24 saat) onbellekte kalabilir. SQLite'ta COUNT(*) yapilir.
+
+    Args:
+        table (str): Tablo adi
+
+    Returns:
+        int: Yaklasik satir sayisi (hata durumunda 0)
+    """
+    try:
+        if DatabaseConfig.is_sqlite():
+            result = db_manager.execute_query(
+                f"SELECT COUNT(*) as Sayi FROM {table}", fetch_one=True, cache=True
+            )
+        else:
+            result = db_manager.execute_query(
+                """
+                SELECT TABLE_ROWS as Sayi
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+                """,
+                (table,), fetch_one=True, cache=True
+            )
+        return int(result['Sayi'] or 0) if result else 0
+    except Exception as e:
+        print(f"[DB ERROR] Satir sayisi tahmini hatasi ({table}): {e}")
+        return 0
@@ -0,0 +1,673 @@
+"""
+Kutuphane Yonetim Sistemi - Sorgu Plani Kontrolu
+Model ve pencerelerdeki SQL sorgularini toplayip EXPLAIN FORMAT=JSON ile
+inceler; full scan, filesort ve gecici tablo kullanimini isaretler ve
+kayitli baseline'a gore kotulesen planlarda hata verir.
+
+Kullanim:
+    python -m src.database.plan_check --list
+    python -m src.database.plan_check --seed 2000
+    python -m src.database.plan_check
+    python -m src.database.plan_check --update
+"""
+
+import argparse
+import ast
+import json
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.database.query_monitor import fingerprint, warnings_not_raised
+from src.utils import constants
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Sorgulari toplanan kaynaklar (modeller ve rapor / yonetim pencereleri)
+DEFAULT_SOURCES = (BASE_DIR / 'src' / 'models', BASE_DIR / 'src' / 'ui')
+DEFAULT_BASELINE = BASE_DIR / 'database' / 'plan_baseline.json'
+
+# Maliyet bu oranin uzerinde artarsa plan kotulesmis sayilir
+COST_TOLERANCE = 1.5
+# Kucuk tablolardaki oynamalari yok saymak icin en az maliyet farki
+MIN_COST_DELTA = 10.0
+
+# EXPLAIN edilebilen sorgular (INSERT ... VALUES plani ilginc degil)
+_SQL_RE = re.compile(r'^\s*(select|with|update|delete)\b', re.I)
+_PLACEHOLDER_RE = re.compile(r'%s|%\((\w+)\)s')
+
+# Placeholder'dan onceki metinden kolon adini bulan kaliplar
+_CONTEXT_PATTERNS = (
+    (re.compile(r'\blike\s*$', re.I), 'like'),
+    (re.compile(r'\b(?:limit|offset)\s*$|\blimit\s+\S+\s*,\s*$', re.I), 'limit'),
+    (re.compile(r'(\w+)\s*\)?\s*between\s+\S+\s+and\s*$', re.I), None),
+    (re.compile(r'(\w+)\s*\)?\s*(?:=|<>|!=|<=|>=|<|>|between)\s*$', re.I), None),
+    (re.compile(r'(\w+)\s*\)?\s+(?:not\s+)?in\s*\((?:[^()]*,)?\s*$', re.I), None),
+)
+
+_NUMERIC_TYPES = {
+    'tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint',
+    'decimal', 'numeric', 'float', 'double', 'year', 'bit',
+}
+_DATE_TYPES = {'date', 'datetime', 'timestamp'}
+
+# --seed ile eklenen sentetik satirlarin isareti
+SEED_MARKER = 'plancheck'
+
+
+# ----------------------------------------------------------------------
+# Kaynak koddan SQL toplama
+# ----------------------------------------------------------------------
+
+def _is_sql(text):
+    """Metin EXPLAIN edilebilir bir SQL sorgusu mu?"""
+    return bool(text) and bool(_SQL_RE.match(text))
+
+
+def _string_value(node, env):
+    """
+    Ifadeyi statik olarak stringe cevirir (literal, f-string, sabit adi
+    ve + birlestirme). Cozulemeyen ifade icin None dondurur.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value if isinstance(node.value, str) else None
+    if isinstance(node, ast.Name):
+        return env.get(node.id)
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                value = value.value
+            part = _string_value(value, env)
+            if part is None:
+                return None
+            parts.append(part)
+        return ''.join(parts)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _string_value(node.left, env)
+        right = _string_value(node.right, env)
+        if left is None or right is None:
+            return None
+        return left + right
+    return None
+
+
+class _SqlCollector:
+    """
+    Bir modul icindeki SQL sorgularini toplar. "query += ..." ile kosullu
+    eklenen parcalar if govdesinden alinir, elif / else dallarindaki
+    eklemeler atlanir; boylece her sorgunun "tum filtreler acik" hali
+    incelenir. Cozulemeyen f-string'ler (dinamik SET listeleri) atlanir.
+    """
+
+    def __init__(self, source, env):
+        self.source = source
+        self.env = env
+        self.found = []
+
+    def collect(self, tree):
+        self._block(tree.body, dict(self.env), {}, frozenset())
+        return self.found
+
+    def _add(self, sql, lineno):
+        self.found.append({'sql': sql, 'source': f"{self.source}:{lineno}"})
+        return len(self.found) - 1
+
+    def _block(self, body, env, opened, frozen):
+        for stmt in body:
+            self._statement(stmt, env, opened, frozen)
+
+    def _statement(self, stmt, env, opened, frozen):
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._block(stmt.body, dict(env), {}, frozenset())
+        elif isinstance(stmt, ast.ClassDef):
+            self._block(stmt.body, env, opened, frozen)
+        elif isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 \
+                and isinstance(stmt.targets[0], ast.Name):
+            name = stmt.targets[0].id
+            value = _string_value(stmt.value, env)
+            if value is None:
+                env.pop(name, None)
+                opened.pop(name, None)
+                self._scan(stmt.value, env)
+                return
+            env[name] = value
+            if _is_sql(value):
+                opened[name] = self._add(value, stmt.lineno)
+            else:
+                opened.pop(name, None)
+        elif isinstance(stmt, ast.AugAssign) and isinstance(stmt.op, ast.Add) \
+                and isinstance(stmt.target, ast.Name):
+            name = stmt.target.id
+            value = _string_value(stmt.value, env)
+            if name in frozen or name not in env or value is None:
+                return
+            env[name] += value
+            if name in opened:
+                self.found[opened[name]]['sql'] = env[name]
+        elif isinstance(stmt, ast.If):
+            self._scan(stmt.test, env)
+            self._block(stmt.body, env, opened, frozen)
+            # elif / else dallari: disaridan gelen sorguya ekleme yapilmaz
+            self._block(stmt.orelse, env, opened, frozen | set(opened))
+        elif isinstance(stmt, (ast.For, ast.AsyncFor, ast.While)):
+            self._scan(getattr(stmt, 'iter', None) or stmt.test, env)
+            self._block(stmt.body, env, opened, frozen)
+            self._block(stmt.orelse, env, opened, frozen)
+        elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+            for item in stmt.items:
+                self._scan(item.context_expr, env)
+            self._block(stmt.body, env, opened, frozen)
+        elif isinstance(stmt, ast.Try):
+            self._block(stmt.body, env, opened, frozen)
+            for handler in stmt.handlers:
+                self._block(handler.body, env, opened, frozen)
+            self._block(stmt.orelse, env, opened, frozen)
+            self._block(stmt.finalbody, env, opened, frozen)
+        else:
+            for child in ast.iter_child_nodes(stmt):
+                if isinstance(child, ast.expr):
+                    self._scan(child, env)
+
+    def _scan(self, node, env):
+        """Atamaya baglanmamis SQL literallerini bulur (execute_query('SELECT ...'))"""
+        if node is None:
+            return
+        if isinstance(node, (ast.Constant, ast.JoinedStr)):
+            value = _string_value(node, env)
+            if _is_sql(value):
+                self._add(value, node.lineno)
+            return
+        for child in ast.iter_child_nodes(node):
+            self._scan(child, env)
+
+
+def _module_constants(tree, env):
+    """Modul seviyesindeki string sabitlerini env'e ekler"""
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 \
+                and isinstance(stmt.targets[0], ast.Name):
+            value = _string_value(stmt.value, env)
+            if value is not None:
+                env[stmt.targets[0].id] = value
+
+
+def collect_statements(paths=DEFAULT_SOURCES):
+    """
+    Kaynak dosyalardaki SQL sorgularini statik olarak toplar. Modul
+    import edilmez (PyQt5 gerekmez); tablo adi sabitleri constants'tan,
+    modul sabitleri (BOOK_LIST_QUERY vb.) dosyalardan cozulur.
+
+    Args:
+        paths (iterable): Dosya veya dizin yollari
+
+    Returns:
+        list: Parmak izine gore tekillestirilmis sorgular
+            ({'fingerprint', 'sql', 'sources'})
+    """
+    files = []
+    for path in paths:
+        path = Path(path)
+        files.extend(sorted(path.rglob('*.py')) if path.is_dir() else [path])
+
+    env = {
+        name: value for name, value in vars(constants).items()
+        if name.isupper() and isinstance(value, str)
+    }
+    trees = []
+    for path in files:
+        try:
+            tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+        except (OSError, SyntaxError) as e:
+            print(f"[PLAN WARNING] {path} okunamadi: {e}")
+            continue
+        _module_constants(tree, env)
+        trees.append((path, tree))
+
+    statements = {}
+    for path, tree in trees:
+        try:
+            source = path.relative_to(BASE_DIR).as_posix()
+        except ValueError:
+            source = str(path)
+        for item in _SqlCollector(source, env).collect(tree):
+            key = fingerprint(item['sql'])
+            entry = statements.setdefault(key, {
+                'fingerprint': key, 'sql': item['sql'], 'sources': []
+            })
+            if item['source'] not in entry['sources']:
+                entry['sources'].append(item['source'])
+    return list(statements.values())
+
+
+# ----------------------------------------------------------------------
+# Ornek parametreler
+# ----------------------------------------------------------------------
+
+def load_column_types(connection):
+    """
+    Veritabanindaki kolon tiplerini okur
+
+    Returns:
+        dict: {kolon_adi_kucuk: data_type}
+    """
+    cursor = connection.cursor()
+    cursor.execute(
+        "SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE()"
+    )
+    types = {}
+    for column, data_type in cursor.fetchall():
+        types.setdefault(str(column).lower(), str(data_type).lower())
+    cursor.close()
+    return types
+
+
+def _sample_value(context, name, column_types):
+    """Placeholder yerine konacak, kolon tipine uygun literal"""
+    column = name
+    for pattern, kind in _CONTEXT_PATTERNS:
+        match = pattern.search(context)
+        if not match:
+            continue
+        if kind == 'like':
+            return "'%a%'"
+        if kind == 'limit':
+            return '10'
+        column = column or match.group(1)
+        break
+
+    data_type = column_types.get((column or '').lower())
+    if data_type in _NUMERIC_TYPES:
+        return '1'
+    if data_type in _DATE_TYPES:
+        return f"'{date.today().isoformat()}'"
+    if data_type is not None:
+        return "'a'"
+    return '1'
+
+
+def sample_statement(sql, column_types):
+    """
+    Parametreli sorgudaki placeholder'lari kolon tipine uygun ornek
+    degerlerle doldurur. Ornegin "WHERE Email = %s" -> "WHERE Email = 'a'";
+    string kolonu sayi ile karsilastirmak index'i devre disi birakacagi
+    icin tip onemlidir.
+
+    Args:
+        sql (str): SQL sorgusu
+        column_types (dict): load_column_types sonucu
+
+    Returns:
+        str: EXPLAIN edilecek sorgu
+    """
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(sql):
+        parts.append(sql[position:match.start()])
+        context = ''.join(parts)[-200:]
+        parts.append(_sample_value(context, match.group(1), column_types))
+        position = match.end()
+    parts.append(sql[position:])
+    return ''.join(parts)
+
+
+# ----------------------------------------------------------------------
+# Plan analizi
+# ----------------------------------------------------------------------
+
+def _walk_plan(node, issues):
+    """EXPLAIN JSON agacinda sorunlu erisimleri toplar"""
+    if isinstance(node, dict):
+        table = node.get('table_name')
+        access = node.get('access_type')
+        if table and access == 'ALL':
+            issues.add(f"full_scan:{table}")
+        elif table and access == 'index':
+            issues.add(f"full_index_scan:{table}")
+        if node.get('using_filesort'):
+            issues.add('filesort')
+        if node.get('using_temporary_table'):
+            issues.add('temporary')
+        for value in node.values():
+            _walk_plan(value, issues)
+    elif isinstance(node, list):
+        for value in node:
+            _walk_plan(value, issues)
+
+
+def plan_issues(plan):
+    """
+    EXPLAIN FORMAT=JSON ciktisini ozetler
+
+    Args:
+        plan (dict): Ayristirilmis EXPLAIN JSON'u
+
+    Returns:
+        tuple: (sirali sorun listesi, sorgu maliyeti veya None)
+    """
+    issues = set()
+    _walk_plan(plan, issues)
+    cost = plan.get('query_block', {}).get('cost_info', {}).get('query_cost')
+    try:
+        cost = float(cost) if cost is not None else None
+    except (TypeError, ValueError):
+        cost = None
+    return sorted(issues), cost
+
+
+def explain_statements(connection, statements):
+    """
+    Her sorguyu EXPLAIN FORMAT=JSON ile inceler
+
+    Args:
+        connection: Veritabani baglantisi
+        statements (list): collect_statements sonucu
+
+    Returns:
+        list: Sorgu basina {'fingerprint', 'sources', 'issues', 'cost', 'error'}
+    """
+    column_types = load_column_types(connection)
+    results = []
+    cursor = connection.cursor()
+    try:
+        # EXPLAIN SELECT'e eklenen Note 1003 uyarisi hata sayilmasin
+        with warnings_not_raised(connection):
+            for statement in statements:
+                result = {
+                    'fingerprint': statement['fingerprint'],
+                    'sources': statement['sources'],
+                    'issues': [],
+                    'cost': None,
+                    'error': None,
+                }
+                try:
+                    cursor.execute('EXPLAIN FORMAT=JSON ' + sample_statement(statement['sql'], column_types))
+                    row = cursor.fetchone()
+                    cursor.fetchall()
+                    result['issues'], result['cost'] = plan_issues(json.loads(row[0]))
+                except Exception as e:
+                    # Sorun degil hata: baseline'a yazilmaz, calismayi basarisiz yapar
+                    result['error'] = str(e)
+                results.append(result)
+    finally:
+        cursor.close()
+        # EXPLAIN UPDATE / DELETE hicbir sey yazmaz, yine de transaction kapatilir
+        connection.rollback()
+    return results
+
+
+# ----------------------------------------------------------------------
+# Baseline
+# ----------------------------------------------------------------------
+
+def load_baseline(path):
+    """
+    Baseline dosyasini okur
+
+    Returns:
+        dict: {fingerprint: {'sources', 'issues', 'cost'}} (dosya yoksa bos)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle).get('statements', {})
+
+
+def save_baseline(path, results):
+    """Mevcut planlari baseline olarak yazar"""
+    statements = {
+        result['fingerprint']: {
+            'sources': result['sources'],
+            'issues': result['issues'],
+            'cost': result['cost'],
+        }
+        for result in sorted(results, key=lambda result: result['fingerprint'])
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump({'version': 1, 'statements': statements}, handle,
+                  ensure_ascii=False, indent=2)
+        handle.write('\n')
+
+
+def compare(results, baseline, tolerance=COST_TOLERANCE, min_cost_delta=MIN_COST_DELTA):
+    """
+    Planlari baseline ile karsilastirir
+
+    Args:
+        results (list): explain_statements sonucu
+        baseline (dict): load_baseline sonucu
+        tolerance (float): Izin verilen maliyet artis orani
+        min_cost_delta (float): Bundan kucuk maliyet artislari yok sayilir
+
+    Returns:
+        dict: errors, regressions, new, improved (sonuc + aciklama
+            listeleri) ve removed (artik kodda olmayan parmak izleri)
+    """
+    report = {'errors': [], 'regressions': [], 'new': [], 'improved': [], 'removed': []}
+    seen = set()
+
+    for result in results:
+        key = result['fingerprint']
+        seen.add(key)
+        if result.get('error'):
+            # EXPLAIN edilemeyen sorgu baseline'la eslesse de basarisizdir
+            report['errors'].append((result, 'EXPLAIN hatasi'))
+            continue
+        base = baseline.get(key)
+        if base is None:
+            if result['issues']:
+                report['new'].append((result, ', '.join(result['issues'])))
+            continue
+
+        added = sorted(set(result['issues']) - set(base.get('issues', ())))
+        removed = sorted(set(base.get('issues', ())) - set(result['issues']))
+        old_cost, cost = base.get('cost'), result['cost']
+        if added:
+            report['regressions'].append((result, 'yeni: ' + ', '.join(added)))
+        elif old_cost and cost and cost > old_cost * tolerance and cost - old_cost >= min_cost_delta:
+            report['regressions'].append((result, f"maliyet {old_cost:.1f} -> {cost:.1f}"))
+        elif removed:
+            report['improved'].append((result, 'giderildi: ' + ', '.join(removed)))
+
+    report['removed'] = sorted(set(baseline) - seen)
+    return report
+
+
+# ----------------------------------------------------------------------
+# Sentetik veri
+# ----------------------------------------------------------------------
+
+def seed_database(connection, scale):
+    """
+    Planlarin kucuk ornek veride yaniltici olmamasi icin sentetik uye,
+    kitap, odunc ve ceza satirlari ekler. Daha once eklenenler sayilir,
+    sadece eksik kisim tamamlanir.
+
+    Args:
+        connection: Veritabani baglantisi
+        scale (int): Uye ve kitap sayisi (odunc sayisi bunun 3 kati)
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT MIN(KategoriID) FROM KATEGORI")
+        kategori_id = cursor.fetchone()[0]
+        cursor.execute("SELECT MIN(KullaniciID) FROM KULLANICI")
+        kullanici_id = cursor.fetchone()[0]
+        if kategori_id is None or kullanici_id is None:
+            raise ValueError("Once sample_data.sql yuklenmeli (KATEGORI / KULLANICI bos)")
+
+        cursor.execute("SELECT COUNT(*) FROM UYE WHERE Email LIKE %s", (f"%@{SEED_MARKER}.invalid",))
+        existing = cursor.fetchone()[0]
+        if existing >= scale:
+            print(f"[PLAN] Sentetik veri zaten var ({existing} uye)")
+            return
+
+        start = existing
+        cursor.executemany(
+            "INSERT INTO UYE (Ad, Soyad, Email, Telefon, Adres) VALUES (%s, %s, %s, %s, %s)",
+            [(f"Ad{i}", f"Soyad{i % 997}", f"uye{i}@{SEED_MARKER}.invalid",
+              f"5{i:09d}"[:15], SEED_MARKER) for i in range(start, scale)]
+        )
+        cursor.executemany(
+            "INSERT INTO KITAP (KitapAdi, Yazar, KategoriID, ISBN, ToplamAdet, MevcutAdet, RafNo) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            [(f"Kitap {i}", f"Yazar {i % 499}", kategori_id, f"PC-{i:010d}", 10, 10, SEED_MARKER)
+             for i in range(start, scale)]
+        )
+
+        cursor.execute("SELECT UyeID FROM UYE WHERE Email LIKE %s ORDER BY UyeID",
+                       (f"%@{SEED_MARKER}.invalid",))
+        uye_ids = [row[0] for row in cursor.fetchall()][start:]
+        cursor.execute("SELECT KitapID FROM KITAP WHERE RafNo = %s ORDER BY KitapID", (SEED_MARKER,))
+        kitap_ids = [row[0] for row in cursor.fetchall()][start:]
+
+        today = date.today()
+        loans = []
+        for i in range(3 * len(uye_ids)):
+            odunc = today - timedelta(days=(i * 7) % 730)
+            son_teslim = odunc + timedelta(days=constants.ODUNC_SURE_GUN)
+            # %80 teslim edilmis, kalani aktif (bir kismi gecikmis)
+            teslim = odunc + timedelta(days=i % 20) if i % 5 else None
+            loans.append((uye_ids[i % len(uye_ids)], kitap_ids[i % len(kitap_ids)], kullanici_id,
+                          odunc, son_teslim, teslim, SEED_MARKER))
+        cursor.executemany(
+            "INSERT INTO ODUNC (UyeID, KitapID, KullaniciID, OduncTarihi, SonTeslimTarihi, "
+            "TeslimTarihi, Notlar) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            loans
+        )
+        cursor.execute(
+            "INSERT INTO CEZA (OduncID, UyeID, Tutar, GecikmeGunu, Aciklama) "
+            "SELECT OduncID, UyeID, 5.00, 1, %s FROM ODUNC "
+            "WHERE Notlar = %s AND MOD(OduncID, 10) = 0 "
+            "AND OduncID NOT IN (SELECT OduncID FROM CEZA WHERE Aciklama = %s)",
+            (SEED_MARKER, SEED_MARKER, SEED_MARKER)
+        )
+        connection.commit()
+        print(f"[PLAN] {len(uye_ids)} uye, {len(kitap_ids)} kitap, {len(loans)} odunc eklendi")
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def analyze_tables(connection):
+    """Index istatistiklerini gunceller (planlar tutarli olsun)"""
+    tables = (constants.TABLE_KULLANICI, constants.TABLE_UYE, constants.TABLE_KATEGORI,
+              constants.TABLE_KITAP, constants.TABLE_ODUNC, constants.TABLE_CEZA,
+              constants.TABLE_LOG_ISLEM)
+    cursor = connection.cursor()
+    cursor.execute(f"ANALYZE TABLE {', '.join(tables)}")
+    cursor.fetchall()
+    cursor.close()
+
+
+# ----------------------------------------------------------------------
+# Komut satiri
+# ----------------------------------------------------------------------
+
+def _print_findings(title, findings):
+    for result, detail in findings:
+        print(f"[{title}] {result['sources'][0]}  {detail}")
+        if result.get('error'):
+            print(f"    {result['error']}")
+        print(f"    {result['fingerprint'][:160]}")
+
+
+def main(argv=None):
+    """
+    Komut satiri girisi
+
+    Returns:
+        int: 0 basarili, 1 plan gerilemesi veya EXPLAIN hatasi var,
+            2 calistirilamadi. Baseline dosyasi yoksa sorunlu sorgular
+            sadece raporlanir, yalnizca EXPLAIN hatalari 1 dondurur.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.database.plan_check',
+        description='Model ve pencere sorgularinin planlarini baseline ile karsilastirir.'
+    )
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON dosyasi')
+    parser.add_argument('--update', action='store_true', help='Mevcut planlari baseline olarak kaydet')
+    parser.add_argument('--list', action='store_true', help='Sadece toplanan sorgulari listele')
+    parser.add_argument('--seed', type=int, metavar='N', help='N uye / kitap ve 3N odunc ekle')
+    parser.add_argument('--analyze', action='store_true', help='Once ANALYZE TABLE calistir')
+    parser.add_argument('--tolerance', type=float, default=COST_TOLERANCE,
+                        help='Izin verilen maliyet artis orani')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Tum sorgularin sonucunu yaz')
+    parser.add_argument('paths', nargs='*', help='Taranacak dosya / dizinler')
+    args = parser.parse_args(argv)
+
+    statements = collect_statements(args.paths or DEFAULT_SOURCES)
+    if args.list:
+        for statement in statements:
+            print(f"{', '.join(statement['sources'])}\n    {statement['fingerprint']}")
+        print(f"{len(statements)} sorgu")
+        return 0
+
+    # Veritabani baglantisi sadece plan incelemesi icin gerekir
+    from src.config.database import DatabaseConfig
+    from src.database.db_manager import db_manager
+
+    if DatabaseConfig.is_sqlite():
+        print("[PLAN ERROR] Plan kontrolu MySQL backend'i gerektirir (DB_BACKEND=mysql)")
+        return 2
+
+    try:
+        with db_manager.get_connection() as conn:
+            if args.seed:
+                seed_database(conn, args.seed)
+            if args.seed or args.analyze:
+                analyze_tables(conn)
+            results = explain_statements(conn, statements)
+    except Exception as e:
+        print(f"[PLAN ERROR] {e}")
+        return 2
+
+    if args.update:
+        errors = [result for result in results if result['error']]
+        if errors:
+            _print_findings('HATA', [(result, 'EXPLAIN hatasi') for result in errors])
+            print(f"[PLAN ERROR] {len(errors)} sorgu EXPLAIN edilemedi, baseline kaydedilmedi")
+            return 1
+        save_baseline(args.baseline, results)
+        print(f"[PLAN] {len(results)} sorgu plani kaydedildi: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    report = compare(results, baseline, tolerance=args.tolerance)
+
+    if args.verbose:
+        for result in results:
+            cost = f"{result['cost']:.1f}" if result['cost'] is not None else '-'
+            issues = 'error' if result['error'] else ', '.join(result['issues']) or 'ok'
+            print(f"[PLAN] {result['sources'][0]}  maliyet={cost}  {issues}")
+
+    _print_findings('HATA', report['errors'])
+    _print_findings('GERILEME', report['regressions'])
+    _print_findings('YENI', report['new'])
+    _print_findings('IYILESME', report['improved'])
+    for key in report['removed']:
+        print(f"[KALDIRILDI] {key[:160]}")
+
+    print(f"[PLAN] {len(results)} sorgu incelendi: {len(report['errors'])} hata, "
+          f"{len(report['regressions'])} gerileme, "
+          f"{len(report['new'])} yeni sorunlu sorgu, {len(report['improved'])} iyilesme")
+    if not Path(args.baseline).exists():
+        # Ilk calistirma: mevcut sorunlar "yeni" sayilip calistirmayi dusurmesin
+        print(f"[PLAN] Baseline yok ({args.baseline}); karsilastirma icin once "
+              f"--update ile mevcut planlari kaydedin")
+        return 1 if report['errors'] else 0
+    if report['improved'] or report['removed']:
+        print("[PLAN] Baseline'i guncellemek icin --update kullanin")
+    return 1 if report['errors'] or report['regressions'] or report['new'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,421 @@
+"""
+Kutuphane Yonetim Sistemi - Connection Pool
+Bekleme kuyruklu, overflow destekli ve izlenebilir MySQL baglanti havuzu
+"""
+
+import threading
+import time
+from collections import deque
+
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+
+class _PoolEntry:
+    """Havuzdaki fiziksel baglanti ve zaman bilgileri"""
+
+    __slots__ = ('cnx', 'created_at', 'last_used')
+
+    def __init__(self, cnx):
+        now = time.monotonic()
+        self.cnx = cnx
+        self.created_at = now
+        self.last_used = now
+
+
+class PooledConnection:
+    """
+    Pool'dan alinan baglanti. close() fiziksel baglantiyi kapatmaz,
+    havuza geri birakir. Diger tum metodlar fiziksel baglantiya iletilir.
+    """
+
+    def __init__(self, pool, entry, wait_time):
+        self._pool = pool
+        self._entry = entry
+        self._cnx = entry.cnx
+        self.wait_time = wait_time
+
+    def __getattr__(self, name):
+        if self._cnx is None:
+            raise PoolError("Baglanti havuza geri birakilmis")
+        return getattr(self._cnx, name)
+
+    @property
+    def pool_name(self):
+        """Baglantinin ait oldugu havuz adi"""
+        return self._pool.pool_name
+
+    def close(self):
+        """Baglantiyi havuza geri birakir"""
+        if self._cnx is None:
+            return
+        entry, self._entry, self._cnx = self._entry, None, None
+        self._pool._release(entry)
+
+
+class ConnectionPool:
+    """
+    Thread-safe MySQL baglanti havuzu.
+
+    Tum baglantilar kullanimdayken get_connection() hemen hata vermez;
+    cagiran FIFO sirali bir kuyrukta pool_timeout saniyeye kadar bekler.
+    pool_size uzerinde pool_max_overflow kadar gecici baglanti acilabilir,
+    bunlar geri birakildiginda kapatilir.
+
+    Checkout ucuzdur: session ayarlari (session_init) fiziksel baglanti
+    basina bir kez yapilir (pool_reset_session acikken her iadede
+    tekrarlanir), ping sadece pool_validate_idle saniyeden uzun
+    bosta kalan baglantilara atilir. pool_keepalive > 0 ise arka plan
+    thread'i bosta bekleyen baglantilari canli tutar.
+    """
+
+    LATENCY_SAMPLES = 1000
+
+    def __init__(self, pool_name='kutuphane_pool', pool_size=5, pool_max_overflow=0,
+                 pool_timeout=30.0, pool_recycle=3600, pool_reset_session=False,
+                 pool_validate_idle=30.0, pool_keepalive=0, session_init=(),
+                 connector=None, **connect_kwargs):
+        self.pool_name = pool_name
+        self.pool_size = pool_size
+        self.max_overflow = pool_max_overflow
+        self.timeout = pool_timeout
+        self.recycle = pool_recycle
+        self.reset_session = pool_reset_session
+        # Bu sureden uzun bosta kalan baglanti checkout'ta ping'lenir
+        # (0: her checkout'ta, None: hic)
+        self.validate_idle = pool_validate_idle
+        self.keepalive = pool_keepalive
+        # Fiziksel baglanti acildiginda bir kez calisan SET ifadeleri
+        self.session_init = tuple(session_init)
+        self._connect_kwargs = connect_kwargs
+        # Baglanti fabrikasi (varsayilan mysql.connector.connect, SQLite icin sqlite_backend.connect)
+        self._connector = connector or mysql.connector.connect
+
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._waiters = deque()
+        self._open = 0
+        self._in_use = 0
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._validations = 0
+        self._recycled = 0
+        self._keepalive_pings = 0
+        self._latencies = deque(maxlen=self.LATENCY_SAMPLES)
+
+        self._stop = threading.Event()
+        self._keepalive_thread = None
+        if self.keepalive:
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop, name=f"{pool_name}_keepalive", daemon=True
+            )
+            self._keepalive_thread.start()
+
+    # ------------------------------------------------------------------
+    # Checkout / release
+    # ------------------------------------------------------------------
+
+    def get_connection(self, timeout=None):
+        """
+        Havuzdan baglanti alir, gerekirse sirasini bekler
+
+        Args:
+            timeout (float): Bekleme suresi (None ise pool_timeout)
+
+        Returns:
+            PooledConnection: Havuz baglantisi
+
+        Raises:
+            PoolError: Sure icinde baglanti alinamazsa veya havuz kapatildiysa
+        """
+        started = time.monotonic()
+        deadline = started + (self.timeout if timeout is None else timeout)
+        ticket = object()
+
+        with self._cond:
+            self._waiters.append(ticket)
+            try:
+                while True:
+                    if self._stop.is_set():
+                        raise PoolError(f"Baglanti havuzu kapatildi ({self.pool_name})")
+                    # Sadece kuyrugun basindaki bekleyen baglanti alabilir
+                    if self._waiters[0] is ticket:
+                        if self._idle:
+                            entry = self._idle.pop()
+                            break
+                        if self._open < self.pool_size + self.max_overflow:
+                            self._open += 1
+                            entry = None
+                            break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolError(
+                            f"Baglanti havuzu dolu ({self.pool_name}), "
+                            f"{self.timeout if timeout is None else timeout} sn beklendi"
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters.remove(ticket)
+                self._cond.notify_all()
+
+            self._in_use += 1
+
+        try:
+            entry = self._prepare(entry)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._open -= 1
+                self._cond.notify_all()
+            raise
+
+        wait_time = time.monotonic() - started
+        with self._cond:
+            self._checkouts += 1
+            self._latencies.append(wait_time)
+
+        return PooledConnection(self, entry, wait_time)
+
+    def _prepare(self, entry):
+        """Yeni baglanti acar veya mevcut baglantiyi kullanima hazirlar"""
+        if entry is None:
+            return _PoolEntry(self._connect())
+
+        now = time.monotonic()
+        if self._expired(entry, now):
+            self._close_quietly(entry.cnx)
+            with self._cond:
+                self._recycled += 1
+            return _PoolEntry(self._connect())
+
+        # Sadece uzun sure bosta kalan baglanti ping'lenir
+        if self.validate_idle is not None and now - entry.last_used >= self.validate_idle:
+            with self._cond:
+                self._validations += 1
+            if not entry.cnx.is_connected():
+                # Yeniden baglanmak session ayarlarini siler, yeni baglanti acilir
+                self._close_quietly(entry.cnx)
+                return _PoolEntry(self._connect())
+        return entry
+
+    def _expired(self, entry, now):
+        """Baglanti pool_recycle suresini asti mi?"""
+        return bool(self.recycle) and now - entry.created_at > self.recycle
+
+    def _release(self, entry):
+        """Baglantiyi havuza geri koyar veya kapatir"""
+        keep = True
+        try:
+            if self.reset_session:
+                entry.cnx.reset_session()
+                # Reset session degiskenlerini de siler
+                self._init_session(entry.cnx)
+            elif entry.cnx.in_transaction:
+                # Acik kalan snapshot sonraki kullaniciya tasinmasin
+                entry.cnx.rollback()
+        except Error:
+            keep = False
+
+        with self._cond:
+            self._in_use -= 1
+            # close_all'dan sonra geri gelen baglanti havuza girmez
+            if keep and self._open <= self.pool_size and not self._stop.is_set():
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._open -= 1
+                keep = False
+            self._cond.notify_all()
+
+        if not keep:
+            self._close_quietly(entry.cnx)
+
+    def _connect(self):
+        """Yeni fiziksel baglanti acar ve session ayarlarini bir kez yapar"""
+        cnx = self._connector(**self._connect_kwargs)
+        try:
+            self._init_session(cnx)
+        except Exception:
+            self._close_quietly(cnx)
+            raise
+        return cnx
+
+    def _init_session(self, cnx):
+        """session_init ifadelerini calistirir"""
+        if not self.session_init:
+            return
+        cursor = cnx.cursor()
+        try:
+            for statement in self.session_init:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    # ------------------------------------------------------------------
+    # Keepalive
+    # ------------------------------------------------------------------
+
+    def _keepalive_loop(self):
+        """Bosta bekleyen baglantilari periyodik olarak ping'ler / yeniler"""
+        while not self._stop.wait(self.keepalive):
+            try:
+                self.ping_idle()
+            except Exception as e:
+                print(f"[DB ERROR] Keepalive hatasi ({self.pool_name}): {e}")
+
+    def ping_idle(self, min_idle=None):
+        """
+        min_idle saniyeden uzun bosta kalan baglantilari ping'ler. Kopuk
+        veya pool_recycle suresini asmis baglantilar yenisiyle degistirilir,
+        boylece uzun bir aradan sonraki ilk istek baglanti kurmak zorunda kalmaz.
+
+        Args:
+            min_idle (float): Bosta kalma esigi (None ise keepalive araligi)
+
+        Returns:
+            int: Kontrol edilen baglanti sayisi
+        """
+        min_idle = self.keepalive if min_idle is None else min_idle
+        now = time.monotonic()
+        with self._cond:
+            # Kontrol sirasinda _open'da sayilmaya devam eder
+            stale = [entry for entry in self._idle if now - entry.last_used >= min_idle]
+            for entry in stale:
+                self._idle.remove(entry)
+
+        for entry in stale:
+            fresh = entry
+            try:
+                if self._expired(entry, now):
+                    self._close_quietly(entry.cnx)
+                    with self._cond:
+                        self._recycled += 1
+                    fresh = _PoolEntry(self._connect())
+                elif not entry.cnx.is_connected():
+                    self._close_quietly(entry.cnx)
+                    fresh = _PoolEntry(self._connect())
+                else:
+                    entry.last_used = time.monotonic()
+            except Exception:
+                fresh = None
+
+            keep = fresh is not None
+            with self._cond:
+                self._keepalive_pings += 1
+                keep = keep and not self._stop.is_set()
+                if keep:
+                    self._idle.appendleft(fresh)
+                else:
+                    self._open -= 1
+                self._cond.notify_all()
+            if fresh is not None and not keep:
+                self._close_quietly(fresh.cnx)
+        return len(stale)
+
+    def warm(self, count=None, progress=None):
+        """
+        Toplam acik baglanti count olana kadar bosta bekleyen baglanti acar.
+        Baglantilar tek tek acilir; bu sirada gelen istekler havuzu normal
+        kullanir, acilan her baglanti hemen kullanilabilir.
+
+        Args:
+            count (int): Hedef baglanti sayisi (None ise pool_size, en fazla pool_size)
+            progress (callable): Her baglantidan sonra progress(acilan, hedef)
+
+        Returns:
+            int: Acilan baglanti sayisi
+
+        Raises:
+            Error: Baglanti acilamazsa
+        """
+        target = self.pool_size if count is None else min(count, self.pool_size)
+        with self._cond:
+            needed = max(target - self._open, 0)
+
+        opened = 0
+        while opened < needed:
+            with self._cond:
+                if self._stop.is_set() or self._open >= target:
+                    break
+                self._open += 1
+            try:
+                entry = _PoolEntry(self._connect())
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify_all()
+            opened += 1
+            if progress:
+                progress(opened, needed)
+        return opened
+
+    @staticmethod
+    def _close_quietly(cnx):
+        try:
+            cnx.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Yonetim
+    # ------------------------------------------------------------------
+
+    def close_all(self):
+        """
+        Havuzu kapatir: keepalive durur, bostaki baglantilar kapatilir.
+        O an kullanimdaki baglantilar geri verildiginde kapatilir; bekleyen
+        ve sonraki get_connection cagrilari PoolError alir.
+        """
+        with self._cond:
+            self._stop.set()
+            entries = list(self._idle)
+            self._idle.clear()
+            self._open -= len(entries)
+            self._cond.notify_all()
+        for entry in entries:
+            self._close_quietly(entry.cnx)
+
+    def get_stats(self):
+        """
+        Anlik havuz istatistikleri
+
+        Returns:
+            dict: in_use, idle, waiters, open, checkouts, timeouts ve
+                  bekleme suresi yuzdelikleri (ms)
+        """
+        with self._cond:
+            latencies = sorted(self._latencies)
+            stats = {
+                'pool_name': self.pool_name,
+                'pool_size': self.pool_size,
+                'max_overflow': self.max_overflow,
+                'open': self._open,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiters': len(self._waiters),
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'validations': self._validations,
+                'recycled': self._recycled,
+                'keepalive_pings': self._keepalive_pings,
+            }
+
+        for name, pct in (('wait_p50_ms', 0.50), ('wait_p95_ms', 0.95), ('wait_p99_ms', 0.99)):
+            stats[name] = _percentile(latencies, pct) * 1000.0
+        return stats
+
+
+def _percentile(sorted_values, pct):
+    """Sirali listeden yuzdelik deger (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct * len(sorted_values))) - 1))
+    return sorted_values[index]
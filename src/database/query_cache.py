@@ -0,0 +1,196 @@
+"""
+Kutuphane Yonetim Sistemi - Sorgu Sonuc Onbellegi
+TTL ve LRU sinirli, tablo bazinda gecersiz kilinan sonuc cache'i
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+_TABLE_RE = re.compile(
+    r'\b(?:from|join|update|into|table)\s+`?(\w+)`?(?:\s*\.\s*`?(\w+)`?)?', re.I
+)
+
+
+def tables_in(query):
+    """
+    SQL metninde gecen tablo adlarini bulur (FROM, JOIN, UPDATE, INTO, TABLE)
+
+    Args:
+        query (str): SQL sorgusu
+
+    Returns:
+        frozenset: Buyuk harfli tablo adlari
+    """
+    tables = set()
+    for schema_or_table, table in _TABLE_RE.findall(query):
+        tables.add((table or schema_or_table).upper())
+    return frozenset(tables)
+
+
+def _freeze(params):
+    """Parametreleri cache anahtari olarak kullanilabilir hale getirir"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    return tuple(params)
+
+
+class QueryCache:
+    """
+    Sorgu + parametre anahtarli sonuc cache'i. Her kayit okudugu tablolari
+    tutar; bir tabloya yazildiginda o tabloyu okuyan kayitlar silinir.
+    """
+
+    def __init__(self, max_entries=256, default_ttl=60.0):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._by_table = {}
+        self._versions = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(query, params, *variant):
+        """
+        Cache anahtari olusturur
+
+        Args:
+            query (str): SQL sorgusu
+            params: Sorgu parametreleri
+            *variant: Sonucun sekline etki eden ek bilgiler (fetch_one vb.)
+        """
+        return (query, _freeze(params)) + variant
+
+    def get(self, key):
+        """
+        Gecerli kayit varsa sonucu dondurur
+
+        Returns:
+            tuple: (bulundu mu, sonuc)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            result, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, result
+
+    def versions(self, tables):
+        """
+        Tablolarin gecersiz kilinma sayaclarini dondurur. Sorgudan once
+        alinip put()'a verilir; arada yazma olduysa eski sonuc cache'e girmez.
+
+        Args:
+            tables (iterable): Tablo adlari
+
+        Returns:
+            tuple: Tablo bazinda sayaclar
+        """
+        with self._lock:
+            return self._versions_of(table.upper() for table in tables)
+
+    def _versions_of(self, tables):
+        """versions() govdesi (_lock altinda cagrilir)"""
+        return (self._epoch,) + tuple(self._versions.get(table, 0) for table in sorted(tables))
+
+    def put(self, key, result, tables, ttl=None, versions=None):
+        """
+        Sonucu cache'e yazar
+
+        Args:
+            key: make_key() ile olusturulan anahtar
+            result: Sorgu sonucu
+            tables (iterable): Sorgunun okudugu tablolar
+            ttl (float): Yasam suresi (sn), None ise default_ttl
+            versions (tuple): Sorgudan once alinan versions(tables) degeri
+        """
+        tables = frozenset(table.upper() for table in tables)
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            if versions is not None and versions != self._versions_of(tables):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (result, expires_at, tables)
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key):
+        """Kaydi ve tablo indeksini siler (_lock altinda cagrilir)"""
+        _, _, tables = self._entries.pop(key)
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def invalidate_tables(self, tables):
+        """
+        Verilen tablolari okuyan tum kayitlari siler
+
+        Args:
+            tables (iterable): Yazilan tablolar
+
+        Returns:
+            int: Silinen kayit sayisi
+        """
+        removed = 0
+        with self._lock:
+            for table in tables:
+                table = table.upper()
+                self._versions[table] = self._versions.get(table, 0) + 1
+                for key in list(self._by_table.get(table, ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        """Tum cache'i temizler"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_table.clear()
+            self._epoch += 1
+
+    def get_stats(self):
+        """
+        Cache istatistikleri
+
+        Returns:
+            dict: hits, misses, hit_ratio, entries, evictions, invalidations
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': (self.hits / total) if total else 0.0,
+                'entries': len(self._entries),
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
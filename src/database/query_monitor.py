@@ -0,0 +1,231 @@
+"""
+Kutuphane Yonetim Sistemi - Sorgu Izleme
+Sorgu parmak izi, sure istatistikleri ve yavas sorgu logu
+"""
+
+import json
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+
+_COMMENT_RE = re.compile(r'(--[^\n]*|/\*.*?\*/)', re.S)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%s|%\(\w+\)s|\?')
+_IN_LIST_RE = re.compile(r'\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_VALUES_RE = re.compile(r'\bvalues\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*')
+_SPACE_RE = re.compile(r'\s+')
+
+_EXPLAINABLE = ('select', 'update', 'delete', 'insert', 'replace')
+
+
+@contextmanager
+def warnings_not_raised(connection):
+    """
+    Blok boyunca baglantinin uyarilari hata olarak firlatmasini kapatir.
+    MySQL 8 SELECT'in EXPLAIN'ine Note 1003 ekler; raise_on_warnings acik
+    baglantida plan okunduktan sonra fetch hata verir.
+
+    Args:
+        connection: Veritabani baglantisi (SQLite baglantisi oldugu gibi kalir)
+    """
+    raise_on_warnings = getattr(connection, 'raise_on_warnings', False)
+    get_warnings = getattr(connection, 'get_warnings', False)
+    if raise_on_warnings or get_warnings:
+        connection.raise_on_warnings = False
+        connection.get_warnings = False
+    try:
+        yield connection
+    finally:
+        if raise_on_warnings or get_warnings:
+            # raise_on_warnings setter'i get_warnings'i de degistirir, once o
+            connection.raise_on_warnings = raise_on_warnings
+            connection.get_warnings = get_warnings
+
+
+def fingerprint(query):
+    """
+    SQL sorgusunu literal degerlerden arindirip normalize eder.
+    Ayni sekildeki sorgular (farkli parametrelerle) ayni parmak izini alir.
+
+    Args:
+        query (str): SQL sorgusu
+
+    Returns:
+        str: Normalize edilmis sorgu
+    """
+    text = _COMMENT_RE.sub(' ', query)
+    text = _STRING_RE.sub('?', text)
+    text = _PLACEHOLDER_RE.sub('?', text)
+    text = _NUMBER_RE.sub('?', text)
+    text = _SPACE_RE.sub(' ', text).strip().lower()
+    text = _IN_LIST_RE.sub('in (?+)', text)
+    text = _VALUES_RE.sub(r'values \1', text)
+    return text
+
+
+def params_shape(params):
+    """
+    Parametre degerlerini loglamadan tiplerini ozetler
+
+    Args:
+        params (tuple/dict): Sorgu parametreleri
+
+    Returns:
+        list/dict: Tip ozetleri (ornegin ['int', 'str[12]', 'None'])
+    """
+    def describe(value):
+        if value is None:
+            return 'None'
+        if isinstance(value, (str, bytes)):
+            return f"{type(value).__name__}[{len(value)}]"
+        return type(value).__name__
+
+    if params is None:
+        return []
+    if isinstance(params, dict):
+        return {key: describe(value) for key, value in params.items()}
+    return [describe(value) for value in params]
+
+
+class QueryMonitor:
+    """
+    Parmak izi bazinda sorgu istatistiklerini toplar, esik degerini asan
+    sorgulari EXPLAIN ciktisiyla birlikte donen log dosyasina yazar.
+    """
+
+    def __init__(self, slow_threshold_ms=500, log_path=None, max_bytes=5 * 1024 * 1024,
+                 backup_count=5, explain=True):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.explain = explain
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._logger = None
+
+        if log_path:
+            self._logger = self._create_logger(log_path, max_bytes, backup_count)
+
+    @staticmethod
+    def _create_logger(log_path, max_bytes, backup_count):
+        """Yavas sorgu logu icin donen dosya logger'i olusturur"""
+        path = Path(log_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"[DB WARNING] Yavas sorgu logu acilamadi: {e}")
+            return None
+
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.getLogger('kutuphane.slow_query')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.handlers = [handler]
+        return logger
+
+    def record(self, kind, query, params, elapsed, rows=0, wait_time=0.0, connection=None):
+        """
+        Tek bir sorgu calismasini kaydeder
+
+        Args:
+            kind (str): query / update / many / procedure
+            query (str): SQL sorgusu veya procedure adi
+            params: Sorgu parametreleri
+            elapsed (float): Toplam sure (sn), baglanti bekleme dahil
+            rows (int): Donen veya etkilenen satir sayisi
+            wait_time (float): Pool'dan baglanti bekleme suresi (sn)
+            connection: EXPLAIN icin hala tutulan baglanti (opsiyonel)
+        """
+        key = fingerprint(query) if kind != 'procedure' else f"call {query}"
+        elapsed_ms = elapsed * 1000.0
+        wait_ms = wait_time * 1000.0
+
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = {
+                    'fingerprint': key, 'kind': kind, 'count': 0,
+                    'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0,
+                    'wait_ms': 0.0, 'slow': 0,
+                }
+                self._stats[key] = stat
+            stat['count'] += 1
+            stat['total_ms'] += elapsed_ms
+            stat['max_ms'] = max(stat['max_ms'], elapsed_ms)
+            stat['rows'] += rows or 0
+            stat['wait_ms'] += wait_ms
+
+            is_slow = self.slow_threshold_ms is not None and elapsed_ms >= self.slow_threshold_ms
+            if is_slow:
+                stat['slow'] += 1
+
+        if is_slow:
+            self._log_slow(kind, key, query, params, elapsed_ms, rows, wait_ms, connection)
+
+    def _log_slow(self, kind, key, query, params, elapsed_ms, rows, wait_ms, connection):
+        """Yavas sorguyu log dosyasina yazar"""
+        if self._logger is None:
+            return
+
+        entry = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'kind': kind,
+            'elapsed_ms': round(elapsed_ms, 2),
+            'wait_ms': round(wait_ms, 2),
+            'rows': rows,
+            'fingerprint': key,
+            'statement': _SPACE_RE.sub(' ', query).strip(),
+            'params': params_shape(params),
+        }
+        if self.explain and connection is not None and kind != 'procedure':
+            entry['explain'] = self._explain(connection, query, params)
+
+        self._logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
+    @staticmethod
+    def _explain(connection, query, params):
+        """Sorgu planini dondurur (hata olursa mesaji)"""
+        statement = query.strip()
+        if not statement.lower().startswith(_EXPLAINABLE):
+            return None
+        cursor = None
+        try:
+            with warnings_not_raised(connection):
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(f"EXPLAIN {statement}", params or ())
+                return cursor.fetchall()
+        except Exception as e:
+            return f"EXPLAIN hatasi: {e}"
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def get_stats(self, top=20, order_by='total_ms'):
+        """
+        En pahali sorgu parmak izlerini dondurur
+
+        Args:
+            top (int): Kac kayit donsun (None ise hepsi)
+            order_by (str): Siralama alani (total_ms, max_ms, count, ...)
+
+        Returns:
+            list: Parmak izi istatistikleri (avg_ms dahil)
+        """
+        with self._lock:
+            stats = [dict(stat) for stat in self._stats.values()]
+        for stat in stats:
+            stat['avg_ms'] = stat['total_ms'] / stat['count'] if stat['count'] else 0.0
+        stats.sort(key=lambda stat: stat.get(order_by, 0), reverse=True)
+        return stats[:top] if top else stats
+
+    def reset(self):
+        """Istatistikleri sifirlar"""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,170 @@
+"""
+Kutuphane Yonetim Sistemi - Deadlock / Lock Wait Tekrar Deneme
+Gecici kilit catismalari icin jitter'li ustel bekleme ve procedure
+cagrilari icin idempotency korumasi
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from mysql.connector import errorcode
+
+
+# Sunucunun islemi tamamen geri aldigi, tekrar denemenin guvenli oldugu hatalar
+RETRYABLE_ERRORS = {
+    errorcode.ER_LOCK_DEADLOCK: 'deadlocks',
+    errorcode.ER_LOCK_WAIT_TIMEOUT: 'lock_wait_timeouts',
+}
+
+
+def retry_reason(error):
+    """
+    Hata tekrar denenebilir mi?
+
+    Args:
+        error (Exception): Veritabani hatasi
+
+    Returns:
+        str/None: Sayac adi (deadlocks / lock_wait_timeouts) veya None
+    """
+    return RETRYABLE_ERRORS.get(getattr(error, 'errno', None))
+
+
+class RetryPolicy:
+    """
+    1213 (deadlock) ve 1205 (lock wait timeout) hatalarinda islemi
+    "full jitter" ustel bekleme ile tekrar calistirir ve sayaclari tutar.
+    """
+
+    def __init__(self, attempts=3, base_delay=0.05, max_delay=1.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._stats = {
+            'retries': 0,
+            'deadlocks': 0,
+            'lock_wait_timeouts': 0,
+            'recovered': 0,
+            'gave_up': 0,
+        }
+
+    def delay(self, attempt):
+        """attempt. tekrar oncesi bekleme suresi (sn)"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def run(self, operation, *args, **kwargs):
+        """
+        Islemi calistirir, gecici kilit hatasinda tekrar dener
+
+        Args:
+            operation (callable): Calistirilacak islem
+
+        Returns:
+            Islemin sonucu
+
+        Raises:
+            Error: Tekrar denenemeyen hata veya deneme hakki bittiyse son hata
+        """
+        attempt = 0
+        while True:
+            try:
+                result = operation(*args, **kwargs)
+            except Exception as e:
+                reason = retry_reason(e)
+                if reason is None:
+                    raise
+                with self._lock:
+                    self._stats[reason] += 1
+                    if attempt >= self.attempts:
+                        self._stats['gave_up'] += 1
+                        raise
+                    self._stats['retries'] += 1
+                delay = self.delay(attempt)
+                attempt += 1
+                print(f"[DB] Kilit catismasi ({e.errno}), "
+                      f"{delay * 1000:.0f} ms sonra tekrar deneniyor ({attempt}/{self.attempts})")
+                time.sleep(delay)
+                continue
+
+            if attempt:
+                with self._lock:
+                    self._stats['recovered'] += 1
+            return result
+
+    def get_stats(self):
+        """
+        Tekrar deneme istatistikleri
+
+        Returns:
+            dict: retries, deadlocks, lock_wait_timeouts, recovered, gave_up
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class IdempotencyGuard:
+    """
+    Ayni anahtarla gelen procedure cagrisinin ikinci kez calismasini
+    engeller (cift tiklama, UI tarafinda tekrar gonderim). Tamamlanan
+    cagrinin sonucu ttl boyunca saklanir; ayni anda gelen ikinci cagri
+    ilkinin bitmesini bekleyip onun sonucunu alir.
+    """
+
+    def __init__(self, ttl=600.0, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._done = OrderedDict()
+        self._running = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def run(self, key, operation):
+        """
+        Anahtar daha once tamamlanmadiysa islemi calistirir
+
+        Args:
+            key: Idempotency anahtari
+            operation (callable): Argumansiz islem
+
+        Returns:
+            Islemin (veya ayni anahtarli onceki cagrinin) sonucu
+        """
+        while True:
+            with self._lock:
+                self._expire()
+                if key in self._done:
+                    self.hits += 1
+                    return self._done[key][1]
+                event = self._running.get(key)
+                if event is None:
+                    event = self._running[key] = threading.Event()
+                    break
+            # Ayni anahtarli cagri suruyor; bitince sonucunu al (hata verdiyse tekrar dene)
+            event.wait()
+
+        try:
+            result = operation()
+        except BaseException:
+            with self._lock:
+                self._running.pop(key).set()
+            raise
+
+        with self._lock:
+            self._done[key] = (time.monotonic() + self.ttl, result)
+            while len(self._done) > self.max_entries:
+                self._done.popitem(last=False)
+            self._running.pop(key).set()
+        return result
+
+    def _expire(self):
+        """Suresi dolan kayitlari siler (_lock altinda cagrilir)"""
+        now = time.monotonic()
+        while self._done:
+            key, (expires_at, _) = next(iter(self._done.items()))
+            if expires_at > now:
+                break
+            del self._done[key]
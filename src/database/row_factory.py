@@ -0,0 +1,169 @@
+"""
+Kutuphane Yonetim Sistemi - Satir Fabrikalari
+Sorgu satirlarini dict yerine kompakt tuple tabanli nesnelere donusturur
+"""
+
+import keyword
+from collections import namedtuple
+from functools import lru_cache
+
+
+ROW_DICT = 'dict'
+ROW_TUPLE = 'tuple'
+ROW_NAMEDTUPLE = 'namedtuple'
+ROW_RECORD = 'record'
+
+ROW_FACTORIES = (ROW_DICT, ROW_TUPLE, ROW_NAMEDTUPLE, ROW_RECORD)
+
+# Varsayilan (DB_ROW_FACTORY) olabilecek tipler: row_factory vermeyen
+# cagrilar satirlara row['Kolon'] ile erisir. tuple / namedtuple sadece
+# cagri bazinda istenebilir.
+DEFAULT_ROW_FACTORIES = (ROW_DICT, ROW_RECORD)
+
+_tuple_getitem = tuple.__getitem__
+_tuple_iter = tuple.__iter__
+
+
+class Record(tuple):
+    """
+    Kolon kumesine ozel uretilen kompakt satir sinifinin tabani.
+
+    Veriyi tuple olarak tutar (satir basina dict ve tekrar eden anahtar
+    string'leri yok). Hem attribute (row.KitapAdi) hem de dict gibi
+    anahtar erisimi (row['KitapAdi'], row.get(...), keys(), 'x' in row)
+    desteklenir; boylece mevcut dict kullanan kod degismeden calisir.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return _tuple_getitem(self, self._index[key])
+            except KeyError:
+                raise KeyError(key) from None
+        return _tuple_getitem(self, key)
+
+    def get(self, key, default=None):
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return _tuple_getitem(self, index)
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(_tuple_iter(self))
+
+    def items(self):
+        return zip(self._fields, _tuple_iter(self))
+
+    def __iter__(self):
+        # dict gibi anahtarlar uzerinde dolasir
+        return iter(self._fields)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self._asdict() == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def _asdict(self):
+        """Satiri dict olarak dondurur"""
+        return dict(zip(self._fields, _tuple_iter(self)))
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value!r}" for name, value in self.items())
+        return f"Record({fields})"
+
+
+def _attribute_name(name):
+    """Kolon adi attribute olarak kullanilabilir mi?"""
+    return name.isidentifier() and not keyword.iskeyword(name) and not hasattr(Record, name)
+
+
+@lru_cache(maxsize=256)
+def record_class(columns):
+    """
+    Kolon kumesi icin __slots__'lu Record alt sinifi uretir (cache'lenir)
+
+    Args:
+        columns (tuple): Kolon adlari
+
+    Returns:
+        type: Record alt sinifi
+    """
+    namespace = {
+        '__slots__': (),
+        '_fields': columns,
+        # Ayni isimli kolonlarda dict cursor gibi sonuncusu gecerli
+        '_index': {name: i for i, name in enumerate(columns)},
+    }
+    for name, index in namespace['_index'].items():
+        if _attribute_name(name):
+            namespace[name] = property(lambda self, i=index: _tuple_getitem(self, i))
+    return type('Record', (Record,), namespace)
+
+
+@lru_cache(maxsize=256)
+def namedtuple_class(columns):
+    """
+    Kolon kumesi icin namedtuple sinifi uretir (cache'lenir).
+    Gecersiz kolon adlari _0, _1 ... olarak yeniden adlandirilir.
+
+    Args:
+        columns (tuple): Kolon adlari
+
+    Returns:
+        type: namedtuple sinifi
+    """
+    return namedtuple('Row', columns, rename=True)
+
+
+def build_rows(rows, columns, factory):
+    """
+    Tuple cursor satirlarini istenen satir tipine donusturur
+
+    Args:
+        rows (list): Cursor'dan gelen tuple satirlar
+        columns (sequence): cursor.column_names
+        factory (str): dict / tuple / namedtuple / record
+
+    Returns:
+        list: Donusturulmus satirlar
+    """
+    if factory == ROW_TUPLE:
+        return rows
+    columns = tuple(columns)
+    if factory == ROW_RECORD:
+        cls = record_class(columns)
+        return [cls(row) for row in rows]
+    if factory == ROW_NAMEDTUPLE:
+        make = namedtuple_class(columns)._make
+        return [make(row) for row in rows]
+    if factory == ROW_DICT:
+        return [dict(zip(columns, row)) for row in rows]
+    raise ValueError(f"Bilinmeyen row factory: {factory}")
+
+
+def build_row(row, columns, factory):
+    """
+    Tek satir icin build_rows
+
+    Returns:
+        Donusturulmus satir veya None
+    """
+    if row is None:
+        return None
+    return build_rows([row], columns, factory)[0]
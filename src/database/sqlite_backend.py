@@ -0,0 +1,380 @@
+"""
+Kutuphane Yonetim Sistemi - SQLite Backend
+Sunucusuz calisma icin mysql-connector baglanti arayuzunu taklit eden
+SQLite (WAL) baglanti ve cursor adaptorleri
+"""
+
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+
+from mysql.connector import errorcode, errors
+
+from src.database.fulltext import normalize_search
+from src.database.sqlite_procedures import PROCEDURES, is_locked
+
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / 'database' / 'schema_sqlite.sql'
+
+_schema_lock = threading.Lock()
+_initialized = set()
+
+# MySQL'deki STORED arama kolonlarinin karsiligi (tablo, kolon, kaynak, indeks).
+# CREATE TABLE IF NOT EXISTS mevcut dosyadaki tabloya kolon eklemedigi icin
+# schema_sqlite.sql'de degil, her dosyada bir kez ALTER ile eklenir.
+SEARCH_COLUMNS = (
+    ('KITAP', 'KitapAdiArama', 'KitapAdi', 'idx_kitap_adi_arama'),
+    ('KITAP', 'YazarArama', 'Yazar', 'idx_yazar_arama'),
+    ('UYE', 'AdArama', 'Ad', 'idx_uye_ad_arama'),
+    ('UYE', 'SoyadArama', 'Soyad', 'idx_uye_soyad_arama'),
+    ('UYE', 'EmailArama', 'Email', 'idx_uye_email_arama'),
+)
+
+
+# ----------------------------------------------------------------------
+# Tip donusumleri (MySQL ile ayni Python tipleri donsun)
+# ----------------------------------------------------------------------
+
+def _convert_date(value):
+    return date.fromisoformat(value.decode()[:10])
+
+
+def _convert_datetime(value):
+    return datetime.fromisoformat(value.decode())
+
+
+def _convert_decimal(value):
+    return Decimal(value.decode())
+
+
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(sep=' ', timespec='seconds'))
+sqlite3.register_converter('DATE', _convert_date)
+sqlite3.register_converter('DATETIME', _convert_datetime)
+sqlite3.register_converter('DECIMAL', _convert_decimal)
+sqlite3.register_converter('BOOLEAN', int)
+
+
+# ----------------------------------------------------------------------
+# MySQL fonksiyonlari
+# ----------------------------------------------------------------------
+
+def _as_date(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _datediff(end, start):
+    end, start = _as_date(end), _as_date(start)
+    if end is None or start is None:
+        return None
+    return (end - start).days
+
+
+def _concat(*values):
+    # MySQL'de herhangi bir arguman NULL ise sonuc NULL
+    if any(value is None for value in values):
+        return None
+    return ''.join(str(value) for value in values)
+
+
+def _register_functions(cnx, database):
+    cnx.create_function('CURDATE', 0, lambda: date.today().isoformat())
+    cnx.create_function('NOW', 0, lambda: datetime.now().isoformat(sep=' ', timespec='seconds'))
+    cnx.create_function('DATEDIFF', 2, _datediff, deterministic=True)
+    cnx.create_function('CONCAT', -1, _concat, deterministic=True)
+    cnx.create_function('YEAR', 1, lambda v: _as_date(v).year if v else None, deterministic=True)
+    cnx.create_function('MONTH', 1, lambda v: _as_date(v).month if v else None, deterministic=True)
+    cnx.create_function('VERSION', 0, lambda: f"SQLite {sqlite3.sqlite_version}")
+    cnx.create_function('DATABASE', 0, lambda: database)
+    # Arama kolonlarinin ifadesi; indeksli oldugu icin deterministik olmali
+    cnx.create_function('ARAMA_NORMALIZE', 1, normalize_search, deterministic=True)
+
+
+# ----------------------------------------------------------------------
+# SQL cevirisi
+# ----------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.)*"|%\(\w+\)s|%s|%%)""")
+_LAST_INSERT_RE = re.compile(r'\bLAST_INSERT_ID\(\)', re.I)
+_FOR_UPDATE_RE = re.compile(r'\s+FOR\s+UPDATE\b', re.I)
+_EXPLAIN_RE = re.compile(r'^\s*EXPLAIN\s+(?!QUERY\s+PLAN)', re.I)
+_DESCRIBE_RE = re.compile(r'^\s*DESCRIBE\s+`?(\w+)`?\s*$', re.I)
+# MySQL'de '\\' tek ters bolu; SQLite'ta iki karakter (ESCAPE tek karakter ister)
+_LIKE_ESCAPE_RE = re.compile(r"\bESCAPE\s+'\\\\'", re.I)
+
+
+@lru_cache(maxsize=512)
+def translate(query):
+    """
+    MySQL sorgusunu SQLite'a cevirir: %s / %(ad)s yer tutuculari,
+    LAST_INSERT_ID(), FOR UPDATE, EXPLAIN, DESCRIBE ve LIKE ... ESCAPE '\\\\'
+
+    Args:
+        query (str): MySQL sorgusu
+
+    Returns:
+        str: SQLite sorgusu
+    """
+    describe = _DESCRIBE_RE.match(query)
+    if describe:
+        return f"PRAGMA table_info({describe.group(1)})"
+
+    def replace(match):
+        token = match.group(0)
+        if token == '%s':
+            return '?'
+        if token == '%%':
+            return '%'
+        if token.startswith('%('):
+            return ':' + token[2:-2]
+        return token
+
+    text = _TOKEN_RE.sub(replace, query)
+    text = _LAST_INSERT_RE.sub('last_insert_rowid()', text)
+    text = _FOR_UPDATE_RE.sub('', text)
+    text = _EXPLAIN_RE.sub('EXPLAIN QUERY PLAN ', text)
+    text = _LIKE_ESCAPE_RE.sub(r"ESCAPE '\\'", text)
+    return text
+
+
+def _translate_error(error):
+    """sqlite3 hatasini mysql.connector hata sinifina cevirir"""
+    if isinstance(error, sqlite3.IntegrityError):
+        return errors.IntegrityError(msg=str(error))
+    if is_locked(error):
+        # busy_timeout doldu: MySQL'deki lock wait timeout (1205) karsiligi
+        return errors.OperationalError(msg=str(error), errno=errorcode.ER_LOCK_WAIT_TIMEOUT)
+    if isinstance(error, sqlite3.OperationalError):
+        return errors.OperationalError(msg=str(error))
+    if isinstance(error, sqlite3.ProgrammingError):
+        return errors.ProgrammingError(msg=str(error))
+    return errors.DatabaseError(msg=str(error))
+
+
+# ----------------------------------------------------------------------
+# Cursor
+# ----------------------------------------------------------------------
+
+class _StoredResult:
+    """callproc sonucu tek bir result set (stored_results() elemani)"""
+
+    def __init__(self, columns, rows, dictionary):
+        self.column_names = tuple(columns)
+        self._rows = [dict(zip(columns, row)) for row in rows] if dictionary else list(rows)
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class SQLiteCursor:
+    """mysql-connector cursor arayuzunun SQLite karsiligi"""
+
+    def __init__(self, connection, dictionary=False):
+        self._connection = connection
+        self._dictionary = dictionary
+        self._cursor = connection._cnx.cursor()
+        self._stored = []
+        self.rowcount = -1
+        self.lastrowid = None
+
+    @property
+    def column_names(self):
+        description = self._cursor.description or ()
+        return tuple(column[0] for column in description)
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self.column_names, row))
+
+    def execute(self, query, params=()):
+        try:
+            self._cursor.execute(translate(query), params or ())
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    def executemany(self, query, params_list):
+        try:
+            self._cursor.executemany(translate(query), params_list)
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        self.rowcount = self._cursor.rowcount
+
+    def callproc(self, proc_name, args=()):
+        """
+        Python ile yazilmis procedure'u calistirir (sqlite_procedures.py)
+
+        Returns:
+            tuple: Verilen argumanlar (mysql-connector ile uyumlu)
+        """
+        procedure = PROCEDURES.get(proc_name)
+        if procedure is None:
+            raise errors.ProgrammingError(msg=f"PROCEDURE {proc_name} does not exist")
+        try:
+            result_sets = procedure(self._connection._cnx, *args)
+        except sqlite3.Error as e:
+            raise _translate_error(e) from e
+        self._stored = [
+            _StoredResult(columns, rows, self._dictionary) for columns, rows in result_sets
+        ]
+        return tuple(args)
+
+    def stored_results(self):
+        stored, self._stored = self._stored, []
+        return iter(stored)
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if not self._dictionary:
+            return rows
+        columns = self.column_names
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        self._cursor.close()
+
+
+# ----------------------------------------------------------------------
+# Baglanti
+# ----------------------------------------------------------------------
+
+class SQLiteConnection:
+    """
+    mysql-connector baglanti arayuzunun (ConnectionPool ve DatabaseManager
+    tarafindan kullanilan kismi) SQLite karsiligi
+    """
+
+    def __init__(self, database, busy_timeout=30.0):
+        self.database = str(database)
+        self.busy_timeout = busy_timeout
+        self._cnx = None
+        self._open()
+
+    def _open(self):
+        Path(self.database).parent.mkdir(parents=True, exist_ok=True)
+        cnx = sqlite3.connect(
+            self.database,
+            timeout=self.busy_timeout,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            # Pool baglantiyi farkli thread'lere sirayla verir
+            check_same_thread=False
+        )
+        cnx.execute('PRAGMA journal_mode=WAL')
+        cnx.execute('PRAGMA synchronous=NORMAL')
+        cnx.execute('PRAGMA foreign_keys=ON')
+        _register_functions(cnx, Path(self.database).stem)
+        self._cnx = cnx
+        _ensure_schema(cnx, self.database)
+
+    def cursor(self, dictionary=False, buffered=None, prepared=False):
+        # SQLite ifadeleri zaten baglanti bazinda cache'lenir, prepared yok sayilir
+        return SQLiteCursor(self, dictionary=dictionary)
+
+    @property
+    def in_transaction(self):
+        return self._cnx is not None and self._cnx.in_transaction
+
+    @property
+    def unread_result(self):
+        return False
+
+    def consume_results(self):
+        pass
+
+    def start_transaction(self):
+        if not self._cnx.in_transaction:
+            self._cnx.execute('BEGIN')
+
+    def commit(self):
+        self._cnx.commit()
+
+    def rollback(self):
+        self._cnx.rollback()
+
+    def reset_session(self):
+        if self._cnx.in_transaction:
+            self._cnx.rollback()
+
+    def is_connected(self):
+        return self._cnx is not None
+
+    def reconnect(self, attempts=1, delay=0):
+        self.close()
+        self._open()
+
+    def close(self):
+        if self._cnx is not None:
+            self._cnx.close()
+            self._cnx = None
+
+
+def _ensure_schema(cnx, database):
+    """Dosyada tablo yoksa schema_sqlite.sql'i uygular (dosya basina bir kez)"""
+    with _schema_lock:
+        if database in _initialized:
+            return
+        exists = cnx.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'KITAP'"
+        ).fetchone()
+        if not exists:
+            cnx.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+            print(f"[DB] SQLite semasi olusturuldu: {database}")
+        _ensure_search_columns(cnx)
+        _initialized.add(database)
+
+
+def _ensure_search_columns(cnx):
+    """
+    Eksik arama kolonlarini ekler. SQLite ALTER ile STORED kolon eklemez;
+    VIRTUAL kolonun degeri indekste saklanir. NOCASE, LIKE 'metin%'
+    aramasinin indeksi kullanmasi icin gerekli (degerler zaten kucuk harf).
+    """
+    for table, column, source, index in SEARCH_COLUMNS:
+        columns = {row[1] for row in cnx.execute(f'PRAGMA table_xinfo({table})')}
+        if column not in columns:
+            cnx.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column} TEXT COLLATE NOCASE "
+                f"GENERATED ALWAYS AS (ARAMA_NORMALIZE({source})) VIRTUAL"
+            )
+        cnx.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({column})")
+    # Telefon ikili (BINARY) kolon; LIKE 'metin%' icin indeks NOCASE olmali
+    cnx.execute("CREATE INDEX IF NOT EXISTS idx_uye_telefon ON UYE (Telefon COLLATE NOCASE)")
+    cnx.commit()
+
+
+def connect(database, busy_timeout=30.0, **_ignored):
+    """
+    ConnectionPool icin baglanti fabrikasi
+
+    Args:
+        database (str): SQLite dosya yolu
+        busy_timeout (float): Kilit bekleme suresi (sn)
+
+    Returns:
+        SQLiteConnection: Baglanti
+    """
+    return SQLiteConnection(database, busy_timeout=busy_timeout)
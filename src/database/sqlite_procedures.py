@@ -0,0 +1,437 @@
+"""
+Kutuphane Yonetim Sistemi - SQLite Procedure'leri
+database/stored_procedures.sql'deki procedure'lerin Python karsiliklari.
+Her fonksiyon ham sqlite3 baglantisi ve procedure parametrelerini alir,
+MySQL'deki gibi (kolonlar, satirlar) result set listesi dondurur.
+Stok ve borc guncellemeleri schema_sqlite.sql'deki trigger'larla yapilir.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.config.database import DatabaseConfig
+from src.utils.constants import (
+    SP_YENI_ODUNC_VER, SP_KITAP_TESLIM_AL, SP_UYE_OZET_RAPOR,
+    SP_KITAP_ARA, SP_AKTIF_ODUNC_SAYISI, SP_TOPLU_ODUNC_VER, SP_TOPLU_TESLIM_AL,
+    SP_OZET_YENILE,
+    MAX_AKTIF_ODUNC, ODUNC_SURE_GUN, GUNLUK_CEZA_TUTARI
+)
+
+
+_GENEL_HATA = 'HATA: Islem sirasinda bir hata olustu!'
+
+
+def is_locked(error):
+    """
+    SQLITE_BUSY / SQLITE_LOCKED mi? MySQL'deki lock wait timeout gibi
+    islem geri alinip tekrar denenebilir.
+    """
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return 'database is locked' in message or 'database table is locked' in message
+
+
+def _result(columns, *rows):
+    """Tek result set'lik procedure sonucu"""
+    return [(columns, list(rows))]
+
+
+def _error(message, **extra):
+    """HATA satiri (Sonuc, Basarili=0 ve ek kolonlar)"""
+    columns = ('Sonuc', 'Basarili') + tuple(extra)
+    return _result(columns, (message, 0) + tuple(extra.values()))
+
+
+def _log(cnx, islem_tipi, kullanici_id, aciklama, yeni_veri):
+    """
+    Procedure icindeki LOG_ISLEM kaydi. DB_PROCEDURE_LOG kapaliysa yazilmaz
+    (MySQL'de @sp_log_islem = 0); kayit audit kuyrugundan gelir.
+    """
+    if not DatabaseConfig.PROCEDURE_LOG:
+        return
+    try:
+        cnx.execute(
+            """INSERT INTO LOG_ISLEM (TabloAdi, IslemTipi, KullaniciID, Aciklama, YeniVeri)
+               VALUES ('ODUNC', ?, ?, ?, ?)""",
+            (islem_tipi, kullanici_id, aciklama, json.dumps(yeni_veri))
+        )
+    except sqlite3.Error:
+        # Procedure'deki CONTINUE HANDLER: log hatasi islemi bozmaz
+        pass
+
+
+@contextmanager
+def _savepoint(cnx, name):
+    """
+    START TRANSACTION / ROLLBACK karsiligi. Disarida transaction yoksa
+    RELEASE ile commit edilir, varsa ona katilir.
+    """
+    cnx.execute(f'SAVEPOINT {name}')
+    try:
+        yield
+    except BaseException:
+        cnx.execute(f'ROLLBACK TO {name}')
+        cnx.execute(f'RELEASE {name}')
+        raise
+    cnx.execute(f'RELEASE {name}')
+
+
+def _as_date(value):
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def sp_yeni_odunc_ver(cnx, uye_id, kitap_id, kullanici_id):
+    """sp_YeniOduncVer(UyeID, KitapID, IslemYapanKullaniciID)"""
+    try:
+        with _savepoint(cnx, 'sp_YeniOduncVer'):
+            aktif = cnx.execute(
+                "SELECT COUNT(*) FROM ODUNC WHERE UyeID = ? AND TeslimTarihi IS NULL",
+                (uye_id,)
+            ).fetchone()[0]
+
+            if aktif >= MAX_AKTIF_ODUNC:
+                return _error(
+                    f'HATA: Uye maksimum {MAX_AKTIF_ODUNC} aktif odunc alabilir. '
+                    f'Su an aktif odunc: {aktif}'
+                )
+
+            row = cnx.execute(
+                "SELECT MevcutAdet FROM KITAP WHERE KitapID = ?", (kitap_id,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                return _error('HATA: Kitap bulunamadi!')
+            if row[0] <= 0:
+                return _error('HATA: Kitap stokta yok!', MevcutStok=row[0])
+
+            odunc_tarihi = date.today()
+            son_teslim = odunc_tarihi + timedelta(days=ODUNC_SURE_GUN)
+
+            # TR_ODUNC_INSERT stoku dusurur
+            cursor = cnx.execute(
+                """INSERT INTO ODUNC (UyeID, KitapID, KullaniciID, OduncTarihi, SonTeslimTarihi)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (uye_id, kitap_id, kullanici_id, odunc_tarihi, son_teslim)
+            )
+            odunc_id = cursor.lastrowid
+
+            _log(cnx, 'INSERT', kullanici_id,
+                 f'Yeni odunc verildi. Uye: {uye_id}, Kitap: {kitap_id}', {
+                     'OduncID': odunc_id, 'UyeID': uye_id, 'KitapID': kitap_id,
+                     'OduncTarihi': odunc_tarihi.isoformat(),
+                     'SonTeslimTarihi': son_teslim.isoformat(),
+                 })
+
+        return _result(
+            ('Sonuc', 'Basarili', 'OduncID', 'OduncTarihi', 'SonTeslimTarihi'),
+            ('BASARILI: Odunc islemi tamamlandi!', 1, odunc_id, odunc_tarihi, son_teslim)
+        )
+    except sqlite3.Error as e:
+        if is_locked(e):
+            # Kilit hatasi HATA satirina cevrilmez, DatabaseManager tekrar dener
+            raise
+        print(f"[DB ERROR] sp_YeniOduncVer: {e}")
+        return _error(_GENEL_HATA)
+
+
+def sp_toplu_odunc_ver(cnx, uye_id, kitap_ids, kullanici_id):
+    """sp_TopluOduncVer(UyeID, KitapIDler JSON, IslemYapanKullaniciID)"""
+    kitap_ids = [int(kitap_id) for kitap_id in json.loads(kitap_ids or '[]')]
+    adet = len(kitap_ids)
+    try:
+        with _savepoint(cnx, 'sp_TopluOduncVer'):
+            aktif = cnx.execute(
+                "SELECT COUNT(*) FROM ODUNC WHERE UyeID = ? AND TeslimTarihi IS NULL",
+                (uye_id,)
+            ).fetchone()[0]
+
+            if adet == 0:
+                return _error('HATA: Odunc verilecek kitap secilmedi!')
+            if aktif + adet > MAX_AKTIF_ODUNC:
+                return _error(
+                    f'HATA: Uye maksimum {MAX_AKTIF_ODUNC} aktif odunc alabilir. '
+                    f'Su an aktif odunc: {aktif}, istenen: {adet}'
+                )
+
+            istenen = {}
+            for kitap_id in kitap_ids:
+                istenen[kitap_id] = istenen.get(kitap_id, 0) + 1
+            placeholders = ', '.join('?' * len(istenen))
+            stok = dict(cnx.execute(
+                f"SELECT KitapID, MevcutAdet FROM KITAP WHERE KitapID IN ({placeholders})",
+                tuple(istenen)
+            ).fetchall())
+
+            eksik = sorted(kitap_id for kitap_id in istenen if kitap_id not in stok)
+            if eksik:
+                return _error('HATA: Kitap bulunamadi!', KitapIDler=','.join(map(str, eksik)))
+            stok_yok = sorted(
+                kitap_id for kitap_id, sayi in istenen.items() if stok[kitap_id] < sayi
+            )
+            if stok_yok:
+                return _error('HATA: Kitap stokta yok!', KitapIDler=','.join(map(str, stok_yok)))
+
+            odunc_tarihi = date.today()
+            son_teslim = odunc_tarihi + timedelta(days=ODUNC_SURE_GUN)
+
+            odunc_ids = []
+            for kitap_id in kitap_ids:
+                cursor = cnx.execute(
+                    """INSERT INTO ODUNC (UyeID, KitapID, KullaniciID, OduncTarihi, SonTeslimTarihi)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (uye_id, kitap_id, kullanici_id, odunc_tarihi, son_teslim)
+                )
+                odunc_ids.append(cursor.lastrowid)
+
+            _log(cnx, 'INSERT', kullanici_id,
+                 f'Toplu odunc verildi. Uye: {uye_id}, Kitap sayisi: {adet}', {
+                     'OduncIDler': odunc_ids, 'UyeID': uye_id, 'KitapIDler': kitap_ids,
+                     'OduncTarihi': odunc_tarihi.isoformat(),
+                     'SonTeslimTarihi': son_teslim.isoformat(),
+                 })
+
+        return _result(
+            ('Sonuc', 'Basarili', 'OduncSayisi', 'OduncIDler', 'OduncTarihi', 'SonTeslimTarihi'),
+            (f'BASARILI: {adet} kitap odunc verildi!', 1, adet, json.dumps(odunc_ids),
+             odunc_tarihi, son_teslim)
+        )
+    except sqlite3.Error as e:
+        if is_locked(e):
+            # Kilit hatasi HATA satirina cevrilmez, DatabaseManager tekrar dener
+            raise
+        print(f"[DB ERROR] sp_TopluOduncVer: {e}")
+        return _error(_GENEL_HATA)
+
+
+def sp_kitap_teslim_al(cnx, odunc_id, teslim_tarihi):
+    """sp_KitapTeslimAl(OduncID, TeslimTarihi)"""
+    teslim_tarihi = _as_date(teslim_tarihi)
+    try:
+        with _savepoint(cnx, 'sp_KitapTeslimAl'):
+            row = cnx.execute(
+                """SELECT UyeID, KitapID, SonTeslimTarihi FROM ODUNC
+                   WHERE OduncID = ? AND TeslimTarihi IS NULL""",
+                (odunc_id,)
+            ).fetchone()
+            if row is None:
+                return _error('HATA: Odunc kaydi bulunamadi veya zaten teslim edilmis!')
+
+            uye_id, _, son_teslim = row
+
+            # TR_ODUNC_UPDATE_TESLIM stoku artirir
+            cnx.execute(
+                "UPDATE ODUNC SET TeslimTarihi = ? WHERE OduncID = ?",
+                (teslim_tarihi, odunc_id)
+            )
+
+            gecikme = (teslim_tarihi - _as_date(son_teslim)).days
+            ceza_tutari = None
+            ceza_id = None
+            if gecikme > 0:
+                ceza_tutari = (gecikme * Decimal(str(GUNLUK_CEZA_TUTARI))).quantize(Decimal('0.01'))
+                # TR_CEZA_INSERT uyenin borcunu artirir
+                cursor = cnx.execute(
+                    """INSERT INTO CEZA (OduncID, UyeID, Tutar, GecikmeGunu, Aciklama)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (odunc_id, uye_id, ceza_tutari, gecikme,
+                     f'Gecikme cezasi: {gecikme} gun gecikme')
+                )
+                ceza_id = cursor.lastrowid
+
+            _log(cnx, 'UPDATE', None,
+                 f'Kitap teslim alindi. Odunc ID: {odunc_id}', {
+                     'OduncID': odunc_id, 'TeslimTarihi': teslim_tarihi.isoformat(),
+                     'GecikmeGunu': gecikme, 'CezaTutari': str(ceza_tutari or 0),
+                 })
+
+        columns = ('Sonuc', 'Basarili', 'GecikmeGunu', 'CezaTutari', 'CezaID')
+        if gecikme > 0:
+            return _result(columns, (
+                'BASARILI: Kitap teslim alindi. Gecikme cezasi eklendi!', 1,
+                gecikme, ceza_tutari, ceza_id
+            ))
+        return _result(columns, ('BASARILI: Kitap zamaninda teslim alindi.', 1, 0, Decimal('0.00'), None))
+    except sqlite3.Error as e:
+        if is_locked(e):
+            # Kilit hatasi HATA satirina cevrilmez, DatabaseManager tekrar dener
+            raise
+        print(f"[DB ERROR] sp_KitapTeslimAl: {e}")
+        return _error(_GENEL_HATA)
+
+
+def sp_toplu_teslim_al(cnx, odunc_ids, teslim_tarihi):
+    """sp_TopluTeslimAl(OduncIDler JSON, TeslimTarihi)"""
+    odunc_ids = sorted({int(odunc_id) for odunc_id in json.loads(odunc_ids or '[]')})
+    teslim_tarihi = _as_date(teslim_tarihi)
+    gunluk_ceza = Decimal(str(GUNLUK_CEZA_TUTARI))
+    try:
+        with _savepoint(cnx, 'sp_TopluTeslimAl'):
+            teslim = {}
+            if odunc_ids:
+                placeholders = ', '.join('?' * len(odunc_ids))
+                for odunc_id, uye_id, son_teslim in cnx.execute(
+                    f"""SELECT OduncID, UyeID, SonTeslimTarihi FROM ODUNC
+                        WHERE OduncID IN ({placeholders}) AND TeslimTarihi IS NULL""",
+                    odunc_ids
+                ).fetchall():
+                    gecikme = max((teslim_tarihi - _as_date(son_teslim)).days, 0)
+                    teslim[odunc_id] = (uye_id, gecikme)
+
+            # TR_ODUNC_UPDATE_TESLIM her satir icin stoku artirir
+            cnx.executemany(
+                "UPDATE ODUNC SET TeslimTarihi = ? WHERE OduncID = ?",
+                [(teslim_tarihi, odunc_id) for odunc_id in teslim]
+            )
+
+            ceza_ids = {}
+            for odunc_id, (uye_id, gecikme) in teslim.items():
+                if gecikme > 0:
+                    cursor = cnx.execute(
+                        """INSERT INTO CEZA (OduncID, UyeID, Tutar, GecikmeGunu, Aciklama)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (odunc_id, uye_id, gecikme * gunluk_ceza, gecikme,
+                         f'Gecikme cezasi: {gecikme} gun gecikme')
+                    )
+                    ceza_ids[odunc_id] = cursor.lastrowid
+
+            toplam_ceza = sum(gecikme for _, gecikme in teslim.values()) * gunluk_ceza
+            _log(cnx, 'UPDATE', None,
+                 f'Toplu teslim alindi. Kitap sayisi: {len(teslim)}', {
+                     'OduncIDler': odunc_ids, 'TeslimTarihi': teslim_tarihi.isoformat(),
+                     'TeslimAlinan': len(teslim), 'ToplamCeza': str(toplam_ceza),
+                 })
+
+        rows = []
+        for odunc_id in odunc_ids:
+            if odunc_id not in teslim:
+                rows.append((odunc_id, 'HATA: Odunc kaydi bulunamadi veya zaten teslim edilmis!',
+                             0, 0, Decimal('0.00'), None))
+                continue
+            gecikme = teslim[odunc_id][1]
+            sonuc = ('BASARILI: Kitap teslim alindi. Gecikme cezasi eklendi!' if gecikme > 0
+                     else 'BASARILI: Kitap zamaninda teslim alindi.')
+            rows.append((odunc_id, sonuc, 1, gecikme,
+                         (gecikme * gunluk_ceza).quantize(Decimal('0.01')),
+                         ceza_ids.get(odunc_id)))
+        return _result(
+            ('OduncID', 'Sonuc', 'Basarili', 'GecikmeGunu', 'CezaTutari', 'CezaID'), *rows
+        )
+    except sqlite3.Error as e:
+        if is_locked(e):
+            # Kilit hatasi HATA satirina cevrilmez, DatabaseManager tekrar dener
+            raise
+        print(f"[DB ERROR] sp_TopluTeslimAl: {e}")
+        return _error(_GENEL_HATA)
+
+
+def sp_uye_ozet_rapor(cnx, uye_id):
+    """sp_UyeOzetRapor(UyeID)"""
+    cursor = cnx.execute(
+        """
+        SELECT u.UyeID, u.Ad, u.Soyad, u.Email, u.Telefon, u.ToplamBorc,
+               (SELECT COUNT(*) FROM ODUNC WHERE UyeID = u.UyeID) AS ToplamKitapSayisi,
+               (SELECT COUNT(*) FROM ODUNC
+                WHERE UyeID = u.UyeID AND TeslimTarihi IS NULL) AS AktifOduncSayisi,
+               (SELECT IFNULL(SUM(Tutar), 0) FROM CEZA WHERE UyeID = u.UyeID) AS ToplamCezaTutari,
+               (SELECT IFNULL(SUM(Tutar), 0) FROM CEZA
+                WHERE UyeID = u.UyeID AND OdendiMi = FALSE) AS OdenmemisCezaTutari
+        FROM UYE u
+        WHERE u.UyeID = ?
+        """,
+        (uye_id,)
+    )
+    columns = [column[0] for column in cursor.description]
+    rows = []
+    for row in cursor.fetchall():
+        values = dict(zip(columns, row))
+        row += (values['ToplamKitapSayisi'] - values['AktifOduncSayisi'],)
+        rows.append(row)
+    return [(columns + ['TeslimEdilenKitapSayisi'], rows)]
+
+
+def sp_kitap_ara(cnx, kitap_adi=None, yazar=None, kategori_id=None, sadece_mevcut=False):
+    """sp_KitapAra(KitapAdi, Yazar, KategoriID, SadeceMevcut)"""
+    cursor = cnx.execute(
+        """
+        SELECT k.KitapID, k.KitapAdi, k.Yazar, kat.KategoriAdi, k.Yayinevi,
+               k.BasimYili, k.ISBN, k.ToplamAdet, k.MevcutAdet, k.RafNo,
+               (k.ToplamAdet - k.MevcutAdet) AS OduncteKitapSayisi
+        FROM KITAP k
+        INNER JOIN KATEGORI kat ON k.KategoriID = kat.KategoriID
+        WHERE (:adi IS NULL OR k.KitapAdi LIKE '%' || :adi || '%')
+          AND (:yazar IS NULL OR k.Yazar LIKE '%' || :yazar || '%')
+          AND (:kategori IS NULL OR k.KategoriID = :kategori)
+          AND (NOT :mevcut OR k.MevcutAdet > 0)
+        ORDER BY k.KitapAdi
+        """,
+        {'adi': kitap_adi, 'yazar': yazar, 'kategori': kategori_id,
+         'mevcut': bool(sadece_mevcut)}
+    )
+    return [([column[0] for column in cursor.description], cursor.fetchall())]
+
+
+def sp_aktif_odunc_sayisi(cnx, uye_id):
+    """sp_AktifOduncSayisi(UyeID)"""
+    cursor = cnx.execute(
+        f"""
+        SELECT u.UyeID, u.Ad, u.Soyad,
+               COUNT(o.OduncID) AS AktifOduncSayisi,
+               ({MAX_AKTIF_ODUNC} - COUNT(o.OduncID)) AS KalanHak
+        FROM UYE u
+        LEFT JOIN ODUNC o ON u.UyeID = o.UyeID AND o.TeslimTarihi IS NULL
+        WHERE u.UyeID = ?
+        GROUP BY u.UyeID, u.Ad, u.Soyad
+        """,
+        (uye_id,)
+    )
+    return [([column[0] for column in cursor.description], cursor.fetchall())]
+
+
+def sp_ozet_yenile(cnx):
+    """sp_OzetYenile()"""
+    with _savepoint(cnx, 'sp_ozet_yenile'):
+        cnx.execute('INSERT OR IGNORE INTO ISTATISTIK_OZET (OzetID) VALUES (1)')
+        cnx.execute(
+            """
+            UPDATE ISTATISTIK_OZET
+            SET UyeSayisi = (SELECT COUNT(*) FROM UYE),
+                KitapSayisi = (SELECT COUNT(*) FROM KITAP),
+                ToplamAdet = (SELECT IFNULL(SUM(ToplamAdet), 0) FROM KITAP),
+                MevcutAdet = (SELECT IFNULL(SUM(MevcutAdet), 0) FROM KITAP),
+                AktifOdunc = (SELECT COUNT(*) FROM ODUNC WHERE TeslimTarihi IS NULL),
+                OdenmemisCezaSayisi = (SELECT COUNT(*) FROM CEZA
+                                       WHERE NOT IFNULL(OdendiMi, 0)),
+                OdenmemisCezaTutari = (SELECT ROUND(IFNULL(SUM(Tutar), 0), 2) FROM CEZA
+                                       WHERE NOT IFNULL(OdendiMi, 0))
+            WHERE OzetID = 1
+            """
+        )
+        cnx.execute('DELETE FROM ODUNC_VADE_OZET')
+        cnx.execute(
+            """
+            INSERT INTO ODUNC_VADE_OZET (SonTeslimTarihi, AktifOdunc)
+            SELECT SonTeslimTarihi, COUNT(*)
+            FROM ODUNC
+            WHERE TeslimTarihi IS NULL
+            GROUP BY SonTeslimTarihi
+            """
+        )
+    return []
+
+
+# call_procedure adi -> Python fonksiyonu
+PROCEDURES = {
+    SP_YENI_ODUNC_VER: sp_yeni_odunc_ver,
+    SP_KITAP_TESLIM_AL: sp_kitap_teslim_al,
+    SP_UYE_OZET_RAPOR: sp_uye_ozet_rapor,
+    SP_KITAP_ARA: sp_kitap_ara,
+    SP_AKTIF_ODUNC_SAYISI: sp_aktif_odunc_sayisi,
+    SP_TOPLU_ODUNC_VER: sp_toplu_odunc_ver,
+    SP_TOPLU_TESLIM_AL: sp_toplu_teslim_al,
+    SP_OZET_YENILE: sp_ozet_yenile,
+}
@@ -0,0 +1,120 @@
+"""
+Kutuphane Yonetim Sistemi - Prepared Statement Onbellegi
+Fiziksel baglanti basina LRU prepared statement cache
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+
+class StatementCache:
+    """
+    Her fiziksel MySQL baglantisi icin SQL metnine gore anahtarlanan
+    prepared cursor'lari saklar. Pool'dan ayni baglanti tekrar alindiginda
+    sorgu sunucuda yeniden parse edilmez.
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._caches = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _physical(connection):
+        """Pool wrapper'inin arkasindaki fiziksel baglantiyi dondurur"""
+        return getattr(connection, '_cnx', None) or connection
+
+    def get_cursor(self, connection, query, dictionary=False):
+        """
+        SQL metni icin prepared cursor dondurur (yoksa olusturur)
+
+        Args:
+            connection: Pool'dan alinmis baglanti
+            query (str): SQL sorgusu
+            dictionary (bool): Satirlar dict olarak mi donsun?
+
+        Returns:
+            cursor: Prepared cursor
+        """
+        physical = self._physical(connection)
+        key = (dictionary, query)
+
+        with self._lock:
+            cache = self._caches.get(physical)
+            if cache is None:
+                cache = OrderedDict()
+                self._caches[physical] = cache
+
+            cursor = cache.get(key)
+            if cursor is not None:
+                cache.move_to_end(key)
+                self.hits += 1
+                return cursor
+
+            self.misses += 1
+
+        cursor = physical.cursor(prepared=True, dictionary=dictionary)
+
+        evicted = []
+        with self._lock:
+            cache[key] = cursor
+            while len(cache) > self.max_size:
+                _, old_cursor = cache.popitem(last=False)
+                evicted.append(old_cursor)
+                self.evictions += 1
+
+        # Cikarilan statement'lari sunucuda da kapat
+        for old_cursor in evicted:
+            try:
+                old_cursor.close()
+            except Exception:
+                pass
+
+        return cursor
+
+    def discard(self, connection, query=None):
+        """
+        Baglantiya ait cache'i (veya tek bir sorguyu) temizler
+
+        Args:
+            connection: Pool'dan alinmis veya fiziksel baglanti
+            query (str): Sadece bu sorgu silinsin (None ise hepsi)
+        """
+        physical = self._physical(connection)
+        with self._lock:
+            cache = self._caches.get(physical)
+            if not cache:
+                return
+            if query is None:
+                cursors = list(cache.values())
+                cache.clear()
+            else:
+                cursors = [cache.pop(key) for key in list(cache) if key[1] == query]
+
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def get_stats(self):
+        """
+        Cache istatistiklerini dondurur
+
+        Returns:
+            dict: hits, misses, evictions, hit_ratio, cached, connections
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': (self.hits / total) if total else 0.0,
+                'cached': sum(len(cache) for cache in self._caches.values()),
+                'connections': len(self._caches),
+            }
@@ -0,0 +1,456 @@
+"""
+Kutuphane Yonetim Sistemi - Asenkron Modeller
+Book, Member, Loan ve Penalty metodlarinin asyncio karsiliklari.
+Sorgu metinleri senkron modellerle ortaktir.
+"""
+
+import json
+from datetime import datetime
+
+from src.database.async_db_manager import async_db_manager
+from src.database.fulltext import prefix_pattern
+from src.models.book import (
+    Book, BOOK_LIST_QUERY, BOOK_BY_ID_QUERY, AVAILABLE_BOOKS_QUERY, BOOK_AVAILABILITY_QUERY
+)
+from src.models.member import (
+    MEMBER_LIST_QUERY, MEMBER_BY_ID_QUERY, MEMBER_SEARCH_QUERY, ACTIVE_MEMBERS_QUERY
+)
+from src.models.loan import (
+    Loan, LOAN_LIST_QUERY, LOAN_BY_ID_QUERY, ACTIVE_LOANS_QUERY,
+    OVERDUE_LOANS_QUERY, LOAN_STATISTICS_QUERY
+)
+from src.models.penalty import (
+    PENALTY_LIST_QUERY, PENALTY_BY_ID_QUERY, UNPAID_PENALTIES_QUERY, PENALTY_STATISTICS_QUERY
+)
+from src.utils.constants import (
+    TABLE_CEZA, SP_UYE_OZET_RAPOR,
+    SP_YENI_ODUNC_VER, SP_KITAP_TESLIM_AL, SP_AKTIF_ODUNC_SAYISI, SP_TOPLU_ODUNC_VER,
+    SP_TOPLU_TESLIM_AL
+)
+
+
+class AsyncBook:
+    """Kitap model sinifi (asyncio)"""
+
+    @staticmethod
+    async def get_all():
+        """Tum kitaplari getirir"""
+        try:
+            return await async_db_manager.execute_query(BOOK_LIST_QUERY)
+        except Exception as e:
+            print(f"[BOOK ERROR] Async get all hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_by_id(kitap_id):
+        """
+        ID'ye gore kitap getirir
+
+        Args:
+            kitap_id (int): Kitap ID
+
+        Returns:
+            dict/None: Kitap bilgileri
+        """
+        try:
+            return await async_db_manager.execute_query(BOOK_BY_ID_QUERY, (kitap_id,), fetch_one=True)
+        except Exception as e:
+            print(f"[BOOK ERROR] Async get by ID hatasi: {e}")
+            return None
+
+    @staticmethod
+    async def search(keyword=None, kategori_id=None, yazar=None):
+        """
+        Kitap adi / yazari verilen metinle baslayan kitaplar (Book.search)
+
+        Returns:
+            list: Kitap listesi
+        """
+        try:
+            query, params = Book._search_query(keyword, kategori_id, yazar)
+            return await async_db_manager.execute_query(query, params)
+        except Exception as e:
+            print(f"[BOOK ERROR] Async search hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_available_books():
+        """Mevcut stoku olan kitaplari getirir"""
+        try:
+            return await async_db_manager.execute_query(AVAILABLE_BOOKS_QUERY)
+        except Exception as e:
+            print(f"[BOOK ERROR] Async available books hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def is_available(kitap_id):
+        """
+        Kitabin odunc verilebilir stoku var mi? (kiosk sorgulari icin)
+
+        Args:
+            kitap_id (int): Kitap ID
+
+        Returns:
+            bool: MevcutAdet > 0 ise True
+        """
+        try:
+            result = await async_db_manager.execute_query(
+                BOOK_AVAILABILITY_QUERY, (kitap_id,), fetch_one=True
+            )
+            return bool(result and result['MevcutAdet'] > 0)
+        except Exception as e:
+            print(f"[BOOK ERROR] Async availability hatasi: {e}")
+            return False
+
+
+class AsyncMember:
+    """Uye model sinifi (asyncio)"""
+
+    @staticmethod
+    async def get_all():
+        """Tum uyeleri getirir"""
+        try:
+            return await async_db_manager.execute_query(MEMBER_LIST_QUERY)
+        except Exception as e:
+            print(f"[MEMBER ERROR] Async get all hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_by_id(uye_id):
+        """
+        ID'ye gore uye getirir
+
+        Args:
+            uye_id (int): Uye ID
+
+        Returns:
+            dict/None: Uye bilgileri
+        """
+        try:
+            return await async_db_manager.execute_query(MEMBER_BY_ID_QUERY, (uye_id,), fetch_one=True)
+        except Exception as e:
+            print(f"[MEMBER ERROR] Async get by ID hatasi: {e}")
+            return None
+
+    @staticmethod
+    async def search(keyword):
+        """
+        Uye arama (Ad, Soyad, Email, Telefon)
+
+        Args:
+            keyword (str): Aranacak kelime
+
+        Returns:
+            list: Uye listesi
+        """
+        try:
+            search_term = prefix_pattern(keyword)
+            if not search_term:
+                return []
+            return await async_db_manager.execute_query(
+                MEMBER_SEARCH_QUERY, (search_term, search_term, search_term, search_term)
+            )
+        except Exception as e:
+            print(f"[MEMBER ERROR] Async search hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_summary(uye_id):
+        """
+        Uye ozet raporu (Stored Procedure)
+
+        Args:
+            uye_id (int): Uye ID
+
+        Returns:
+            dict/None: Ozet bilgiler
+        """
+        try:
+            results = await async_db_manager.call_procedure(SP_UYE_OZET_RAPOR, (uye_id,))
+            return results[0] if results else None
+        except Exception as e:
+            print(f"[MEMBER ERROR] Async summary hatasi: {e}")
+            return None
+
+    @staticmethod
+    async def get_active_members():
+        """Aktif uyeleri getirir"""
+        try:
+            return await async_db_manager.execute_query(ACTIVE_MEMBERS_QUERY)
+        except Exception as e:
+            print(f"[MEMBER ERROR] Async active members hatasi: {e}")
+            return []
+
+
+class AsyncLoan:
+    """Odunc model sinifi (asyncio)"""
+
+    @staticmethod
+    async def get_all():
+        """Tum odunc kayitlarini getirir"""
+        try:
+            return await async_db_manager.execute_query(LOAN_LIST_QUERY)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async get all hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_by_id(odunc_id):
+        """
+        ID'ye gore odunc getirir
+
+        Args:
+            odunc_id (int): Odunc ID
+
+        Returns:
+            dict/None: Odunc bilgileri
+        """
+        try:
+            return await async_db_manager.execute_query(LOAN_BY_ID_QUERY, (odunc_id,), fetch_one=True)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async get by ID hatasi: {e}")
+            return None
+
+    @staticmethod
+    async def get_active_loans():
+        """Aktif odunc kayitlarini getirir (TeslimTarihi NULL)"""
+        try:
+            return await async_db_manager.execute_query(ACTIVE_LOANS_QUERY)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async active loans hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_overdue_loans():
+        """Geciken odunc kayitlarini getirir"""
+        try:
+            return await async_db_manager.execute_query(OVERDUE_LOANS_QUERY)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async overdue loans hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_statistics():
+        """Odunc istatistikleri"""
+        try:
+            result = await async_db_manager.execute_query(LOAN_STATISTICS_QUERY, fetch_one=True)
+            return result if result else {}
+        except Exception as e:
+            print(f"[LOAN ERROR] Async statistics hatasi: {e}")
+            return {}
+
+    @staticmethod
+    async def create_loan(uye_id, kitap_id, kullanici_id):
+        """
+        Yeni odunc verir (Stored Procedure: sp_YeniOduncVer)
+
+        Args:
+            uye_id (int): Uye ID
+            kitap_id (int): Kitap ID
+            kullanici_id (int): Islem yapan kullanici ID
+
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        try:
+            results = await async_db_manager.call_procedure(
+                SP_YENI_ODUNC_VER, (uye_id, kitap_id, kullanici_id)
+            )
+            Loan._audit_loans(results, uye_id, [kitap_id], kullanici_id)
+            return Loan._create_loan_result(results)
+        except Exception as e:
+            return False, Loan._create_loan_error(e)
+
+    @staticmethod
+    async def create_loans(uye_id, kitap_ids, kullanici_id):
+        """
+        Bir uyeye birden fazla kitabi tek transaction'da odunc verir
+        (Stored Procedure: sp_TopluOduncVer)
+
+        Args:
+            uye_id (int): Uye ID
+            kitap_ids (list): Kitap ID listesi
+            kullanici_id (int): Islem yapan kullanici ID
+
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        kitap_ids = Loan._loan_book_ids(kitap_ids)
+        if not kitap_ids:
+            return False, "Odunc verilecek kitap secilmedi"
+
+        try:
+            results = await async_db_manager.call_procedure(
+                SP_TOPLU_ODUNC_VER, (uye_id, json.dumps(kitap_ids), kullanici_id)
+            )
+            Loan._audit_loans(results, uye_id, kitap_ids, kullanici_id)
+            return Loan._create_loans_result(results, len(kitap_ids))
+        except Exception as e:
+            return False, Loan._create_loan_error(e)
+
+    @staticmethod
+    async def return_loan(odunc_id, teslim_tarihi=None):
+        """
+        Kitap teslim alir (Stored Procedure: sp_KitapTeslimAl)
+
+        Args:
+            odunc_id (int): Odunc ID
+            teslim_tarihi (date): Teslim tarihi (None ise bugun)
+
+        Returns:
+            tuple: (bool, str, float) - (Basarili mi, Mesaj, Ceza tutari)
+        """
+        try:
+            if teslim_tarihi is None:
+                teslim_tarihi = datetime.now().date()
+
+            results = await async_db_manager.call_procedure(
+                SP_KITAP_TESLIM_AL, (odunc_id, teslim_tarihi)
+            )
+            Loan._audit_returns(results, [odunc_id], teslim_tarihi)
+            return Loan._return_result(results)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async return loan hatasi: {e}")
+            return False, f"Teslim alma hatasi: {str(e)[:100]}", 0.0
+
+    @staticmethod
+    async def return_loans(odunc_ids, teslim_tarihi=None):
+        """
+        Birden fazla kitabi tek transaction'da teslim alir
+        (Stored Procedure: sp_TopluTeslimAl)
+
+        Args:
+            odunc_ids (list): Odunc ID listesi
+            teslim_tarihi (date): Teslim tarihi (None ise bugun)
+
+        Returns:
+            tuple: (bool, str, list) - (Basarili mi, Mesaj, Odunc bazinda sonuclar)
+        """
+        odunc_ids = [int(odunc_id) for odunc_id in odunc_ids or () if odunc_id is not None]
+        if not odunc_ids:
+            return False, "Teslim alinacak odunc secilmedi", []
+
+        try:
+            if teslim_tarihi is None:
+                teslim_tarihi = datetime.now().date()
+
+            results = await async_db_manager.call_procedure(
+                SP_TOPLU_TESLIM_AL, (json.dumps(odunc_ids), teslim_tarihi)
+            )
+            Loan._audit_returns(results, odunc_ids, teslim_tarihi)
+            return Loan._return_loans_result(results)
+        except Exception as e:
+            print(f"[LOAN ERROR] Async return loans hatasi: {e}")
+            return False, f"Toplu teslim hatasi: {str(e)[:100]}", []
+
+    @staticmethod
+    async def get_active_loan_count(uye_id):
+        """
+        Uyenin aktif odunc sayisini getirir (Stored Procedure)
+
+        Args:
+            uye_id (int): Uye ID
+
+        Returns:
+            int: Aktif odunc sayisi
+        """
+        try:
+            results = await async_db_manager.call_procedure(SP_AKTIF_ODUNC_SAYISI, (uye_id,))
+            if results:
+                return results[0].get('AktifOduncSayisi', 0)
+            return 0
+        except Exception as e:
+            print(f"[LOAN ERROR] Async active count hatasi: {e}")
+            return 0
+
+
+class AsyncPenalty:
+    """Ceza model sinifi (asyncio)"""
+
+    @staticmethod
+    async def get_all():
+        """Tum cezalari getirir"""
+        try:
+            return await async_db_manager.execute_query(PENALTY_LIST_QUERY)
+        except Exception as e:
+            print(f"[PENALTY ERROR] Async get all hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_by_id(ceza_id):
+        """
+        ID'ye gore ceza getirir
+
+        Args:
+            ceza_id (int): Ceza ID
+
+        Returns:
+            dict/None: Ceza bilgileri
+        """
+        try:
+            return await async_db_manager.execute_query(PENALTY_BY_ID_QUERY, (ceza_id,), fetch_one=True)
+        except Exception as e:
+            print(f"[PENALTY ERROR] Async get by ID hatasi: {e}")
+            return None
+
+    @staticmethod
+    async def get_unpaid():
+        """Odenmemis cezalari getirir"""
+        try:
+            return await async_db_manager.execute_query(UNPAID_PENALTIES_QUERY)
+        except Exception as e:
+            print(f"[PENALTY ERROR] Async unpaid hatasi: {e}")
+            return []
+
+    @staticmethod
+    async def get_statistics():
+        """Ceza istatistikleri"""
+        try:
+            result = await async_db_manager.execute_query(PENALTY_STATISTICS_QUERY, fetch_one=True)
+            return result if result else {}
+        except Exception as e:
+            print(f"[PENALTY ERROR] Async statistics hatasi: {e}")
+            return {}
+
+    @staticmethod
+    async def pay_penalty(ceza_id):
+        """
+        Ceza odemesi yapar
+
+        Args:
+            ceza_id (int): Ceza ID
+
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        try:
+            async with async_db_manager.transaction():
+                ceza = await AsyncPenalty.get_by_id(ceza_id)
+                if not ceza:
+                    return False, "Ceza bulunamadi"
+
+                if ceza['OdendiMi']:
+                    return False, "Bu ceza zaten odenmis"
+
+                query = f"""
+                    UPDATE {TABLE_CEZA}
+                    SET OdendiMi = TRUE
+                    WHERE CezaID = %s AND OdendiMi = FALSE
+                """
+                affected, _ = await async_db_manager.execute_update(query, (ceza_id,))
+
+                if affected > 0:
+                    update_debt_query = """
+                        UPDATE UYE
+                        SET ToplamBorc = ToplamBorc - %s
+                        WHERE UyeID = %s
+                    """
+                    await async_db_manager.execute_update(
+                        update_debt_query, (ceza['Tutar'], ceza['UyeID'])
+                    )
+                    return True, f"Ceza odendi ({ceza['Tutar']} TL)"
+                return False, "Odeme yapilamadi"
+
+        except Exception as e:
+            print(f"[PENALTY ERROR] Async pay penalty hatasi: {e}")
+            return False, str(e)
@@ -3,11 +3,71 @@ Kutuphane Yonetim Sistemi - Kitap Modeli
 Kitap CRUD islemleri
 """
 
+from src.config.database import DatabaseConfig
+from src.database.audit import audit_event, update_diff
 from src.database.db_manager import db_manager
-from src.utils.constants import TABLE_KITAP, TABLE_KATEGORI, SP_KITAP_ARA
+from src.database.fulltext import boolean_query, prefix_pattern, split_terms
+from src.database.pagination import fetch_page, estimated_count
+from src.database.row_factory import ROW_RECORD
+from src.utils.constants import TABLE_KITAP, TABLE_KATEGORI, BOOK_SEARCH_PAGE_SIZE
 from src.utils.validators import validate_required, validate_positive_number, validate_year, validate_isbn
 
 
+# Toplu katalog yuklemesinde kullanilan kolonlar (sirasi import_catalog satirlariyla ayni)
+CATALOG_COLUMNS = (
+    'KitapAdi', 'Yazar', 'ISBN', 'Yayinevi', 'BasimYili', 'ToplamAdet', 'MevcutAdet', 'KategoriID'
+)
+
+BOOK_SELECT = f"""
+    SELECT k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi, 
+           k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
+           kat.KategoriAdi
+    FROM {TABLE_KITAP} k
+    LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
+"""
+
+BOOK_LIST_QUERY = f"{BOOK_SELECT}    ORDER BY k.KitapID DESC\n"
+
+# get_page ile siralanabilecek kolonlar (hepsi NOT NULL ve indeksli)
+BOOK_SORT_KEYS = {
+    'KitapID': 'k.KitapID',
+    'KitapAdi': 'k.KitapAdi',
+    'Yazar': 'k.Yazar',
+    'MevcutAdet': 'k.MevcutAdet',
+}
+
+BOOK_BY_ID_QUERY = f"""
+    SELECT k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi, 
+           k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
+           kat.KategoriAdi
+    FROM {TABLE_KITAP} k
+    LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
+    WHERE k.KitapID = %s
+"""
+
+AVAILABLE_BOOKS_QUERY = f"""
+    SELECT k.KitapID, k.KitapAdi, k.Yazar, k.MevcutAdet,
+           kat.KategoriAdi
+    FROM {TABLE_KITAP} k
+    LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
+    WHERE k.MevcutAdet > 0
+    ORDER BY k.KitapAdi
+"""
+
+# database/schema.sql'deki ft_kitap_arama indeksinin kolonlari (ayni sirada olmali)
+BOOK_MATCH = "MATCH(k.KitapAdi, k.Yazar, k.Yayinevi) AGAINST (%s IN BOOLEAN MODE)"
+
+BOOK_SEARCH_COLUMNS = """
+    k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi,
+    k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
+    kat.KategoriAdi
+"""
+
+BOOK_AVAILABILITY_QUERY = f"""
+    SELECT MevcutAdet FROM {TABLE_KITAP} WHERE KitapID = %s
+"""
+
+
 class Book:
     """Kitap model sinifi"""
     
@@ -20,19 +80,42 @@ class Book:
             list: Kitap listesi
         """
         try:
-            query = f"""
-                SELECT k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi, 
-                       k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
-                       kat.KategoriAdi
-                FROM {TABLE_KITAP} k
-                LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
-                ORDER BY k.KitapID DESC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(BOOK_LIST_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[BOOK ERROR] Get all hatasi: {e}")
             return []
     
+    @staticmethod
+    def get_page(page_size=None, cursor=None, sort='-KitapID'):
+        """
+        Kitap listesinin bir sayfasini getirir (keyset sayfalama)
+        
+        Args:
+            page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+            cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+            sort (str): 'KitapID', 'KitapAdi', 'Yazar', 'MevcutAdet' ('-' on eki azalan)
+            
+        Returns:
+            tuple: (list, tuple/None) - (Sayfa, sonraki sayfa cursor'u)
+        """
+        try:
+            return fetch_page(
+                BOOK_SELECT, BOOK_SORT_KEYS, 'KitapID', sort, cursor, page_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[BOOK ERROR] Get page hatasi: {e}")
+            return [], None
+    
+    @staticmethod
+    def estimated_count():
+        """
+        Yaklasik kitap sayisi (liste sayaci icin, COUNT(*) yapmaz)
+        
+        Returns:
+            int: Satir sayisi tahmini
+        """
+        return estimated_count(TABLE_KITAP)
+    
     @staticmethod
     def get_by_id(kitap_id):
         """
@@ -45,15 +128,9 @@ class Book:
             dict/None: Kitap bilgileri
         """
         try:
-            query = f"""
-                SELECT k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi, 
-                       k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
-                       kat.KategoriAdi
-                FROM {TABLE_KITAP} k
-                LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
-                WHERE k.KitapID = %s
-            """
-            return db_manager.execute_query(query, (kitap_id,), fetch_one=True)
+            return db_manager.execute_query(
+                BOOK_BY_ID_QUERY, (kitap_id,), fetch_one=True, row_factory=ROW_RECORD
+            )
         except Exception as e:
             print(f"[BOOK ERROR] Get by ID hatasi: {e}")
             return None
@@ -61,55 +138,119 @@ class Book:
     @staticmethod
     def search(keyword=None, kategori_id=None, yazar=None):
         """
-        Kitap arama (Stored Procedure kullanir)
+        Kitap adi / yazari verilen metinle baslayan kitaplar. Buyuk-kucuk
+        harf ve Turkce karakter farki gozetilmez ('calik' -> 'Çalıkuşu');
+        arama indeksli KitapAdiArama / YazarArama kolonlarinda yapilir.
         
         Args:
-            keyword (str): Kitap adi arama
+            keyword (str): Kitap adi baslangici
             kategori_id (int): Kategori filtresi
-            yazar (str): Yazar filtresi
+            yazar (str): Yazar adi baslangici
             
         Returns:
-            list: Kitap listesi
+            list: Kitap listesi (kitap adina gore sirali)
         """
         try:
-            # sp_KitapAra 4 parametre aliyor: KitapAdi, Yazar, ISBN, KategoriID
-            results = db_manager.call_procedure(
-                SP_KITAP_ARA, 
-                (keyword, yazar, None, kategori_id)
-            )
-            return results
+            query, params = Book._search_query(keyword, kategori_id, yazar)
+            return db_manager.execute_query(query, params, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[BOOK ERROR] Search hatasi: {e}")
-            # SP hatasi varsa normal sorgu ile dene
-            try:
-                query = f"""
-                    SELECT k.KitapID, k.KitapAdi, k.Yazar, k.ISBN, k.Yayinevi, 
-                           k.BasimYili, k.ToplamAdet, k.MevcutAdet, k.KategoriID,
-                           kat.KategoriAdi
-                    FROM {TABLE_KITAP} k
-                    LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
-                    WHERE 1=1
-                """
-                params = []
-                
-                if keyword:
-                    query += " AND k.KitapAdi LIKE %s"
-                    params.append(f"%{keyword}%")
-                
-                if kategori_id:
-                    query += " AND k.KategoriID = %s"
-                    params.append(kategori_id)
-                
-                if yazar:
-                    query += " AND k.Yazar LIKE %s"
-                    params.append(f"%{yazar}%")
-                
-                query += " ORDER BY k.KitapID DESC"
-                
-                return db_manager.execute_query(query, tuple(params) if params else None)
-            except Exception as e2:
-                print(f"[BOOK ERROR] Fallback search hatasi: {e2}")
-                return []
+            return []
+    
+    @staticmethod
+    def _search_query(keyword, kategori_id, yazar):
+        """
+        search() sorgusu (async model ile ortak)
+        
+        Returns:
+            tuple: (sorgu, parametreler)
+        """
+        conditions = []
+        params = []
+        title = prefix_pattern(keyword)
+        if title:
+            conditions.append("k.KitapAdiArama LIKE %s ESCAPE '\\\\'")
+            params.append(title)
+        author = prefix_pattern(yazar)
+        if author:
+            conditions.append("k.YazarArama LIKE %s ESCAPE '\\\\'")
+            params.append(author)
+        if kategori_id:
+            conditions.append("k.KategoriID = %s")
+            params.append(kategori_id)
+        
+        query = f"""
+            {BOOK_SELECT}
+            WHERE {' AND '.join(conditions) or '1=1'}
+            ORDER BY k.KitapAdiArama, k.KitapID
+        """
+        return query, tuple(params)
+    
+    @staticmethod
+    def search_ranked(keyword, kategori_id=None, sadece_mevcut=False, page=1,
+                      page_size=BOOK_SEARCH_PAGE_SIZE):
+        """
+        Kitap adi, yazar ve yayinevinde ilgi sirali arama (FULLTEXT / ngram).
+        Indekse girmeyecek kadar kisa terimler ve SQLite backend'i icin
+        LIKE ile aranir.
+        
+        Args:
+            keyword (str): Arama metni (tum kelimeler eslesmeli)
+            kategori_id (int): Kategori filtresi
+            sadece_mevcut (bool): Sadece rafta olan kitaplar
+            page (int): Sayfa numarasi (1'den baslar)
+            page_size (int): Sayfa basina kitap
+            
+        Returns:
+            tuple: (kitap listesi, sonraki sayfa var mi)
+        """
+        try:
+            if DatabaseConfig.is_sqlite():
+                match, like_terms = None, split_terms(keyword)
+            else:
+                match, like_terms = boolean_query(keyword)
+            
+            conditions = []
+            params = []
+            if match:
+                conditions.append(BOOK_MATCH)
+                params.append(match)
+            for term in like_terms:
+                conditions.append("(k.KitapAdi LIKE %s OR k.Yazar LIKE %s OR k.Yayinevi LIKE %s)")
+                params.extend([f"%{term}%"] * 3)
+            if kategori_id:
+                conditions.append("k.KategoriID = %s")
+                params.append(kategori_id)
+            if sadece_mevcut:
+                conditions.append("k.MevcutAdet > 0")
+            
+            if match:
+                # Skor ifadesi WHERE'dekiyle ayni; InnoDB MATCH'i bir kez hesaplar
+                select = f"{BOOK_SEARCH_COLUMNS}, {BOOK_MATCH} as Skor"
+                order = "Skor DESC, k.KitapID DESC"
+                params.insert(0, match)
+            else:
+                select = BOOK_SEARCH_COLUMNS
+                order = "k.KitapID DESC"
+            
+            query = f"""
+                SELECT {select}
+                FROM {TABLE_KITAP} k
+                LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
+                WHERE {' AND '.join(conditions) or '1=1'}
+                ORDER BY {order}
+                LIMIT %s OFFSET %s
+            """
+            # Bir fazla satir istenir: sonraki sayfa icin COUNT(*) gerekmez
+            params.extend([page_size + 1, (max(page, 1) - 1) * page_size])
+            
+            books = db_manager.execute_query(
+                query, tuple(params), row_factory=ROW_RECORD
+            )
+            return books[:page_size], len(books) > page_size
+        except Exception as e:
+            print(f"[BOOK ERROR] Ranked search hatasi: {e}")
+            return [], False
     
     @staticmethod
     def create(kitap_adi, yazar, isbn, yayinevi, basim_yili, toplam_adet, kategori_id):
@@ -129,48 +270,93 @@ class Book:
             tuple: (bool, str/int) - (Basarili mi, Hata mesaji veya KitapID)
         """
         try:
-            # Validasyon
-            if not validate_required(kitap_adi):
-                return False, "Kitap adi zorunlu"
-            if not validate_required(yazar):
-                return False, "Yazar zorunlu"
-            if not validate_required(isbn):
-                return False, "ISBN zorunlu"
-            if not validate_isbn(isbn):
-                return False, "Gecersiz ISBN formati"
-            if not validate_required(yayinevi):
-                return False, "Yayinevi zorunlu"
-            if not validate_year(basim_yili):
-                return False, "Gecersiz basim yili"
-            if not validate_positive_number(toplam_adet):
-                return False, "Toplam adet pozitif olmali"
-            
-            # ISBN benzersiz mi?
-            check_query = f"SELECT COUNT(*) as sayi FROM {TABLE_KITAP} WHERE ISBN = %s"
-            result = db_manager.execute_query(check_query, (isbn,), fetch_one=True)
-            if result['sayi'] > 0:
-                return False, "Bu ISBN zaten kayitli"
+            with db_manager.transaction():
+                # Validasyon
+                if not validate_required(kitap_adi):
+                    return False, "Kitap adi zorunlu"
+                if not validate_required(yazar):
+                    return False, "Yazar zorunlu"
+                if not validate_required(isbn):
+                    return False, "ISBN zorunlu"
+                if not validate_isbn(isbn):
+                    return False, "Gecersiz ISBN formati"
+                if not validate_required(yayinevi):
+                    return False, "Yayinevi zorunlu"
+                if not validate_year(basim_yili):
+                    return False, "Gecersiz basim yili"
+                if not validate_positive_number(toplam_adet):
+                    return False, "Toplam adet pozitif olmali"
+                
+                # ISBN benzersiz mi?
+                check_query = f"SELECT COUNT(*) as sayi FROM {TABLE_KITAP} WHERE ISBN = %s"
+                result = db_manager.execute_query(check_query, (isbn,), fetch_one=True)
+                if result['sayi'] > 0:
+                    return False, "Bu ISBN zaten kayitli"
+                
+                # MevcutAdet baslangicta ToplamAdet ile ayni
+                mevcut_adet = toplam_adet
+                
+                # Insert
+                query = f"""
+                    INSERT INTO {TABLE_KITAP} 
+                    (KitapAdi, Yazar, ISBN, Yayinevi, BasimYili, ToplamAdet, MevcutAdet, KategoriID)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """
+                affected, last_id = db_manager.execute_update(
+                    query, (kitap_adi, yazar, isbn, yayinevi, basim_yili, 
+                           toplam_adet, mevcut_adet, kategori_id)
+                )
+                
+                if affected > 0:
+                    audit_event(TABLE_KITAP, 'INSERT', f'Yeni kitap eklendi. KitapID: {last_id}',
+                                yeni_veri={'KitapID': last_id, 'KitapAdi': kitap_adi, 'Yazar': yazar,
+                                           'ISBN': isbn, 'ToplamAdet': toplam_adet})
+                    return True, last_id
+                return False, "Kitap eklenemedi"
             
-            # MevcutAdet baslangicta ToplamAdet ile ayni
-            mevcut_adet = toplam_adet
+        except Exception as e:
+            print(f"[BOOK ERROR] Create hatasi: {e}")
+            return False, str(e)
+    
+    @staticmethod
+    def import_catalog(books, progress=None, atomic=True):
+        """
+        Katalog dosyasindan gelen kitaplari toplu ekler (execute_many /
+        LOAD DATA). Satir bazinda ISBN kontrolu yapilmaz; tekrar eden ISBN
+        UNIQUE kisiti nedeniyle hata verir.
+        
+        Args:
+            books (iterable): dict satirlari (KitapAdi, Yazar, ISBN, Yayinevi,
+                BasimYili, ToplamAdet, KategoriID) - generator olabilir
+            progress (callable): progress(yuklenen, toplam)
+            atomic (bool): True ise hata olursa hicbir kitap eklenmez
             
-            # Insert
-            query = f"""
-                INSERT INTO {TABLE_KITAP} 
-                (KitapAdi, Yazar, ISBN, Yayinevi, BasimYili, ToplamAdet, MevcutAdet, KategoriID)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            affected, last_id = db_manager.execute_update(
-                query, (kitap_adi, yazar, isbn, yayinevi, basim_yili, 
-                       toplam_adet, mevcut_adet, kategori_id)
-            )
+        Returns:
+            tuple: (bool, str/int) - (Basarili mi, Hata mesaji veya eklenen sayi)
+        """
+        def rows():
+            for book in books:
+                toplam_adet = int(book.get('ToplamAdet') or 1)
+                # MevcutAdet baslangicta ToplamAdet ile ayni
+                yield (
+                    book['KitapAdi'], book['Yazar'], book.get('ISBN') or None,
+                    book.get('Yayinevi'), book.get('BasimYili'),
+                    toplam_adet, toplam_adet, book['KategoriID']
+                )
+        
+        try:
+            total = len(books) if hasattr(books, '__len__') else None
             
-            if affected > 0:
-                return True, last_id
-            return False, "Kitap eklenemedi"
+            def report(done, _):
+                if progress:
+                    progress(done, total)
             
+            loaded = db_manager.load_data(
+                TABLE_KITAP, CATALOG_COLUMNS, rows(), atomic=atomic, progress=report
+            )
+            return True, loaded
         except Exception as e:
-            print(f"[BOOK ERROR] Create hatasi: {e}")
+            print(f"[BOOK ERROR] Import catalog hatasi: {e}")
             return False, str(e)
     
     @staticmethod
@@ -187,78 +373,82 @@ class Book:
             tuple: (bool, str) - (Basarili mi, Mesaj)
         """
         try:
-            # Mevcut kitap var mi?
-            existing = Book.get_by_id(kitap_id)
-            if not existing:
-                return False, "Kitap bulunamadi"
-            
-            # Guncellenecek alanlar
-            updates = []
-            params = []
-            
-            if kitap_adi is not None:
-                updates.append("KitapAdi = %s")
-                params.append(kitap_adi)
-            
-            if yazar is not None:
-                updates.append("Yazar = %s")
-                params.append(yazar)
-            
-            if isbn is not None:
-                if not validate_isbn(isbn):
-                    return False, "Gecersiz ISBN formati"
-                # ISBN benzersiz mi?
-                check_query = f"""
-                    SELECT COUNT(*) as sayi FROM {TABLE_KITAP} 
-                    WHERE ISBN = %s AND KitapID != %s
-                """
-                result = db_manager.execute_query(
-                    check_query, (isbn, kitap_id), fetch_one=True
-                )
-                if result['sayi'] > 0:
-                    return False, "Bu ISBN zaten kayitli"
-                updates.append("ISBN = %s")
-                params.append(isbn)
-            
-            if yayinevi is not None:
-                updates.append("Yayinevi = %s")
-                params.append(yayinevi)
-            
-            if basim_yili is not None:
-                if not validate_year(basim_yili):
-                    return False, "Gecersiz basim yili"
-                updates.append("BasimYili = %s")
-                params.append(basim_yili)
-            
-            if toplam_adet is not None:
-                if not validate_positive_number(toplam_adet):
-                    return False, "Toplam adet pozitif olmali"
-                updates.append("ToplamAdet = %s")
-                params.append(toplam_adet)
+            with db_manager.transaction():
+                # Mevcut kitap var mi?
+                existing = Book.get_by_id(kitap_id)
+                if not existing:
+                    return False, "Kitap bulunamadi"
                 
-                # MevcutAdet'i de ayarla (fark kadar ekle/cikar)
-                fark = int(toplam_adet) - existing['ToplamAdet']
-                yeni_mevcut = existing['MevcutAdet'] + fark
-                if yeni_mevcut < 0:
-                    yeni_mevcut = 0
-                updates.append("MevcutAdet = %s")
-                params.append(yeni_mevcut)
-            
-            if kategori_id is not None:
-                updates.append("KategoriID = %s")
-                params.append(kategori_id)
-            
-            if not updates:
-                return False, "Guncellenecek alan yok"
-            
-            params.append(kitap_id)
-            query = f"UPDATE {TABLE_KITAP} SET {', '.join(updates)} WHERE KitapID = %s"
-            
-            affected, _ = db_manager.execute_update(query, tuple(params))
-            
-            if affected > 0:
-                return True, "Kitap guncellendi"
-            return False, "Guncelleme yapilamadi"
+                # Guncellenecek alanlar
+                updates = []
+                params = []
+                
+                if kitap_adi is not None:
+                    updates.append("KitapAdi = %s")
+                    params.append(kitap_adi)
+                
+                if yazar is not None:
+                    updates.append("Yazar = %s")
+                    params.append(yazar)
+                
+                if isbn is not None:
+                    if not validate_isbn(isbn):
+                        return False, "Gecersiz ISBN formati"
+                    # ISBN benzersiz mi?
+                    check_query = f"""
+                        SELECT COUNT(*) as sayi FROM {TABLE_KITAP} 
+                        WHERE ISBN = %s AND KitapID != %s
+                    """
+                    result = db_manager.execute_query(
+                        check_query, (isbn, kitap_id), fetch_one=True
+                    )
+                    if result['sayi'] > 0:
+                        return False, "Bu ISBN zaten kayitli"
+                    updates.append("ISBN = %s")
+                    params.append(isbn)
+                
+                if yayinevi is not None:
+                    updates.append("Yayinevi = %s")
+                    params.append(yayinevi)
+                
+                if basim_yili is not None:
+                    if not validate_year(basim_yili):
+                        return False, "Gecersiz basim yili"
+                    updates.append("BasimYili = %s")
+                    params.append(basim_yili)
+                
+                if toplam_adet is not None:
+                    if not validate_positive_number(toplam_adet):
+                        return False, "Toplam adet pozitif olmali"
+                    updates.append("ToplamAdet = %s")
+                    params.append(toplam_adet)
+                    
+                    # MevcutAdet'i de ayarla (fark kadar ekle/cikar)
+                    fark = int(toplam_adet) - existing['ToplamAdet']
+                    yeni_mevcut = existing['MevcutAdet'] + fark
+                    if yeni_mevcut < 0:
+                        yeni_mevcut = 0
+                    updates.append("MevcutAdet = %s")
+                    params.append(yeni_mevcut)
+                
+                if kategori_id is not None:
+                    updates.append("KategoriID = %s")
+                    params.append(kategori_id)
+                
+                if not updates:
+                    return False, "Guncellenecek alan yok"
+                
+                params.append(kitap_id)
+                query = f"UPDATE {TABLE_KITAP} SET {', '.join(updates)} WHERE KitapID = %s"
+                
+                affected, _ = db_manager.execute_update(query, tuple(params))
+                
+                if affected > 0:
+                    eski, yeni = update_diff(existing, updates, params)
+                    audit_event(TABLE_KITAP, 'UPDATE', f'Kitap guncellendi. KitapID: {kitap_id}',
+                                eski_veri=eski, yeni_veri=yeni)
+                    return True, "Kitap guncellendi"
+                return False, "Guncelleme yapilamadi"
             
         except Exception as e:
             print(f"[BOOK ERROR] Update hatasi: {e}")
@@ -289,6 +479,8 @@ class Book:
             affected, _ = db_manager.execute_update(query, (kitap_id,))
             
             if affected > 0:
+                audit_event(TABLE_KITAP, 'DELETE', f'Kitap silindi. KitapID: {kitap_id}',
+                            eski_veri={'KitapID': kitap_id})
                 return True, "Kitap silindi"
             return False, "Kitap bulunamadi"
             
@@ -300,15 +492,25 @@ class Book:
     def get_available_books():
         """Mevcut stoku olan kitaplari getirir"""
         try:
-            query = f"""
-                SELECT k.KitapID, k.KitapAdi, k.Yazar, k.MevcutAdet,
-                       kat.KategoriAdi
-                FROM {TABLE_KITAP} k
-                LEFT JOIN {TABLE_KATEGORI} kat ON k.KategoriID = kat.KategoriID
-                WHERE k.MevcutAdet > 0
-                ORDER BY k.KitapAdi
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(AVAILABLE_BOOKS_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[BOOK ERROR] Available books hatasi: {e}")
             return []
+    
+    @staticmethod
+    def is_available(kitap_id):
+        """
+        Kitabin odunc verilebilir stoku var mi?
+        
+        Args:
+            kitap_id (int): Kitap ID
+            
+        Returns:
+            bool: MevcutAdet > 0 ise True
+        """
+        try:
+            result = db_manager.execute_query(BOOK_AVAILABILITY_QUERY, (kitap_id,), fetch_one=True)
+            return bool(result and result['MevcutAdet'] > 0)
+        except Exception as e:
+            print(f"[BOOK ERROR] Availability hatasi: {e}")
+            return False
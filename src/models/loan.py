@@ -3,15 +3,102 @@ Kutuphane Yonetim Sistemi - Odunc Modeli
 Odunc verme ve teslim alma islemleri (Stored Procedures kullanir)
 """
 
+import json
 from datetime import datetime, timedelta
+from src.database.audit import audit_event
 from src.database.db_manager import db_manager
+from src.database.pagination import fetch_page, estimated_count
+from src.database.retry import retry_reason
+from src.database.row_factory import ROW_RECORD
 from src.utils.constants import (
     TABLE_ODUNC, SP_YENI_ODUNC_VER, SP_KITAP_TESLIM_AL, 
-    SP_AKTIF_ODUNC_SAYISI, ODUNC_SURE_GUN
+    SP_AKTIF_ODUNC_SAYISI, SP_TOPLU_ODUNC_VER, SP_TOPLU_TESLIM_AL, ODUNC_SURE_GUN
 )
 from src.utils.helpers import format_date_for_display, calculate_days_between
 
 
+# Odunc procedure'lerinin HATA satiri Sonuc onekleri -> kullanici mesaji
+# (sp_YeniOduncVer / sp_TopluOduncVer ve sqlite_procedures karsiliklari)
+LOAN_ERROR_MESSAGES = (
+    ('HATA: Uye maksimum', "Uye maksimum odunc limitine ulasti (5 kitap)"),
+    ('HATA: Kitap stokta yok', "Kitap stokta yok"),
+    ('HATA: Kitap bulunamadi', "Uye veya kitap bulunamadi"),
+    ('HATA: Odunc verilecek kitap secilmedi', "Odunc verilecek kitap secilmedi"),
+)
+
+
+LOAN_SELECT = f"""
+    SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
+           o.SonTeslimTarihi, o.TeslimTarihi, o.KullaniciID,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad,
+           k.KitapAdi, k.Yazar,
+           kul.KullaniciAdi
+    FROM {TABLE_ODUNC} o
+    INNER JOIN UYE u ON o.UyeID = u.UyeID
+    INNER JOIN KITAP k ON o.KitapID = k.KitapID
+    LEFT JOIN KULLANICI kul ON o.KullaniciID = kul.KullaniciID
+"""
+
+LOAN_LIST_QUERY = f"{LOAN_SELECT}    ORDER BY o.OduncID DESC\n"
+
+# get_page ile siralanabilecek kolonlar (hepsi NOT NULL ve indeksli)
+LOAN_SORT_KEYS = {
+    'OduncID': 'o.OduncID',
+    'OduncTarihi': 'o.OduncTarihi',
+    'SonTeslimTarihi': 'o.SonTeslimTarihi',
+}
+
+LOAN_BY_ID_QUERY = f"""
+    SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
+           o.SonTeslimTarihi, o.TeslimTarihi, o.KullaniciID,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email,
+           k.KitapAdi, k.Yazar, k.ISBN,
+           kul.KullaniciAdi
+    FROM {TABLE_ODUNC} o
+    INNER JOIN UYE u ON o.UyeID = u.UyeID
+    INNER JOIN KITAP k ON o.KitapID = k.KitapID
+    LEFT JOIN KULLANICI kul ON o.KullaniciID = kul.KullaniciID
+    WHERE o.OduncID = %s
+"""
+
+ACTIVE_LOANS_QUERY = f"""
+    SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
+           o.SonTeslimTarihi,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad,
+           k.KitapAdi, k.Yazar,
+           DATEDIFF(CURDATE(), o.SonTeslimTarihi) as GecikmeGun
+    FROM {TABLE_ODUNC} o
+    INNER JOIN UYE u ON o.UyeID = u.UyeID
+    INNER JOIN KITAP k ON o.KitapID = k.KitapID
+    WHERE o.TeslimTarihi IS NULL
+    ORDER BY o.SonTeslimTarihi ASC
+"""
+
+OVERDUE_LOANS_QUERY = f"""
+    SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
+           o.SonTeslimTarihi,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email, u.Telefon,
+           k.KitapAdi, k.Yazar,
+           DATEDIFF(CURDATE(), o.SonTeslimTarihi) as GecikmeGun
+    FROM {TABLE_ODUNC} o
+    INNER JOIN UYE u ON o.UyeID = u.UyeID
+    INNER JOIN KITAP k ON o.KitapID = k.KitapID
+    WHERE o.TeslimTarihi IS NULL 
+      AND o.SonTeslimTarihi < CURDATE()
+    ORDER BY o.SonTeslimTarihi ASC
+"""
+
+LOAN_STATISTICS_QUERY = """
+    SELECT 
+        COUNT(*) as ToplamOdunc,
+        SUM(CASE WHEN TeslimTarihi IS NULL THEN 1 ELSE 0 END) as AktifOdunc,
+        SUM(CASE WHEN TeslimTarihi IS NOT NULL THEN 1 ELSE 0 END) as TeslimEdilen,
+        SUM(CASE WHEN TeslimTarihi IS NULL AND SonTeslimTarihi < CURDATE() 
+            THEN 1 ELSE 0 END) as Geciken
+    FROM ODUNC
+"""
+
+
 class Loan:
     """Odunc model sinifi"""
     
@@ -24,23 +111,62 @@ class Loan:
             list: Odunc listesi
         """
         try:
-            query = f"""
-                SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
-                       o.SonTeslimTarihi, o.TeslimTarihi, o.KullaniciID,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad,
-                       k.KitapAdi, k.Yazar,
-                       kul.KullaniciAdi
-                FROM {TABLE_ODUNC} o
-                INNER JOIN UYE u ON o.UyeID = u.UyeID
-                INNER JOIN KITAP k ON o.KitapID = k.KitapID
-                LEFT JOIN KULLANICI kul ON o.KullaniciID = kul.KullaniciID
-                ORDER BY o.OduncID DESC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(LOAN_LIST_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[LOAN ERROR] Get all hatasi: {e}")
             return []
     
+    @staticmethod
+    def get_page(page_size=None, cursor=None, sort='-OduncID'):
+        """
+        Odunc listesinin bir sayfasini getirir (keyset sayfalama)
+        
+        Args:
+            page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+            cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+            sort (str): 'OduncID', 'OduncTarihi', 'SonTeslimTarihi' ('-' on eki azalan)
+            
+        Returns:
+            tuple: (list, tuple/None) - (Sayfa, sonraki sayfa cursor'u)
+        """
+        try:
+            return fetch_page(
+                LOAN_SELECT, LOAN_SORT_KEYS, 'OduncID', sort, cursor, page_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[LOAN ERROR] Get page hatasi: {e}")
+            return [], None
+    
+    @staticmethod
+    def estimated_count():
+        """
+        Yaklasik odunc sayisi (liste sayaci icin, COUNT(*) yapmaz)
+        
+        Returns:
+            int: Satir sayisi tahmini
+        """
+        return estimated_count(TABLE_ODUNC)
+    
+    @staticmethod
+    def iter_all(batch_size=1000):
+        """
+        Tum odunc kayitlarini bellege toplamadan satir satir getirir
+        (export gibi buyuk okumalar icin)
+        
+        Args:
+            batch_size (int): Sunucudan tek seferde cekilecek satir sayisi
+            
+        Yields:
+            dict: Odunc kaydi
+        """
+        try:
+            yield from db_manager.execute_iter(
+                LOAN_LIST_QUERY, batch_size=batch_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[LOAN ERROR] Iter all hatasi: {e}")
+            raise
+    
     @staticmethod
     def get_by_id(odunc_id):
         """
@@ -53,19 +179,9 @@ class Loan:
             dict/None: Odunc bilgileri
         """
         try:
-            query = f"""
-                SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
-                       o.SonTeslimTarihi, o.TeslimTarihi, o.KullaniciID,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email,
-                       k.KitapAdi, k.Yazar, k.ISBN,
-                       kul.KullaniciAdi
-                FROM {TABLE_ODUNC} o
-                INNER JOIN UYE u ON o.UyeID = u.UyeID
-                INNER JOIN KITAP k ON o.KitapID = k.KitapID
-                LEFT JOIN KULLANICI kul ON o.KullaniciID = kul.KullaniciID
-                WHERE o.OduncID = %s
-            """
-            return db_manager.execute_query(query, (odunc_id,), fetch_one=True)
+            return db_manager.execute_query(
+                LOAN_BY_ID_QUERY, (odunc_id,), fetch_one=True, row_factory=ROW_RECORD
+            )
         except Exception as e:
             print(f"[LOAN ERROR] Get by ID hatasi: {e}")
             return None
@@ -79,19 +195,7 @@ class Loan:
             list: Aktif odunc listesi
         """
         try:
-            query = f"""
-                SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
-                       o.SonTeslimTarihi,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad,
-                       k.KitapAdi, k.Yazar,
-                       DATEDIFF(CURDATE(), o.SonTeslimTarihi) as GecikmeGun
-                FROM {TABLE_ODUNC} o
-                INNER JOIN UYE u ON o.UyeID = u.UyeID
-                INNER JOIN KITAP k ON o.KitapID = k.KitapID
-                WHERE o.TeslimTarihi IS NULL
-                ORDER BY o.SonTeslimTarihi ASC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(ACTIVE_LOANS_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[LOAN ERROR] Active loans hatasi: {e}")
             return []
@@ -123,13 +227,13 @@ class Loan:
             
             query += " ORDER BY o.OduncTarihi DESC"
             
-            return db_manager.execute_query(query, (uye_id,))
+            return db_manager.execute_query(query, (uye_id,), row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[LOAN ERROR] Get by member hatasi: {e}")
             return []
     
     @staticmethod
-    def create_loan(uye_id, kitap_id, kullanici_id):
+    def create_loan(uye_id, kitap_id, kullanici_id, idempotency_key=None):
         """
         Yeni odunc verir (Stored Procedure: sp_YeniOduncVer)
         
@@ -137,6 +241,8 @@ class Loan:
             uye_id (int): Uye ID
             kitap_id (int): Kitap ID
             kullanici_id (int): Islem yapan kullanici ID
+            idempotency_key (str): Ayni anahtarla tekrar gonderilen istek
+                ikinci kez odunc vermez
             
         Returns:
             tuple: (bool, str) - (Basarili mi, Mesaj)
@@ -145,23 +251,137 @@ class Loan:
             # sp_YeniOduncVer(UyeID, KitapID, IslemYapanKullaniciID)
             results = db_manager.call_procedure(
                 SP_YENI_ODUNC_VER, 
-                (uye_id, kitap_id, kullanici_id)
+                (uye_id, kitap_id, kullanici_id),
+                idempotency_key=idempotency_key
             )
-            return True, "Odunc verme basarili"
+            Loan._audit_loans(results, uye_id, [kitap_id], kullanici_id)
+            return Loan._create_loan_result(results)
             
         except Exception as e:
-            error_msg = str(e)
+            return False, Loan._create_loan_error(e)
+    
+    @staticmethod
+    def create_loans(uye_id, kitap_ids, kullanici_id, idempotency_key=None):
+        """
+        Bir uyeye birden fazla kitabi tek transaction'da odunc verir
+        (Stored Procedure: sp_TopluOduncVer). Limit bir kez kontrol edilir,
+        kitaplardan biri verilemezse hicbiri verilmez.
+        
+        Args:
+            uye_id (int): Uye ID
+            kitap_ids (list): Kitap ID listesi
+            kullanici_id (int): Islem yapan kullanici ID
+            idempotency_key (str): Ayni anahtarla tekrar gonderilen istek
+                ikinci kez odunc vermez
+            
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        kitap_ids = Loan._loan_book_ids(kitap_ids)
+        if not kitap_ids:
+            return False, "Odunc verilecek kitap secilmedi"
+        
+        try:
+            # sp_TopluOduncVer(UyeID, KitapIDler JSON, IslemYapanKullaniciID)
+            results = db_manager.call_procedure(
+                SP_TOPLU_ODUNC_VER,
+                (uye_id, json.dumps(kitap_ids), kullanici_id),
+                idempotency_key=idempotency_key
+            )
+            Loan._audit_loans(results, uye_id, kitap_ids, kullanici_id)
+            return Loan._create_loans_result(results, len(kitap_ids))
+            
+        except Exception as e:
+            return False, Loan._create_loan_error(e)
+    
+    @staticmethod
+    def _loan_book_ids(kitap_ids):
+        """Kitap ID'lerini procedure'e gidecek int listesine cevirir"""
+        return [int(kitap_id) for kitap_id in kitap_ids or () if kitap_id is not None]
+    
+    @staticmethod
+    def _create_loan_result(results):
+        """
+        sp_YeniOduncVer sonucunu (bool, mesaj) tuple'ina cevirir. Procedure
+        is kurali hatalarini exception yerine Basarili=0 satiri olarak doner.
+        
+        Args:
+            results (list): Procedure sonuclari
             
-            # Hata mesajlarini anlamli hale getir
-            if "limit" in error_msg.lower() or "5" in error_msg:
-                return False, "Uye maksimum odunc limitine ulasti (5 kitap)"
-            elif "stok" in error_msg.lower() or "mevcut" in error_msg.lower():
-                return False, "Kitap stokta yok"
-            elif "bulunamadi" in error_msg.lower():
-                return False, "Uye veya kitap bulunamadi"
-            else:
-                print(f"[LOAN ERROR] Create loan hatasi: {e}")
-                return False, f"Odunc verme hatasi: {error_msg[:100]}"
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        row = results[0] if results else None
+        if not row or not row.get('Basarili'):
+            sonuc = row.get('Sonuc') if row else "Procedure sonuc dondurmedi"
+            return False, Loan._create_loan_error(sonuc)
+        return True, "Odunc verme basarili"
+    
+    @staticmethod
+    def _create_loans_result(results, adet):
+        """
+        sp_TopluOduncVer sonucunu (bool, mesaj) tuple'ina cevirir
+        
+        Args:
+            results (list): Procedure sonuclari
+            adet (int): Istenen kitap sayisi
+            
+        Returns:
+            tuple: (bool, str) - (Basarili mi, Mesaj)
+        """
+        row = results[0] if results else None
+        if not row or not row.get('Basarili'):
+            sonuc = row.get('Sonuc') if row else "Procedure sonuc dondurmedi"
+            return False, Loan._create_loan_error(sonuc)
+        return True, f"{row.get('OduncSayisi', adet)} kitap odunc verildi"
+    
+    @staticmethod
+    def _audit_loans(results, uye_id, kitap_ids, kullanici_id):
+        """
+        Basarili odunc verme islemini audit kuyruguna ekler. Kayit
+        procedure'deki LOG_ISLEM insert'inin (DB_PROCEDURE_LOG) karsiligidir.
+        """
+        row = results[0] if results else None
+        if not row or not row.get('Basarili'):
+            return
+        
+        yeni_veri = {
+            'UyeID': uye_id,
+            'OduncTarihi': row.get('OduncTarihi'),
+            'SonTeslimTarihi': row.get('SonTeslimTarihi')
+        }
+        if 'OduncIDler' in row:
+            odunc_ids = row['OduncIDler']
+            if isinstance(odunc_ids, str):
+                odunc_ids = json.loads(odunc_ids)
+            yeni_veri.update(OduncIDler=odunc_ids, KitapIDler=kitap_ids)
+            aciklama = f'Toplu odunc verildi. Uye: {uye_id}, Kitap sayisi: {len(kitap_ids)}'
+        else:
+            yeni_veri.update(OduncID=row.get('OduncID'), KitapID=kitap_ids[0])
+            aciklama = f'Yeni odunc verildi. Uye: {uye_id}, Kitap: {kitap_ids[0]}'
+        audit_event(TABLE_ODUNC, 'INSERT', aciklama, yeni_veri=yeni_veri, kullanici_id=kullanici_id)
+    
+    @staticmethod
+    def _create_loan_error(error):
+        """
+        Odunc verme hatasini kullaniciya gosterilecek mesaja cevirir
+        
+        Args:
+            error (Exception/str): Procedure hatasi veya HATA satirinin Sonuc metni
+            
+        Returns:
+            str: Anlamli hata mesaji
+        """
+        if retry_reason(error):
+            return "Islem yogunluk nedeniyle tamamlanamadi, lutfen tekrar deneyin"
+        
+        error_msg = str(error)
+        for prefix, message in LOAN_ERROR_MESSAGES:
+            if error_msg.startswith(prefix):
+                return message
+        
+        print(f"[LOAN ERROR] Create loan hatasi: {error}")
+        return f"Odunc verme hatasi: {error_msg[:100]}"
     
     @staticmethod
     def return_loan(odunc_id, teslim_tarihi=None):
@@ -186,20 +406,121 @@ class Loan:
                 (odunc_id, teslim_tarihi)
             )
             
-            # Procedure'den ceza tutarini al
-            ceza_tutari = 0.0
-            if results and len(results) > 0 and 'CezaTutari' in results[0]:
-                ceza_tutari = float(results[0]['CezaTutari'])
-            
-            if ceza_tutari > 0:
-                return True, f"Kitap teslim alindi. Gecikme cezasi: {ceza_tutari} TL", ceza_tutari
-            else:
-                return True, "Kitap basariyla teslim alindi", 0.0
+            Loan._audit_returns(results, [odunc_id], teslim_tarihi)
+            return Loan._return_result(results)
             
         except Exception as e:
             print(f"[LOAN ERROR] Return loan hatasi: {e}")
             return False, f"Teslim alma hatasi: {str(e)[:100]}", 0.0
     
+    @staticmethod
+    def _return_result(results):
+        """
+        sp_KitapTeslimAl sonucunu (bool, mesaj, ceza) tuple'ina cevirir
+        
+        Args:
+            results (list): Procedure sonuclari
+            
+        Returns:
+            tuple: (bool, str, float) - (Basarili mi, Mesaj, Ceza tutari)
+        """
+        # Procedure'den ceza tutarini al
+        ceza_tutari = 0.0
+        if results and len(results) > 0 and 'CezaTutari' in results[0]:
+            ceza_tutari = float(results[0]['CezaTutari'])
+        
+        if ceza_tutari > 0:
+            return True, f"Kitap teslim alindi. Gecikme cezasi: {ceza_tutari} TL", ceza_tutari
+        else:
+            return True, "Kitap basariyla teslim alindi", 0.0
+    
+    @staticmethod
+    def return_loans(odunc_ids, teslim_tarihi=None):
+        """
+        Birden fazla kitabi tek transaction'da teslim alir
+        (Stored Procedure: sp_TopluTeslimAl). Bulunamayan veya zaten teslim
+        edilmis kayitlar atlanir, sonucta Basarili=0 olarak doner.
+        
+        Args:
+            odunc_ids (list): Odunc ID listesi
+            teslim_tarihi (date): Teslim tarihi (None ise bugun)
+            
+        Returns:
+            tuple: (bool, str, list) - (Basarili mi, Mesaj, Odunc bazinda sonuclar)
+                   Sonuc satirlari: OduncID, Sonuc, Basarili, GecikmeGunu,
+                   CezaTutari, CezaID
+        """
+        odunc_ids = [int(odunc_id) for odunc_id in odunc_ids or () if odunc_id is not None]
+        if not odunc_ids:
+            return False, "Teslim alinacak odunc secilmedi", []
+        
+        try:
+            if teslim_tarihi is None:
+                teslim_tarihi = datetime.now().date()
+            
+            # sp_TopluTeslimAl(OduncIDler JSON, TeslimTarihi)
+            results = db_manager.call_procedure(
+                SP_TOPLU_TESLIM_AL,
+                (json.dumps(odunc_ids), teslim_tarihi)
+            )
+            Loan._audit_returns(results, odunc_ids, teslim_tarihi)
+            return Loan._return_loans_result(results)
+            
+        except Exception as e:
+            print(f"[LOAN ERROR] Return loans hatasi: {e}")
+            return False, f"Toplu teslim hatasi: {str(e)[:100]}", []
+    
+    @staticmethod
+    def _audit_returns(results, odunc_ids, teslim_tarihi):
+        """
+        Basarili teslim alma islemini audit kuyruguna ekler. Kayit
+        procedure'deki LOG_ISLEM insert'inin (DB_PROCEDURE_LOG) karsiligidir.
+        """
+        basarili = [row for row in results or () if row.get('Basarili')]
+        if not basarili:
+            return
+        
+        if 'OduncID' in basarili[0]:
+            toplam_ceza = sum(float(row.get('CezaTutari') or 0) for row in basarili)
+            audit_event(
+                TABLE_ODUNC, 'UPDATE', f'Toplu teslim alindi. Kitap sayisi: {len(basarili)}',
+                yeni_veri={'OduncIDler': odunc_ids, 'TeslimTarihi': teslim_tarihi,
+                           'TeslimAlinan': len(basarili), 'ToplamCeza': toplam_ceza}
+            )
+        else:
+            row = basarili[0]
+            audit_event(
+                TABLE_ODUNC, 'UPDATE', f'Kitap teslim alindi. Odunc ID: {odunc_ids[0]}',
+                yeni_veri={'OduncID': odunc_ids[0], 'TeslimTarihi': teslim_tarihi,
+                           'GecikmeGunu': row.get('GecikmeGunu'),
+                           'CezaTutari': row.get('CezaTutari') or 0}
+            )
+    
+    @staticmethod
+    def _return_loans_result(results):
+        """
+        sp_TopluTeslimAl sonucunu (bool, mesaj, satirlar) tuple'ina cevirir
+        
+        Args:
+            results (list): Procedure sonuclari
+            
+        Returns:
+            tuple: (bool, str, list) - (Basarili mi, Mesaj, Odunc bazinda sonuclar)
+        """
+        rows = [row for row in results or () if 'OduncID' in row]
+        if not rows:
+            sonuc = results[0].get('Sonuc') if results else "Procedure sonuc dondurmedi"
+            return False, f"Toplu teslim hatasi: {sonuc}", []
+        
+        basarili = [row for row in rows if row.get('Basarili')]
+        toplam_ceza = sum(float(row.get('CezaTutari') or 0) for row in basarili)
+        message = f"{len(basarili)} kitap teslim alindi"
+        if toplam_ceza > 0:
+            message += f". Toplam gecikme cezasi: {toplam_ceza:.2f} TL"
+        if len(basarili) < len(rows):
+            message += f". {len(rows) - len(basarili)} kayit bulunamadi veya zaten teslim edilmis"
+        return bool(basarili), message, rows
+    
     @staticmethod
     def get_active_loan_count(uye_id):
         """
@@ -229,20 +550,7 @@ class Loan:
             list: Geciken odunc listesi
         """
         try:
-            query = f"""
-                SELECT o.OduncID, o.UyeID, o.KitapID, o.OduncTarihi, 
-                       o.SonTeslimTarihi,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email, u.Telefon,
-                       k.KitapAdi, k.Yazar,
-                       DATEDIFF(CURDATE(), o.SonTeslimTarihi) as GecikmeGun
-                FROM {TABLE_ODUNC} o
-                INNER JOIN UYE u ON o.UyeID = u.UyeID
-                INNER JOIN KITAP k ON o.KitapID = k.KitapID
-                WHERE o.TeslimTarihi IS NULL 
-                  AND o.SonTeslimTarihi < CURDATE()
-                ORDER BY o.SonTeslimTarihi ASC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(OVERDUE_LOANS_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[LOAN ERROR] Overdue loans hatasi: {e}")
             return []
@@ -256,16 +564,9 @@ class Loan:
             dict: Istatistik bilgileri
         """
         try:
-            query = """
-                SELECT 
-                    COUNT(*) as ToplamOdunc,
-                    SUM(CASE WHEN TeslimTarihi IS NULL THEN 1 ELSE 0 END) as AktifOdunc,
-                    SUM(CASE WHEN TeslimTarihi IS NOT NULL THEN 1 ELSE 0 END) as TeslimEdilen,
-                    SUM(CASE WHEN TeslimTarihi IS NULL AND SonTeslimTarihi < CURDATE() 
-                        THEN 1 ELSE 0 END) as Geciken
-                FROM ODUNC
-            """
-            result = db_manager.execute_query(query, fetch_one=True)
+            result = db_manager.execute_query(
+                LOAN_STATISTICS_QUERY, fetch_one=True, row_factory=ROW_RECORD, cache=True
+            )
             return result if result else {}
         except Exception as e:
             print(f"[LOAN ERROR] Statistics hatasi: {e}")
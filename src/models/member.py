@@ -3,11 +3,55 @@ Kutuphane Yonetim Sistemi - Uye Modeli
 Uye CRUD islemleri
 """
 
+from src.database.audit import audit_event, update_diff
 from src.database.db_manager import db_manager
+from src.database.fulltext import prefix_pattern
+from src.database.pagination import fetch_page, estimated_count
+from src.database.row_factory import ROW_RECORD
 from src.utils.constants import TABLE_UYE, SP_UYE_OZET_RAPOR
 from src.utils.validators import validate_required, validate_email, validate_phone
 
 
+MEMBER_SELECT = f"""
+    SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
+           KayitTarihi, ToplamBorc, AktifMi
+    FROM {TABLE_UYE}
+"""
+
+MEMBER_LIST_QUERY = f"{MEMBER_SELECT}    ORDER BY UyeID DESC\n"
+
+# get_page ile siralanabilecek kolonlar (hepsi NOT NULL ve indeksli)
+MEMBER_SORT_KEYS = {
+    'UyeID': 'UyeID',
+    'Email': 'Email',
+}
+
+MEMBER_BY_ID_QUERY = f"""
+    SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
+           KayitTarihi, ToplamBorc, AktifMi
+    FROM {TABLE_UYE}
+    WHERE UyeID = %s
+"""
+
+MEMBER_SEARCH_QUERY = f"""
+    SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
+           KayitTarihi, ToplamBorc, AktifMi
+    FROM {TABLE_UYE}
+    WHERE AdArama LIKE %s ESCAPE '\\\\'
+       OR SoyadArama LIKE %s ESCAPE '\\\\'
+       OR EmailArama LIKE %s ESCAPE '\\\\'
+       OR Telefon LIKE %s ESCAPE '\\\\'
+    ORDER BY UyeID DESC
+"""
+
+ACTIVE_MEMBERS_QUERY = f"""
+    SELECT UyeID, Ad, Soyad, Email, Telefon, ToplamBorc
+    FROM {TABLE_UYE}
+    WHERE AktifMi = TRUE
+    ORDER BY Ad, Soyad
+"""
+
+
 class Member:
     """Uye model sinifi"""
     
@@ -20,17 +64,42 @@ class Member:
             list: Uye listesi
         """
         try:
-            query = f"""
-                SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
-                       KayitTarihi, ToplamBorc, AktifMi
-                FROM {TABLE_UYE}
-                ORDER BY UyeID DESC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(MEMBER_LIST_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[MEMBER ERROR] Get all hatasi: {e}")
             return []
     
+    @staticmethod
+    def get_page(page_size=None, cursor=None, sort='-UyeID'):
+        """
+        Uye listesinin bir sayfasini getirir (keyset sayfalama)
+        
+        Args:
+            page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+            cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+            sort (str): 'UyeID', 'Email' ('-' on eki azalan)
+            
+        Returns:
+            tuple: (list, tuple/None) - (Sayfa, sonraki sayfa cursor'u)
+        """
+        try:
+            return fetch_page(
+                MEMBER_SELECT, MEMBER_SORT_KEYS, 'UyeID', sort, cursor, page_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[MEMBER ERROR] Get page hatasi: {e}")
+            return [], None
+    
+    @staticmethod
+    def estimated_count():
+        """
+        Yaklasik uye sayisi (liste sayaci icin, COUNT(*) yapmaz)
+        
+        Returns:
+            int: Satir sayisi tahmini
+        """
+        return estimated_count(TABLE_UYE)
+    
     @staticmethod
     def get_by_id(uye_id):
         """
@@ -43,13 +112,9 @@ class Member:
             dict/None: Uye bilgileri
         """
         try:
-            query = f"""
-                SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
-                       KayitTarihi, ToplamBorc, AktifMi
-                FROM {TABLE_UYE}
-                WHERE UyeID = %s
-            """
-            return db_manager.execute_query(query, (uye_id,), fetch_one=True)
+            return db_manager.execute_query(
+                MEMBER_BY_ID_QUERY, (uye_id,), fetch_one=True, row_factory=ROW_RECORD
+            )
         except Exception as e:
             print(f"[MEMBER ERROR] Get by ID hatasi: {e}")
             return None
@@ -57,7 +122,9 @@ class Member:
     @staticmethod
     def search(keyword):
         """
-        Uye arama (Ad, Soyad, Email, Telefon)
+        Ad, soyad, email veya telefonu verilen metinle baslayan uyeler.
+        Buyuk-kucuk harf ve Turkce karakter farki gozetilmez; her kolon
+        indeksli oldugundan arama tablo taramasi yapmaz.
         
         Args:
             keyword (str): Arama kelimesi
@@ -66,19 +133,12 @@ class Member:
             list: Uye listesi
         """
         try:
-            query = f"""
-                SELECT UyeID, Ad, Soyad, Email, Telefon, Adres, 
-                       KayitTarihi, ToplamBorc, AktifMi
-                FROM {TABLE_UYE}
-                WHERE Ad LIKE %s
-                   OR Soyad LIKE %s
-                   OR Email LIKE %s
-                   OR Telefon LIKE %s
-                ORDER BY UyeID DESC
-            """
-            search_term = f"%{keyword}%"
+            search_term = prefix_pattern(keyword)
+            if not search_term:
+                return []
             return db_manager.execute_query(
-                query, (search_term, search_term, search_term, search_term)
+                MEMBER_SEARCH_QUERY, (search_term, search_term, search_term, search_term),
+                row_factory=ROW_RECORD
             )
         except Exception as e:
             print(f"[MEMBER ERROR] Search hatasi: {e}")
@@ -100,38 +160,42 @@ class Member:
             tuple: (bool, str/int) - (Basarili mi, Hata mesaji veya UyeID)
         """
         try:
-            # Validasyon
-            if not validate_required(ad):
-                return False, "Ad zorunlu"
-            if not validate_required(soyad):
-                return False, "Soyad zorunlu"
-            if not validate_required(email):
-                return False, "Email zorunlu"
-            if not validate_email(email):
-                return False, "Gecersiz email formati"
-            if not validate_required(telefon):
-                return False, "Telefon zorunlu"
-            if not validate_phone(telefon):
-                return False, "Gecersiz telefon formati (10 haneli, 5 ile baslar)"
-            
-            # Email benzersiz mi?
-            check_query = f"SELECT COUNT(*) as sayi FROM {TABLE_UYE} WHERE Email = %s"
-            result = db_manager.execute_query(check_query, (email,), fetch_one=True)
-            if result['sayi'] > 0:
-                return False, "Bu email adresi zaten kayitli"
-            
-            # Insert
-            query = f"""
-                INSERT INTO {TABLE_UYE} (Ad, Soyad, Email, Telefon, Adres)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            affected, last_id = db_manager.execute_update(
-                query, (ad, soyad, email, telefon, adres)
-            )
-            
-            if affected > 0:
-                return True, last_id
-            return False, "Uye eklenemedi"
+            with db_manager.transaction():
+                # Validasyon
+                if not validate_required(ad):
+                    return False, "Ad zorunlu"
+                if not validate_required(soyad):
+                    return False, "Soyad zorunlu"
+                if not validate_required(email):
+                    return False, "Email zorunlu"
+                if not validate_email(email):
+                    return False, "Gecersiz email formati"
+                if not validate_required(telefon):
+                    return False, "Telefon zorunlu"
+                if not validate_phone(telefon):
+                    return False, "Gecersiz telefon formati (10 haneli, 5 ile baslar)"
+                
+                # Email benzersiz mi?
+                check_query = f"SELECT COUNT(*) as sayi FROM {TABLE_UYE} WHERE Email = %s"
+                result = db_manager.execute_query(check_query, (email,), fetch_one=True)
+                if result['sayi'] > 0:
+                    return False, "Bu email adresi zaten kayitli"
+                
+                # Insert
+                query = f"""
+                    INSERT INTO {TABLE_UYE} (Ad, Soyad, Email, Telefon, Adres)
+                    VALUES (%s, %s, %s, %s, %s)
+                """
+                affected, last_id = db_manager.execute_update(
+                    query, (ad, soyad, email, telefon, adres)
+                )
+                
+                if affected > 0:
+                    audit_event(TABLE_UYE, 'INSERT', f'Yeni uye eklendi. UyeID: {last_id}',
+                                yeni_veri={'UyeID': last_id, 'Ad': ad, 'Soyad': soyad,
+                                           'Email': email, 'Telefon': telefon})
+                    return True, last_id
+                return False, "Uye eklenemedi"
             
         except Exception as e:
             print(f"[MEMBER ERROR] Create hatasi: {e}")
@@ -151,64 +215,68 @@ class Member:
             tuple: (bool, str) - (Basarili mi, Mesaj)
         """
         try:
-            # Mevcut uye var mi?
-            existing = Member.get_by_id(uye_id)
-            if not existing:
-                return False, "Uye bulunamadi"
-            
-            # Guncellenecek alanlar
-            updates = []
-            params = []
-            
-            if ad is not None:
-                updates.append("Ad = %s")
-                params.append(ad)
-            
-            if soyad is not None:
-                updates.append("Soyad = %s")
-                params.append(soyad)
-            
-            if email is not None:
-                if not validate_email(email):
-                    return False, "Gecersiz email formati"
-                # Email benzersiz mi?
-                check_query = f"""
-                    SELECT COUNT(*) as sayi FROM {TABLE_UYE} 
-                    WHERE Email = %s AND UyeID != %s
-                """
-                result = db_manager.execute_query(
-                    check_query, (email, uye_id), fetch_one=True
-                )
-                if result['sayi'] > 0:
-                    return False, "Bu email adresi zaten kayitli"
-                updates.append("Email = %s")
-                params.append(email)
-            
-            if telefon is not None:
-                if not validate_phone(telefon):
-                    return False, "Gecersiz telefon formati"
-                updates.append("Telefon = %s")
-                params.append(telefon)
-            
-            if adres is not None:
-                updates.append("Adres = %s")
-                params.append(adres)
-            
-            if aktif_mi is not None:
-                updates.append("AktifMi = %s")
-                params.append(aktif_mi)
-            
-            if not updates:
-                return False, "Guncellenecek alan yok"
-            
-            params.append(uye_id)
-            query = f"UPDATE {TABLE_UYE} SET {', '.join(updates)} WHERE UyeID = %s"
-            
-            affected, _ = db_manager.execute_update(query, tuple(params))
-            
-            if affected > 0:
-                return True, "Uye guncellendi"
-            return False, "Guncelleme yapilamadi"
+            with db_manager.transaction():
+                # Mevcut uye var mi?
+                existing = Member.get_by_id(uye_id)
+                if not existing:
+                    return False, "Uye bulunamadi"
+                
+                # Guncellenecek alanlar
+                updates = []
+                params = []
+                
+                if ad is not None:
+                    updates.append("Ad = %s")
+                    params.append(ad)
+                
+                if soyad is not None:
+                    updates.append("Soyad = %s")
+                    params.append(soyad)
+                
+                if email is not None:
+                    if not validate_email(email):
+                        return False, "Gecersiz email formati"
+                    # Email benzersiz mi?
+                    check_query = f"""
+                        SELECT COUNT(*) as sayi FROM {TABLE_UYE} 
+                        WHERE Email = %s AND UyeID != %s
+                    """
+                    result = db_manager.execute_query(
+                        check_query, (email, uye_id), fetch_one=True
+                    )
+                    if result['sayi'] > 0:
+                        return False, "Bu email adresi zaten kayitli"
+                    updates.append("Email = %s")
+                    params.append(email)
+                
+                if telefon is not None:
+                    if not validate_phone(telefon):
+                        return False, "Gecersiz telefon formati"
+                    updates.append("Telefon = %s")
+                    params.append(telefon)
+                
+                if adres is not None:
+                    updates.append("Adres = %s")
+                    params.append(adres)
+                
+                if aktif_mi is not None:
+                    updates.append("AktifMi = %s")
+                    params.append(aktif_mi)
+                
+                if not updates:
+                    return False, "Guncellenecek alan yok"
+                
+                params.append(uye_id)
+                query = f"UPDATE {TABLE_UYE} SET {', '.join(updates)} WHERE UyeID = %s"
+                
+                affected, _ = db_manager.execute_update(query, tuple(params))
+                
+                if affected > 0:
+                    eski, yeni = update_diff(existing, updates, params)
+                    audit_event(TABLE_UYE, 'UPDATE', f'Uye guncellendi. UyeID: {uye_id}',
+                                eski_veri=eski, yeni_veri=yeni)
+                    return True, "Uye guncellendi"
+                return False, "Guncelleme yapilamadi"
             
         except Exception as e:
             print(f"[MEMBER ERROR] Update hatasi: {e}")
@@ -230,6 +298,8 @@ class Member:
             affected, _ = db_manager.execute_update(query, (uye_id,))
             
             if affected > 0:
+                audit_event(TABLE_UYE, 'DELETE', f'Uye silindi. UyeID: {uye_id}',
+                            eski_veri={'UyeID': uye_id})
                 return True, "Uye silindi"
             return False, "Uye bulunamadi"
             
@@ -265,13 +335,7 @@ class Member:
     def get_active_members():
         """Aktif uyeleri getirir"""
         try:
-            query = f"""
-                SELECT UyeID, Ad, Soyad, Email, Telefon, ToplamBorc
-                FROM {TABLE_UYE}
-                WHERE AktifMi = TRUE
-                ORDER BY Ad, Soyad
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(ACTIVE_MEMBERS_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[MEMBER ERROR] Active members hatasi: {e}")
             return []
@@ -286,7 +350,7 @@ class Member:
                 WHERE ToplamBorc > 0
                 ORDER BY ToplamBorc DESC
             """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(query, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[MEMBER ERROR] Members with debt hatasi: {e}")
             return []
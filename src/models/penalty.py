@@ -3,10 +3,66 @@ Kutuphane Yonetim Sistemi - Ceza Modeli
 Ceza kayitlari ve odeme islemleri
 """
 
+from src.database.audit import audit_event
 from src.database.db_manager import db_manager
+from src.database.pagination import fetch_page, estimated_count
+from src.database.row_factory import ROW_RECORD
 from src.utils.constants import TABLE_CEZA
 
 
+PENALTY_SELECT = f"""
+    SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OdendiMi, 
+           c.OlusturmaTarihi,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad,
+           o.KitapID, k.KitapAdi
+    FROM {TABLE_CEZA} c
+    INNER JOIN UYE u ON c.UyeID = u.UyeID
+    LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
+    LEFT JOIN KITAP k ON o.KitapID = k.KitapID
+"""
+
+PENALTY_LIST_QUERY = f"{PENALTY_SELECT}    ORDER BY c.CezaID DESC\n"
+
+# get_page ile siralanabilecek kolonlar (hepsi NOT NULL ve indeksli)
+PENALTY_SORT_KEYS = {
+    'CezaID': 'c.CezaID',
+}
+
+PENALTY_BY_ID_QUERY = f"""
+    SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OdendiMi, 
+           c.OlusturmaTarihi,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email,
+           o.KitapID, k.KitapAdi, k.Yazar
+    FROM {TABLE_CEZA} c
+    INNER JOIN UYE u ON c.UyeID = u.UyeID
+    LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
+    LEFT JOIN KITAP k ON o.KitapID = k.KitapID
+    WHERE c.CezaID = %s
+"""
+
+UNPAID_PENALTIES_QUERY = f"""
+    SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OlusturmaTarihi,
+           u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email, u.Telefon,
+           k.KitapAdi
+    FROM {TABLE_CEZA} c
+    INNER JOIN UYE u ON c.UyeID = u.UyeID
+    LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
+    LEFT JOIN KITAP k ON o.KitapID = k.KitapID
+    WHERE c.OdendiMi = FALSE
+    ORDER BY c.OlusturmaTarihi DESC
+"""
+
+PENALTY_STATISTICS_QUERY = f"""
+    SELECT 
+        COUNT(*) as ToplamCeza,
+        SUM(Tutar) as ToplamTutar,
+        SUM(CASE WHEN OdendiMi = TRUE THEN Tutar ELSE 0 END) as OdenenTutar,
+        SUM(CASE WHEN OdendiMi = FALSE THEN Tutar ELSE 0 END) as BekleyenTutar,
+        COUNT(CASE WHEN OdendiMi = FALSE THEN 1 END) as OdenmeyenSayisi
+    FROM {TABLE_CEZA}
+"""
+
+
 class Penalty:
     """Ceza model sinifi"""
     
@@ -19,22 +75,62 @@ class Penalty:
             list: Ceza listesi
         """
         try:
-            query = f"""
-                SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OdendiMi, 
-                       c.OlusturmaTarihi,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad,
-                       o.KitapID, k.KitapAdi
-                FROM {TABLE_CEZA} c
-                INNER JOIN UYE u ON c.UyeID = u.UyeID
-                LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
-                LEFT JOIN KITAP k ON o.KitapID = k.KitapID
-                ORDER BY c.CezaID DESC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(PENALTY_LIST_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[PENALTY ERROR] Get all hatasi: {e}")
             return []
     
+    @staticmethod
+    def get_page(page_size=None, cursor=None, sort='-CezaID'):
+        """
+        Ceza listesinin bir sayfasini getirir (keyset sayfalama)
+        
+        Args:
+            page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+            cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+            sort (str): 'CezaID' ('-' on eki azalan)
+            
+        Returns:
+            tuple: (list, tuple/None) - (Sayfa, sonraki sayfa cursor'u)
+        """
+        try:
+            return fetch_page(
+                PENALTY_SELECT, PENALTY_SORT_KEYS, 'CezaID', sort, cursor, page_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[PENALTY ERROR] Get page hatasi: {e}")
+            return [], None
+    
+    @staticmethod
+    def estimated_count():
+        """
+        Yaklasik ceza sayisi (liste sayaci icin, COUNT(*) yapmaz)
+        
+        Returns:
+            int: Satir sayisi tahmini
+        """
+        return estimated_count(TABLE_CEZA)
+    
+    @staticmethod
+    def iter_all(batch_size=1000):
+        """
+        Tum ceza kayitlarini bellege toplamadan satir satir getirir
+        (export gibi buyuk okumalar icin)
+        
+        Args:
+            batch_size (int): Sunucudan tek seferde cekilecek satir sayisi
+            
+        Yields:
+            dict: Ceza kaydi
+        """
+        try:
+            yield from db_manager.execute_iter(
+                PENALTY_LIST_QUERY, batch_size=batch_size, row_factory=ROW_RECORD
+            )
+        except Exception as e:
+            print(f"[PENALTY ERROR] Iter all hatasi: {e}")
+            raise
+    
     @staticmethod
     def get_by_id(ceza_id):
         """
@@ -47,18 +143,9 @@ class Penalty:
             dict/None: Ceza bilgileri
         """
         try:
-            query = f"""
-                SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OdendiMi, 
-                       c.OlusturmaTarihi,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email,
-                       o.KitapID, k.KitapAdi, k.Yazar
-                FROM {TABLE_CEZA} c
-                INNER JOIN UYE u ON c.UyeID = u.UyeID
-                LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
-                LEFT JOIN KITAP k ON o.KitapID = k.KitapID
-                WHERE c.CezaID = %s
-            """
-            return db_manager.execute_query(query, (ceza_id,), fetch_one=True)
+            return db_manager.execute_query(
+                PENALTY_BY_ID_QUERY, (ceza_id,), fetch_one=True, row_factory=ROW_RECORD
+            )
         except Exception as e:
             print(f"[PENALTY ERROR] Get by ID hatasi: {e}")
             return None
@@ -90,7 +177,7 @@ class Penalty:
             
             query += " ORDER BY c.OlusturmaTarihi DESC"
             
-            return db_manager.execute_query(query, (uye_id,))
+            return db_manager.execute_query(query, (uye_id,), row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[PENALTY ERROR] Get by member hatasi: {e}")
             return []
@@ -104,18 +191,7 @@ class Penalty:
             list: Odenmemis ceza listesi
         """
         try:
-            query = f"""
-                SELECT c.CezaID, c.OduncID, c.UyeID, c.Tutar, c.OlusturmaTarihi,
-                       u.Ad as UyeAd, u.Soyad as UyeSoyad, u.Email, u.Telefon,
-                       k.KitapAdi
-                FROM {TABLE_CEZA} c
-                INNER JOIN UYE u ON c.UyeID = u.UyeID
-                LEFT JOIN ODUNC o ON c.OduncID = o.OduncID
-                LEFT JOIN KITAP k ON o.KitapID = k.KitapID
-                WHERE c.OdendiMi = FALSE
-                ORDER BY c.OlusturmaTarihi DESC
-            """
-            return db_manager.execute_query(query)
+            return db_manager.execute_query(UNPAID_PENALTIES_QUERY, row_factory=ROW_RECORD)
         except Exception as e:
             print(f"[PENALTY ERROR] Unpaid hatasi: {e}")
             return []
@@ -132,33 +208,38 @@ class Penalty:
             tuple: (bool, str) - (Basarili mi, Mesaj)
         """
         try:
-            # Ceza mevcut mu ve odenmemis mi?
-            ceza = Penalty.get_by_id(ceza_id)
-            if not ceza:
-                return False, "Ceza bulunamadi"
-            
-            if ceza['OdendiMi']:
-                return False, "Bu ceza zaten odenmis"
-            
-            # Odeme yap
-            query = f"""
-                UPDATE {TABLE_CEZA} 
-                SET OdendiMi = TRUE
-                WHERE CezaID = %s
-            """
-            affected, _ = db_manager.execute_update(query, (ceza_id,))
-            
-            if affected > 0:
-                # Uyenin toplam borcunu guncelle
-                update_debt_query = """
-                    UPDATE UYE 
-                    SET ToplamBorc = ToplamBorc - %s
-                    WHERE UyeID = %s
+            with db_manager.transaction():
+                # Ceza mevcut mu ve odenmemis mi?
+                ceza = Penalty.get_by_id(ceza_id)
+                if not ceza:
+                    return False, "Ceza bulunamadi"
+                
+                if ceza['OdendiMi']:
+                    return False, "Bu ceza zaten odenmis"
+                
+                # Odeme yap (es zamanli ikinci odemeyi engellemek icin kosullu)
+                query = f"""
+                    UPDATE {TABLE_CEZA} 
+                    SET OdendiMi = TRUE
+                    WHERE CezaID = %s AND OdendiMi = FALSE
                 """
-                db_manager.execute_update(update_debt_query, (ceza['Tutar'], ceza['UyeID']))
+                affected, _ = db_manager.execute_update(query, (ceza_id,))
                 
-                return True, f"Ceza odendi ({ceza['Tutar']} TL)"
-            return False, "Odeme yapilamadi"
+                if affected > 0:
+                    # Uyenin toplam borcunu guncelle
+                    update_debt_query = """
+                        UPDATE UYE 
+                        SET ToplamBorc = ToplamBorc - %s
+                        WHERE UyeID = %s
+                    """
+                    db_manager.execute_update(update_debt_query, (ceza['Tutar'], ceza['UyeID']))
+                    
+                    audit_event(TABLE_CEZA, 'UPDATE', f'Ceza odendi. CezaID: {ceza_id}',
+                                eski_veri={'OdendiMi': False},
+                                yeni_veri={'CezaID': ceza_id, 'UyeID': ceza['UyeID'],
+                                           'Tutar': ceza['Tutar'], 'OdendiMi': True})
+                    return True, f"Ceza odendi ({ceza['Tutar']} TL)"
+                return False, "Odeme yapilamadi"
             
         except Exception as e:
             print(f"[PENALTY ERROR] Pay penalty hatasi: {e}")
@@ -209,30 +290,34 @@ class Penalty:
             tuple: (bool, str) - (Basarili mi, Mesaj)
         """
         try:
-            # Ceza mevcut mu?
-            ceza = Penalty.get_by_id(ceza_id)
-            if not ceza:
-                return False, "Ceza bulunamadi"
-            
-            # Odenmisse silinemez
-            if ceza['OdendiMi']:
-                return False, "Odenmis ceza silinemez"
-            
-            # Once uyenin borcunu azalt
-            update_debt_query = """
-                UPDATE UYE 
-                SET ToplamBorc = ToplamBorc - %s
-                WHERE UyeID = %s
-            """
-            db_manager.execute_update(update_debt_query, (ceza['Tutar'], ceza['UyeID']))
-            
-            # Cezayi sil
-            query = f"DELETE FROM {TABLE_CEZA} WHERE CezaID = %s"
-            affected, _ = db_manager.execute_update(query, (ceza_id,))
-            
-            if affected > 0:
-                return True, "Ceza silindi"
-            return False, "Ceza silinemedi"
+            with db_manager.transaction():
+                # Ceza mevcut mu?
+                ceza = Penalty.get_by_id(ceza_id)
+                if not ceza:
+                    return False, "Ceza bulunamadi"
+                
+                # Odenmisse silinemez
+                if ceza['OdendiMi']:
+                    return False, "Odenmis ceza silinemez"
+                
+                # Once uyenin borcunu azalt
+                update_debt_query = """
+                    UPDATE UYE 
+                    SET ToplamBorc = ToplamBorc - %s
+                    WHERE UyeID = %s
+                """
+                db_manager.execute_update(update_debt_query, (ceza['Tutar'], ceza['UyeID']))
+                
+                # Cezayi sil
+                query = f"DELETE FROM {TABLE_CEZA} WHERE CezaID = %s"
+                affected, _ = db_manager.execute_update(query, (ceza_id,))
+                
+                if affected > 0:
+                    audit_event(TABLE_CEZA, 'DELETE', f'Ceza silindi. CezaID: {ceza_id}',
+                                eski_veri={'CezaID': ceza_id, 'UyeID': ceza['UyeID'],
+                                           'Tutar': ceza['Tutar']})
+                    return True, "Ceza silindi"
+                return False, "Ceza silinemedi"
             
         except Exception as e:
             print(f"[PENALTY ERROR] Delete hatasi: {e}")
@@ -247,16 +332,9 @@ class Penalty:
             dict: Istatistik bilgileri
         """
         try:
-            query = f"""
-                SELECT 
-                    COUNT(*) as ToplamCeza,
-                    SUM(Tutar) as ToplamTutar,
-                    SUM(CASE WHEN OdendiMi = TRUE THEN Tutar ELSE 0 END) as OdenenTutar,
-                    SUM(CASE WHEN OdendiMi = FALSE THEN Tutar ELSE 0 END) as BekleyenTutar,
-                    COUNT(CASE WHEN OdendiMi = FALSE THEN 1 END) as OdenmeyenSayisi
-                FROM {TABLE_CEZA}
-            """
-            result = db_manager.execute_query(query, fetch_one=True)
+            result = db_manager.execute_query(
+                PENALTY_STATISTICS_QUERY, fetch_one=True, row_factory=ROW_RECORD, cache=True
+            )
             return result if result else {}
         except Exception as e:
             print(f"[PENALTY ERROR] Statistics hatasi: {e}")
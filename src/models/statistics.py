@@ -0,0 +1,73 @@
+"""
+Kutuphane Yonetim Sistemi - Istatistik Modeli
+Dashboard sayaclari (trigger'larla guncellenen ozet tablolarindan)
+"""
+
+from src.database.db_manager import db_manager
+from src.database.row_factory import ROW_RECORD
+from src.utils.constants import TABLE_ISTATISTIK_OZET, TABLE_ODUNC_VADE_OZET, SP_OZET_YENILE
+
+
+# Ozet slotlarinin toplami + vadesi gecmis gun kovalarinin toplami. MySQL'de
+# trigger'lar baglanti basina bir slot satirini gunceller (en fazla 16 satir),
+# SQLite'ta tek satir vardir. Tablolarin boyutu uye/kitap/odunc sayisindan
+# bagimsizdir, sorgu her zaman ucuzdur.
+SUMMARY_QUERY = f"""
+    SELECT IFNULL(SUM(s.UyeSayisi), 0) as UyeSayisi,
+           IFNULL(SUM(s.KitapSayisi), 0) as KitapSayisi,
+           IFNULL(SUM(s.ToplamAdet), 0) as ToplamAdet,
+           IFNULL(SUM(s.MevcutAdet), 0) as MevcutAdet,
+           IFNULL(SUM(s.AktifOdunc), 0) as AktifOdunc,
+           IFNULL(SUM(s.OdenmemisCezaSayisi), 0) as OdenmemisCezaSayisi,
+           IFNULL(SUM(s.OdenmemisCezaTutari), 0) as OdenmemisCezaTutari,
+           (SELECT IFNULL(SUM(v.AktifOdunc), 0)
+            FROM {TABLE_ODUNC_VADE_OZET} v
+            WHERE v.SonTeslimTarihi < CURDATE()) as GecikenOdunc
+    FROM {TABLE_ISTATISTIK_OZET} s
+"""
+
+_COUNT_FIELDS = ('UyeSayisi', 'KitapSayisi', 'ToplamAdet', 'MevcutAdet',
+                 'AktifOdunc', 'OdenmemisCezaSayisi', 'GecikenOdunc')
+
+
+class Statistics:
+    """Dashboard istatistik model sinifi"""
+
+    @staticmethod
+    def get_summary():
+        """
+        Dashboard sayaclari
+
+        Returns:
+            dict: UyeSayisi, KitapSayisi, ToplamAdet, MevcutAdet, AktifOdunc,
+                  GecikenOdunc, OdenmemisCezaSayisi, OdenmemisCezaTutari
+                  (hata durumunda bos dict)
+        """
+        try:
+            result = db_manager.execute_query(
+                SUMMARY_QUERY, fetch_one=True, row_factory=ROW_RECORD, cache=True
+            )
+            if not result:
+                return {}
+            summary = dict(result.items())
+            for field in _COUNT_FIELDS:
+                summary[field] = int(summary.get(field) or 0)
+            return summary
+        except Exception as e:
+            print(f"[STATISTICS ERROR] Ozet okuma hatasi: {e}")
+            return {}
+
+    @staticmethod
+    def refresh_summary():
+        """
+        Ozet tablolarini kaynak tablolardan yeniden hesaplar
+        (trigger'lar disinda yapilan toplu degisikliklerden sonra)
+
+        Returns:
+            tuple: (basarili: bool, mesaj: str)
+        """
+        try:
+            db_manager.call_procedure(SP_OZET_YENILE)
+            return True, "Istatistikler yeniden hesaplandi"
+        except Exception as e:
+            return False, f"Ozet yenileme hatasi: {str(e)[:100]}"
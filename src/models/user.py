@@ -5,10 +5,23 @@ Kullanici giris, CRUD islemleri
 
 import bcrypt
 from src.database.db_manager import db_manager
+from src.database.pagination import fetch_page, estimated_count
 from src.utils.constants import TABLE_KULLANICI, ROLE_ADMIN, ROLE_GOREVLI
 from src.utils.validators import validate_required
 
 
+USER_SELECT = f"""
+    SELECT KullaniciID, KullaniciAdi, Rol, AdSoyad, Email, AktifMi
+    FROM {TABLE_KULLANICI}
+"""
+
+# get_page ile siralanabilecek kolonlar (hepsi NOT NULL ve indeksli)
+USER_SORT_KEYS = {
+    'KullaniciID': 'KullaniciID',
+    'KullaniciAdi': 'KullaniciAdi',
+}
+
+
 class User:
     """Kullanici model sinifi"""
     
@@ -89,6 +102,37 @@ class User:
             print(f"[USER ERROR] Get all hatasi: {e}")
             return []
     
+    @staticmethod
+    def get_page(page_size=None, cursor=None, sort='KullaniciID'):
+        """
+        Kullanici listesinin bir sayfasini getirir (keyset sayfalama)
+        
+        Args:
+            page_size (int): Sayfa boyutu (None ise LIST_PAGE_SIZE)
+            cursor (tuple): Onceki sayfanin next_cursor'u (None ise ilk sayfa)
+            sort (str): 'KullaniciID', 'KullaniciAdi' ('-' on eki azalan)
+            
+        Returns:
+            tuple: (list, tuple/None) - (Sayfa, sonraki sayfa cursor'u)
+        """
+        try:
+            return fetch_page(
+                USER_SELECT, USER_SORT_KEYS, 'KullaniciID', sort, cursor, page_size
+            )
+        except Exception as e:
+            print(f"[USER ERROR] Get page hatasi: {e}")
+            return [], None
+    
+    @staticmethod
+    def estimated_count():
+        """
+        Yaklasik kullanici sayisi (liste sayaci icin, COUNT(*) yapmaz)
+        
+        Returns:
+            int: Satir sayisi tahmini
+        """
+        return estimated_count(TABLE_KULLANICI)
+    
     @staticmethod
     def get_by_id(kullanici_id):
         """
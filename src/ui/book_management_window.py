@@ -11,6 +11,7 @@ from PyQt5.QtGui import QColor, QFont
 from src.models.book import Book
 from src.utils.helpers import ask_yes_no_tr
 from src.database.db_manager import db_manager
+from src.utils.query_executor import QueryExecutor, set_table_loading
 
 class BookManagementWindow(QWidget):
     """Kitap yonetim ekrani"""
@@ -18,6 +19,7 @@ class BookManagementWindow(QWidget):
     def __init__(self, dashboard=None):
         super().__init__()
         self.dashboard = dashboard
+        self.executor = QueryExecutor(self)
         self.init_ui()
         self.load_books()
     
@@ -34,7 +36,7 @@ class BookManagementWindow(QWidget):
         # Arama bolumu
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText('Kitap adı, yazar veya ISBN ile ara...')
+        self.search_input.setPlaceholderText('Kitap adı, yazar veya yayınevi ile ara...')
         self.search_input.textChanged.connect(self.search_books)
         search_layout.addWidget(QLabel('Ara:'))
         search_layout.addWidget(self.search_input)
@@ -74,6 +76,12 @@ class BookManagementWindow(QWidget):
         button_layout.addWidget(self.refresh_btn)
         
         button_layout.addStretch()
+        
+        # Arama sonuclari sayfa sayfa gelir
+        self.more_btn = QPushButton('Daha Fazla Sonuç')
+        self.more_btn.clicked.connect(self.load_more_results)
+        self.more_btn.setVisible(False)
+        button_layout.addWidget(self.more_btn)
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
@@ -137,12 +145,19 @@ class BookManagementWindow(QWidget):
             self.table.setColumnWidth(7, 60)
 
     def load_books(self):
-        try:
-            books = Book.get_all()
-            self.update_table_content(books)
-        except Exception as e:
-            print(f"Hata detayı: {e}")
-            QMessageBox.critical(self, 'Hata', f'Kitaplar yüklenemedi: {str(e)}')
+        # Liste ve arama ayni anahtari kullanir, son istenen kazanir
+        self.more_btn.setVisible(False)
+        set_table_loading(self.table, True)
+        self.executor.submit(
+            'books', Book.get_all,
+            on_result=self.update_table_content,
+            on_error=self.on_load_error,
+            on_finished=lambda: set_table_loading(self.table, False)
+        )
+    
+    def on_load_error(self, e):
+        print(f"Hata detayı: {e}")
+        QMessageBox.critical(self, 'Hata', f'Kitaplar yüklenemedi: {str(e)}')
     
     def refresh_data(self):
         self.load_books()
@@ -154,11 +169,32 @@ class BookManagementWindow(QWidget):
         if not search_text:
             self.load_books()
             return
-        try:
-            books = Book.search(search_text)
-            self.update_table_content(books)
-        except Exception as e:
-            QMessageBox.critical(self, 'Hata', f'Arama hatası: {str(e)}')
+        self.search_text = search_text
+        self.search_page = 1
+        self.search_results = []
+        self.submit_search()
+    
+    def load_more_results(self):
+        self.search_page += 1
+        self.submit_search()
+    
+    def submit_search(self):
+        # Ilgi sirali arama (FULLTEXT); sonuclar sayfa sayfa eklenir
+        self.more_btn.setEnabled(False)
+        set_table_loading(self.table, True)
+        self.executor.submit(
+            'books', Book.search_ranked, self.search_text, page=self.search_page,
+            on_result=self.on_search_results,
+            on_error=lambda e: QMessageBox.critical(self, 'Hata', f'Arama hatası: {str(e)}'),
+            on_finished=lambda: set_table_loading(self.table, False)
+        )
+    
+    def on_search_results(self, result):
+        books, has_more = result
+        self.search_results.extend(books)
+        self.update_table_content(self.search_results)
+        self.more_btn.setVisible(has_more)
+        self.more_btn.setEnabled(True)
     
     def add_book(self):
         dialog = BookDialog(self)
@@ -275,7 +311,7 @@ class BookDialog(QDialog):
         try:
             # schema.sql'e göre tablo adı: KATEGORI
             query = "SELECT KategoriID, KategoriAdi FROM KATEGORI ORDER BY KategoriAdi"
-            categories = db_manager.execute_query(query)
+            categories = db_manager.execute_query(query, cache=True)
             
             self.kategori_combo.clear()
             self.kategori_combo.addItem('Seçiniz...', None)
@@ -8,11 +8,10 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QStackedWidget)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QIcon
-from src.models.loan import Loan
 from src.models.penalty import Penalty
-from src.models.member import Member
-from src.models.book import Book
+from src.models.statistics import Statistics
 from src.utils.toast_notification import ToastNotification
+from src.utils.query_executor import QueryExecutor
 
 
 class DashboardWindow(QMainWindow):
@@ -22,6 +21,7 @@ class DashboardWindow(QMainWindow):
         super().__init__()
         self.user = user
         self.current_screen_name = 'Ana Sayfa'
+        self.executor = QueryExecutor(self)
         self.init_ui()
         self.load_statistics()
     
@@ -290,29 +290,43 @@ class DashboardWindow(QMainWindow):
         """)
         return btn
     
+    @staticmethod
+    def fetch_statistics():
+        """Kart degerlerini veritabanindan toplar (arka plan thread'inde calisir)"""
+        # Tam tablo okumak yerine trigger'larla guncellenen ozet satiri okunur
+        summary = Statistics.get_summary()
+        return {
+            'Toplam Üye': summary.get('UyeSayisi', 0),
+            'Toplam Kitap': summary.get('KitapSayisi', 0),
+            'Aktif Ödünç': summary.get('AktifOdunc', 0),
+            'Geciken Ödünç': summary.get('GecikenOdunc', 0),
+        }
+    
     def load_statistics(self):
-        """Istatistikleri yukle"""
-        try:
-            # Uye sayisi
-            members = Member.get_all()
-            self.stat_cards['Toplam Üye'].update_value(len(members))
-            
-            # Kitap sayisi
-            books = Book.get_all()
-            self.stat_cards['Toplam Kitap'].update_value(len(books))
-            
-            # Odunc istatistikleri
-            loan_stats = Loan.get_statistics()
-            self.stat_cards['Aktif Ödünç'].update_value(loan_stats.get('AktifOdunc', 0))
-            self.stat_cards['Geciken Ödünç'].update_value(loan_stats.get('Geciken', 0))
-            
-        except Exception as e:
-            print(f"[DASHBOARD ERROR] Istatistik yukleme hatasi: {e}")
-            # Hata durumunda varsayilan degerler
-            if hasattr(self, 'stat_cards'):
-                for card in self.stat_cards.values():
-                    if card.value_label.text() == '0':
-                        card.update_value('0')
+        """Istatistikleri yukle (arka planda, GUI thread'i bloklanmaz)"""
+        for card in self.stat_cards.values():
+            card.value_label.setEnabled(False)
+        self.executor.submit(
+            'statistics', self.fetch_statistics,
+            on_result=self.on_statistics_loaded,
+            on_error=self.on_statistics_error,
+            on_finished=self.on_statistics_finished
+        )
+    
+    def on_statistics_loaded(self, stats):
+        for name, value in stats.items():
+            self.stat_cards[name].update_value(value)
+    
+    def on_statistics_error(self, e):
+        print(f"[DASHBOARD ERROR] Istatistik yukleme hatasi: {e}")
+        # Hata durumunda varsayilan degerler
+        for card in self.stat_cards.values():
+            if card.value_label.text() == '0':
+                card.update_value('0')
+    
+    def on_statistics_finished(self):
+        for card in self.stat_cards.values():
+            card.value_label.setEnabled(True)
     
     def refresh_statistics(self):
         """Istatistikleri yeniden yukle - diğer ekranlar tarafından çağrılabilir"""
@@ -11,7 +11,11 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QSpinBox, QMessageBox, QHeaderView)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QColor
+from src.config.database import DatabaseConfig
 from src.database.db_manager import DatabaseManager
+from src.database.fulltext import boolean_query
+from src.models.book import BOOK_MATCH
+from src.utils.query_executor import QueryExecutor, set_table_loading
 from datetime import datetime
 
 
@@ -22,6 +26,7 @@ class DynamicQueryWindow(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.current_query_type = 'KITAP'  # KITAP veya UYE
+        self.executor = QueryExecutor(self)
         self.init_ui()
     
     def init_ui(self):
@@ -353,7 +358,8 @@ class DynamicQueryWindow(QWidget):
             'Basım Yılı (Eskiden Yeniye)',
             'Basım Yılı (Yeniden Eskiye)',
             'Mevcut Adet (Artan)',
-            'Mevcut Adet (Azalan)'
+            'Mevcut Adet (Azalan)',
+            'İlgi (Arama Eşleşmesi)'
         ])
         self.book_sort_combo.setStyleSheet(self.get_input_style())
         sort_layout.addWidget(self.book_sort_combo)
@@ -530,7 +536,7 @@ class DynamicQueryWindow(QWidget):
         try:
             db = DatabaseManager()
             query = "SELECT KategoriID, KategoriAdi FROM KATEGORI ORDER BY KategoriAdi"
-            results = db.execute_query(query)
+            results = db.execute_query(query, use_replica=True, cache=True)
             
             for row in results:
                 self.category_combo.addItem(row['KategoriAdi'], row['KategoriID'])
@@ -569,6 +575,19 @@ class DynamicQueryWindow(QWidget):
             
             params = []
             
+            # Ad / yazar / yayinevi terimleri once FULLTEXT indeksiyle daraltilir,
+            # LIKE kosullari sadece eslesen satirlarda kolon bazli kontrol yapar
+            match = None
+            if not DatabaseConfig.is_sqlite():
+                match, _ = boolean_query(' '.join([
+                    self.book_name_input.text(),
+                    self.author_input.text(),
+                    self.publisher_input.text()
+                ]))
+            if match:
+                query += f" AND {BOOK_MATCH}"
+                params.append(match)
+            
             # Dinamik koşullar
             if self.book_name_input.text().strip():
                 query += " AND k.KitapAdi LIKE %s"
@@ -617,20 +636,36 @@ class DynamicQueryWindow(QWidget):
                 query += " ORDER BY k.MevcutAdet ASC"
             elif 'Mevcut Adet (Azalan)' in sort_option:
                 query += " ORDER BY k.MevcutAdet DESC"
+            elif 'İlgi' in sort_option:
+                if match:
+                    query += f" ORDER BY {BOOK_MATCH} DESC, k.KitapAdi ASC"
+                    params.append(match)
+                else:
+                    query += " ORDER BY k.KitapAdi ASC"
             
-            # Sorguyu çalıştır
-            results = db.execute_query(query, tuple(params))
-            
-            # Sonuçları göster
-            self.display_book_results(results)
-            
-            # Toast bildirimi
-            if self.parent:
-                self.parent.show_toast(f'{len(results)} sonuç bulundu', 'success')
+            # Sorguyu arka planda çalıştır (kitap ve üye sorgusu ayni anahtar)
+            set_table_loading(self.results_table, True)
+            self.executor.submit(
+                'query', db.execute_query, query, tuple(params), use_replica=True,
+                on_result=self.on_book_results,
+                on_error=self.on_query_error,
+                on_finished=lambda: set_table_loading(self.results_table, False)
+            )
             
         except Exception as e:
-            print(f"Sorgu hatası: {e}")
-            QMessageBox.critical(self, 'Hata', f'Sorgu çalıştırılırken hata oluştu:\n{str(e)}')
+            self.on_query_error(e)
+    
+    def on_book_results(self, results):
+        """Kitap sorgusu sonucunu göster"""
+        self.display_book_results(results)
+        
+        # Toast bildirimi
+        if self.parent:
+            self.parent.show_toast(f'{len(results)} sonuç bulundu', 'success')
+    
+    def on_query_error(self, e):
+        print(f"Sorgu hatası: {e}")
+        QMessageBox.critical(self, 'Hata', f'Sorgu çalıştırılırken hata oluştu:\n{str(e)}')
     
     def execute_member_query(self):
         """Üye sorgusu çalıştır"""
@@ -708,19 +743,25 @@ class DynamicQueryWindow(QWidget):
             elif 'Kayıt Tarihi (Yeniden Eskiye)' in sort_option:
                 query += " ORDER BY KayitTarihi DESC"
             
-            # Sorguyu çalıştır
-            results = db.execute_query(query, tuple(params))
-            
-            # Sonuçları göster
-            self.display_member_results(results)
-            
-            # Toast bildirimi
-            if self.parent:
-                self.parent.show_toast(f'{len(results)} sonuç bulundu', 'success')
+            # Sorguyu arka planda çalıştır
+            set_table_loading(self.results_table, True)
+            self.executor.submit(
+                'query', db.execute_query, query, tuple(params), use_replica=True,
+                on_result=self.on_member_results,
+                on_error=self.on_query_error,
+                on_finished=lambda: set_table_loading(self.results_table, False)
+            )
             
         except Exception as e:
-            print(f"Sorgu hatası: {e}")
-            QMessageBox.critical(self, 'Hata', f'Sorgu çalıştırılırken hata oluştu:\n{str(e)}')
+            self.on_query_error(e)
+    
+    def on_member_results(self, results):
+        """Üye sorgusu sonucunu göster"""
+        self.display_member_results(results)
+        
+        # Toast bildirimi
+        if self.parent:
+            self.parent.show_toast(f'{len(results)} sonuç bulundu', 'success')
     
     def display_book_results(self, results):
         """Kitap sonuçlarını tabloda göster (Modernize Edildi)"""
@@ -6,13 +6,16 @@ Tek bir pencerede hem ödünç verme hem teslim alma işlemleri
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QTableWidget, QTableWidgetItem, QLineEdit, QLabel,
                              QMessageBox, QDialog, QFormLayout, QComboBox, 
-                             QDateEdit, QHeaderView)
+                             QDateEdit, QHeaderView, QListWidget, QListWidgetItem)
 from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QColor, QFont
 from src.models.loan import Loan
 from src.models.member import Member
 from src.models.book import Book
+from src.utils.query_executor import QueryExecutor, set_table_loading
+from src.utils.constants import MAX_AKTIF_ODUNC
 from datetime import datetime
+from uuid import uuid4
 
 class LoanWindow(QWidget):
     """Odunc ve Teslim yonetim ekrani"""
@@ -22,6 +25,7 @@ class LoanWindow(QWidget):
         self.user = user
         self.dashboard = dashboard
         self.all_loans = [] # Arama yapabilmek için veriyi hafızada tutacağız
+        self.executor = QueryExecutor(self)
         self.init_ui()
         self.load_active_loans()
     
@@ -52,6 +56,8 @@ class LoanWindow(QWidget):
         self.table.horizontalHeader().setVisible(False)
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        # Toplu teslim için Ctrl/Shift ile çoklu seçim
+        self.table.setSelectionMode(QTableWidget.ExtendedSelection)
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setMinimumHeight(400)
         
@@ -70,6 +76,11 @@ class LoanWindow(QWidget):
         self.return_btn.clicked.connect(self.return_book)
         button_layout.addWidget(self.return_btn)
         
+        self.bulk_return_btn = QPushButton('Toplu Teslim')
+        self.bulk_return_btn.setStyleSheet("background-color: #17a2b8; color: white; font-weight: bold;")
+        self.bulk_return_btn.clicked.connect(self.bulk_return)
+        button_layout.addWidget(self.bulk_return_btn)
+        
         self.refresh_btn = QPushButton('Yenile')
         self.refresh_btn.clicked.connect(self.load_active_loans)
         button_layout.addWidget(self.refresh_btn)
@@ -142,12 +153,18 @@ class LoanWindow(QWidget):
         header.setSectionResizeMode(2, QHeaderView.Stretch) # Kitap adı esnek
 
     def load_active_loans(self):
-        """Aktif ödünçleri veritabanından çek"""
-        try:
-            self.all_loans = Loan.get_active_loans()
-            self.update_table_content(self.all_loans)
-        except Exception as e:
-            QMessageBox.critical(self, 'Hata', f'Ödünçler yüklenemedi: {str(e)}')
+        """Aktif ödünçleri veritabanından çek (arka planda)"""
+        set_table_loading(self.table, True)
+        self.executor.submit(
+            'active_loans', Loan.get_active_loans,
+            on_result=self.on_loans_loaded,
+            on_error=lambda e: QMessageBox.critical(self, 'Hata', f'Ödünçler yüklenemedi: {str(e)}'),
+            on_finished=lambda: set_table_loading(self.table, False)
+        )
+    
+    def on_loans_loaded(self, loans):
+        self.all_loans = loans
+        self.search_loans()
     
     def search_loans(self):
         """Client-side arama"""
@@ -202,6 +219,27 @@ class LoanWindow(QWidget):
             self.load_active_loans()
             if self.dashboard:
                 self.dashboard.refresh_statistics()
+    
+    def bulk_return(self):
+        """Seçili ödünçleri tek işlemde teslim al"""
+        # 0. satır başlık
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows() if index.row() > 0})
+        if not rows:
+            QMessageBox.warning(self, 'Uyarı', 'Lütfen teslim alınacak işlemleri seçin!')
+            return
+        
+        loans = [
+            (int(self.table.item(row, 0).text()), self.table.item(row, 1).text(), self.table.item(row, 2).text())
+            for row in rows
+        ]
+        
+        dialog = BulkReturnDialog(self, loans)
+        if dialog.exec_() == QDialog.Accepted:
+            if dialog.success_message and self.dashboard:
+                self.dashboard.show_toast(dialog.success_message[0], dialog.success_message[1])
+            self.load_active_loans()
+            if self.dashboard:
+                self.dashboard.refresh_statistics()
 
 
 class NewLoanDialog(QDialog):
@@ -213,6 +251,8 @@ class NewLoanDialog(QDialog):
         self.members = []
         self.books = []
         self.success_message = None
+        # Cift tiklamada ayni odunc iki kez verilmesin
+        self.request_key = uuid4().hex
         self.init_ui()
         self.load_data()
     
@@ -227,8 +267,15 @@ class NewLoanDialog(QDialog):
         self.uye_combo = QComboBox()
         layout.addRow('Üye Seçin:', self.uye_combo)
         
-        self.kitap_combo = QComboBox()
-        layout.addRow('Kitap Seçin:', self.kitap_combo)
+        # Bir üyeye birden fazla kitap tek işlemde verilebilir
+        self.kitap_list = QListWidget()
+        self.kitap_list.setMinimumHeight(200)
+        self.kitap_list.itemChanged.connect(self.update_selection_label)
+        layout.addRow('Kitap Seçin:', self.kitap_list)
+        
+        self.selection_label = QLabel()
+        layout.addRow('', self.selection_label)
+        self.update_selection_label()
         
         info_label = QLabel('Not: Ödünç süresi 15 gündür. Gecikmede günlük 5 TL ceza uygulanır.')
         info_label.setStyleSheet("color: #666; font-style: italic;")
@@ -255,29 +302,55 @@ class NewLoanDialog(QDialog):
                 self.uye_combo.addItem(f"{member['Ad']} {member['Soyad']} ({member['Email']})", member['UyeID'])
             
             self.books = Book.get_available_books()
-            self.kitap_combo.clear()
-            self.kitap_combo.addItem("Seçiniz...", None)
+            self.kitap_list.blockSignals(True)
+            self.kitap_list.clear()
             for book in self.books:
-                self.kitap_combo.addItem(f"{book['KitapAdi']} - {book['Yazar']}", book['KitapID'])
+                item = QListWidgetItem(f"{book['KitapAdi']} - {book['Yazar']}")
+                item.setData(Qt.UserRole, book['KitapID'])
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                self.kitap_list.addItem(item)
+            self.kitap_list.blockSignals(False)
+            self.update_selection_label()
             
         except Exception as e:
             QMessageBox.critical(self, 'Hata', f'Veriler yüklenemedi: {str(e)}')
     
+    def selected_book_ids(self):
+        """İşaretli kitapların ID listesi"""
+        ids = []
+        for row in range(self.kitap_list.count()):
+            item = self.kitap_list.item(row)
+            if item.checkState() == Qt.Checked:
+                ids.append(item.data(Qt.UserRole))
+        return ids
+    
+    def update_selection_label(self, *_):
+        count = len(self.selected_book_ids())
+        self.selection_label.setText(f'Seçilen kitap: {count} (en fazla {MAX_AKTIF_ODUNC} aktif ödünç)')
+        color = '#dc3545' if count > MAX_AKTIF_ODUNC else '#666'
+        self.selection_label.setStyleSheet(f"color: {color};")
+    
     def create_loan(self):
         uye_id = self.uye_combo.currentData()
-        kitap_id = self.kitap_combo.currentData()
+        kitap_ids = self.selected_book_ids()
         
-        if not uye_id or not kitap_id:
-            QMessageBox.warning(self, 'Uyarı', 'Lütfen üye ve kitap seçin!')
+        if not uye_id or not kitap_ids:
+            QMessageBox.warning(self, 'Uyarı', 'Lütfen üye ve en az bir kitap seçin!')
             return
         
         try:
-            result = Loan.create_loan(uye_id, kitap_id, self.user.kullanici_id)
-            if result:
-                self.success_message = (f'Ödünç işlemi başarılı! (ID: {result})', 'success')
+            # Seçilen kitapların hepsi tek transaction'da verilir
+            success, message = Loan.create_loans(
+                uye_id, kitap_ids, self.user.kullanici_id, idempotency_key=self.request_key
+            )
+            if success:
+                self.success_message = (f'Ödünç işlemi başarılı! ({message})', 'success')
                 self.accept()
             else:
-                QMessageBox.warning(self, 'Uyarı', 'Ödünç işlemi gerçekleştirilemedi!')
+                # Başarısız istek sonrası yeni seçim yeni istek sayılır
+                self.request_key = uuid4().hex
+                QMessageBox.warning(self, 'Uyarı', f'Ödünç işlemi gerçekleştirilemedi!\n{message}')
         except Exception as e:
             QMessageBox.critical(self, 'Hata', f'Ödünç verme hatası: {str(e)}')
 
@@ -348,4 +421,82 @@ class ReturnDialog(QDialog):
                 else:
                     QMessageBox.warning(self, 'Uyarı', 'Teslim işlemi başarısız!')
             except Exception as e:
-                QMessageBox.critical(self, 'Hata', f'Hata: {str(e)}')
\ No newline at end of file
+                QMessageBox.critical(self, 'Hata', f'Hata: {str(e)}')
+
+
+class BulkReturnDialog(QDialog):
+    """Toplu teslim alma dialogu (iade kutusu)"""
+    
+    def __init__(self, parent, loans):
+        super().__init__(parent)
+        # (OduncID, Üye, Kitap) listesi
+        self.loans = loans
+        self.success_message = None
+        self.init_ui()
+    
+    def init_ui(self):
+        self.setWindowTitle('Toplu Teslim Al')
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.setMinimumWidth(500)
+        
+        layout = QFormLayout()
+        
+        layout.addRow('Seçilen Ödünç:', QLabel(str(len(self.loans))))
+        
+        loan_list = QListWidget()
+        loan_list.setMinimumHeight(200)
+        for odunc_id, uye_adi, kitap_adi in self.loans:
+            loan_list.addItem(f"#{odunc_id}  {uye_adi} - {kitap_adi}")
+        layout.addRow(loan_list)
+        
+        self.teslim_tarihi_input = QDateEdit()
+        self.teslim_tarihi_input.setCalendarPopup(True)
+        self.teslim_tarihi_input.setDate(QDate.currentDate())
+        layout.addRow('Teslim Tarihi:', self.teslim_tarihi_input)
+        
+        info = QLabel('Not: Tüm kayıtlar tek işlemde teslim alınır, gecikmeler için ceza otomatik hesaplanır.')
+        info.setWordWrap(True)
+        info.setStyleSheet("color: #666; font-style: italic;")
+        layout.addRow(info)
+        
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton('Teslim Al')
+        save_btn.setStyleSheet("background-color: #17a2b8; color: white; font-weight: bold;")
+        save_btn.clicked.connect(self.process_returns)
+        button_layout.addWidget(save_btn)
+        
+        cancel_btn = QPushButton('İptal')
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        
+        layout.addRow(button_layout)
+        self.setLayout(layout)
+    
+    def process_returns(self):
+        teslim_tarihi = self.teslim_tarihi_input.date().toPyDate()
+        
+        reply = QMessageBox.question(
+            self,
+            'Teslim Onayı',
+            f'{len(self.loans)} kitabı teslim almak istediğinize emin misiniz?\nTeslim Tarihi: {teslim_tarihi}',
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        try:
+            odunc_ids = [odunc_id for odunc_id, _, _ in self.loans]
+            success, message, results = Loan.return_loans(odunc_ids, teslim_tarihi)
+            if not success:
+                QMessageBox.warning(self, 'Uyarı', f'Teslim işlemi başarısız!\n{message}')
+                return
+            
+            failed = [str(row['OduncID']) for row in results if not row.get('Basarili')]
+            if failed:
+                QMessageBox.information(
+                    self, 'Bilgi', f'Teslim alınamayan kayıtlar: {", ".join(failed)}'
+                )
+            self.success_message = (message, 'success')
+            self.accept()
+        except Exception as e:
+            QMessageBox.critical(self, 'Hata', f'Hata: {str(e)}')
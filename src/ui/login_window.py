@@ -5,9 +5,12 @@ Kullanici girisi
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QPushButton, QMessageBox, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont, QIcon
+from src.config.database import DatabaseConfig
+from src.database.db_manager import db_manager
 from src.models.user import User
+from src.utils.query_executor import QueryExecutor
 
 
 class LoginWindow(QWidget):
@@ -19,7 +22,10 @@ class LoginWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.current_user = None
+        self.executor = QueryExecutor(self)
         self.init_ui()
+        # Baglanti havuzu pencere cizildikten sonra arka planda isitilir
+        QTimer.singleShot(0, self.start_warm_up)
     
     def init_ui(self):
         """UI baslangic"""
@@ -151,6 +157,13 @@ class LoginWindow(QWidget):
         self.login_btn.clicked.connect(self.login)
         box_layout.addWidget(self.login_btn)
         
+        # Veritabani baglanti durumu
+        self.status_label = QLabel('')
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setWordWrap(True)
+        self.status_label.setStyleSheet('color: #777777; font-size: 10px; background: transparent;')
+        box_layout.addWidget(self.status_label)
+        
         box_layout.addSpacing(10)
         
         # Test kullanıcı bilgisi (küçük ve gri)
@@ -175,6 +188,30 @@ class LoginWindow(QWidget):
         qr.moveCenter(cp)
         self.move(qr.topLeft())
     
+    def start_warm_up(self):
+        """Baglanti havuzunu arka planda hazirlar"""
+        if DatabaseConfig.POOL_WARM_SIZE <= 0:
+            return
+        self.status_label.setText('Veritabanına bağlanılıyor...')
+        self.executor.submit(
+            'warm_up', db_manager.warm_up,
+            on_progress=self.on_warm_up_progress,
+            on_result=self.on_warm_up_finished,
+            on_error=self.on_warm_up_error
+        )
+    
+    def on_warm_up_progress(self, opened, total):
+        self.status_label.setText(f'Veritabanına bağlanılıyor... ({opened}/{total})')
+    
+    def on_warm_up_finished(self, opened):
+        self.status_label.setStyleSheet('color: #28a745; font-size: 10px; background: transparent;')
+        self.status_label.setText('Veritabanı bağlantısı hazır')
+    
+    def on_warm_up_error(self, e):
+        # Giris yine denenebilir; ilk sorgu baglantiyi tekrar dener
+        self.status_label.setStyleSheet('color: #dc3545; font-size: 10px; background: transparent;')
+        self.status_label.setText(f'Veritabanına bağlanılamadı: {e}')
+    
     def login(self):
         """Giris islemi"""
         username = self.username_input.text().strip()
@@ -191,12 +228,18 @@ class LoginWindow(QWidget):
             self.password_input.setFocus()
             return
         
-        # Login denemesi
+        # Login denemesi arka planda: havuz hala isiniyorsa arayuz donmaz
         self.login_btn.setEnabled(False)
         self.login_btn.setText('Giriş yapılıyor...')
         
-        user = User.login(username, password)
-        
+        self.executor.submit(
+            'login', User.login, username, password,
+            on_result=self.on_login_result,
+            on_error=lambda e: self.on_login_result(None)
+        )
+    
+    def on_login_result(self, user):
+        """Giris sonucu (GUI thread'inde)"""
         if user:
             self.current_user = user
             self.login_successful.emit(user)
@@ -136,7 +136,7 @@ class BookReportWindow(QWidget):
                     LIMIT 20
                 """
             
-            books = db.execute_query(query)
+            books = db.execute_query(query, use_replica=True)
             
             # Satır Sayısı: Veri + 1 (Başlık için)
             self.table.setRowCount(len(books) + 1)
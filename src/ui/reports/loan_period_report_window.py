@@ -9,6 +9,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QColor, QFont
 from src.database.db_manager import DatabaseManager
+from src.utils.query_executor import QueryExecutor, set_table_loading
 from datetime import datetime, timedelta
 
 
@@ -18,6 +19,7 @@ class LoanPeriodReportWindow(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = DatabaseManager()
+        self.executor = QueryExecutor(self)
         self.init_ui()
         # Varsayılan olarak son 30 günü göster
         self.load_report()
@@ -203,20 +205,29 @@ class LoanPeriodReportWindow(QWidget):
                     END DESC
             """
             
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                cursor.execute(query, (start_date, end_date, start_date, end_date))
-                loans = cursor.fetchall()
-                cursor.close()
-            
-            # Tabloyu güncelle
-            self.populate_table(loans)
-            
-            # Özet bilgiyi güncelle
-            self.update_summary(loans, start_date, end_date)
+            # Sorgu arka planda calisir; tarih degisince eski istek yok sayilir
+            set_table_loading(self.table, True)
+            self.executor.submit(
+                'report', self.db.execute_query,
+                query, (start_date, end_date, start_date, end_date), use_replica=True,
+                on_result=lambda loans: self.on_report_loaded(loans, start_date, end_date),
+                on_error=self.on_report_error,
+                on_finished=lambda: set_table_loading(self.table, False)
+            )
             
         except Exception as e:
-            QMessageBox.critical(self, 'Hata', f'Rapor yüklenirken hata oluştu:\n{str(e)}')
+            self.on_report_error(e)
+    
+    def on_report_loaded(self, loans, start_date, end_date):
+        """Sorgu sonucunu tabloya ve özete yansıt"""
+        # Tabloyu güncelle
+        self.populate_table(loans)
+        
+        # Özet bilgiyi güncelle
+        self.update_summary(loans, start_date, end_date)
+    
+    def on_report_error(self, e):
+        QMessageBox.critical(self, 'Hata', f'Rapor yüklenirken hata oluştu:\n{str(e)}')
     
     def populate_table(self, loans):
         """Tabloyu doldur"""
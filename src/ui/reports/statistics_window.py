@@ -13,6 +13,7 @@ from src.models.loan import Loan
 from src.models.penalty import Penalty
 from src.models.member import Member
 from src.models.book import Book
+from src.database.db_manager import db_manager
 
 class StatCard(QFrame):
     """Küçük İstatistik Kartı"""
@@ -275,48 +276,50 @@ class StatisticsWindow(QWidget):
     def load_statistics(self):
         """Istatistikleri veritabanından çek ve UI güncelle"""
         try:
-            # --- 1. ÜYE İSTATİSTİKLERİ ---
-            members = Member.get_all()
-            active_members = [m for m in members if m['AktifMi']]
-            
-            self.stat_cards['total_members'].set_value(len(members))
-            self.stat_cards['active_members'].set_value(len(active_members))
-            
-            # --- 2. KİTAP İSTATİSTİKLERİ ---
-            books = Book.get_all()
-            total_books = sum(b['ToplamAdet'] for b in books)
-            avail_books = sum(b['MevcutAdet'] for b in books)
-            
-            self.stat_cards['total_books'].set_value(total_books)
-            self.stat_cards['avail_books'].set_value(avail_books)
-            
-            # --- 3. ÖDÜNÇ İSTATİSTİKLERİ ---
-            loan_stats = Loan.get_statistics()
-            self.stat_cards['active_loans'].set_value(loan_stats.get('AktifOdunc', 0))
-            self.stat_cards['overdue_loans'].set_value(loan_stats.get('Geciken', 0))
-            
-            # Tablo Verisi Hazırla
-            loan_data = [
-                ('Toplam İşlem Hacmi', loan_stats.get('ToplamOdunc', 0)),
-                ('Aktif Ödünç Verilen', loan_stats.get('AktifOdunc', 0)),
-                ('Başarıyla Teslim Edilen', loan_stats.get('TeslimEdilmis', 0)),
-                ('Gecikmeye Düşen', loan_stats.get('Geciken', 0))
-            ]
-            self.update_table_data(self.loan_table, ['İstatistik Türü', 'Adet'], loan_data)
-            
-            # --- 4. CEZA İSTATİSTİKLERİ ---
-            penalty_stats = Penalty.get_statistics()
-            self.stat_cards['total_penalties'].set_value(penalty_stats.get('ToplamCeza', 0))
-            self.stat_cards['unpaid_penalties'].set_value(penalty_stats.get('OdenmemisCeza', 0))
-            self.stat_cards['total_debt'].set_value(f"{penalty_stats.get('ToplamTutar', 0):.2f} TL")
-            
-            # Tablo Verisi Hazırla
-            penalty_data = [
-                ('Toplam Kesilen Ceza', f"{penalty_stats.get('ToplamTutar', 0):.2f} TL"),
-                ('Tahsil Edilen Tutar', f"{penalty_stats.get('OdenenTutar', 0):.2f} TL"),
-                ('Bekleyen (Ödenmemiş) Tutar', f"{penalty_stats.get('OdenmemisTutar', 0):.2f} TL")
-            ]
-            self.update_table_data(self.penalty_table, ['Finansal Durum', 'Tutar'], penalty_data)
+            # Rapor ekrani: okumalar replikadan yapilabilir
+            with db_manager.replica_reads():
+                # --- 1. ÜYE İSTATİSTİKLERİ ---
+                members = Member.get_all()
+                active_members = [m for m in members if m['AktifMi']]
+                
+                self.stat_cards['total_members'].set_value(len(members))
+                self.stat_cards['active_members'].set_value(len(active_members))
+                
+                # --- 2. KİTAP İSTATİSTİKLERİ ---
+                books = Book.get_all()
+                total_books = sum(b['ToplamAdet'] for b in books)
+                avail_books = sum(b['MevcutAdet'] for b in books)
+                
+                self.stat_cards['total_books'].set_value(total_books)
+                self.stat_cards['avail_books'].set_value(avail_books)
+                
+                # --- 3. ÖDÜNÇ İSTATİSTİKLERİ ---
+                loan_stats = Loan.get_statistics()
+                self.stat_cards['active_loans'].set_value(loan_stats.get('AktifOdunc', 0))
+                self.stat_cards['overdue_loans'].set_value(loan_stats.get('Geciken', 0))
+                
+                # Tablo Verisi Hazırla
+                loan_data = [
+                    ('Toplam İşlem Hacmi', loan_stats.get('ToplamOdunc', 0)),
+                    ('Aktif Ödünç Verilen', loan_stats.get('AktifOdunc', 0)),
+                    ('Başarıyla Teslim Edilen', loan_stats.get('TeslimEdilmis', 0)),
+                    ('Gecikmeye Düşen', loan_stats.get('Geciken', 0))
+                ]
+                self.update_table_data(self.loan_table, ['İstatistik Türü', 'Adet'], loan_data)
+                
+                # --- 4. CEZA İSTATİSTİKLERİ ---
+                penalty_stats = Penalty.get_statistics()
+                self.stat_cards['total_penalties'].set_value(penalty_stats.get('ToplamCeza', 0))
+                self.stat_cards['unpaid_penalties'].set_value(penalty_stats.get('OdenmemisCeza', 0))
+                self.stat_cards['total_debt'].set_value(f"{penalty_stats.get('ToplamTutar', 0):.2f} TL")
+                
+                # Tablo Verisi Hazırla
+                penalty_data = [
+                    ('Toplam Kesilen Ceza', f"{penalty_stats.get('ToplamTutar', 0):.2f} TL"),
+                    ('Tahsil Edilen Tutar', f"{penalty_stats.get('OdenenTutar', 0):.2f} TL"),
+                    ('Bekleyen (Ödenmemiş) Tutar', f"{penalty_stats.get('OdenmemisTutar', 0):.2f} TL")
+                ]
+                self.update_table_data(self.penalty_table, ['Finansal Durum', 'Tutar'], penalty_data)
             
         except Exception as e:
             print(f"Istatistik hatasi: {e}")
@@ -14,6 +14,15 @@ ODUNC_SURE_GUN = 15
 # Ceza Hesaplama
 GUNLUK_CEZA_TUTARI = 5.00
 
+# Katalog Arama
+# FULLTEXT indeksi ngram parser kullanir; sunucudaki ngram_token_size ile ayni olmali.
+# Bundan kisa terimler indekste bulunmadigi icin LIKE ile aranir.
+NGRAM_TOKEN_SIZE = 2
+BOOK_SEARCH_PAGE_SIZE = 50
+
+# Keyset sayfalama (Model.get_page) varsayilan sayfa boyutu
+LIST_PAGE_SIZE = 50
+
 # Veritabanı Tablo Isimleri
 TABLE_KULLANICI = 'KULLANICI'
 TABLE_UYE = 'UYE'
@@ -22,6 +31,9 @@ TABLE_KITAP = 'KITAP'
 TABLE_ODUNC = 'ODUNC'
 TABLE_CEZA = 'CEZA'
 TABLE_LOG_ISLEM = 'LOG_ISLEM'
+TABLE_ISTATISTIK_OZET = 'ISTATISTIK_OZET'
+TABLE_ODUNC_VADE_OZET = 'ODUNC_VADE_OZET'
+TABLE_SCHEMA_VERSION = 'SCHEMA_VERSION'
 
 # Stored Procedure Isimleri
 SP_YENI_ODUNC_VER = 'sp_YeniOduncVer'
@@ -29,6 +41,30 @@ SP_KITAP_TESLIM_AL = 'sp_KitapTeslimAl'
 SP_UYE_OZET_RAPOR = 'sp_UyeOzetRapor'
 SP_KITAP_ARA = 'sp_KitapAra'
 SP_AKTIF_ODUNC_SAYISI = 'sp_AktifOduncSayisi'
+SP_TOPLU_ODUNC_VER = 'sp_TopluOduncVer'
+SP_TOPLU_TESLIM_AL = 'sp_TopluTeslimAl'
+SP_OZET_YENILE = 'sp_OzetYenile'
+
+# Stored procedure'lerin yazdigi tablolar (sorgu cache invalidasyonu icin).
+# Listede olmayan procedure cagrildiginda tum cache temizlenir.
+SP_WRITE_TABLES = {
+    SP_YENI_ODUNC_VER: (TABLE_ODUNC, TABLE_LOG_ISLEM),
+    SP_KITAP_TESLIM_AL: (TABLE_ODUNC, TABLE_CEZA, TABLE_LOG_ISLEM),
+    SP_UYE_OZET_RAPOR: (),
+    SP_KITAP_ARA: (),
+    SP_AKTIF_ODUNC_SAYISI: (),
+    SP_TOPLU_ODUNC_VER: (TABLE_ODUNC, TABLE_LOG_ISLEM),
+    SP_TOPLU_TESLIM_AL: (TABLE_ODUNC, TABLE_CEZA, TABLE_LOG_ISLEM),
+    SP_OZET_YENILE: (TABLE_ISTATISTIK_OZET, TABLE_ODUNC_VADE_OZET),
+}
+
+# Trigger'larin dolayli olarak yazdigi tablolar (database/triggers.sql)
+TRIGGER_WRITE_TABLES = {
+    TABLE_ODUNC: (TABLE_KITAP, TABLE_LOG_ISLEM, TABLE_ISTATISTIK_OZET, TABLE_ODUNC_VADE_OZET),
+    TABLE_CEZA: (TABLE_UYE, TABLE_LOG_ISLEM, TABLE_ISTATISTIK_OZET),
+    TABLE_KITAP: (TABLE_ISTATISTIK_OZET,),
+    TABLE_UYE: (TABLE_ISTATISTIK_OZET,),
+}
 
 # UI Mesajlari
 MSG_SUCCESS = 'Islem basarili!'
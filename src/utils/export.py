@@ -0,0 +1,33 @@
+"""
+Kutuphane Yonetim Sistemi - Disa Aktarma
+Sorgu sonuclarini satir satir dosyaya yazan yardimci fonksiyonlar
+"""
+
+import csv
+
+
+def export_rows_to_csv(rows, file_path, columns=None, encoding='utf-8-sig'):
+    """
+    Satirlari CSV dosyasina yazar. rows bir generator olabilir
+    (ornegin Loan.iter_all()), bu durumda tum tablo bellege alinmaz.
+
+    Args:
+        rows (iterable): dict satirlari
+        file_path (str): Hedef dosya yolu
+        columns (list): Kolon sirasi (None ise ilk satirin anahtarlari)
+        encoding (str): Dosya kodlamasi (Excel icin BOM'lu UTF-8)
+
+    Returns:
+        int: Yazilan satir sayisi
+    """
+    count = 0
+    with open(file_path, 'w', newline='', encoding=encoding) as f:
+        writer = None
+        for row in rows:
+            if writer is None:
+                fieldnames = columns or list(row.keys())
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+    return count
@@ -0,0 +1,243 @@
+"""
+Kutuphane Yonetim Sistemi - Arka Plan Sorgu Calistirici
+Model cagrilarini QThreadPool uzerinde calistirip sonucu Qt sinyalleriyle
+GUI thread'ine ulastirir. Boylece yavas sorgularda arayuz donmaz.
+"""
+
+import itertools
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, Qt
+from PyQt5.QtWidgets import QTableWidgetItem
+from PyQt5.QtGui import QColor
+
+from src.config.database import DatabaseConfig
+
+
+class _QuerySignals(QObject):
+    """Worker thread'den GUI thread'ine sonuc tasiyan sinyaller"""
+
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+    progress = pyqtSignal(int, object)
+
+
+class _QueryTask(QRunnable):
+    """Tek bir model cagrisini havuzdaki bir thread'de calistirir"""
+
+    def __init__(self, request_id, fn, args, kwargs, signals, cancelled):
+        super().__init__()
+        self.request_id = request_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.cancelled = cancelled
+        self.setAutoDelete(False)
+
+    def run(self):
+        # Baslamadan iptal edildiyse veritabanina hic gidilmez
+        if self.cancelled.is_set():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, e)
+        else:
+            self.signals.finished.emit(self.request_id, result)
+
+
+class QueryExecutor(QObject):
+    """
+    Anahtar bazli arka plan sorgu calistirici.
+
+    Ayni anahtarla yeni bir istek gonderildiginde onceki istek eskimis
+    sayilir: henuz baslamadiysa kuyruktan alinir, calisiyorsa sonucu
+    yok sayilir. Geri cagirmalar her zaman GUI thread'inde calisir.
+
+    Example:
+        self.executor = QueryExecutor(self)
+        self.executor.submit('books', Book.get_all,
+                             on_result=self.update_table_content,
+                             on_error=self.show_error)
+    """
+
+    def __init__(self, parent=None, max_threads=None):
+        super().__init__(parent)
+        self._thread_pool = QThreadPool(self)
+        # Veritabani havuzundan fazla thread acmak sadece kuyrukta bekletir
+        self._thread_pool.setMaxThreadCount(
+            max_threads or DatabaseConfig.POOL_SIZE + DatabaseConfig.POOL_MAX_OVERFLOW
+        )
+        self._signals = _QuerySignals()
+        self._signals.finished.connect(self._on_finished, Qt.QueuedConnection)
+        self._signals.failed.connect(self._on_failed, Qt.QueuedConnection)
+        self._signals.progress.connect(self._on_progress, Qt.QueuedConnection)
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._requests = {}
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, on_finished=None,
+               on_progress=None, **kwargs):
+        """
+        Model cagrisini arka planda calistirir
+
+        Args:
+            key (str): Istek anahtari; ayni anahtarli eski istek iptal edilir
+            fn (callable): Calistirilacak fonksiyon (ornegin Book.get_all)
+            *args, **kwargs: fn parametreleri
+            on_result (callable): Basarili sonucta cagrilir (result)
+            on_error (callable): Hata durumunda cagrilir (exception)
+            on_finished (callable): Her iki durumda da en son cagrilir
+            on_progress (callable): Verilirse fn'e progress=... parametresi
+                gecilir; fn'in progress(*degerler) cagrilari GUI thread'inde
+                on_progress(*degerler) olarak calisir
+
+        Returns:
+            int: Istek ID
+        """
+        request_id = next(self._ids)
+        cancelled = threading.Event()
+        if on_progress is not None:
+            signal = self._signals.progress
+            kwargs['progress'] = lambda *values: signal.emit(request_id, values)
+        task = _QueryTask(request_id, fn, args, kwargs, self._signals, cancelled)
+
+        with self._lock:
+            previous = self._latest.get(key)
+            self._latest[key] = request_id
+            self._requests[request_id] = (
+                key, task, cancelled, on_result, on_error, on_finished, on_progress
+            )
+
+        if previous is not None:
+            self._drop(previous)
+
+        self._thread_pool.start(task)
+        return request_id
+
+    def cancel(self, key):
+        """
+        Anahtara ait bekleyen istegi iptal eder; geri cagirmalari calismaz
+
+        Args:
+            key (str): Istek anahtari
+        """
+        with self._lock:
+            request_id = self._latest.pop(key, None)
+        if request_id is not None:
+            self._drop(request_id)
+
+    def cancel_all(self):
+        """Tum bekleyen istekleri iptal eder"""
+        with self._lock:
+            request_ids = list(self._latest.values())
+            self._latest.clear()
+        for request_id in request_ids:
+            self._drop(request_id)
+
+    def is_running(self, key):
+        """Anahtar icin sonuc bekleniyor mu?"""
+        with self._lock:
+            return key in self._latest
+
+    def _drop(self, request_id):
+        """Istegi eskimis isaretler, baslamadiysa kuyruktan alir"""
+        with self._lock:
+            entry = self._requests.pop(request_id, None)
+        if entry is None:
+            return
+        _, task, cancelled = entry[:3]
+        cancelled.set()
+        self._thread_pool.tryTake(task)
+
+    def _take(self, request_id):
+        """Istek hala guncelse geri cagirmalarini dondurur"""
+        with self._lock:
+            entry = self._requests.pop(request_id, None)
+            if entry is None:
+                return None
+            key = entry[0]
+            if self._latest.get(key) == request_id:
+                del self._latest[key]
+        return entry
+
+    def _on_finished(self, request_id, result):
+        entry = self._take(request_id)
+        if entry is None:
+            return
+        _, _, _, on_result, _, on_finished, _ = entry
+        try:
+            if on_result:
+                on_result(result)
+        finally:
+            if on_finished:
+                on_finished()
+
+    def _on_failed(self, request_id, error):
+        entry = self._take(request_id)
+        if entry is None:
+            return
+        _, _, _, _, on_error, on_finished, _ = entry
+        try:
+            if on_error:
+                on_error(error)
+            else:
+                print(f"[EXECUTOR ERROR] Arka plan sorgu hatasi: {error}")
+        finally:
+            if on_finished:
+                on_finished()
+
+    def _on_progress(self, request_id, values):
+        with self._lock:
+            entry = self._requests.get(request_id)
+        # Iptal edilmis / eskimis istegin ilerlemesi gosterilmez
+        if entry is not None and entry[6]:
+            entry[6](*values)
+
+    def shutdown(self, wait_ms=5000):
+        """
+        Bekleyen istekleri iptal eder ve calisanlarin bitmesini bekler
+
+        Args:
+            wait_ms (int): En fazla bekleme suresi (ms)
+        """
+        self.cancel_all()
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone(wait_ms)
+
+
+def set_table_loading(table, loading, message='Yükleniyor...'):
+    """
+    Tabloyu yukleniyor durumuna alir veya cikarir. Tablo bossa ortada
+    bir bilgi satiri gosterilir; doluysa eski veri soluk kalir.
+
+    Args:
+        table (QTableWidget): Hedef tablo
+        loading (bool): Yukleniyor mu?
+        message (str): Bos tabloda gosterilecek mesaj
+    """
+    table.setEnabled(not loading)
+    if loading:
+        table.viewport().setCursor(Qt.BusyCursor)
+        if table.rowCount() == 0 and table.columnCount() > 0:
+            table.setRowCount(1)
+            item = QTableWidgetItem(message)
+            item.setTextAlignment(Qt.AlignCenter)
+            item.setForeground(QColor('#777777'))
+            item.setFlags(Qt.ItemIsEnabled)
+            table.setItem(0, 0, item)
+            table.setSpan(0, 0, 1, table.columnCount())
+            table.setProperty('loading_placeholder', message)
+    else:
+        table.viewport().unsetCursor()
+        placeholder = table.property('loading_placeholder')
+        if placeholder:
+            table.setProperty('loading_placeholder', None)
+            table.setSpan(0, 0, 1, 1)
+            # Sonuc gelmediyse (hata) bilgi satiri kaldirilir
+            item = table.item(0, 0)
+            if item is not None and item.text() == placeholder:
+                table.removeRow(0)